@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+""" Compare the template backends: Checks that the builtin renderer gives
+the same output as Cheetah for every template and measures how many
+templates per second each backend renders. """
+
+import sys
+import time
+from optparse import OptionParser
+
+from templates import Templates
+from template_backend import Cheetah, backends
+from code_generator import GRMTemplate
+from modtool_add import ModToolAdd
+
+### Sample template variables ################################################
+def _block_infos():
+    """ Template variables for blocks of all types, languages and versions,
+    with and without arguments, types, VOLK, hints, instrumentation, thread
+    policy and asynchronous I/O """
+    item_types = ModToolAdd._item_types
+    infos = []
+    for version in ('36', '37'):
+        for lang in ('cpp', 'python'):
+            for blocktype in ModToolAdd._block_types:
+                if blocktype in ('tagged_stream', 'message') and (lang, version) != ('cpp', '37'):
+                    continue
+                for arglist in ('', 'float k=1.0, const std::string &length_tag_key'):
+                    infos.append({'modname': 'howto', 'blockname': 'square_ff',
+                                  'fullblockname': 'howto_square_ff', 'version': version,
+                                  'lang': lang, 'blocktype': blocktype, 'arglist': arglist,
+                                  'license': Templates['defaultlicense'],
+                                  'intype': ModToolAdd._no_item_type, 'outtype': ModToolAdd._no_item_type,
+                                  'family': None, 'kernel': 'scalar', 'volk_kernel': None,
+                                  'volk_inputs': [], 'volk_outputs': [], 'volk_args': '',
+                                  'volk_align_type': '', 'hints': [], 'instrument': False, 'affinity': False,
+                                  'async_io': False,
+                                  'bench': False, 'bench_python': False,
+                                  'mod_block_sep': {'37': '/'}.get(version, '_'),
+                                  'block_magic_version': {'37': '2'}.get(version, ''),
+                                  'swigname': 'howto_swig'})
+    for info in [dict(i) for i in infos if i['blocktype'] in ('sync', 'decimator', 'interpolator', 'general')]:
+        info['intype'] = item_types['c']
+        info['outtype'] = item_types['f']
+        if info['lang'] == 'cpp':
+            info['kernel'] = 'volk'
+            info['volk_kernel'] = 'volk_32fc_magnitude_32f'
+            info['volk_inputs'] = [{'name': 'in', 'index': 0, 'ctype': 'lv_32fc_t'}]
+            info['volk_outputs'] = [{'name': 'out', 'index': 0, 'ctype': 'float'}]
+            info['volk_args'] = 'out, in, noutput_items'
+            info['volk_align_type'] = 'float'
+            info['hints'] = [{'call': 'set_history', 'value': 4},
+                             {'call': 'set_min_output_buffer', 'value': 1024}]
+            info['instrument'] = info['affinity'] = info['version'] == '37'
+        infos.append(info)
+    for info in [dict(i) for i in infos if i['blocktype'] in ('source', 'sink')
+                 and (i['lang'], i['version']) == ('cpp', '37')]:
+        info['intype'] = info['outtype'] = item_types['c']
+        info['async_io'] = True
+        info['instrument'] = info['affinity'] = info['arglist'] == ''
+        infos.append(info)
+    return infos
+
+def _family_infos():
+    """ Template variables for a templated family """
+    item_types = ModToolAdd._item_types
+    infos = []
+    for blocktype in ('sync', 'decimator', 'general', 'source'):
+        members = [{'blockname': 'scale_%s' % suffix, 'intype': item_types[suffix[0]],
+                    'outtype': item_types[suffix[-1]]} for suffix in ('ff', 'cf')]
+        infos.append({'modname': 'howto', 'familyname': 'scale', 'members': members,
+                      'blocktype': blocktype, 'arglist': 'float k=1.0',
+                      'license': Templates['defaultlicense'], 'version': '37',
+                      'hints': [{'call': 'set_output_multiple', 'value': 8}],
+                      'affinity': blocktype != 'source'})
+    return infos
+
+def get_samples():
+    """ Return a dict tpl_id -> list of template variables """
+    samples = {}
+    for tpl_id in Templates.keys():
+        samples[tpl_id] = _block_infos()
+    samples['block_family_impl_h'] = samples['block_family_impl_cpp'] = _family_infos()
+    samples['bench_python'] = [{'modname': 'howto', 'blockname': 'square_ff',
+                                'params': params, 'param_names': ', '.join([p['key'] for p in params]),
+                                'inputs': [{'index': 0, 'itemsize': 'gr.sizeof_float',
+                                            'source': 'gr.vector_source_f([1.0], True, 1)'}],
+                                'outputs': [{'index': 0, 'itemsize': 'gr.sizeof_float'}],
+                                'nitems': 10000000}
+                               for params in ([], [{'key': 'k', 'value': '1.0'}])]
+    samples['unity_cmakeentry'] = [{'modname': 'howto', 'group_size': 8}]
+    samples['pch_cmakeentry'] = samples['pch_h'] = [{'modname': 'howto'}]
+    samples['qa_cmakeentry36'] = [{'modname': 'howto', 'basename': 'qa_howto_square_ff',
+                                   'filename': 'qa_howto_square_ff.cc'}]
+    samples['swig_split_cmakeentry'] = [{'modname': 'howto', 'mainswigfile': 'howto_swig.i',
+                                         'swigname': 'howto_swig',
+                                         'swig_make': 'GR_SWIG_MAKE(howto_swig howto_swig.i)'}]
+    return samples
+
+### Benchmark ################################################################
+def render_all(backend, tpl_id, samples):
+    """ Render a template with all its samples. Returns the outputs, an
+    output is None if the backend can't render the sample. """
+    outputs = []
+    for info in samples:
+        tpl = GRMTemplate(Templates[tpl_id], dict(info))
+        try:
+            outputs.append(backend.render(tpl.src, tpl.searchList))
+        except Exception:
+            outputs.append(None)
+    return outputs
+
+def measure(backend, tpl_id, samples, min_time):
+    """ Return the number of rendered templates per second """
+    render_all(backend, tpl_id, samples)
+    (renders, start) = (0, time.time())
+    while renders == 0 or time.time() - start < min_time:
+        render_all(backend, tpl_id, samples)
+        renders += len(samples)
+    return renders / (time.time() - start)
+
+def main():
+    """ Go, go, go! """
+    parser = OptionParser(usage='%prog [options] [template ...]')
+    parser.add_option("-t", "--min-time", type="float", default=0.2,
+            help="Minimum time to render each template, in seconds [default=%default]")
+    (options, args) = parser.parse_args()
+    names = ['builtin']
+    if Cheetah is None:
+        print "Cheetah is not installed, only timing the builtin backend."
+    else:
+        names.append('cheetah')
+    instances = dict([(name, backends[name]()) for name in names])
+    samples = get_samples()
+    tpl_ids = args or sorted(Templates.keys())
+    mismatches = []
+    print "%-24s %8s %12s %12s %8s" % ('Template', 'Samples', 'builtin/s', 'cheetah/s', 'Speedup')
+    for tpl_id in tpl_ids:
+        if tpl_id not in Templates:
+            print "No such template: %s" % tpl_id
+            sys.exit(1)
+        outputs = dict([(name, render_all(instances[name], tpl_id, samples[tpl_id])) for name in names])
+        if 'cheetah' in outputs and outputs['builtin'] != outputs['cheetah']:
+            mismatches.append(tpl_id)
+        ok_samples = [s for (s, out) in zip(samples[tpl_id], outputs['builtin']) if out is not None]
+        if not ok_samples:
+            print "%-24s %8s (not a substituted template)" % (tpl_id, 0)
+            continue
+        rates = dict([(name, measure(instances[name], tpl_id, ok_samples, options.min_time)) for name in names])
+        if 'cheetah' in rates:
+            print "%-24s %8d %12.0f %12.0f %7.1fx" % (tpl_id, len(ok_samples), rates['builtin'],
+                                                      rates['cheetah'], rates['builtin'] / rates['cheetah'])
+        else:
+            print "%-24s %8d %12.0f %12s %8s" % (tpl_id, len(ok_samples), rates['builtin'], '-', '-')
+    if mismatches:
+        print "Output differs from Cheetah for: %s" % ', '.join(mismatches)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
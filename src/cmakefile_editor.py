@@ -40,6 +40,21 @@ class CMakeFileEditor(object):
         regexp = re.compile(regexp, re.MULTILINE)
         self.cfile = re.sub(regexp, '', self.cfile, count=1)
 
+    def append_re_line_sequence(self, linepattern, newline):
+        """ Like util_functions.append_re_line_sequence(), but on the buffer:
+        Paste newline after the last line matching linepattern, or at the
+        end if there is no such line. """
+        lines = re.findall(linepattern, self.cfile, flags=re.MULTILINE)
+        if len(lines) == 0:
+            self.cfile += newline
+            return
+        last_line = lines[-1]
+        self.cfile = self.cfile.replace(last_line, last_line + newline + '\n')
+
+    def append(self, text):
+        """ Append text to the end of the buffer. """
+        self.cfile += text
+
     def write(self):
         """ Write the changes back to the file. """
         open(self.filename, 'w').write(self.cfile)
@@ -1,15 +1,18 @@
 """ A code generator (needed by ModToolAdd) """
 
 from templates import Templates
-import Cheetah.Template
+from template_backend import render_template
 from util_functions import str_to_fancyc_comment
 from util_functions import str_to_python_comment
 from util_functions import strip_default_values
 from util_functions import strip_arg_types
+from util_functions import arg_declarations
 
 ### Code generator class #####################################################
-class GRMTemplate(Cheetah.Template.Template):
-    """ An extended template class """
+class GRMTemplate(object):
+    """ A template with the GNU Radio block types and the helper functions
+    in its search list. Substituted by the template backend when it is
+    turned into a string. """
     def __init__(self, src, searchList):
         self.grtypelist = {
                 'sync': 'gr_sync_block',
@@ -18,15 +21,24 @@ class GRMTemplate(Cheetah.Template.Template):
                 'decimator': 'gr_sync_decimator',
                 'interpolator': 'gr_sync_interpolator',
                 'general': 'gr_block',
+                'tagged_stream': 'gr_tagged_stream_block',
+                'message': 'gr_block',
                 'hier': 'gr_hier_block2',
                 'noblock': ''}
         searchList['str_to_fancyc_comment'] = str_to_fancyc_comment
         searchList['str_to_python_comment'] = str_to_python_comment
         searchList['strip_default_values'] = strip_default_values
         searchList['strip_arg_types'] = strip_arg_types
-        Cheetah.Template.Template.__init__(self, src, searchList=searchList)
-        self.grblocktype = self.grtypelist[searchList['blocktype']]
+        searchList['arg_declarations'] = arg_declarations
+        searchList['grtypelist'] = self.grtypelist
+        if 'blocktype' in searchList:
+            searchList['grblocktype'] = self.grtypelist[searchList['blocktype']]
+        self.src = src
+        self.searchList = searchList
+
+    def __str__(self):
+        return render_template(self.src, self.searchList)
 
 def get_template(tpl_id, **kwargs):
-    """ Return the template given by tpl_id, parsed through Cheetah """
+    """ Return the template given by tpl_id, substituted by the template backend """
     return str(GRMTemplate(Templates[tpl_id], searchList=kwargs))
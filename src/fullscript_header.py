@@ -19,13 +19,29 @@
 #
 
 import sys
+import __builtin__
 import os
 import re
+import copy
+import hashlib
 import glob
+import time
+import errno
+import struct
+import select
+import ctypes
+import ctypes.util
+import subprocess
 import base64
 import tarfile
+import zipfile
+import shutil
+import cStringIO
+import cPickle
+import json
+import multiprocessing
 from datetime import datetime
 from optparse import OptionParser, OptionGroup
-import Cheetah.Template
+from multiprocessing.pool import ThreadPool
 import xml.etree.ElementTree as ET
 
@@ -23,32 +23,97 @@ This is the GNU Radio HOWTO module. Place your Python package
 description here (python/__init__.py).
 '''
 
-# ----------------------------------------------------------------
-# Temporary workaround for ticket:181 (swig+python problem)
-import sys
-_RTLD_GLOBAL = 0
-try:
-    from dl import RTLD_GLOBAL as _RTLD_GLOBAL
-except ImportError:
+import sys as _sys
+import types as _types
+
+# Blocks are only imported when they're used for the first time, so a
+# flowgraph that needs one block doesn't have to load all of them.
+# This table maps the names this package exports to the submodules that
+# define them. gr_modtool keeps it up to date when adding, removing or
+# disabling blocks. Names that aren't in here (e.g. the C++ blocks) are
+# looked up in the SWIG module.
+_lazy_blocks = {
+}
+_swig_module = 'howto_swig'
+
+def _import_swig_module():
+    """ Import the SWIG module """
+    # ----------------------------------------------------------------
+    # Temporary workaround for ticket:181 (swig+python problem)
+    _RTLD_GLOBAL = 0
     try:
-	from DLFCN import RTLD_GLOBAL as _RTLD_GLOBAL
+        from dl import RTLD_GLOBAL as _RTLD_GLOBAL
     except ImportError:
-	pass
+        try:
+            from DLFCN import RTLD_GLOBAL as _RTLD_GLOBAL
+        except ImportError:
+            pass
 
-if _RTLD_GLOBAL != 0:
-    _dlopenflags = sys.getdlopenflags()
-    sys.setdlopenflags(_dlopenflags|_RTLD_GLOBAL)
-# ----------------------------------------------------------------
+    if _RTLD_GLOBAL != 0:
+        _dlopenflags = _sys.getdlopenflags()
+        _sys.setdlopenflags(_dlopenflags|_RTLD_GLOBAL)
+    # ----------------------------------------------------------------
+    try:
+        return __import__(_swig_module, globals(), {}, ['*'])
+    finally:
+        # ----------------------------------------------------------------
+        # Tail of workaround
+        if _RTLD_GLOBAL != 0:
+            _sys.setdlopenflags(_dlopenflags)      # Restore original flags
+        # ----------------------------------------------------------------
+
+class _LazyModule(_types.ModuleType):
+    """ The module object of this package. Imports submodules on demand and
+    copies their names in here, like 'from <submodule> import *' would. """
+    def __init__(self, name, doc=None):
+        _types.ModuleType.__init__(self, name, doc)
+        self.__dict__['_loaded'] = set()
 
+    def _load(self, submodule):
+        """ Import a submodule (once) and copy its exported names """
+        if submodule in self._loaded:
+            return
+        self._loaded.add(submodule)
+        if submodule == _swig_module:
+            module = _import_swig_module()
+        else:
+            module = __import__(submodule, globals(), {}, ['*'])
+        names = getattr(module, '__all__', None)
+        if names is None:
+            names = [n for n in dir(module) if not n.startswith('_')]
+        for name in names:
+            self.__dict__[name] = getattr(module, name)
 
-# import swig generated symbols into the howto namespace
-from howto_swig import *
+    def __getattr__(self, name):
+        if name == '__all__':
+            for submodule in [_swig_module] + sorted(set(_lazy_blocks.values())):
+                self._load(submodule)
+            self.__dict__['__all__'] = sorted(
+                    [n for n in self.__dict__.keys() if not n.startswith('_')])
+            return self.__all__
+        if name.startswith('__'):
+            raise AttributeError(name)
+        submodules = [_lazy_blocks.get(name), _swig_module] + sorted(set(_lazy_blocks.values()))
+        for submodule in submodules:
+            if submodule is None or submodule in self._loaded:
+                continue
+            self._load(submodule)
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'module' object has no attribute '%s'" % name)
 
 # import any pure python here
 #
 
 # ----------------------------------------------------------------
-# Tail of workaround
-if _RTLD_GLOBAL != 0:
-    sys.setdlopenflags(_dlopenflags)      # Restore original flags
+# Replace this module by the lazy one. Everything defined above that's
+# not private is still available from the package.
+_module = _LazyModule(__name__, __doc__)
+for _name in ('__file__', '__path__', '__package__'):
+    if _name in globals():
+        setattr(_module, _name, globals()[_name])
+_module.__dict__.update(
+        [(_name, _value) for (_name, _value) in globals().items() if not _name.startswith('_')])
+_module._original = _sys.modules[__name__] # Keeps our globals alive
+_sys.modules[__name__] = _module
 # ----------------------------------------------------------------
@@ -11,6 +11,8 @@ from modtool_rm import ModToolRemove
 from modtool_newmod import ModToolNewModule
 from modtool_disable import ModToolDisable
 from modtool_makexml import ModToolMakeXML
+from modtool_watch import ModToolWatch
+from modtool_rename import ModToolRename, ModToolRenameModule
 from util_functions import get_command_from_argv
 
 def get_class_dict():
@@ -37,7 +39,11 @@ def main():
         sys.exit(2)
     modtool = cmd_dict[command]()
     modtool.setup()
-    modtool.run()
+    modtool.lock_module()
+    try:
+        modtool.run()
+    finally:
+        modtool.unlock_module()
 
 if __name__ == '__main__':
     if not ((sys.version_info[0] > 2) or
@@ -10,18 +10,27 @@ except ImportError:
 
 class GRCXMLGenerator(object):
     """ Create and write the XML bindings for a GRC block. """
-    def __init__(self, modname=None, blockname=None, doc=None, params=None, iosig=None):
+    def __init__(self, modname=None, blockname=None, doc=None, params=None, iosig=None, msg_ports=None):
         """docstring for __init__"""
         params_list = ['$'+s['key'] for s in params if s['in_constructor']]
+        # Parameters with a setter are applied after the block is made,
+        # if there's a condition (setter_if) only when it holds
+        setter_list = []
+        for param in [s for s in params if 'setter' in s]:
+            setter = 'self.$(id).%s($%s)' % (param['setter'], param['key'])
+            if 'setter_if' in param:
+                setter = '#if %s\n%s\n#end if' % (param['setter_if'], setter)
+            setter_list.append('\n' + setter)
         # Can't make a dict 'cause order matters
         self._header = (('name', blockname.replace('_', ' ').capitalize()),
                         ('key', '%s_%s' % (modname, blockname)),
                         ('category', modname.upper()),
                         ('import', 'import %s' % modname),
-                        ('make', '%s.%s(%s)' % (modname, blockname, ', '.join(params_list)))
+                        ('make', '%s.%s(%s)%s' % (modname, blockname, ', '.join(params_list), ''.join(setter_list)))
                        )
         self.params = params
         self.iosig = iosig
+        self.msg_ports = msg_ports or {'in': [], 'out': []}
         self.doc = doc
         self.root = None
         if LXML_IMPORTED:
@@ -55,6 +64,8 @@ class GRCXMLGenerator(object):
             if len(param['default']):
                 ET.SubElement(param_tag, 'value').text = param['default']
             ET.SubElement(param_tag, 'type').text = param['type']
+            if 'hide' in param:
+                ET.SubElement(param_tag, 'hide').text = param['hide']
         for inout in sorted(iosig.keys()):
             if iosig[inout]['max_ports'] == '0':
                 continue
@@ -74,6 +85,13 @@ class GRCXMLGenerator(object):
                     elif len(iosig[inout]['type']) < int(iosig[inout]['max_ports']):
                         ET.SubElement(s_tag, 'nports').text = str(int(iosig[inout]['max_ports']) -
                                                                   len(iosig[inout]['type'])+1)
+        for inout in ('in', 'out'):
+            for port in self.msg_ports[inout]:
+                s_tag = ET.SubElement(root, {'in': 'sink', 'out': 'source'}[inout])
+                ET.SubElement(s_tag, 'name').text = port
+                ET.SubElement(s_tag, 'type').text = 'message'
+                if inout == 'out':
+                    ET.SubElement(s_tag, 'optional').text = '1'
         if self.doc is not None:
             ET.SubElement(root, 'doc').text = self.doc
         self.root = root
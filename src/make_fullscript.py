@@ -23,18 +23,26 @@ import os
 LIST_OF_FILES = (
         'util_functions.py',
         'templates.py',
+        'template_backend.py',
         'code_generator.py',
         'cmakefile_editor.py',
+        'unity_build.py',
+        'swig_per_block.py',
+        'tree_rewriter.py',
         'modtool_base.py',
         'modtool_info.py',
         'modtool_add.py',
         'modtool_rm.py',
         'modtool_disable.py',
         'newmod_tarfile.py',
+        'newmod_skeleton.py',
         'modtool_newmod.py',
         'parser_cc_block.py',
         'grc_xml_generator.py',
+        'python_bench_generator.py',
         'modtool_makexml.py',
+        'modtool_watch.py',
+        'modtool_rename.py',
         'modtool_help.py',
         'gr_modtool.py')
 
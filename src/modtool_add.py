@@ -3,26 +3,81 @@
 import os
 import sys
 import re
+import json
+import multiprocessing
 from optparse import OptionGroup
 
-from util_functions import append_re_line_sequence, ask_yes_no
+from util_functions import ask_yes_no
 from cmakefile_editor import CMakeFileEditor
 from modtool_base import ModTool
+from unity_build import UnityBuild
+from swig_per_block import PerBlockSwig
+from parser_cc_block import ParserCCBlock, grc_type_translator
+from python_bench_generator import PythonBenchGenerator
 from templates import Templates
 from code_generator import get_template
-import Cheetah.Template
+from template_backend import get_backend, render_template
 
 ### Add new block module #####################################################
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+def _render_template(job):
+    """ Substitute a (tpl_id, info) pair. This is a function, not a method,
+    so it can be sent to the worker processes. """
+    (tpl_id, info) = job
+    return get_template(tpl_id, **info)
+
 class ModToolAdd(ModTool):
     """ Add block to the out-of-tree module. """
     name = 'add'
     aliases = ('insert',)
     _block_types = ('sink', 'source', 'sync', 'decimator', 'interpolator',
-                    'general', 'hier', 'noblock')
+                    'general', 'tagged_stream', 'message', 'hier', 'noblock')
+    _manifest_keys = ('name', 'type', 'lang', 'arglist', 'add_python_qa',
+                      'add_cpp_qa', 'license', 'license_file', 'types', 'templated', 'kernel', 'volk_kernel', 'bench',
+                      'bench_python', 'history', 'output_multiple', 'min_output_buffer', 'max_noutput',
+                      'instrument', 'affinity', 'async_io')
+    # Item types for --types: C++ type, type for sizeof(), GRC type,
+    # NumPy type and the suffix of gr.sizeof_*
+    _item_types = {
+        'b': {'cpp': 'unsigned char', 'size': 'unsigned char', 'grc': 'byte',
+              'numpy': 'numpy.uint8', 'gr_size': 'char', 'vec': 'b'},
+        's': {'cpp': 'short', 'size': 'short', 'grc': 'short',
+              'numpy': 'numpy.int16', 'gr_size': 'short', 'vec': 's'},
+        'i': {'cpp': 'int', 'size': 'int', 'grc': 'int',
+              'numpy': 'numpy.int32', 'gr_size': 'int', 'vec': 'i'},
+        'f': {'cpp': 'float', 'size': 'float', 'grc': 'float',
+              'numpy': 'numpy.float32', 'gr_size': 'float', 'vec': 'f'},
+        'c': {'cpp': 'gr_complex', 'size': 'gr_complex', 'grc': 'complex',
+              'numpy': 'numpy.complex64', 'gr_size': 'gr_complex', 'vec': 'c'},
+    }
+    # Placeholders for blocks without --types
+    _no_item_type = {'cpp': 'float', 'size': '<+float+>',
+                     'grc': '<!-- e.g. int, real, complex, byte, short, xxx_vector, ...-->',
+                     'numpy': '<+numpy.float+>', 'gr_size': '<+float+>',
+                     'vec': '<+f+>'}
+    # C types of the VOLK signatures, and the matching --types codes
+    _volk_types = {'8i': ('int8_t', 'b'), '8ic': ('lv_8sc_t', None),
+                   '16i': ('int16_t', 's'), '16ic': ('lv_16sc_t', None),
+                   '16u': ('uint16_t', None), '32f': ('float', 'f'),
+                   '32fc': ('lv_32fc_t', 'c'), '32i': ('int32_t', 'i'),
+                   '32u': ('uint32_t', None), '64f': ('double', None),
+                   '64u': ('uint64_t', None)}
+    # Buffer and scheduling hints: option, and the gr_block method it calls
+    _hint_calls = (('history', 'set_history'),
+                   ('output_multiple', 'set_output_multiple'),
+                   ('min_output_buffer', 'set_min_output_buffer'),
+                   ('max_noutput', 'set_max_noutput_items'))
     def __init__(self):
         ModTool.__init__(self)
         self._add_cc_qa = False
         self._add_py_qa = False
+        self._blocks = []
+        self._tpl_queue = []
+        self._editors = {}
 
     def setup_parser(self):
         parser = ModTool.setup_parser(self)
@@ -42,12 +97,59 @@ class ModToolAdd(ModTool):
                 help="If given, only source files are written, but CMakeLists.txt files are left unchanged.")
         ogroup.add_option("-l", "--lang", type="choice", choices=('cpp', 'c++', 'python'),
                 default='cpp', help="Language (cpp or python)")
+        ogroup.add_option("--unity-build", type="int", default=None, metavar="N",
+                help="Compile the library in unity builds of N sources each (also sets N if unity builds are already enabled).")
+        ogroup.add_option("--pch", action="store_true", default=False,
+                help="Use a precompiled header for the library (needs CMake 3.16).")
+        ogroup.add_option("--swig-per-block", action="store_true", default=False,
+                help="Switch the module to one SWIG file per block (swig/<block>.i).")
+        ogroup.add_option("--manifest", type="string", default=None,
+                help="Add all blocks described in this YAML or JSON file. The other options are used as defaults for the blocks.")
+        ogroup.add_option("-j", "--jobs", type="int", default=multiprocessing.cpu_count(),
+                help="Number of processes rendering the templates when adding several blocks. Default is the number of CPUs.")
+        ogroup.add_option("--types", type="string", default=None,
+                help="Add a family of blocks, one per item type, e.g. 'ff,cc,ii'. Type codes are b(yte), s(hort), i(nt), f(loat) and c(omplex); the first is the input type, the second the output type (a single code sets both). The blocks are called <name>_<types>.")
+        ogroup.add_option("--templated", action="store_true", default=False,
+                help="With --types, use one templated C++ implementation with explicit instantiations for the whole family.")
+        ogroup.add_option("--kernel", type="choice", choices=('scalar', 'volk'), default='scalar',
+                help="Skeleton of work(): scalar (the default) or volk, which calls the aligned VOLK kernel on aligned buffers and the VOLK dispatcher otherwise.")
+        ogroup.add_option("--volk-kernel", type="string", default='volk_32f_x2_multiply_32f',
+                help="The VOLK kernel called with --kernel volk. Default is volk_32f_x2_multiply_32f.")
+        ogroup.add_option("--bench", action="store_true", default=False,
+                help="Add a C++ benchmark (lib/bench_<block>.cc), which measures the throughput of work() and prints it as JSON.")
+        ogroup.add_option("--bench-python", action="store_true", default=False,
+                help="Add a Python throughput benchmark and regression test (python/bench_<block>.py).")
+        ogroup.add_option("--history", type="int", default=None, metavar="N",
+                help="Call set_history(N) in the constructor, i.e. every work() call sees N-1 items of the previous call.")
+        ogroup.add_option("--output-multiple", type="int", default=None, metavar="N",
+                help="Call set_output_multiple(N) in the constructor, so noutput_items is always a multiple of N.")
+        ogroup.add_option("--min-output-buffer", type="int", default=None, metavar="N",
+                help="Call set_min_output_buffer(N) in the constructor, so the output buffers hold at least N items.")
+        ogroup.add_option("--max-noutput", type="int", default=None, metavar="N",
+                help="Call set_max_noutput_items(N) in the constructor, so work() never gets more than N output items.")
+        ogroup.add_option("--instrument", action="store_true", default=False,
+                help="Record the duration and number of items of every work() call. The statistics are available through getters and, if the module is built with ENABLE_CTRLPORT, through ControlPort.")
+        ogroup.add_option("--affinity", action="store_true", default=False,
+                help="Set the processor affinity and thread priority of the block from its entry in <module>_affinity.conf when it is constructed. makexml adds matching GRC parameters.")
+        ogroup.add_option("--async-io", action="store_true", default=False,
+                help="For sources and sinks: Do the I/O in a thread of its own, which exchanges the items with work() through a lock-free ring buffer (lib/spsc_ring.h), so work() never blocks on I/O.")
         parser.add_option_group(ogroup)
         return parser
 
     def setup(self):
         ModTool.setup(self)
+        get_backend() # Fail early if the template backend is not available
         options = self.options
+        if options.unity_build is not None and options.unity_build < 1:
+            print 'Unity build groups need at least one source.'
+            sys.exit(2)
+        if self._info['version'] == 'autofoo' and not self.options.skip_cmakefiles:
+            print "Warning: Autotools modules are not supported. ",
+            print "Files will be created, but Makefiles will not be edited."
+            self.options.skip_cmakefiles = True
+        if options.manifest is not None:
+            self._setup_manifest(options.manifest)
+            return
         self._info['blocktype'] = options.block_type
         if self._info['blocktype'] is None:
             while self._info['blocktype'] not in self._block_types:
@@ -73,6 +175,7 @@ class ModToolAdd(ModTool):
             print 'Invalid block name.'
             sys.exit(2)
         print "Block/code identifier: " + self._info['blockname']
+        self._check_block_type(self._info)
         self._info['fullblockname'] = self._info['modname'] + '_' + self._info['blockname']
         self._info['license'] = self.setup_choose_license()
 
@@ -89,11 +192,332 @@ class ModToolAdd(ModTool):
             self._add_cc_qa = options.add_cpp_qa
             if self._add_cc_qa is None:
                 self._add_cc_qa = ask_yes_no('Add C++ QA code?', not self._add_py_qa)
-        if self._info['version'] == 'autofoo' and not self.options.skip_cmakefiles:
-            print "Warning: Autotools modules are not supported. ",
-            print "Files will be created, but Makefiles will not be edited."
-            self.options.skip_cmakefiles = True
+        self._blocks = self._expand_family((self._info, self._add_cc_qa, self._add_py_qa),
+                                           options.types, options.templated)
+        for (info, add_cc_qa, add_py_qa) in self._blocks:
+            self._setup_kernel(info, options.kernel, options.volk_kernel)
+            info['bench'] = self._setup_bench(info, options.bench)
+            info['bench_python'] = self._setup_bench_python(info, options.bench_python)
+            info['hints'] = self._setup_hints(info, dict([(key, getattr(options, key))
+                                                          for (key, call) in self._hint_calls]))
+            info['instrument'] = self._setup_instrument(info, options.instrument)
+            info['affinity'] = self._setup_affinity(info, options.affinity)
+            info['async_io'] = self._setup_async_io(info, options.async_io)
+
+    def _setup_manifest(self, fname):
+        """ Read the blocks to add from a manifest. This is either a list of
+        blocks, or a dict with the list under 'blocks'. Every block is a dict
+        with the keys in _manifest_keys, of which only 'name' is required;
+        the others default to the command line options. A 'defaults' dict
+        next to 'blocks' overrides the command line options for all blocks.
+        Example (YAML):
+          defaults: {type: sync, add_python_qa: true}
+          blocks:
+            - {name: scale, arglist: 'float k=1.0'}
+            - {name: framer, type: general, add_cpp_qa: true}
+            - {name: add_const, types: 'ff,cc', templated: true}
+        """
+        try:
+            text = open(fname).read()
+        except IOError:
+            print "Can't read manifest %s." % fname
+            sys.exit(2)
+        try:
+            if yaml is not None:
+                manifest = yaml.safe_load(text)
+            else:
+                manifest = json.loads(text)
+        except Exception: # yaml.YAMLError or ValueError
+            manifest = None
+        if manifest is None:
+            print "Can't parse manifest %s%s." % (fname, {True: '', False: ' (no PyYAML found, so it must be JSON)'}[yaml is not None])
+            sys.exit(2)
+        defaults = {}
+        if isinstance(manifest, dict):
+            defaults = manifest.get('defaults', {})
+            manifest = manifest.get('blocks')
+        if not isinstance(manifest, list) or not isinstance(defaults, dict):
+            print "Manifest %s must contain a list of blocks." % fname
+            sys.exit(2)
+        self._blocks = []
+        names = set()
+        options = self.options
+        for (idx, entry) in enumerate(manifest):
+            if not isinstance(entry, dict) or 'name' not in entry:
+                print "Block #%d in %s has no name." % (idx + 1, fname)
+                sys.exit(2)
+            unknown_keys = [k for k in entry.keys() + defaults.keys() if k not in self._manifest_keys]
+            if unknown_keys:
+                print "Unknown key '%s' in %s (valid keys: %s)." % (unknown_keys[0], fname, ', '.join(self._manifest_keys))
+                sys.exit(2)
+            block = dict(defaults)
+            block.update(entry)
+            family = self._expand_family(self._setup_manifest_block(block),
+                                         block.get('types', options.types),
+                                         bool(block.get('templated', options.templated)))
+            for (info, add_cc_qa, add_py_qa) in family:
+                self._setup_kernel(info, block.get('kernel', options.kernel),
+                                   block.get('volk_kernel', options.volk_kernel))
+                info['bench'] = self._setup_bench(info, bool(block.get('bench', options.bench)))
+                info['bench_python'] = self._setup_bench_python(info, bool(block.get('bench_python', options.bench_python)))
+                info['hints'] = self._setup_hints(info, dict([(key, block.get(key, getattr(options, key)))
+                                                              for (key, call) in self._hint_calls]))
+                info['instrument'] = self._setup_instrument(info, bool(block.get('instrument', options.instrument)))
+                info['affinity'] = self._setup_affinity(info, bool(block.get('affinity', options.affinity)))
+                info['async_io'] = self._setup_async_io(info, bool(block.get('async_io', options.async_io)))
+                if info['blockname'] in names:
+                    print "Block %s is listed twice in %s." % (info['blockname'], fname)
+                    sys.exit(2)
+                names.add(info['blockname'])
+            self._blocks += family
+        if not self._blocks:
+            print "No blocks found in %s." % fname
+            sys.exit(2)
+        print "Adding %d blocks from %s." % (len(self._blocks), fname)
+
+    def _setup_manifest_block(self, block):
+        """ Check a block from the manifest and return the same tuple
+        (info, add C++ QA, add Python QA) the interactive setup creates. """
+        options = self.options
+        info = dict(self._info)
+        info['blockname'] = str(block['name'])
+        info['blocktype'] = block.get('type', options.block_type)
+        info['lang'] = {'c++': 'cpp'}.get(block.get('lang', options.lang), block.get('lang', options.lang))
+        info['arglist'] = str(block.get('arglist', options.argument_list or ''))
+        if not re.match('^[a-zA-Z0-9_]+$', info['blockname']):
+            print 'Invalid block name: %s' % info['blockname']
+            sys.exit(2)
+        if info['blocktype'] not in self._block_types:
+            print 'Block %s: Type must be one of %s' % (info['blockname'], str(self._block_types))
+            sys.exit(2)
+        if info['lang'] not in ('cpp', 'python'):
+            print 'Block %s: Language must be cpp or python.' % info['blockname']
+            sys.exit(2)
+        self._check_block_type(info)
+        if ((self._skip_subdirs['lib'] and info['lang'] == 'cpp')
+             or (self._skip_subdirs['python'] and info['lang'] == 'python')):
+            print "Block %s: Missing or skipping relevant subdir." % info['blockname']
+            sys.exit(1)
+        info['fullblockname'] = info['modname'] + '_' + info['blockname']
+        if 'license' in block:
+            info['license'] = str(block['license'])
+        elif 'license_file' in block:
+            try:
+                info['license'] = open(block['license_file']).read()
+            except IOError:
+                print "Block %s: Can't read license file %s." % (info['blockname'], block['license_file'])
+                sys.exit(2)
+        else:
+            info['license'] = self.setup_choose_license()
+        add_py_qa = False
+        if not (info['blocktype'] in ('noblock') or self._skip_subdirs['python']):
+            add_py_qa = bool(block.get('add_python_qa', options.add_python_qa))
+        add_cc_qa = False
+        if info['lang'] == 'cpp':
+            add_cc_qa = bool(block.get('add_cpp_qa', options.add_cpp_qa))
+        return (info, add_cc_qa, add_py_qa)
+
+    def _check_block_type(self, info):
+        """ Tagged stream and message blocks only exist in the 3.7 C++
+        templates. """
+        if info['blocktype'] in ('tagged_stream', 'message') and (info['lang'] != 'cpp' or info['version'] != '37'):
+            print "Block %s: %s blocks need C++ and a 3.7 module." % (info['blockname'], info['blocktype'])
+            sys.exit(2)
+
+    def _expand_family(self, block, types, templated=False):
+        """ Turn a block into a family with one member per item type, e.g.
+        types 'ff,cc' turns 'scale' into 'scale_ff' and 'scale_cc'.
+        block is an (info, add C++ QA, add Python QA) tuple, a list of
+        these is returned. Without types, this is a list with only the block,
+        which keeps the type placeholders in the templates. """
+        (info, add_cc_qa, add_py_qa) = block
+        info['intype'] = info['outtype'] = self._no_item_type
+        info['family'] = None
+        if types is None:
+            if templated:
+                print "--templated needs --types."
+                sys.exit(2)
+            return [block]
+        if info['blocktype'] in ('noblock', 'message'):
+            print "Block %s: Type families need a block type other than noblock or message." % info['blockname']
+            sys.exit(2)
+        suffixes = [t.strip() for t in str(types).split(',') if t.strip()]
+        if not suffixes:
+            print "Block %s: No types given." % info['blockname']
+            sys.exit(2)
+        for suffix in suffixes:
+            if not re.match('^[%s]{1,2}$' % ''.join(self._item_types.keys()), suffix):
+                print "Block %s: Invalid types '%s' (one or two of the codes b, s, i, f, c)." % (info['blockname'], suffix)
+                sys.exit(2)
+            if suffixes.count(suffix) > 1:
+                print "Block %s: Types '%s' are given twice." % (info['blockname'], suffix)
+                sys.exit(2)
+        if templated and (info['version'] != '37' or info['lang'] != 'cpp'
+                          or info['blocktype'] in ('hier', 'tagged_stream')):
+            print "Block %s: Templated families need a C++ block (not hier or tagged_stream) and the 3.7 API." % info['blockname']
+            sys.exit(2)
+        family = {'familyname': info['blockname'], 'templated': templated, 'members': []}
+        blocks = []
+        for suffix in suffixes:
+            member = dict(info)
+            member['blockname'] = '%s_%s' % (info['blockname'], suffix)
+            member['fullblockname'] = member['modname'] + '_' + member['blockname']
+            member['intype'] = self._item_types[suffix[0]]
+            member['outtype'] = self._item_types[suffix[-1]]
+            member['family'] = family
+            family['members'].append(dict([(k, member[k]) for k in ('blockname', 'intype', 'outtype')]))
+            blocks.append((member, add_cc_qa, add_py_qa))
+        print "Type family: " + ', '.join([m['blockname'] for m in family['members']])
+        return blocks
+
+    def _setup_kernel(self, info, kernel, volk_kernel):
+        """ Set the template variables for the work() skeleton. For VOLK,
+        the buffers and the call are derived from the kernel name, which
+        lists the input signatures, the operation and the output signatures,
+        e.g. volk_32f_x2_multiply_32f has two float inputs and a float
+        output. If the buffer types are known, they also set the item types
+        of the io signatures. """
+        info['kernel'] = kernel
+        info['volk_kernel'] = volk_kernel
+        info['volk_inputs'] = []
+        info['volk_outputs'] = []
+        info['volk_args'] = ''
+        info['volk_align_type'] = ''
+        if kernel != 'volk':
+            return
+        if info['lang'] != 'cpp' or info['blocktype'] not in ('sync', 'decimator', 'interpolator', 'general'):
+            print "Block %s: VOLK kernels need a C++ sync, decimator, interpolator or general block." % info['blockname']
+            sys.exit(2)
+        if info['family'] is not None:
+            print "Block %s: VOLK kernels have fixed types and can't be used with --types." % info['blockname']
+            sys.exit(2)
+        if not re.match(r'^volk_\w+$', str(volk_kernel)):
+            print "Block %s: Invalid VOLK kernel '%s'." % (info['blockname'], volk_kernel)
+            sys.exit(2)
+        signatures = ([], []) # Inputs, outputs
+        direction = 0
+        for token in volk_kernel[len('volk_'):].split('_'):
+            if re.match(r'^s?\d+[a-z]+$', token):
+                signatures[direction].append(token)
+            elif re.match(r'^x\d+$', token) and signatures[direction]:
+                signatures[direction].extend(signatures[direction][-1:] * (int(token[1:]) - 1))
+            else: # Part of the operation, outputs follow
+                direction = 1
+        args = []
+        for (direction, key, prefix, scalar) in ((1, 'volk_outputs', 'out', '<+&result+>'),
+                                                 (0, 'volk_inputs', 'in', '<+scalar+>')):
+            buffers = [sig for sig in signatures[direction] if sig[0] != 's']
+            for sig in signatures[direction]:
+                if sig[0] == 's':
+                    args.append(scalar)
+                    continue
+                name = prefix
+                if len(buffers) > 1:
+                    name += str(len(info[key]))
+                info[key].append({'name': name, 'index': len(info[key]),
+                                  'ctype': self._volk_types.get(sig, ('<+type+>', None))[0]})
+                args.append(name)
+            if buffers and self._volk_types.get(buffers[0], (None, None))[1] is not None:
+                info[{0: 'intype', 1: 'outtype'}[direction]] = self._item_types[self._volk_types[buffers[0]][1]]
+        if not info['volk_inputs'] + info['volk_outputs']:
+            print "Block %s: Can't find any buffers in the signature of %s." % (info['blockname'], volk_kernel)
+            sys.exit(2)
+        info['volk_args'] = ', '.join(args + ['noutput_items'])
+        info['volk_align_type'] = (info['volk_outputs'] + info['volk_inputs'])[0]['ctype']
+        print "VOLK kernel: %s (%s)" % (volk_kernel, info['volk_args'])
+
+    def _setup_bench(self, info, bench):
+        """ Check if a benchmark can be added to the block described by
+        info. The benchmark calls work() directly, so the block must be a
+        C++ block derived from gr_sync_block. """
+        if not bench:
+            return False
+        if info['lang'] != 'cpp' or info['blocktype'] not in ('sync', 'decimator', 'interpolator', 'source', 'sink'):
+            print "Block %s: Benchmarks need a C++ sync, decimator, interpolator, source or sink block." % info['blockname']
+            sys.exit(2)
+        return True
+
+    def _setup_bench_python(self, info, bench_python):
+        """ Check if a Python benchmark can be added to the block described
+        by info. It is created from the parsed C++ code of the block. """
+        if not bench_python:
+            return False
+        if (info['lang'] != 'cpp' or info['blocktype'] in ('noblock', 'tagged_stream', 'message')
+                or self._skip_subdirs['python']):
+            print "Block %s: Python benchmarks need a C++ stream block (not tagged_stream) and the python/ subdir." % info['blockname']
+            sys.exit(2)
+        return True
+
+    def _setup_hints(self, info, values):
+        """ Check the buffer and scheduling hints (a dict option -> value or
+        None) and return the calls for the constructor, in the order of
+        _hint_calls. The hints are methods of gr_block, so they need a C++
+        block that has a scheduler of its own. """
+        hints = []
+        for (key, call) in self._hint_calls:
+            if values[key] is None:
+                continue
+            try:
+                value = int(values[key])
+            except ValueError:
+                value = 0
+            if value < 1:
+                print "Block %s: --%s must be a positive number." % (info['blockname'], key.replace('_', '-'))
+                sys.exit(2)
+            hints.append({'call': call, 'value': value})
+        if not hints:
+            return hints
+        if info['lang'] != 'cpp' or info['blocktype'] in ('hier', 'message', 'noblock'):
+            print "Block %s: Buffer and scheduling hints need a C++ block other than hier, message or noblock." % info['blockname']
+            sys.exit(2)
+        if info['blocktype'] == 'tagged_stream' and (values['history'] is not None or values['output_multiple'] is not None):
+            print "Block %s: Tagged stream blocks work on whole packets, so --history and --output-multiple don't apply." % info['blockname']
+            sys.exit(2)
+        if values['history'] is not None and info['blocktype'] == 'source':
+            print "Block %s: Sources have no input, so they have no history." % info['blockname']
+            sys.exit(2)
+        if values['output_multiple'] is not None and info['kernel'] == 'volk':
+            print "Block %s: VOLK kernels set their own output multiple." % info['blockname']
+            sys.exit(2)
+        return hints
 
+    def _setup_instrument(self, info, instrument):
+        """ Check if the block described by info can record work()
+        statistics. The code is part of the 3.7 block templates. """
+        if not instrument:
+            return False
+        if info['lang'] != 'cpp' or info['version'] != '37' or info['blocktype'] in ('hier', 'message', 'noblock'):
+            print "Block %s: Instrumentation needs a C++ block (other than hier, message or noblock) in a 3.7 module." % info['blockname']
+            sys.exit(2)
+        if info['family'] is not None and info['family']['templated']:
+            print "Block %s: Instrumentation can't be used with --templated." % info['blockname']
+            sys.exit(2)
+        return True
+
+    def _setup_affinity(self, info, affinity):
+        """ Check if the block described by info can read its thread policy
+        from the policy file. This needs a block with a thread of its own,
+        and the helper in lib/ is written for the 3.7 API. """
+        if not affinity:
+            return False
+        if info['lang'] != 'cpp' or info['version'] != '37' or info['blocktype'] in ('hier', 'noblock'):
+            print "Block %s: --affinity needs a C++ block (other than hier or noblock) in a 3.7 module." % info['blockname']
+            sys.exit(2)
+        return True
+
+    def _setup_async_io(self, info, async_io):
+        """ Check if the block described by info can do its I/O in a thread
+        of its own. Only sources and sinks do I/O, and the ring buffer and
+        the thread are part of the 3.7 block templates. """
+        if not async_io:
+            return False
+        if info['lang'] != 'cpp' or info['version'] != '37' or info['blocktype'] not in ('source', 'sink'):
+            print "Block %s: --async-io needs a C++ source or sink in a 3.7 module." % info['blockname']
+            sys.exit(2)
+        if info['family'] is not None and info['family']['templated']:
+            print "Block %s: --async-io can't be used with --templated." % info['blockname']
+            sys.exit(2)
+        return True
 
     def setup_choose_license(self):
         """ Select a license by the following rules, in this order:
@@ -111,13 +535,83 @@ class ModToolAdd(ModTool):
         else:
             return Templates['defaultlicense']
 
-    def _write_tpl(self, tpl, path, fname):
-        """ Shorthand for writing a substituted template to a file"""
+    def _write_tpl(self, tpl, path, fname, mode=None, **extra_info):
+        """ Shorthand for writing a substituted template to a file.
+        extra_info is added to the template variables from self._info.
+        The file is written by _render_templates(). """
         print "Adding file '%s'..." % fname
-        open(os.path.join(path, fname), 'w').write(get_template(tpl, **self._info))
+        info = dict(self._info)
+        info.update(extra_info)
+        self._tpl_queue.append((tpl, info, os.path.join(path, fname), mode))
+
+    def _render_templates(self):
+        """ Substitute and write all templates queued by _write_tpl().
+        Substituting is CPU-bound, so if there are several blocks, it is
+        spread over a pool of processes. """
+        jobs = [(tpl, info) for (tpl, info, fname, mode) in self._tpl_queue]
+        num_procs = min(self.options.jobs, len(jobs))
+        if len(self._blocks) > 1 and num_procs > 1:
+            pool = multiprocessing.Pool(num_procs)
+            try:
+                texts = pool.map(_render_template, jobs)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            texts = map(_render_template, jobs)
+        for (text, (tpl, info, fname, mode)) in zip(texts, self._tpl_queue):
+            open(fname, 'w').write(text)
+            if mode is not None:
+                os.chmod(fname, mode)
+        self._tpl_queue = []
+
+    def _get_editor(self, filename, separator=' '):
+        """ Return an editor for filename. Editors are shared between all
+        blocks, so every file is read and written only once; see
+        _write_editors(). """
+        if filename not in self._editors:
+            self._editors[filename] = CMakeFileEditor(filename)
+        self._editors[filename].separator = separator
+        return self._editors[filename]
+
+    def _write_editors(self):
+        """ Write back all files changed through _get_editor() """
+        for filename in sorted(self._editors.keys()):
+            self._editors[filename].write()
+        self._editors = {}
 
     def run(self):
         """ Go, go, go. """
+        for (info, add_cc_qa, add_py_qa) in self._blocks:
+            (self._info, self._add_cc_qa, self._add_py_qa) = (info, add_cc_qa, add_py_qa)
+            if len(self._blocks) > 1:
+                print "Block %s (%s, %s):" % (info['blockname'], info['blocktype'], info['lang'])
+            self._run_block()
+        if [b for b in self._blocks if b[0]['kernel'] == 'volk'] and not self.options.skip_cmakefiles:
+            self._run_volk_cmake()
+        if [b for b in self._blocks if b[0]['instrument']] and not self.options.skip_cmakefiles:
+            self._run_ctrlport_cmake()
+            self._require_boost_version('1.53', 'Instrumented blocks use boost::atomic')
+        if [b for b in self._blocks if b[0]['affinity']]:
+            self._run_thread_policy()
+        if [b for b in self._blocks if b[0]['async_io']]:
+            self._run_async_io()
+        self._render_templates()
+        for (info, add_cc_qa, add_py_qa) in self._blocks:
+            if info['bench_python']:
+                self._info = info
+                self._run_python_bench()
+        self._write_editors()
+        has_lib = [b for b in self._blocks if b[0]['lang'] == 'cpp']
+        if has_lib and not self.options.skip_cmakefiles:
+            unity = UnityBuild(self._info['modname'])
+            if self.options.unity_build is not None or self.options.pch:
+                unity.enable(self.options.unity_build, self.options.pch)
+            else:
+                unity.update()
+
+    def _run_block(self):
+        """ Add the block described by self._info """
         has_swig = (
                 self._info['lang'] == 'cpp'
                 and not self._skip_subdirs['swig']
@@ -157,17 +651,16 @@ class ModToolAdd(ModTool):
             self._write_tpl('qa_h',   'lib', fname_qa_h)
             if not self.options.skip_cmakefiles:
                 try:
-                    append_re_line_sequence(self._file['cmlib'],
-                                            '\$\{CMAKE_CURRENT_SOURCE_DIR\}/qa_%s.cc.*\n' % self._info['modname'],
-                                            '  ${CMAKE_CURRENT_SOURCE_DIR}/qa_%s.cc' % self._info['blockname'])
-                    append_re_line_sequence(self._file['qalib'],
-                                            '#include.*\n',
-                                            '#include "%s"' % fname_qa_h)
-                    append_re_line_sequence(self._file['qalib'],
-                                            '(addTest.*suite.*\n|new CppUnit.*TestSuite.*\n)',
-                                            '  s->addTest(gr::%s::qa_%s::suite());' % (self._info['modname'],
-                                                                                       self._info['blockname'])
-                                            )
+                    self._get_editor(self._file['cmlib']).append_re_line_sequence(
+                            '\$\{CMAKE_CURRENT_SOURCE_DIR\}/qa_%s.cc.*\n' % self._info['modname'],
+                            '  ${CMAKE_CURRENT_SOURCE_DIR}/qa_%s.cc' % self._info['blockname'])
+                    ed = self._get_editor(self._file['qalib'])
+                    ed.append_re_line_sequence('#include.*\n',
+                                               '#include "%s"' % fname_qa_h)
+                    ed.append_re_line_sequence('(addTest.*suite.*\n|new CppUnit.*TestSuite.*\n)',
+                                               '  s->addTest(gr::%s::qa_%s::suite());' % (self._info['modname'],
+                                                                                          self._info['blockname'])
+                                              )
                 except IOError:
                     print "Can't add C++ QA files."
         def _add_qa36():
@@ -175,30 +668,44 @@ class ModToolAdd(ModTool):
             fname_qa_cc = 'qa_%s.cc' % self._info['fullblockname']
             self._write_tpl('qa_cpp36', 'lib', fname_qa_cc)
             if not self.options.skip_cmakefiles:
-                open(self._file['cmlib'], 'a').write(
-                        str(
-                            Cheetah.Template.Template(
-                                Templates['qa_cmakeentry36'],
-                                searchList={'basename': os.path.splitext(fname_qa_cc)[0],
-                                            'filename': fname_qa_cc,
-                                            'modname': self._info['modname']
-                                           }
-                            )
-                         )
+                ed = self._get_editor(self._file['cmlib'])
+                ed.append(
+                        render_template(
+                            Templates['qa_cmakeentry36'],
+                            {'basename': os.path.splitext(fname_qa_cc)[0],
+                             'filename': fname_qa_cc,
+                             'modname': self._info['modname']
+                            }
+                        )
                 )
-                ed = CMakeFileEditor(self._file['cmlib'])
                 ed.remove_double_newlines()
-                ed.write()
+        def _add_bench():
+            " Add a C++ benchmark executable "
+            fname_bench = 'bench_%s.cc' % self._info['blockname']
+            self._write_tpl('bench_cpp', 'lib', fname_bench)
+            if not self.options.skip_cmakefiles:
+                ed = self._get_editor(self._file['cmlib'])
+                ed.append(get_template('bench_cmakeentry', **self._info))
+                ed.remove_double_newlines()
         fname_cc = None
         fname_h  = None
+        family = self._info['family']
         if self._info['version']  == '37':
             fname_h  = self._info['blockname'] + '.h'
             fname_cc = self._info['blockname'] + '.cc'
-            if self._info['blocktype'] in ('source', 'sink', 'sync', 'decimator',
-                                           'interpolator', 'general', 'hier'):
-                fname_cc = self._info['blockname'] + '_impl.cc'
-                self._write_tpl('block_impl_h',   'lib', self._info['blockname'] + '_impl.h')
-            self._write_tpl('block_impl_cpp', 'lib', fname_cc)
+            if family is not None and family['templated']:
+                # One implementation for all members, added with the first one
+                fname_cc = None
+                if self._info['blockname'] == family['members'][0]['blockname']:
+                    fname_cc = family['familyname'] + '_impl.cc'
+                    self._write_tpl('block_family_impl_h', 'lib', family['familyname'] + '_impl.h', **family)
+                    self._write_tpl('block_family_impl_cpp', 'lib', fname_cc, **family)
+            else:
+                if self._info['blocktype'] in ('source', 'sink', 'sync', 'decimator', 'interpolator',
+                                               'general', 'tagged_stream', 'message', 'hier'):
+                    fname_cc = self._info['blockname'] + '_impl.cc'
+                    self._write_tpl('block_impl_h',   'lib', self._info['blockname'] + '_impl.h')
+                self._write_tpl('block_impl_cpp', 'lib', fname_cc)
             self._write_tpl('block_def_h',    self._info['includedir'], fname_h)
         else: # Pre-3.7 or autotools
             fname_h  = self._info['fullblockname'] + '.h'
@@ -206,12 +713,9 @@ class ModToolAdd(ModTool):
             self._write_tpl('block_h36',   self._info['includedir'], fname_h)
             self._write_tpl('block_cpp36', 'lib',                    fname_cc)
         if not self.options.skip_cmakefiles:
-            ed = CMakeFileEditor(self._file['cmlib'])
-            ed.append_value('add_library', fname_cc)
-            ed.write()
-            ed = CMakeFileEditor(self._file['cminclude'])
-            ed.append_value('install', fname_h, 'DESTINATION[^()]+')
-            ed.write()
+            if fname_cc is not None:
+                self._get_editor(self._file['cmlib']).append_value('add_library', fname_cc)
+            self._get_editor(self._file['cminclude']).append_value('install', fname_h, 'DESTINATION[^()]+')
         if self._add_cc_qa:
             if self._info['version'] == '37':
                 _add_qa()
@@ -219,14 +723,116 @@ class ModToolAdd(ModTool):
                 _add_qa36()
             elif self._info['version'] == 'autofoo':
                 print "Warning: C++ QA files not supported for autotools."
+        if self._info['bench']:
+            _add_bench()
+
+    def _run_volk_cmake(self):
+        """ Make the module find and link VOLK, unless it already does.
+        - add cmake/Modules/FindVolk.cmake
+        - find VOLK and add its include path in the top-level CMakeLists.txt
+        - link the library against it
+        """
+        fname_find = os.path.join('cmake', 'Modules', 'FindVolk.cmake')
+        if os.path.isdir(os.path.dirname(fname_find)) and not os.path.isfile(fname_find):
+            print "Adding file '%s'..." % fname_find
+            open(fname_find, 'w').write(Templates['find_volk_cmake'])
+        ed = self._get_editor('CMakeLists.txt', '\n    ')
+        if not re.search(r'^find_package\(Volk\)', ed.cfile, flags=re.MULTILINE|re.IGNORECASE):
+            print "Editing CMakeLists.txt..."
+            ed.append_re_line_sequence(r'^find_package\(.*\n', 'find_package(Volk)')
+            checks = list(re.finditer(r'^if\(NOT \w+_FOUND\)\n[^\n]*\nendif\(\)[^\n]*\n', ed.cfile, flags=re.MULTILINE))
+            if checks:
+                volk_check = '\nif(NOT VOLK_FOUND)\n    message(FATAL_ERROR "Volk required to compile %s")\nendif()\n' % (
+                        self._info['modname'])
+                ed.cfile = ed.cfile[:checks[-1].end()] + volk_check + ed.cfile[checks[-1].end():]
+            ed.append_value('include_directories', '${VOLK_INCLUDE_DIRS}')
+        ed = self._get_editor(self._file['cmlib'])
+        if not re.search(r'\$\{VOLK_LIBRARIES\}', ed.cfile):
+            ed.append_value('target_link_libraries', '${VOLK_LIBRARIES}')
+
+    def _run_ctrlport_cmake(self):
+        """ Add the ENABLE_CTRLPORT option, which exports the statistics of
+        instrumented blocks through ControlPort, to lib/CMakeLists.txt
+        unless it's already there. """
+        ed = self._get_editor(self._file['cmlib'])
+        if not re.search(r'^option\(ENABLE_CTRLPORT\b', ed.cfile, flags=re.MULTILINE):
+            ed.append(Templates['ctrlport_cmakeentry'])
+            ed.remove_double_newlines()
+
+    def _require_boost_version(self, version, reason):
+        """ Raise the Boost version required by find_package() in the
+        top-level CMakeLists.txt to version, unless it's already as high.
+        reason is printed along with the change. """
+        ed = self._get_editor('CMakeLists.txt')
+        mobj = re.search(r'^find_package\(Boost(\s+"?([0-9.]+)"?)?', ed.cfile, flags=re.MULTILINE)
+        if mobj is None:
+            print "Warning: No find_package(Boost) in CMakeLists.txt. %s, which needs Boost %s." % (reason, version)
+            return
+        to_tuple = lambda v: tuple([int(x) for x in v.split('.') if x])
+        if mobj.group(2) is not None and to_tuple(mobj.group(2)) >= to_tuple(version):
+            return
+        print "Editing CMakeLists.txt (%s, which needs Boost %s)..." % (reason, version)
+        ed.cfile = ed.cfile[:mobj.end(0) - len(mobj.group(1) or '')] + (' "%s"' % version) + ed.cfile[mobj.end(0):]
+
+    def _run_thread_policy(self):
+        """ Add the thread policy of the blocks with --affinity.
+        - add lib/thread_policy.{h,cc}, which read the policy file, unless
+          they're already there
+        - add an entry for every new block to <module>_affinity.conf
+        - build thread_policy.cc and install the policy file
+        """
+        for fname in ('thread_policy.h', 'thread_policy.cc'):
+            if not os.path.isfile(os.path.join('lib', fname)):
+                self._write_tpl(fname.replace('.', '_'), 'lib', fname)
+        fname_conf = '%s_affinity.conf' % self._info['modname']
+        if not os.path.isfile(fname_conf):
+            print "Adding file '%s'..." % fname_conf
+            open(fname_conf, 'w').write(get_template('affinity_conf', **self._info))
+        conf = open(fname_conf).read()
+        for (info, add_cc_qa, add_py_qa) in self._blocks:
+            if info['affinity'] and not re.search(r'^\s*%s\s' % re.escape(info['blockname']), conf, flags=re.MULTILINE):
+                print "Adding %s to %s..." % (info['blockname'], fname_conf)
+                open(fname_conf, 'a').write('%-23s %-8s %s\n' % (info['blockname'], '-', '-'))
+        if self.options.skip_cmakefiles:
+            return
+        ed = self._get_editor(self._file['cmlib'])
+        if not re.search(r'\bthread_policy\.cc\b', ed.cfile):
+            ed.append_value('add_library', 'thread_policy.cc')
+            ed.append(get_template('thread_policy_cmakeentry', **self._info))
+            ed.remove_double_newlines()
+
+    def _run_async_io(self):
+        """ Add what the blocks with --async-io need.
+        - add lib/spsc_ring.h, the ring buffer between work() and the I/O
+          thread, unless it's already there
+        - link Boost.Thread, require a Boost with boost::atomic
+        """
+        if not os.path.isfile(os.path.join('lib', 'spsc_ring.h')):
+            self._write_tpl('spsc_ring_h', 'lib', 'spsc_ring.h')
+        if self.options.skip_cmakefiles:
+            return
+        ed = self._get_editor('CMakeLists.txt')
+        mobj = re.search(r'^find_package\(Boost\b[^()]*\bCOMPONENTS\b([^()]*)\)', ed.cfile, flags=re.MULTILINE)
+        if mobj is None:
+            print "Warning: No Boost components in CMakeLists.txt, make sure Boost.Thread is linked."
+        elif 'thread' not in mobj.group(1).split():
+            print "Editing CMakeLists.txt..."
+            ed.cfile = ed.cfile[:mobj.end(1)] + ' thread' + ed.cfile[mobj.end(1):]
+        self._require_boost_version('1.53', 'The ring of --async-io blocks uses boost::atomic')
 
     def _run_swig(self):
         """ Do everything that needs doing in the subdir 'swig'.
-        - Edit main *.i file
+        - Edit main *.i file, or add a per-block *.i file
         """
         if self._get_mainswigfile() is None:
             print 'Warning: No main swig file found.'
             return
+        swig = PerBlockSwig(self._info['modname'], self._get_mainswigfile())
+        if self.options.swig_per_block:
+            swig.enable(self._info['version'], not self.options.skip_cmakefiles)
+        if swig.is_enabled():
+            swig.add_block(self._info, not self.options.skip_cmakefiles)
+            return
         print "Editing %s..." % self._file['swig']
         mod_block_sep = '/'
         if self._info['version'] == '36':
@@ -236,14 +842,13 @@ class ModToolAdd(ModTool):
                 self._info['modname'],
                 mod_block_sep,
                 self._info['blockname'])
-        if re.search('#include', open(self._file['swig'], 'r').read()):
-            append_re_line_sequence(self._file['swig'], '^#include.*\n', include_str)
+        ed = self._get_editor(self._file['swig'])
+        if re.search('#include', ed.cfile):
+            ed.append_re_line_sequence('^#include.*\n', include_str)
         else: # I.e., if the swig file is empty
-            oldfile = open(self._file['swig'], 'r').read()
             regexp = re.compile('^%\{\n', re.MULTILINE)
-            oldfile = regexp.sub('%%{\n%s\n' % include_str, oldfile, count=1)
-            open(self._file['swig'], 'w').write(oldfile)
-        open(self._file['swig'], 'a').write(swig_block_magic_str)
+            ed.cfile = regexp.sub('%%{\n%s\n' % include_str, ed.cfile, count=1)
+        ed.append(swig_block_magic_str)
 
     def _run_python_qa(self):
         """ Do everything that needs doing in the subdir 'python' to add
@@ -252,32 +857,69 @@ class ModToolAdd(ModTool):
         - include in CMakeLists.txt
         """
         fname_py_qa = 'qa_' + self._info['blockname'] + '.py'
-        self._write_tpl('qa_python', 'python', fname_py_qa)
-        os.chmod(os.path.join('python', fname_py_qa), 0755)
-        if self.options.skip_cmakefiles or CMakeFileEditor(self._file['cmpython']).check_for_glob('qa_*.py'):
+        self._write_tpl('qa_python', 'python', fname_py_qa, 0755)
+        if self.options.skip_cmakefiles or self._get_editor(self._file['cmpython']).check_for_glob('qa_*.py'):
             return
         print "Editing python/CMakeLists.txt..."
-        open(self._file['cmpython'], 'a').write(
+        self._get_editor(self._file['cmpython']).append(
                 'GR_ADD_TEST(qa_%s ${PYTHON_EXECUTABLE} ${CMAKE_CURRENT_SOURCE_DIR}/%s)\n' % \
                   (self._info['blockname'], fname_py_qa))
 
+    def _run_python_bench(self):
+        """ Add a Python benchmark for the block in self._info. Its
+        flow graph is built from the io signature of the C++ code, so this
+        must run after the templates are written.
+        - add bench_*.py file
+        - run it as a test from CMakeLists.txt
+        """
+        blockname = self._info['blockname']
+        template_args = None
+        if self._info['version'] == '37':
+            fname_cc = os.path.join('lib', blockname + '_impl.cc')
+            fname_h  = os.path.join(self._info['includedir'], blockname + '.h')
+            if self._info['family'] is not None and self._info['family']['templated']:
+                fname_cc = os.path.join('lib', self._info['family']['familyname'] + '_impl.cc')
+                template_args = {'IN_T': self._info['intype']['cpp'], 'OUT_T': self._info['outtype']['cpp']}
+        else:
+            fname_cc = os.path.join('lib', self._info['fullblockname'] + '.cc')
+            fname_h  = os.path.join(self._info['includedir'], self._info['fullblockname'] + '.h')
+        parser = ParserCCBlock(fname_cc, fname_h, blockname, self._info['version'], grc_type_translator,
+                               template_args)
+        try:
+            params = parser.read_params()
+        except ValueError as ve:
+            print "Not adding a benchmark for %s. %s" % (blockname, ve.args[0])
+            return
+        bench_generator = PythonBenchGenerator(self._info['modname'], blockname,
+                                               params, parser.read_io_signature())
+        fname_bench = 'bench_%s.py' % blockname
+        print "Adding file '%s'..." % fname_bench
+        bench_generator.save(os.path.join('python', fname_bench))
+        if self.options.skip_cmakefiles:
+            return
+        self._get_editor(self._file['cmpython']).append(bench_generator.cmake_entry())
+
     def _run_python(self):
         """ Do everything that needs doing in the subdir 'python' to add
         a Python block.
         - add .py file
         - include in CMakeLists.txt
-        - include in __init__.py
+        - include in __init__.py (or its table of lazily loaded blocks)
         """
         fname_py = self._info['blockname'] + '.py'
         self._write_tpl('block_python', 'python', fname_py)
-        append_re_line_sequence(self._file['pyinit'],
-                                '(^from.*import.*\n|# import any pure.*\n)',
-                                'from %s import *' % self._info['blockname'])
+        ed = self._get_editor(self._file['pyinit'])
+        lazy_table_re = re.compile(r'^(_lazy_blocks\s*=\s*\{[^{}]*?)(^\})', re.MULTILINE)
+        if lazy_table_re.search(ed.cfile):
+            print "Editing %s..." % self._file['pyinit']
+            entry = "    '%s': '%s',\n" % (self._info['blockname'], self._info['blockname'])
+            ed.cfile = lazy_table_re.sub(lambda mobj: mobj.group(1) + entry + mobj.group(2), ed.cfile, count=1)
+        else:
+            ed.append_re_line_sequence('(^from.*import.*\n|# import any pure.*\n)',
+                                       'from %s import *' % self._info['blockname'])
         if self.options.skip_cmakefiles:
             return
-        ed = CMakeFileEditor(self._file['cmpython'])
-        ed.append_value('GR_PYTHON_INSTALL', fname_py, 'DESTINATION[^()]+')
-        ed.write()
+        self._get_editor(self._file['cmpython']).append_value('GR_PYTHON_INSTALL', fname_py, 'DESTINATION[^()]+')
 
     def _run_grc(self):
         """ Do everything that needs doing in the subdir 'grc' to add
@@ -287,10 +929,11 @@ class ModToolAdd(ModTool):
         """
         fname_grc = self._info['fullblockname'] + '.xml'
         self._write_tpl('grc_xml', 'grc', fname_grc)
-        ed = CMakeFileEditor(self._file['cmgrc'], '\n    ')
-        if self.options.skip_cmakefiles or ed.check_for_glob('*.xml'):
+        if self.options.skip_cmakefiles:
+            return
+        ed = self._get_editor(self._file['cmgrc'], '\n    ')
+        if ed.check_for_glob('*.xml'):
             return
         print "Editing grc/CMakeLists.txt..."
         ed.append_value('install', fname_grc, 'DESTINATION[^()]+')
-        ed.write()
 
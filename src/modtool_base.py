@@ -3,14 +3,23 @@
 import os
 import re
 import sys
+import time
+import errno
 from optparse import OptionParser, OptionGroup
 
 from util_functions import get_modname
 from templates import Templates
 
 ### ModTool base class #######################################################
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 class ModTool(object):
     """ Base class for all modtool command classes. """
+    _lock_mode = 'exclusive'
+    _lock_file = '.gr_modtool.lock'
     def __init__(self):
         self._subdirs = ['lib', 'include', 'python', 'swig', 'grc'] # List subdirs where stuff happens
         self._has_subdirs = {}
@@ -24,6 +33,8 @@ class ModTool(object):
         self.args = None
         self.options = None
         self._dir = None
+        self._lock_fid = None
+        self._lock_path = None
 
     def setup_parser(self):
         """ Init the option parser. If derived classes need to add options,
@@ -45,6 +56,8 @@ class ModTool(object):
                 help="Don't do anything in the python/ subdirectory.")
         ogroup.add_option("--skip-grc", action="store_true", default=False,
                 help="Don't do anything in the grc/ subdirectory.")
+        ogroup.add_option("--lock-timeout", type="float", default=60,
+                help="Seconds to wait for other gr_modtool instances working on the same module. Default is 60.")
         parser.add_option_group(ogroup)
         return parser
 
@@ -130,6 +143,78 @@ class ModTool(object):
                 return fname
         return None
 
+    def _get_lock_file(self):
+        """ Return the path of the lock file. It goes into .git/ or build/
+        if the module has one, so it doesn't show up as an untracked file. """
+        if os.path.isdir('.git'):
+            return os.path.join('.git', 'gr_modtool.lock')
+        if os.path.isdir('build'):
+            return os.path.join('build', self._lock_file)
+        return self._lock_file
+
+    def lock_module(self, mode=None):
+        """ Take an advisory lock on the module in the current directory, so
+        concurrent gr_modtool runs don't lose each other's edits.
+        mode is 'shared' for read-only commands or 'exclusive' for commands
+        that change files, and defaults to the command's _lock_mode.
+        Waits for --lock-timeout seconds, then quits. """
+        if mode is None:
+            mode = self._lock_mode
+        if mode is None or fcntl is None or self._lock_fid is not None:
+            return
+        lock_path = os.path.abspath(self._get_lock_file())
+        lock_op = {'shared': fcntl.LOCK_SH, 'exclusive': fcntl.LOCK_EX}[mode]
+        t_start = time.time()
+        while True:
+            try:
+                lock_fid = open(lock_path, 'a')
+            except IOError:
+                return # E.g. read-only module, nobody else can change it either
+            try:
+                fcntl.flock(lock_fid.fileno(), lock_op | fcntl.LOCK_NB)
+            except IOError, e:
+                lock_fid.close()
+                if e.errno not in (errno.EAGAIN, errno.EACCES):
+                    raise
+            else:
+                # The previous holder may have removed the file after we opened it
+                if self._is_same_file(lock_fid, lock_path):
+                    self._lock_fid = lock_fid
+                    self._lock_path = lock_path
+                    return
+                lock_fid.close()
+                continue
+            if time.time() - t_start >= self.options.lock_timeout:
+                print "Timed out after %g seconds waiting for a lock on %s." % (
+                        self.options.lock_timeout, lock_path)
+                print "Is another gr_modtool instance working on this module?"
+                sys.exit(1)
+            time.sleep(0.1)
+
+    def _is_same_file(self, fid, path):
+        """ Check if the open file fid is still the file at path """
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            return False
+        fid_stat = os.fstat(fid.fileno())
+        return (fid_stat.st_dev, fid_stat.st_ino) == (path_stat.st_dev, path_stat.st_ino)
+
+    def unlock_module(self):
+        """ Release the lock taken by lock_module(). The lock file is removed
+        unless another instance holds the lock. """
+        if self._lock_fid is None:
+            return
+        try:
+            # Only succeeds if nobody else has a lock on the file
+            fcntl.flock(self._lock_fid.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            os.remove(self._lock_path)
+        except (IOError, OSError):
+            pass
+        fcntl.flock(self._lock_fid.fileno(), fcntl.LOCK_UN)
+        self._lock_fid.close()
+        self._lock_fid = None
+
     def run(self):
         """ Override this. """
         pass
@@ -7,6 +7,7 @@ from optparse import OptionGroup
 
 from modtool_base import ModTool
 from cmakefile_editor import CMakeFileEditor
+from unity_build import UnityBuild
 
 ### Disable module ###########################################################
 class ModToolDisable(ModTool):
@@ -58,6 +59,7 @@ class ModToolDisable(ModTool):
                 return False
             pymodname = os.path.splitext(fname)[0]
             initfile = re.sub(r'((from|import)\s+\b'+pymodname+r'\b)', r'#\1', initfile)
+            initfile = re.sub(r"^(\s*)('\w+'\s*:\s*'"+pymodname+r"',)", r'\1#\2', initfile, flags=re.MULTILINE)
             open(self._file['pyinit'], 'w').write(initfile)
             return False
         def _handle_cc_qa(cmake, fname):
@@ -74,6 +76,11 @@ class ModToolDisable(ModTool):
                 cmake.comment_out_lines('target_link_libraries.*'+os.path.splitext(fname)[0])
                 cmake.comment_out_lines('GR_ADD_TEST.*'+os.path.splitext(fname)[0])
             return True
+        def _handle_cc_bench(cmake, fname):
+            """ Comment out a benchmark executable """
+            cmake.comment_out_lines('add_executable.*'+fname)
+            cmake.comment_out_lines(r'target_link_libraries\(\s*%s\b' % os.path.splitext(fname)[0])
+            return True
         def _handle_h_swig(cmake, fname):
             """ Comment out include files from the SWIG file,
             as well as the block magic """
@@ -107,8 +114,10 @@ class ModToolDisable(ModTool):
         # List of special rules: 0: subdir, 1: filename re match, 2: function
         special_treatments = (
                 ('python', 'qa.+py$', _handle_py_qa),
-                ('python', '^(?!qa).+py$', _handle_py_mod),
+                ('python', 'bench_.+py$', _handle_py_qa),
+                ('python', '^(?!qa|bench_).+py$', _handle_py_mod),
                 ('lib', 'qa.+\.cc$', _handle_cc_qa),
+                ('lib', 'bench_.+\.cc$', _handle_cc_bench),
                 ('include/%s' % self._info['modname'], '.+\.h$', _handle_h_swig),
                 ('include', '.+\.h$', _handle_h_swig),
                 ('swig', '.+\.i$', _handle_i_swig)
@@ -140,5 +149,7 @@ class ModToolDisable(ModTool):
                 if not file_disabled:
                     cmake.disable_file(fname)
             cmake.write()
+            if subdir == 'lib':
+                UnityBuild(self._info['modname']).update()
         print "Careful: 'gr_modtool disable' does not resolve dependencies."
 
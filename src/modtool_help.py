@@ -7,6 +7,8 @@ from modtool_rm import ModToolRemove
 from modtool_newmod import ModToolNewModule
 from modtool_disable import ModToolDisable
 from modtool_makexml import ModToolMakeXML
+from modtool_watch import ModToolWatch
+from modtool_rename import ModToolRename, ModToolRenameModule
 from util_functions import get_command_from_argv
 from templates import Templates
 
@@ -44,6 +46,7 @@ class ModToolHelp(ModTool):
     ''' Show some help. '''
     name = 'help'
     aliases = ('h', '?')
+    _lock_mode = None
     def __init__(self):
         ModTool.__init__(self)
 
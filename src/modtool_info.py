@@ -5,13 +5,15 @@ import sys
 from optparse import OptionGroup
 
 from modtool_base import ModTool
-from util_functions import get_modname
+from util_functions import get_modname, load_cache, save_cache, get_mtime
 
 ### Info  module #############################################################
 class ModToolInfo(ModTool):
     """ Create a new out-of-tree module """
     name = 'info'
     aliases = ('getinfo', 'inf')
+    _cache_name = 'info_cache'
+    _lock_mode = None # Locks in run(), once the base dir is known
     def __init__(self):
         ModTool.__init__(self)
 
@@ -24,6 +26,8 @@ class ModToolInfo(ModTool):
                 help="Return the output in a format that's easier to read for Python scripts.")
         ogroup.add_option("--suggested-dirs", default=None, type="string",
                 help="Suggest typical include dirs if nothing better can be detected.")
+        ogroup.add_option("--no-cache", action="store_true", default=False,
+                help="Don't use or update the cached module info.")
         parser.add_option_group(ogroup)
         return parser
 
@@ -42,6 +46,14 @@ class ModToolInfo(ModTool):
                 print "No module found."
             sys.exit(0)
         os.chdir(mod_info['base_dir'])
+        self.lock_module('shared')
+        cache = {}
+        if not self.options.no_cache:
+            cache = load_cache(self._cache_name)
+            cached_info = self._get_cached_info(cache, mod_info['base_dir'])
+            if cached_info is not None:
+                self._print_info(cached_info)
+                return
         mod_info['modname'] = get_modname()
         if self._info['version'] == '36' and os.path.isdir(os.path.join('include', mod_info['modname'])):
             self._info['version'] = '37'
@@ -58,11 +70,63 @@ class ModToolInfo(ModTool):
         if build_dir is not None:
             mod_info['build_dir'] = build_dir
             mod_info['incdirs'] += self._get_include_dirs(mod_info)
+        if not self.options.no_cache:
+            cache[mod_info['base_dir']] = {'stamp': self._get_cache_stamp(mod_info),
+                                           'mod_info': mod_info}
+            save_cache(self._cache_name, cache)
+        self._print_info(mod_info)
+
+    def _print_info(self, mod_info):
+        """ Output the module info in the requested format """
         if self.options.python_readable:
             print str(mod_info)
         else:
             self._pretty_print(mod_info)
 
+    def _get_cache_stamp(self, mod_info):
+        """ Return everything a cached result for this module depends on:
+        the mtimes of the top-level CMakeLists.txt, gnuradio.project, the
+        include dir and the CMakeCache.txt in the detected build dir, plus
+        the suggested dirs (which can end up in incdirs).
+        The build dir can appear after the result was cached, so this also
+        includes the subdirs of the dir the build dir is searched in (not
+        its mtime, gr_modtool's lock file comes and goes there) and the
+        mtime of build/CMakeCache.txt (which appears when cmake is run in
+        an existing build/). """
+        base_dir = mod_info['base_dir']
+        base_build_dir = base_dir
+        if 'is_component' in mod_info.keys():
+            base_build_dir = os.path.split(base_dir)[0]
+        cmakecache = None
+        if 'build_dir' in mod_info.keys():
+            cmakecache = os.path.join(mod_info['build_dir'], 'CMakeCache.txt')
+        return (get_mtime(os.path.join(base_dir, 'CMakeLists.txt')),
+                get_mtime(os.path.join(base_dir, 'gnuradio.project')),
+                get_mtime(os.path.join(base_dir, 'include')),
+                self._get_subdirs(base_build_dir),
+                get_mtime(os.path.join(base_build_dir, 'build', 'CMakeCache.txt')),
+                cmakecache,
+                cmakecache and get_mtime(cmakecache),
+                self.options.suggested_dirs)
+
+    def _get_subdirs(self, dirname):
+        """ Return the sorted names of the subdirs of dirname """
+        try:
+            return sorted([d for d in os.listdir(dirname) if os.path.isdir(os.path.join(dirname, d))])
+        except OSError:
+            return None
+
+    def _get_cached_info(self, cache, base_dir):
+        """ Return the cached module info for base_dir, or None if there is
+        none or it's stale. """
+        try:
+            entry = cache[base_dir]
+        except KeyError:
+            return None
+        if entry['stamp'] != self._get_cache_stamp(entry['mod_info']):
+            return None
+        return entry['mod_info']
+
     def _get_base_dir(self, start_dir):
         """ Figure out the base dir (where the top-level cmake file is) """
         base_dir = os.path.abspath(start_dir)
@@ -3,21 +3,103 @@
 import sys
 import os
 import re
+import copy
 import glob
+import time
+import json
+import hashlib
+import multiprocessing
 from optparse import OptionGroup
 
 from modtool_base import ModTool
-from parser_cc_block import ParserCCBlock
+from parser_cc_block import ParserCCBlock, grc_type_translator
 from grc_xml_generator import GRCXMLGenerator
+from python_bench_generator import PythonBenchGenerator
 from cmakefile_editor import CMakeFileEditor
+from util_functions import load_cache, save_cache
 
 ### Remove module ###########################################################
+def _read_block_data(parser):
+    """ Parse a block, return the GRC parameters, the IO signature and
+    the message ports """
+    params = parser.read_params()
+    for hint in parser.read_sched_hints():
+        params.append({'key': hint['key'],
+                       'type': 'int',
+                       'default': hint['value'],
+                       'in_constructor': False,
+                       'setter': hint['setter'],
+                       'hide': 'part'})
+    if parser.read_thread_policy():
+        # Unset by default, so the policy file applies
+        params.append({'key': 'affinity', 'type': 'int_vector', 'default': '[]', 'in_constructor': False,
+                       'setter': 'set_processor_affinity', 'setter_if': '$affinity()', 'hide': 'part'})
+        params.append({'key': 'priority', 'type': 'int', 'default': '-1', 'in_constructor': False,
+                       'setter': 'set_thread_priority', 'setter_if': '$priority() >= 0', 'hide': 'part'})
+    return (params, parser.read_io_signature(), parser.read_msg_ports())
+
+def _write_grc_xml(modname, blockname, params, iosig, msg_ports=None):
+    """ Take the return values from the parser and write the GRC bindings
+    with the XML generator. Changes params and iosig. Returns the name of
+    the XML file. """
+    fname_xml = '%s_%s.xml' % (modname, blockname)
+    # Some adaptions for the GRC
+    for inout in ('in', 'out'):
+        if iosig[inout]['max_ports'] == '-1':
+            iosig[inout]['max_ports'] = '$num_%sputs' % inout
+            params.append({'key': 'num_%sputs' % inout,
+                           'type': 'int',
+                           'name': 'Num %sputs' % inout,
+                           'default': '2',
+                           'in_constructor': False})
+    grc_generator = GRCXMLGenerator(
+            modname=modname,
+            blockname=blockname,
+            params=params,
+            iosig=iosig,
+            msg_ports=msg_ports
+    )
+    grc_generator.save(os.path.join('grc', fname_xml))
+    return fname_xml
+
+def _file_hash(fname):
+    """ Return the SHA-1 of the contents of fname """
+    return hashlib.sha1(open(fname, 'rb').read()).hexdigest()
+
+def _make_block(job):
+    """ Parse a block (unless its data is cached) and write its GRC
+    bindings. This is a function, not a method, so it can be sent to the
+    worker processes. Errors are returned instead of raised, so one bad
+    block doesn't stop the others. """
+    (parser, modname, data) = job
+    try:
+        if data is None:
+            data = _read_block_data(parser)
+        (params, iosig, msg_ports) = copy.deepcopy(data)
+        _write_grc_xml(modname, parser.blockname, params, iosig, msg_ports)
+    except (IOError, ValueError) as e:
+        return {'error': str(e)}
+    except Exception as e:
+        # E.g. no IO signature found
+        return {'error': '%s: %s' % (e.__class__.__name__, e)}
+    return {'data': data}
+
 class ModToolMakeXML(ModTool):
     """ Make XML file for GRC block bindings """
     name = 'makexml'
     aliases = ('mx',)
+    _cache_name = 'makexml_cache'
+    # Number of parsed blocks kept in the cache, the least recently used
+    # ones are dropped first
+    _cache_size = 5000
+    # Maps every XML file makexml wrote to the hashes of its sources and
+    # of the XML itself, so unchanged blocks and hand-edited XML are skipped
+    _xml_manifest_file = os.path.join('grc', '.gr_modtool_makexml.json')
     def __init__(self):
         ModTool.__init__(self)
+        self._parse_cache = {}
+        self._num_parsed = 0
+        self._xml_manifest = {}
 
     def setup_parser(self):
         " Initialise the option parser for 'gr_modtool.py makexml' "
@@ -27,7 +109,15 @@ class ModToolMakeXML(ModTool):
         ogroup.add_option("-p", "--pattern", type="string", default=None,
                 help="Filter possible choices for blocks to be parsed.")
         ogroup.add_option("-y", "--yes", action="store_true", default=False,
-                help="Answer all questions with 'yes'. This can overwrite existing files!")
+                help="Answer all questions with 'yes'. GRC bindings that were edited by hand are only overwritten with --force.")
+        ogroup.add_option("--bench-python", action="store_true", default=False,
+                help="Also create a Python throughput benchmark and regression test (python/bench_<block>.py) for every block.")
+        ogroup.add_option("--no-cache", action="store_true", default=False,
+                help="Parse all blocks, even those whose .cc and .h files haven't changed since they were last parsed.")
+        ogroup.add_option("-j", "--jobs", type="int", default=multiprocessing.cpu_count(),
+                help="Number of processes parsing the blocks and writing their GRC bindings. Default is the number of CPUs.")
+        ogroup.add_option("--force", action="store_true", default=False,
+                help="Regenerate the GRC bindings of all blocks, including those whose sources haven't changed and XML files that were edited by hand.")
         parser.add_option_group(ogroup)
         return parser
 
@@ -45,6 +135,9 @@ class ModToolMakeXML(ModTool):
         if len(self._info['pattern']) == 0:
             self._info['pattern'] = '.'
         self._info['yes'] = options.yes
+        if options.bench_python and self._skip_subdirs['python']:
+            print "Missing or skipping python/, can't add Python benchmarks."
+            sys.exit(1)
 
     def run(self):
         """ Go, go, go! """
@@ -55,14 +148,138 @@ class ModToolMakeXML(ModTool):
                 files = self._search_files('lib', '*_impl.cc')
             else:
                 files = self._search_files('lib', '*.cc')
-            for f in files:
-                if os.path.basename(f)[0:2] == 'qa':
-                    continue
-                (params, iosig, blockname) = self._parse_cc_h(f)
-                self._make_grc_xml_from_block_data(params, iosig, blockname)
+            if not self.options.no_cache:
+                self._parse_cache = load_cache(self._cache_name)
+            files = [f for f in files if os.path.basename(f)[0:2] != 'qa' and os.path.basename(f)[0:6] != 'bench_']
+            self._xml_manifest = self._load_xml_manifest()
+            (num_made, failed) = self._make_blocks(files)
+            self._save_xml_manifest()
+            if not self.options.no_cache:
+                self._save_parse_cache()
+                if self._num_parsed < num_made:
+                    print "Parsed %d blocks, %d were unchanged." % (self._num_parsed, num_made - self._num_parsed)
+            if failed:
+                print "Couldn't make GRC bindings for %d blocks:" % len(failed)
+                for (fname_cc, error) in failed:
+                    print "  %s: %s" % (fname_cc, error)
+                sys.exit(1)
         # 2) Go through python/
 
 
+    def _make_blocks(self, files):
+        """ Make the GRC bindings (and benchmarks) for the blocks in files,
+        unless they are up to date or were edited by hand. Parsing and
+        writing the XML is spread over a pool of processes, the
+        CMakeLists.txt files are edited afterwards. Returns the number of
+        blocks made and a list of (file name, error) for those that failed. """
+        failed = []
+        jobs = []
+        (up_to_date, edited) = ([], [])
+        parsers = []
+        for fname_cc in files:
+            try:
+                parsers += [(fname_cc, parser) for parser in self._get_parsers(fname_cc)]
+            except IOError:
+                failed.append((fname_cc, "Can't open some of the files necessary to parse it."))
+        for (fname_cc, parser) in parsers:
+            fname_xml = '%s_%s.xml' % (self._info['modname'], parser.blockname)
+            state = self._get_xml_state(fname_xml, parser.cache_key())
+            if self.options.bench_python and not os.path.isfile(os.path.join('python', 'bench_%s.py' % parser.blockname)):
+                state = {'current': 'stale'}.get(state, state)
+            if state == 'current' and not self.options.force:
+                up_to_date.append(fname_xml)
+                continue
+            if state == 'edited' and not self.options.force:
+                edited.append(fname_xml)
+                continue
+            cached = self._parse_cache.get(parser.cache_key(), {}).get('data')
+            jobs.append((fname_cc, parser, cached, fname_xml, state))
+        if up_to_date:
+            print "%d GRC bindings are up to date." % len(up_to_date)
+        if edited:
+            print "Keeping GRC bindings that were edited by hand (use --force to overwrite them):"
+            for fname_xml in edited:
+                print "  grc/%s" % fname_xml
+        work = [(parser, self._info['modname'], cached) for (fname_cc, parser, cached, fname_xml, state) in jobs]
+        num_procs = min(self.options.jobs, len(work))
+        if num_procs > 1:
+            pool = multiprocessing.Pool(num_procs)
+            try:
+                results = pool.map(_make_block, work)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = map(_make_block, work)
+        fnames_made = []
+        for ((fname_cc, parser, cached, fname_xml, state), result) in zip(jobs, results):
+            if 'error' in result:
+                failed.append((self._block_source(fname_cc, parser), result['error']))
+                continue
+            print "Making GRC bindings for %s..." % self._block_source(fname_cc, parser)
+            if state in ('unknown', 'edited'):
+                print "Warning: Overwriting existing GRC file."
+            if cached is None:
+                self._num_parsed += 1
+            self._parse_cache[parser.cache_key()] = {'data': result['data'], 'atime': time.time()}
+            self._record_xml(fname_xml, parser.cache_key())
+            fnames_made.append(fname_xml)
+            if self.options.bench_python:
+                (params, iosig, msg_ports) = copy.deepcopy(result['data'])
+                self._make_python_bench(params, iosig, parser.blockname)
+        self._add_grc_cmake(fnames_made)
+        return (len(fnames_made), failed)
+
+    def _get_xml_state(self, fname_xml, source_key):
+        """ Compare grc/fname_xml with the manifest. Returns
+        - 'missing' if there's no such file
+        - 'unknown' if makexml didn't write it (e.g. gr_modtool add did)
+        - 'edited' if it was changed since makexml wrote it
+        - 'current' if makexml wrote it from the same sources
+        - 'stale' if makexml wrote it from other sources """
+        path = os.path.join('grc', fname_xml)
+        if not os.path.isfile(path):
+            return 'missing'
+        entry = self._xml_manifest.get(fname_xml)
+        if entry is None:
+            return 'unknown'
+        if _file_hash(path) != entry['xml']:
+            return 'edited'
+        if entry['source'] != source_key:
+            return 'stale'
+        return 'current'
+
+    def _record_xml(self, fname_xml, source_key):
+        """ Note in the manifest that grc/fname_xml was just written from
+        the sources with the given hash """
+        self._xml_manifest[fname_xml] = {'source': source_key,
+                                         'xml': _file_hash(os.path.join('grc', fname_xml))}
+
+    def _load_xml_manifest(self):
+        """ Read the XML manifest. A missing or broken manifest is empty,
+        i.e. all XML files are treated like files makexml didn't write. """
+        try:
+            manifest = json.load(open(self._xml_manifest_file))
+        except (IOError, ValueError):
+            return {}
+        if not isinstance(manifest, dict):
+            return {}
+        return manifest
+
+    def _save_xml_manifest(self):
+        """ Write back the XML manifest, without the entries of deleted
+        XML files """
+        for fname_xml in self._xml_manifest.keys():
+            if not os.path.isfile(os.path.join('grc', fname_xml)):
+                del self._xml_manifest[fname_xml]
+        if not self._xml_manifest and not os.path.isfile(self._xml_manifest_file):
+            return
+        try:
+            open(self._xml_manifest_file, 'w').write(
+                    json.dumps(self._xml_manifest, indent=4, sort_keys=True, separators=(',', ': ')) + '\n')
+        except IOError:
+            print "Warning: Can't write %s, all GRC bindings will be regenerated next time." % self._xml_manifest_file
+
     def _search_files(self, path, path_glob):
         """ Search for files matching pattern in the given path. """
         files = glob.glob("%s/%s"% (path, path_glob))
@@ -75,77 +292,122 @@ class ModToolMakeXML(ModTool):
             print "None found."
         return files_filt
 
-    def _make_grc_xml_from_block_data(self, params, iosig, blockname):
-        """ Take the return values from the parser and call the XML
-        generator. Also, check the makefile if the .xml file is in there.
-        If necessary, add. """
-        fname_xml = '%s_%s.xml' % (self._info['modname'], blockname)
-        # Some adaptions for the GRC
-        for inout in ('in', 'out'):
-            if iosig[inout]['max_ports'] == '-1':
-                iosig[inout]['max_ports'] = '$num_%sputs' % inout
-                params.append({'key': 'num_%sputs' % inout,
-                               'type': 'int',
-                               'name': 'Num %sputs' % inout,
-                               'default': '2',
-                               'in_constructor': False})
-        if os.path.isfile(os.path.join('grc', fname_xml)):
-            # TODO add an option to keep
+    def _make_python_bench(self, params, iosig, blockname):
+        """ Create python/bench_<block>.py from the parser data, and run it
+        as a test from python/CMakeLists.txt """
+        fname_bench = 'bench_%s.py' % blockname
+        if os.path.isfile(os.path.join('python', fname_bench)):
+            print "Warning: Overwriting existing benchmark %s." % fname_bench
+        else:
+            print "Adding file '%s'..." % fname_bench
+        bench_generator = PythonBenchGenerator(self._info['modname'], blockname, params, iosig)
+        bench_generator.save(os.path.join('python', fname_bench))
+        ed = CMakeFileEditor(self._file['cmpython'])
+        if re.search(r'\b%s\b' % re.escape(fname_bench), ed.cfile) is None:
+            print "Adding %s to python/CMakeLists.txt..." % fname_bench
+            ed.append(bench_generator.cmake_entry())
+            ed.write()
+
+    def _make_grc_xml_from_block_data(self, params, iosig, blockname, msg_ports=None):
+        """ Write the GRC bindings of a single block and add them to
+        grc/CMakeLists.txt if necessary """
+        if os.path.isfile(os.path.join('grc', '%s_%s.xml' % (self._info['modname'], blockname))):
             print "Warning: Overwriting existing GRC file."
-        grc_generator = GRCXMLGenerator(
-                modname=self._info['modname'],
-                blockname=blockname,
-                params=params,
-                iosig=iosig
-        )
-        grc_generator.save(os.path.join('grc', fname_xml))
-        if not self._skip_subdirs['grc']:
-            ed = CMakeFileEditor(self._file['cmgrc'])
-            if re.search(fname_xml, ed.cfile) is None and not ed.check_for_glob('*.xml'):
-                print "Adding GRC bindings to grc/CMakeLists.txt..."
-                ed.append_value('install', fname_xml, 'DESTINATION[^()]+')
-                ed.write()
+        self._add_grc_cmake([_write_grc_xml(self._info['modname'], blockname, params, iosig, msg_ports)])
 
-    def _parse_cc_h(self, fname_cc):
-        """ Go through a .cc and .h-file defining a block and return info """
-        def _type_translate(p_type, default_v=None):
-            """ Translates a type from C++ to GRC """
-            translate_dict = {'float': 'float',
-                              'double': 'real',
-                              'int': 'int',
-                              'gr_complex': 'complex',
-                              'char': 'byte',
-                              'unsigned char': 'byte',
-                              'std::string': 'string',
-                              'std::vector<int>': 'int_vector',
-                              'std::vector<float>': 'real_vector',
-                              'std::vector<gr_complex>': 'complex_vector',
-                              }
-            if p_type in ('int',) and default_v[:2].lower() == '0x':
-                return 'hex'
-            try:
-                return translate_dict[p_type]
-            except KeyError:
-                return 'raw'
-        def _get_blockdata(fname_cc):
-            """ Return the block name and the header file name from the .cc file name """
-            blockname = os.path.splitext(os.path.basename(fname_cc.replace('_impl.', '.')))[0]
-            fname_h = (blockname + '.h').replace('_impl.', '.')
-            blockname = blockname.replace(self._info['modname']+'_', '', 1)
-            return (blockname, fname_h)
-        # Go, go, go
-        print "Making GRC bindings for %s..." % fname_cc
-        (blockname, fname_h) = _get_blockdata(fname_cc)
+    def _add_grc_cmake(self, fnames_xml):
+        """ Install the XML files in grc/CMakeLists.txt, unless they
+        already are (or all XML files are installed by a glob). The file
+        is edited once for all blocks. """
+        if self._skip_subdirs['grc'] or not fnames_xml:
+            return
+        ed = CMakeFileEditor(self._file['cmgrc'])
+        if ed.check_for_glob('*.xml'):
+            return
+        new_fnames = [f for f in fnames_xml if re.search(re.escape(f), ed.cfile) is None]
+        if not new_fnames:
+            return
+        print "Adding GRC bindings to grc/CMakeLists.txt..."
+        for fname_xml in new_fnames:
+            ed.append_value('install', fname_xml, 'DESTINATION[^()]+')
+        ed.write()
+
+    def _get_family_members(self, fname_cc):
+        """ If fname_cc is the implementation of a templated block family
+        (gr_modtool add --templated), return a (block name, IN_T, OUT_T)
+        tuple for each of its explicit instantiations. Otherwise (or if the
+        file can't be read), return an empty list. """
+        if self._info['version'] != '37':
+            return []
+        familyname = os.path.basename(fname_cc)[:-len('_impl.cc')]
         try:
-            parser = ParserCCBlock(fname_cc,
-                                   os.path.join(self._info['includedir'], fname_h),
-                                   blockname,
-                                   self._info['version'],
-                                   _type_translate
-                                  )
+            code_cc = open(fname_cc).read()
         except IOError:
-            print "Can't open some of the files necessary to parse %s." % fname_cc
-            sys.exit(1)
-        return (parser.read_params(), parser.read_io_signature(), blockname)
+            return []
+        instance_regex = r'template\s+class\s+%s_impl\s*<\s*([^,<>]+?)\s*,\s*([^,<>]+?)\s*,\s*(\w+)\s*>\s*;' % re.escape(familyname)
+        return [(blockname, in_t, out_t) for (in_t, out_t, blockname) in re.findall(instance_regex, code_cc)]
+
+    def _block_source(self, fname_cc, parser):
+        """ Name a block's sources in messages: the .cc file, plus the
+        block name if the .cc file implements a templated family """
+        if self._get_family_members(fname_cc):
+            return '%s (%s)' % (fname_cc, parser.blockname)
+        return fname_cc
+
+    def _get_parsers(self, fname_cc):
+        """ Return the parsers for the blocks defined in fname_cc: one for
+        a plain block, one for each member of a templated family. A family
+        has no header of its own, its members are read from their headers
+        with the family's template parameters replaced by their types.
+        Raises IOError if one of the files can't be read. """
+        members = self._get_family_members(fname_cc)
+        if not members:
+            return [self._get_parser(fname_cc)]
+        return [ParserCCBlock(fname_cc,
+                              os.path.join(self._info['includedir'], blockname + '.h'),
+                              blockname,
+                              self._info['version'],
+                              grc_type_translator,
+                              {'IN_T': in_t, 'OUT_T': out_t})
+                for (blockname, in_t, out_t) in members]
+
+    def _get_parser(self, fname_cc):
+        """ Return a parser for the block defined in fname_cc and its
+        header. Raises IOError if one of them can't be read. """
+        blockname = os.path.splitext(os.path.basename(fname_cc.replace('_impl.', '.')))[0]
+        fname_h = (blockname + '.h').replace('_impl.', '.')
+        blockname = blockname.replace(self._info['modname']+'_', '', 1)
+        return ParserCCBlock(fname_cc,
+                             os.path.join(self._info['includedir'], fname_h),
+                             blockname,
+                             self._info['version'],
+                             grc_type_translator
+                            )
+
+    def _parse_cc_h(self, fname_cc):
+        """ Go through a .cc file and the headers of the blocks it defines,
+        and return a list with the GRC parameters, the IO signature, the
+        message ports and the block name of each block. Raises IOError or
+        ValueError if a block can't be parsed. """
+        signatures = []
+        for parser in self._get_parsers(fname_cc):
+            cache_key = parser.cache_key()
+            if cache_key not in self._parse_cache:
+                self._parse_cache[cache_key] = {'data': _read_block_data(parser)}
+                self._num_parsed += 1
+            self._parse_cache[cache_key]['atime'] = time.time()
+            # The callers change the results, so don't hand out the cached ones
+            (params, iosig, msg_ports) = copy.deepcopy(self._parse_cache[cache_key]['data'])
+            signatures.append((params, iosig, msg_ports, parser.blockname))
+        return signatures
+
+    def _save_parse_cache(self):
+        """ Write back the parse cache, without the least recently used
+        entries if it has grown too large """
+        if len(self._parse_cache) > self._cache_size:
+            by_atime = sorted(self._parse_cache.keys(), key=lambda k: self._parse_cache[k].get('atime', 0))
+            for cache_key in by_atime[:len(self._parse_cache) - self._cache_size]:
+                del self._parse_cache[cache_key]
+        save_cache(self._cache_name, self._parse_cache)
 
 
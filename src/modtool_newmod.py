@@ -5,16 +5,41 @@ import re
 import sys
 import base64
 import tarfile
+import cStringIO
 from optparse import OptionGroup
 
 from modtool_base import ModTool
+from tree_rewriter import MultiReplacer, is_binary
+from newmod_skeleton import open_skeleton, create_from_skeleton
 from newmod_tarfile import NEWMOD_TARFILE
+from unity_build import UnityBuild
+from swig_per_block import PerBlockSwig
 
 ### New out-of-tree-mod module ###############################################
+class Base64Reader(object):
+    """ Read-only file object that decodes base64 text line by line, so the
+    decoded data never has to be held in memory as a whole. """
+    def __init__(self, text):
+        self._lines = iter(cStringIO.StringIO(text))
+        self._buf = ''
+
+    def read(self, size=-1):
+        """ Read up to size bytes (everything if size is negative) """
+        while size < 0 or len(self._buf) < size:
+            try:
+                self._buf += base64.b64decode(self._lines.next())
+            except StopIteration:
+                break
+        if size < 0:
+            size = len(self._buf)
+        (data, self._buf) = (self._buf[:size], self._buf[size:])
+        return data
+
 class ModToolNewModule(ModTool):
     """ Create a new out-of-tree module """
     name = 'newmod'
     aliases = ('nm', 'create')
+    _lock_mode = None
     def __init__(self):
         ModTool.__init__(self)
 
@@ -23,6 +48,20 @@ class ModToolNewModule(ModTool):
         parser = ModTool.setup_parser(self)
         parser.usage = '%prog rm [options]. \n Call %prog without any options to run it interactively.'
         ogroup = OptionGroup(parser, "New out-of-tree module options")
+        ogroup.add_option("--skeleton", type="string", default=None,
+                help="Use this directory, tar or zip file as module skeleton instead of the built-in one.")
+        ogroup.add_option("--placeholder", type="string", default="howto",
+                help="Name used for the module in the skeleton given by --skeleton. Default is 'howto'.")
+        ogroup.add_option("--link", action="store_true", default=False,
+                help="Hard-link files from a skeleton directory that need no changes instead of copying them. Only use this if you never edit those files in place.")
+        ogroup.add_option("-j", "--jobs", type="int", default=8,
+                help="Number of threads used to copy and rewrite the files of a --skeleton directory. Default is 8.")
+        ogroup.add_option("--unity-build", type="int", default=None, metavar="N",
+                help="Compile the library in unity builds of N sources each.")
+        ogroup.add_option("--pch", action="store_true", default=False,
+                help="Use a precompiled header for the library (needs CMake 3.16).")
+        ogroup.add_option("--swig-per-block", action="store_true", default=False,
+                help="Use one SWIG file per block (swig/<block>.i) instead of adding all blocks to the main SWIG file.")
         parser.add_option_group(ogroup)
         return parser
 
@@ -37,6 +76,16 @@ class ModToolNewModule(ModTool):
         if not re.match('[a-zA-Z0-9_]+', self._info['modname']):
             print 'Invalid module name.'
             sys.exit(2)
+        if options.unity_build is not None and options.unity_build < 1:
+            print 'Unity build groups need at least one source.'
+            sys.exit(2)
+        self.options = options
+        self._skeleton = None
+        if options.skeleton is not None:
+            self._skeleton = open_skeleton(options.skeleton)
+            if self._skeleton is None:
+                print 'Skeleton %s is neither a directory nor a tar or zip file.' % options.skeleton
+                sys.exit(2)
         self._dir = options.directory
         if self._dir == '.':
             self._dir = './gr-%s' % self._info['modname']
@@ -51,10 +100,10 @@ class ModToolNewModule(ModTool):
 
     def run(self):
         """
-        * Unpack the tar.bz2 to the new locations
-        * Remove the bz2
-        * Open all files, rename howto and HOWTO to the module name
-        * Rename files and directories that contain the word howto
+        * Stream the tar.bz2 (or copy the user's skeleton) to the new
+          location, member by member
+        * On the way, rename howto and HOWTO to the module name in all
+          paths and file contents
         """
         print "Creating directory..."
         try:
@@ -63,26 +112,50 @@ class ModToolNewModule(ModTool):
         except OSError:
             print 'Could not create directory %s. Quitting.' % self._dir
             sys.exit(2)
-        print "Copying howto example..."
-        open('tmp.tar.bz2', 'wb').write(base64.b64decode(NEWMOD_TARFILE))
-        print "Unpacking..."
-        tar = tarfile.open('tmp.tar.bz2', mode='r:bz2')
-        tar.extractall()
-        tar.close()
-        os.unlink('tmp.tar.bz2')
-        print "Replacing occurences of 'howto' to '%s'..." % self._info['modname'],
-        for root, dirs, files in os.walk('.'):
-            for filename in files:
-                f = os.path.join(root, filename)
-                s = open(f, 'r').read()
-                s = s.replace('howto', self._info['modname'])
-                s = s.replace('HOWTO', self._info['modname'].upper())
-                open(f, 'w').write(s)
-                if filename.find('howto') != -1:
-                    os.rename(f, os.path.join(root, filename.replace('howto', self._info['modname'])))
-            if os.path.basename(root) == 'howto':
-                os.rename(root, os.path.join(os.path.dirname(root), self._info['modname']))
+        placeholder = 'howto'
+        if self._skeleton is not None:
+            placeholder = self.options.placeholder
+        replacer = MultiReplacer({placeholder: self._info['modname'],
+                                  placeholder.upper(): self._info['modname'].upper()})
+        if self._skeleton is not None:
+            print "Copying skeleton and replacing occurences of '%s' to '%s'..." % (
+                    placeholder, self._info['modname']),
+            create_from_skeleton(self._skeleton, replacer, self.options.link, self.options.jobs)
+        else:
+            print "Unpacking howto example and replacing occurences of '%s' to '%s'..." % (
+                    placeholder, self._info['modname']),
+            self._unpack_builtin_skeleton(replacer)
         print "Done."
+        if self.options.unity_build is not None or self.options.pch:
+            if os.path.isfile(os.path.join('lib', 'CMakeLists.txt')):
+                UnityBuild(self._info['modname']).enable(self.options.unity_build, self.options.pch)
+            else:
+                print "Warning: No lib/CMakeLists.txt, can't set up unity builds or precompiled headers."
+        if self.options.swig_per_block:
+            mainswigfile = self._info['modname'] + '_swig.i'
+            if os.path.isfile(os.path.join('swig', mainswigfile)):
+                version = {True: '37', False: '36'}[os.path.isdir(os.path.join('include', self._info['modname']))]
+                PerBlockSwig(self._info['modname'], mainswigfile).enable(version)
+            else:
+                print "Warning: No swig/%s, can't set up per-block SWIG files." % mainswigfile
         print "Use 'gr_modtool add' to add a new block to this currently empty module."
 
+    def _unpack_builtin_skeleton(self, replacer):
+        """ Stream the built-in tar.bz2 into the current directory, applying
+        the replacer to paths and file contents on the way """
+        tar = tarfile.open(fileobj=Base64Reader(NEWMOD_TARFILE), mode='r|bz2')
+        for member in tar:
+            member.name = replacer.replace(member.name)[0]
+            if not member.isfile():
+                tar.extract(member)
+                continue
+            data = tar.extractfile(member).read()
+            if not is_binary(data[:1024]):
+                data = replacer.replace(data)[0]
+            if os.path.dirname(member.name) and not os.path.isdir(os.path.dirname(member.name)):
+                os.makedirs(os.path.dirname(member.name))
+            open(member.name, 'wb').write(data)
+            os.chmod(member.name, member.mode)
+        tar.close()
+
 
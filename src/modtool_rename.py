@@ -0,0 +1,169 @@
+""" Rename blocks or whole modules """
+
+import os
+import re
+import sys
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+from tree_rewriter import MultiReplacer, TreeRewriter
+
+### Rename block module ######################################################
+class ModToolRename(ModTool):
+    """ Rename a block (all files, identifiers and build entries) """
+    name = 'rename'
+    aliases = ('mv',)
+    def __init__(self):
+        ModTool.__init__(self)
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py rename' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog rename [options] [OLD_NAME] [NEW_NAME]. \n Call %prog without any options to run it interactively.'
+        ogroup = OptionGroup(parser, "Rename module options")
+        ogroup.add_option("--new-name", type="string", default=None,
+                help="New name of the block.")
+        ogroup.add_option("--dry-run", action="store_true", default=False,
+                help="Only show what would be changed.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        options = self.options
+        if self._info['blockname'] is None:
+            if len(self.args) >= 2:
+                self._info['blockname'] = self.args[1]
+            else:
+                self._info['blockname'] = raw_input("Enter name of block to rename (without module name prefix): ")
+        self._info['newname'] = options.new_name
+        if self._info['newname'] is None:
+            if len(self.args) >= 3:
+                self._info['newname'] = self.args[2]
+            else:
+                self._info['newname'] = raw_input("Enter new name of the block: ")
+        if not re.match('^[a-zA-Z0-9_]+$', self._info['newname']):
+            print 'Invalid block name.'
+            sys.exit(2)
+        if not self._block_exists(self._info['blockname']):
+            print "Can't find block %s in this module." % self._info['blockname']
+            sys.exit(2)
+        if self._block_exists(self._info['newname']):
+            print "A block called %s already exists." % self._info['newname']
+            sys.exit(2)
+
+    def _block_exists(self, blockname):
+        """ Check if there is a header or Python file for this block """
+        if self._info['version'] == '37':
+            fname_h = blockname + '.h'
+        else:
+            fname_h = self._info['modname'] + '_' + blockname + '.h'
+        return (os.path.isfile(os.path.join(self._info['includedir'], fname_h))
+                or os.path.isfile(os.path.join('python', blockname + '.py')))
+
+    def _get_replacements(self, oldname, newname):
+        """ Return a dict of the forms a block name takes in the code gr_modtool
+        generates, and their renamed versions. The forms are matched as
+        whole identifiers, so neither words that contain the block name
+        (add_library, GR_ADD_TEST for a block 'add') nor other blocks that
+        start with it (add_const) are touched. """
+        forms = ('%(mod)s_%(block)s', '%(mod)s_%(block)s_sptr', '%(mod)s_make_%(block)s',
+                 '%(mod)s/%(block)s.h', '%(mod)s::%(block)s', '%(mod)s.%(block)s',
+                 '%(block)s_impl', 'qa_%(block)s', 'qa_%(mod)s_%(block)s',
+                 '%(block)s.h', '%(block)s.cc', '%(block)s.i', '%(block)s.py', '%(block)s.xml',
+                 '(%(mod)s, %(block)s)', '(%(mod)s,%(block)s)',
+                 'INCLUDED_%(MOD)s_%(BLOCK)s_H', 'INCLUDED_%(MOD)s_%(BLOCK)s_IMPL_H', '_QA_%(BLOCK)s_H_',
+                 # C++ class
+                 '%(MOD)s_API %(block)s', '%(block)s::', '<%(block)s>', 'public %(block)s', '~%(block)s(',
+                 # Python block and its QA
+                 'class %(block)s(', '= %(block)s(', 'from %(block)s import %(block)s',
+                 'from %(block)s import', 'import %(block)s',
+                 '%(block)s.in_dtype', '%(block)s.out_dtype',
+                 # Block name strings, GRC names
+                 '"%(block)s"', "'%(block)s'", '<name>%(block)s</name>', '<name>%(human)s</name>')
+        old = {'mod': self._info['modname'], 'MOD': self._info['modname'].upper(),
+               'block': oldname, 'BLOCK': oldname.upper(), 'human': oldname.replace('_', ' ').capitalize()}
+        new = {'mod': self._info['modname'], 'MOD': self._info['modname'].upper(),
+               'block': newname, 'BLOCK': newname.upper(), 'human': newname.replace('_', ' ').capitalize()}
+        return dict([(form % old, form % new) for form in forms])
+
+    def run(self):
+        """ Go, go, go! """
+        replacer = MultiReplacer(
+                self._get_replacements(self._info['blockname'], self._info['newname']),
+                whole_words=True, word_chars='a-zA-Z0-9_')
+        print "Renaming %s to %s..." % (self._info['blockname'], self._info['newname'])
+        # Block names are often plain words, so stay out of docs/ and cmake/
+        subdirs = [d for d in self._subdirs + ['apps', 'examples']
+                   if os.path.isdir(d) and not self._skip_subdirs.get(d, False)]
+        self._rewrite(replacer, subdirs)
+
+    def _rewrite(self, replacer, subdirs=('.',)):
+        """ Run the replacer over the given subdirs and report """
+        files_changed = {}
+        renamed = []
+        rewriter = TreeRewriter(replacer)
+        for subdir in subdirs:
+            (subdir_files_changed, subdir_renamed) = rewriter.rewrite(subdir, self.options.dry_run)
+            files_changed.update(subdir_files_changed)
+            renamed += subdir_renamed
+        for fname in sorted(files_changed.keys()):
+            print "Changing %s (%d occurrences)" % (fname, files_changed[fname])
+        for (old_path, new_path) in renamed:
+            print "Renaming %s -> %s" % (old_path, new_path)
+        if self.options.dry_run:
+            print "Dry run, nothing was changed."
+        print "Careful: Check the changes, names in hand-written code may have been missed."
+
+### Rename module module #####################################################
+class ModToolRenameModule(ModToolRename):
+    """ Rename the whole module """
+    name = 'renamemod'
+    aliases = ('mvmod',)
+    def __init__(self):
+        ModToolRename.__init__(self)
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py renamemod' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog renamemod [options] [NEW_NAME]. \n Call %prog without any options to run it interactively.'
+        ogroup = OptionGroup(parser, "Rename module options")
+        ogroup.add_option("--new-name", type="string", default=None,
+                help="New name of the module.")
+        ogroup.add_option("--dry-run", action="store_true", default=False,
+                help="Only show what would be changed.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def _get_replacements(self, oldname, newname):
+        """ Return a dict of all spellings of the module name that need
+        replacing. Names are replaced as whole words, where '_', '/' etc.
+        separate words, so this covers mod_block, gr-mod, mod/api.h,
+        MOD_API etc. """
+        replacements = {oldname: newname,
+                        oldname.upper(): newname.upper()}
+        human_name = oldname.replace('_', ' ').capitalize()
+        if human_name not in replacements.keys():
+            replacements[human_name] = newname.replace('_', ' ').capitalize()
+        return replacements
+
+    def setup(self):
+        ModTool.setup(self)
+        self._info['newname'] = self.options.new_name
+        if self._info['newname'] is None:
+            if len(self.args) >= 2:
+                self._info['newname'] = self.args[1]
+            else:
+                self._info['newname'] = raw_input("Enter new name of the module: ")
+        if not re.match('^[a-zA-Z0-9_]+$', self._info['newname']):
+            print 'Invalid module name.'
+            sys.exit(2)
+
+    def run(self):
+        """ Go, go, go! """
+        replacer = MultiReplacer(
+                self._get_replacements(self._info['modname'], self._info['newname']),
+                whole_words=True)
+        print "Renaming module %s to %s..." % (self._info['modname'], self._info['newname'])
+        self._rewrite(replacer)
+        print "You might also want to rename the module directory to gr-%s." % self._info['newname']
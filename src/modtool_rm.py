@@ -9,6 +9,7 @@ from optparse import OptionGroup
 from util_functions import remove_pattern_from_file
 from modtool_base import ModTool
 from cmakefile_editor import CMakeFileEditor
+from unity_build import UnityBuild
 
 ### Remove module ###########################################################
 class ModToolRemove(ModTool):
@@ -48,8 +49,14 @@ class ModToolRemove(ModTool):
     def run(self):
         """ Go, go, go! """
         def _remove_cc_test_case(filename=None, ed=None):
-            """ Special function that removes the occurrences of a qa*.cc file
-            from the CMakeLists.txt. """
+            """ Special function that removes the occurrences of a qa*.cc or
+            bench_*.cc file from the CMakeLists.txt. """
+            if filename[:6] == 'bench_':
+                filebase = os.path.splitext(filename)[0]
+                ed.delete_entry('add_executable', r'\b%s\b' % filebase)
+                ed.delete_entry('target_link_libraries', r'\b%s\b' % filebase)
+                ed.remove_double_newlines()
+                return
             if filename[:2] != 'qa':
                 return
             if self._info['version'] == '37':
@@ -73,12 +80,12 @@ class ModToolRemove(ModTool):
                 ed.remove_double_newlines()
 
         def _remove_py_test_case(filename=None, ed=None):
-            """ Special function that removes the occurrences of a qa*.{cc,h} file
-            from the CMakeLists.txt and the qa_$modname.cc. """
-            if filename[:2] != 'qa':
+            """ Special function that removes the occurrences of a qa*.py or
+            bench_*.py file from the CMakeLists.txt. """
+            if filename[:2] != 'qa' and filename[:6] != 'bench_':
                 return
             filebase = os.path.splitext(filename)[0]
-            ed.delete_entry('GR_ADD_TEST', filebase)
+            ed.delete_entry('GR_ADD_TEST', r'\b%s\b' % filebase)
             ed.remove_double_newlines()
 
         def _make_swig_regex(filename):
@@ -91,6 +98,7 @@ class ModToolRemove(ModTool):
         if not self._skip_subdirs['lib']:
             self._run_subdir('lib', ('*.cc', '*.h'), ('add_library',),
                              cmakeedit_func=_remove_cc_test_case)
+            UnityBuild(self._info['modname']).update()
         if not self._skip_subdirs['include']:
             incl_files_deleted = self._run_subdir(self._info['includedir'], ('*.h',), ('install',))
         if not self._skip_subdirs['swig']:
@@ -99,11 +107,12 @@ class ModToolRemove(ModTool):
                 # TODO do this on all *.i files
                 remove_pattern_from_file(self._file['swig'], _make_swig_regex(f))
         if not self._skip_subdirs['python']:
-            py_files_deleted = self._run_subdir('python', ('*.py',), ('GR_PYTHON_INSTALL',),
+            py_files_deleted = self._run_subdir('python', ('*.py', 'bench_*.json'), ('GR_PYTHON_INSTALL',),
                                                 cmakeedit_func=_remove_py_test_case)
             for f in py_files_deleted:
                 remove_pattern_from_file(self._file['pyinit'], '.*import\s+%s.*' % f[:-3])
                 remove_pattern_from_file(self._file['pyinit'], '.*from\s+%s\s+import.*\n' % f[:-3])
+                remove_pattern_from_file(self._file['pyinit'], "^\s*'\w+'\s*:\s*'%s',.*\n" % f[:-3])
         if not self._skip_subdirs['grc']:
             self._run_subdir('grc', ('*.xml',), ('install',))
 
@@ -0,0 +1,275 @@
+""" Watch a module and keep the GRC bindings and docs up to date """
+
+import os
+import re
+import sys
+import copy
+import glob
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+import subprocess
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+from modtool_info import ModToolInfo
+from modtool_makexml import ModToolMakeXML
+
+### File watchers ############################################################
+class InotifyWatcher(object):
+    """ Watches directories using Linux' inotify (through ctypes).
+    Raises OSError if inotify is not available. """
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO    = 0x00000080
+    IN_Q_OVERFLOW  = 0x00004000
+    _event_header = struct.Struct('iIII')
+    def __init__(self, dirs):
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise OSError('libc not found')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init'):
+            raise OSError('inotify not supported')
+        self._fd = libc.inotify_init()
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init() failed')
+        self._dirs = {}
+        for d in dirs:
+            wd = libc.inotify_add_watch(self._fd, d,
+                                        self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), 'Can\'t watch %s' % d)
+            self._dirs[wd] = d
+
+    def wait(self, timeout):
+        """ Wait up to timeout seconds (None: forever) for changes.
+        Returns the set of changed files. """
+        (readable, dummy1, dummy2) = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        buf = os.read(self._fd, 65536)
+        changed = set()
+        idx = 0
+        while idx < len(buf):
+            (wd, mask, cookie, name_len) = self._event_header.unpack_from(buf, idx)
+            idx += self._event_header.size
+            name = buf[idx:idx+name_len].rstrip('\0')
+            idx += name_len
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost, so treat everything as changed
+                for d in self._dirs.values():
+                    changed.update([os.path.join(d, f) for f in os.listdir(d)])
+            elif wd in self._dirs and len(name):
+                changed.add(os.path.join(self._dirs[wd], name))
+        return changed
+
+class PollingWatcher(object):
+    """ Watches directories by polling the files' mtimes. Fallback for
+    systems without inotify. """
+    def __init__(self, dirs, interval=1.0):
+        self._dirs = dirs
+        self._interval = interval
+        self._mtimes = self._scan()
+
+    def _scan(self):
+        """ Return a dict file -> mtime for all files in the watched dirs """
+        mtimes = {}
+        for d in self._dirs:
+            for f in os.listdir(d):
+                fname = os.path.join(d, f)
+                try:
+                    mtimes[fname] = os.stat(fname).st_mtime
+                except OSError:
+                    pass
+        return mtimes
+
+    def wait(self, timeout):
+        """ Wait up to timeout seconds (None: forever) for changes.
+        Returns the set of changed files. """
+        t_start = time.time()
+        while True:
+            time.sleep(self._interval if timeout is None else min(self._interval, timeout))
+            mtimes = self._scan()
+            changed = set([f for f in mtimes.keys() if mtimes[f] != self._mtimes.get(f)])
+            self._mtimes = mtimes
+            if changed or (timeout is not None and time.time() - t_start >= timeout):
+                return changed
+
+### Watch module #############################################################
+class ModToolWatch(ModToolMakeXML):
+    """ Watch the module and regenerate GRC bindings on changes """
+    name = 'watch'
+    aliases = ('wa',)
+    _lock_mode = None # Only locks while regenerating
+    def __init__(self):
+        ModToolMakeXML.__init__(self)
+        self._signatures = {}
+        self._build_dir = None
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py watch' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog watch [options]. \n Runs until interrupted with Ctrl-C.'
+        ogroup = OptionGroup(parser, "Watch module options")
+        ogroup.add_option("-p", "--pattern", type="string", default=None,
+                help="Only watch blocks matching this regex.")
+        ogroup.add_option("--poll", action="store_true", default=False,
+                help="Poll for changes instead of using inotify.")
+        ogroup.add_option("--poll-interval", type="float", default=1.0,
+                help="Seconds between two polls. Default is 1.")
+        ogroup.add_option("--debounce", type="float", default=0.5,
+                help="Wait until files have been quiet for this many seconds before regenerating. Default is 0.5.")
+        ogroup.add_option("--build-dir", type="string", default=None,
+                help="Build directory in which the SWIG docs are refreshed. Detected if not given.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        options = self.options
+        if options.pattern is not None:
+            self._info['pattern'] = options.pattern
+        elif options.block_name is not None:
+            self._info['pattern'] = options.block_name
+        elif len(self.args) >= 2:
+            self._info['pattern'] = self.args[1]
+        else:
+            self._info['pattern'] = '.'
+        self._info['yes'] = True
+        if self._skip_subdirs['lib']:
+            print "Nothing to watch without lib/."
+            sys.exit(1)
+        if options.build_dir is not None:
+            self._build_dir = os.path.abspath(options.build_dir)
+        else:
+            self._build_dir = ModToolInfo()._get_build_dir({'base_dir': os.getcwd()})
+
+    def run(self):
+        """ Go, go, go! """
+        dirs = ('lib', self._info['includedir'])
+        watcher = None
+        if not self.options.poll:
+            try:
+                watcher = InotifyWatcher(dirs)
+                print "Using inotify to watch %s." % ', '.join(dirs)
+            except (OSError, AttributeError):
+                print "Can't use inotify, falling back to polling."
+        if watcher is None:
+            watcher = PollingWatcher(dirs, self.options.poll_interval)
+            print "Polling %s every %g seconds." % (', '.join(dirs), self.options.poll_interval)
+        for fname_cc in self._get_block_files():
+            self._signatures[fname_cc] = self._read_signature(fname_cc)
+        num_blocks = sum([len(self._get_family_members(fname_cc)) or 1 for fname_cc in self._signatures])
+        print "Watching %d blocks. Press Ctrl-C to stop." % num_blocks
+        while True:
+            changed = watcher.wait(None)
+            # Debounce: Collect everything until the files have settled
+            while True:
+                more_changes = watcher.wait(self.options.debounce)
+                if not more_changes:
+                    break
+                changed.update(more_changes)
+            self.lock_module('exclusive')
+            self._handle_changes(changed)
+            self.unlock_module()
+
+    def _get_block_files(self):
+        """ Return the .cc files of all watched blocks """
+        if self._info['version'] == '37':
+            files = glob.glob(os.path.join('lib', '*_impl.cc'))
+        else:
+            files = glob.glob(os.path.join('lib', '*.cc'))
+        return [f for f in files if os.path.basename(f)[0:2] != 'qa'
+                and re.search(self._info['pattern'], os.path.basename(f)) is not None]
+
+    def _get_cc_for_file(self, fname):
+        """ Map a changed file to the .cc file of its block, or return None
+        if it doesn't belong to a watched block """
+        (base, ext) = os.path.splitext(os.path.basename(fname))
+        block_files = self._get_block_files()
+        if ext == '.h' and os.path.dirname(fname) == self._info['includedir']:
+            if self._info['version'] == '37':
+                fname_cc = os.path.join('lib', base + '_impl.cc')
+            else:
+                fname_cc = os.path.join('lib', base + '.cc')
+            if fname_cc not in block_files:
+                # Members of templated families share the family's .cc
+                for family_cc in block_files:
+                    if base in [member[0] for member in self._get_family_members(family_cc)]:
+                        return family_cc
+        elif ext == '.cc' and os.path.dirname(fname) == 'lib':
+            fname_cc = fname
+        else:
+            return None
+        if fname_cc in block_files:
+            return fname_cc
+        return None
+
+    def _read_signature(self, fname_cc):
+        """ Parse the blocks defined in fname_cc. Returns a list with
+        (params, iosig, msg_ports, blockname) for each block, or None if they
+        can't be parsed (e.g. because they're half-written). """
+        try:
+            return self._parse_cc_h(fname_cc)
+        except (IOError, ValueError, AttributeError):
+            print "Can't parse %s, waiting for the next change." % fname_cc
+            return None
+
+    def _handle_changes(self, changed):
+        """ Regenerate the XML of all blocks whose make() signature or IO
+        signature changed. If only the docs changed, refresh the SWIG docs. """
+        blocks_changed = {}
+        for fname in changed:
+            fname_cc = self._get_cc_for_file(os.path.relpath(fname))
+            if fname_cc is not None:
+                header_changed = os.path.splitext(fname)[1] == '.h'
+                blocks_changed[fname_cc] = blocks_changed.get(fname_cc, False) or header_changed
+        refresh_docs = False
+        for fname_cc in sorted(blocks_changed.keys()):
+            signature = self._read_signature(fname_cc)
+            if signature is None:
+                continue
+            if signature == self._signatures.get(fname_cc):
+                refresh_docs = refresh_docs or blocks_changed[fname_cc]
+                continue
+            old_signatures = self._signatures.get(fname_cc) or []
+            self._signatures[fname_cc] = signature
+            source_keys = dict([(parser.blockname, parser.cache_key()) for parser in self._get_parsers(fname_cc)])
+            self._xml_manifest = self._load_xml_manifest()
+            for block_signature in signature:
+                if block_signature in old_signatures:
+                    continue
+                (params, iosig, msg_ports, blockname) = copy.deepcopy(block_signature)
+                print "Signature of %s changed, regenerating GRC bindings..." % blockname
+                self._make_grc_xml_from_block_data(params, iosig, blockname, msg_ports)
+                # Tell makexml these are generated bindings, not hand-edited ones
+                self._record_xml('%s_%s.xml' % (self._info['modname'], blockname), source_keys[blockname])
+            self._save_xml_manifest()
+        if refresh_docs:
+            self._refresh_swig_docs()
+
+    def _refresh_swig_docs(self):
+        """ Rerun doxygen and swig_doc.py like the build would, so the SWIG
+        docstrings are up to date without rebuilding """
+        if self._build_dir is None:
+            return
+        doxyfiles = glob.glob(os.path.join(self._build_dir, 'swig', '*_swig_docs', 'Doxyfile'))
+        swig_doc_script = os.path.abspath(os.path.join('docs', 'doxygen', 'swig_doc.py'))
+        if not doxyfiles or not os.path.isfile(swig_doc_script):
+            return
+        for doxyfile in doxyfiles:
+            doxy_dir = os.path.dirname(doxyfile)
+            swig_doc_file = doxy_dir[:-len('_swig_docs')] + '.i'
+            print "Refreshing %s..." % swig_doc_file
+            try:
+                if subprocess.call(['doxygen', doxyfile], stdout=open(os.devnull, 'w')) != 0:
+                    print "Warning: doxygen failed."
+                    continue
+                subprocess.call([sys.executable, swig_doc_script,
+                                 os.path.join(doxy_dir, 'xml'), swig_doc_file],
+                                cwd=os.path.dirname(swig_doc_script))
+            except OSError:
+                print "Warning: Can't run doxygen, not refreshing the SWIG docs."
+                return
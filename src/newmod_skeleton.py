@@ -0,0 +1,236 @@
+""" User-supplied module skeletons for newmod """
+
+import os
+import shutil
+import tarfile
+import zipfile
+from multiprocessing.pool import ThreadPool
+
+from tree_rewriter import is_binary
+from util_functions import load_cache, save_cache
+
+### Skeleton sources #########################################################
+def _strip_common_dir(members):
+    """ Archives often contain one top-level directory (e.g. gr-howto/).
+    If so, remove it from all member names. members is a list of
+    (name, is_dir, handle) tuples. """
+    names = [m[0] for m in members]
+    top_dirs = set([n.split('/')[0] for n in names])
+    if len(top_dirs) != 1 or not [n for n in names if '/' in n]:
+        return members
+    prefix = top_dirs.pop() + '/'
+    return [(m[0][len(prefix):], m[1], m[2]) for m in members if m[0].startswith(prefix)]
+
+class DirSkeleton(object):
+    """ A skeleton that lives in a directory """
+    threadsafe = True # Every file is opened on its own
+    def __init__(self, path):
+        self.path = path
+        self._members = None
+        self._stamp = None
+
+    def _scan(self):
+        """ Walk the skeleton once, collecting members and their stats """
+        self._members = []
+        stamp = []
+        for (dirpath, dirnames, filenames) in os.walk(self.path):
+            dirnames[:] = sorted([d for d in dirnames if d not in ('.git', '.svn', '.hg')])
+            reldir = os.path.relpath(dirpath, self.path)
+            for name in dirnames + sorted(filenames):
+                relname = os.path.normpath(os.path.join(reldir, name))
+                fstat = os.lstat(os.path.join(dirpath, name))
+                self._members.append((relname, name in dirnames, None))
+                stamp.append((relname, fstat.st_size, fstat.st_mtime))
+        self._stamp = tuple(stamp)
+
+    def stamp(self):
+        """ Changes whenever any file in the skeleton changes """
+        if self._stamp is None:
+            self._scan()
+        return self._stamp
+
+    def members(self):
+        """ Return a list of (name, is_dir, handle), parents before children """
+        if self._members is None:
+            self._scan()
+        return self._members
+
+    def read(self, member):
+        """ Return the contents of a file """
+        return open(os.path.join(self.path, member[0]), 'rb').read()
+
+    def mode(self, member):
+        """ Return the permission bits of a file """
+        return os.stat(os.path.join(self.path, member[0])).st_mode & 07777
+
+    def copy(self, member, dest, link=False):
+        """ Copy a file unchanged to dest. If link is given, try to hard-link
+        it instead. """
+        src = os.path.join(self.path, member[0])
+        if os.path.islink(src):
+            os.symlink(os.readlink(src), dest)
+            return
+        if link:
+            try:
+                os.link(src, dest)
+                return
+            except OSError:
+                pass # E.g. different file systems, so copy
+        shutil.copyfile(src, dest)
+        shutil.copymode(src, dest)
+
+class TarSkeleton(object):
+    """ A skeleton packed into a (possibly compressed) tar file """
+    threadsafe = False # All members are read through one file object
+    def __init__(self, path):
+        self.path = path
+        self._tar = tarfile.open(path, mode='r:*')
+        self._members = None
+
+    def stamp(self):
+        """ Changes whenever the archive changes """
+        fstat = os.stat(self.path)
+        return (fstat.st_size, fstat.st_mtime)
+
+    def members(self):
+        """ Return a list of (name, is_dir, handle), parents before children """
+        if self._members is None:
+            members = []
+            for tarinfo in self._tar.getmembers():
+                name = os.path.normpath(tarinfo.name)
+                if name != '.' and (tarinfo.isdir() or tarinfo.isfile() or tarinfo.issym()):
+                    members.append((name, tarinfo.isdir(), tarinfo))
+            self._members = _strip_common_dir(members)
+        return self._members
+
+    def read(self, member):
+        """ Return the contents of a file """
+        if member[2].issym():
+            return ''
+        return self._tar.extractfile(member[2]).read()
+
+    def mode(self, member):
+        """ Return the permission bits of a file """
+        return member[2].mode & 07777
+
+    def copy(self, member, dest, link=False):
+        """ Copy a file unchanged to dest """
+        if member[2].issym():
+            os.symlink(member[2].linkname, dest)
+            return
+        shutil.copyfileobj(self._tar.extractfile(member[2]), open(dest, 'wb'))
+        os.chmod(dest, self.mode(member))
+
+class ZipSkeleton(object):
+    """ A skeleton packed into a zip file """
+    threadsafe = False # All members are read through one file object
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._members = None
+
+    def stamp(self):
+        """ Changes whenever the archive changes """
+        fstat = os.stat(self.path)
+        return (fstat.st_size, fstat.st_mtime)
+
+    def members(self):
+        """ Return a list of (name, is_dir, handle), parents before children """
+        if self._members is None:
+            members = []
+            for zipinfo in self._zip.infolist():
+                name = os.path.normpath(zipinfo.filename)
+                if name != '.':
+                    members.append((name, zipinfo.filename.endswith('/'), zipinfo))
+            self._members = _strip_common_dir(members)
+        return self._members
+
+    def read(self, member):
+        """ Return the contents of a file """
+        return self._zip.read(member[2])
+
+    def mode(self, member):
+        """ Return the permission bits of a file (0644 if not stored) """
+        return (member[2].external_attr >> 16) & 07777 or 0644
+
+    def copy(self, member, dest, link=False):
+        """ Copy a file unchanged to dest """
+        shutil.copyfileobj(self._zip.open(member[2]), open(dest, 'wb'))
+        os.chmod(dest, self.mode(member))
+
+def open_skeleton(path):
+    """ Return the right skeleton object for a directory, tar or zip file,
+    or None if path is none of these. """
+    path = os.path.abspath(path)
+    if os.path.isdir(path):
+        return DirSkeleton(path)
+    if os.path.isfile(path):
+        if zipfile.is_zipfile(path):
+            return ZipSkeleton(path)
+        if tarfile.is_tarfile(path):
+            return TarSkeleton(path)
+    return None
+
+### Skeleton manifest ########################################################
+def get_skeleton_manifest(skeleton, replacer):
+    """ Return a dict with the sets 'rewrite' (files whose contents contain
+    one of the placeholders) and 'rename' (paths containing a placeholder).
+    Building it requires reading the whole skeleton once, so manifests are
+    cached per skeleton and reused as long as the skeleton is unchanged. """
+    cache_name = 'skeleton_manifests'
+    cache = load_cache(cache_name)
+    cache_key = (os.path.abspath(skeleton.path), tuple(sorted(replacer.replacements.keys())))
+    stamp = skeleton.stamp()
+    if cache_key in cache and cache[cache_key]['stamp'] == stamp:
+        return cache[cache_key]['manifest']
+    print "Indexing skeleton %s..." % skeleton.path
+    manifest = {'rewrite': set(), 'rename': set()}
+    for member in skeleton.members():
+        if replacer.search(member[0]):
+            manifest['rename'].add(member[0])
+        if not member[1]:
+            data = skeleton.read(member)
+            if not is_binary(data[:1024]) and replacer.search(data):
+                manifest['rewrite'].add(member[0])
+    cache[cache_key] = {'stamp': stamp, 'manifest': manifest}
+    save_cache(cache_name, cache)
+    return manifest
+
+def create_from_skeleton(skeleton, replacer, link=False, num_threads=1):
+    """ Create a new module from a skeleton in the current directory.
+    Only the files listed in the manifest are read and rewritten,
+    everything else is copied (or hard-linked) as it is.
+    Directories are created first, then the files are written, in a thread
+    pool of num_threads threads if the skeleton can be read from several
+    threads (file I/O releases the GIL, which pays off for large skeletons). """
+    manifest = get_skeleton_manifest(skeleton, replacer)
+    files = []
+    for member in skeleton.members():
+        dest = member[0]
+        if dest in manifest['rename']:
+            dest = replacer.replace(dest)[0]
+        if member[1]:
+            if not os.path.isdir(dest):
+                os.makedirs(dest)
+            continue
+        if os.path.dirname(dest) and not os.path.isdir(os.path.dirname(dest)):
+            os.makedirs(os.path.dirname(dest))
+        files.append((member, dest))
+    def create_file(job):
+        """ Write one file of the new module """
+        (member, dest) = job
+        if member[0] in manifest['rewrite']:
+            open(dest, 'wb').write(replacer.replace(skeleton.read(member))[0])
+            os.chmod(dest, skeleton.mode(member))
+        else:
+            skeleton.copy(member, dest, link)
+    if num_threads > 1 and skeleton.threadsafe and len(files) > 1:
+        pool = ThreadPool(num_threads)
+        try:
+            pool.map(create_file, files)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for job in files:
+            create_file(job)
@@ -1,1034 +1,1050 @@
 ### The entire new module zipfile as base64 encoded tar.bz2  ###
-NEWMOD_TARFILE = """QlpoOTFBWSZTWYfc42YBX8V////9VoP///////////////8QAQgAEUoEgAgBBAABgig4YWs3lV6H
-Zu59vbde3G5cvNnc2Ach6z3TvazG689d5vNy8+Sca9vq5QqnxgN1g8OQ27tzrkA6d3ne8Mle2nQL
-3ZzTyda4LZoN3ddqAPQN2XiDVDRrbvPcHsworSbNmkmkoCwpK21MlG2stvruA0yRlmaxrTRWLRlt
-NRWiLabYow1JltlaNrNVrgen1p9eyT7GtMURCSULFakraTWNjIEKgzKVYyaWy+fQzzNIusrzbPHW
-NE75QFXLvg+6vY1mzT3Xte9EnfB9y+vr7wL17jUXrZh06vOcvPebVyz0ZpDstbo0+A+qyu32775v
-dcc3qy2hRbRsjNl5l3dHNDTJTDk3ZdBXu9bx12wG8VeGGq9h7jYWd08vdem1ls7BRRVACumigAD2
-94eAAAAH3sAfR57eQegBRmwDQGtB9NKRCVFABQAACu3zrTegC9jXIAAd7wAAHQ2UK9Ad1ltR3Ydd
-Mubvbe9ZUoAG7ydXk1UGsldimqgbYrrCidaQoUCla0JJFLZqXsaReY1T2wFPrgLilPe3JV7avRpS
-qbBtvdkkr2ZXvO7ozBmvsyfFF3GjxrEDYMQJUqFQAIJdOVysFVsYqy84auwYZ2NAHFR877n3Q9a4
-yVCARfRkGSFqqrACRG23ALa0VRVWsiEpKF2+7u1VVXq+46qgj3tyADaEG2axnR0CEdlNI21piibZ
-InDbto7uOMqxarWmnvcdUklKezTrFOho91udunbadj7t8Wr0yzaTpqUdRtSlJBtqpdgH2w8Nno6U
-VWrvoHdUVEB6mtlKBKaaKUUVbaqjTZGiBTZlBQFGUZllrtlSqXFgqr21cPsHr1Xq2sb0SOKoJJJf
-ZlUkqRBRC9uL6qxrZlIATZgNtK2z1TG0SzZSXrs64Vkl106qVKlX3bklwvSDpS+wDCObAqQnzlfO
-GCEnp7sGwYetLjSwEUoIqIqKVKUlFCtaqhVNs9UGy3sxUfeC3CUEAQAhAINAg0EwNEaaJk1PBNTa
-k2ptJ6NJ6YU9RiA9QeoaGgeoEppoghCBJiE09EVP2TVMxMmmRPVHqAyDR6T1GgDCAyNDRkAAAaCU
-3qqSU0UBoZAAARkYAjAmAACZMAAjAENMAAATBJ6pSSBTQp+kYU8oMm9KD0mg9QNMgAAAAAYgGmgN
-DQAAAIUkIQE0yAENJgTQAAU2gRiEnqfoamKDzQUNGZCMQxNAAAqJIQECaAgAIAAjRMQnlNGmMpim
-ZDSnpojE08pkNAABoBwf4Y/4SIIkJ/vSv66Gm6f95Jn31JS/5pUjbpf76MtX+v/0f+zNccHVIfkA
-T9IujtCpKDrFGwokKWVLuAEQ/BKLufn/Th+kOh+n9eXDZjEmP2TjOMzYy8XZUS85uFJ98QREfs4J
-Eg6Ao9AE3F5aqipCCmhiClSIv6oK1xlVmncqZzxJjEoGVzrEDzOSbwq35bGdEhRg6hWSWaYUgkoI
-akqRoyzLTRK0qVlkZFDtlQFSgQQyBFaFaQEoARlBZ0SrqExSRDUJiJKCyQCKLkCqI4LIAAjr8N8U
-0KYd4Ef5cDKL/r9Po1/C6XEe/fOVm38ah/oPxkU/shJ2B5sn9JAkf7T+ox7o4n9bNT/c4qhSEPuX
-q/C9X53twG+HfnPICAAAAMPr/4+vAAAgCICuM+y1VVVFX+/DP+FlBdOfX6CHbA30mylEeyiIHmvj
-S9wEjUx6Dy2/8oME6/uTr5TJDOS9TVhndkTp4UjBCK4CZLpQjE/cqBZRArD/a4y0HYdRD+JRUU2r
-2GBZiI5E1PzN6D+PxA+P0if4x1f9av3tNlbNmn8z1c9tjdXDTMmmZVfbUjVCEfUUMEDKECfFUDKU
-CEDJOUx11+LdeVeIZS66XXaXqWxpmWXFf7FaNZ/BXrpjyVipu0waHuEVDn/RZPZe3yWLomUkkfqP
-tKEP0ZJZ4GOcDDRYc6yBkQGFiwTHNTvi4clsdL1HgMEiNiNFGq6EfH7T3DPvFG+5oZyeCzoo6NsM
-PR7+07EfhLVFDqDCTl5eY5nR3LrdEncRRxJ+3v8n73Bf5f9lw/5Nu61KWdCIoiTPFdm8sANlH43i
-pI976mQ9ixPg5e5pMSpHRUKw6eWNkT/BX/bTUsJVNLJlKskjjfGXSxJMf14Ta/wrzWHCjajBoK/B
-B9HPHtNsX6oUfyyiFBy+vOrWR5YkqA/GEmyimAlOOJNW7FPUDIl84P0rlcGdf25tP55iNiOBJTQf
-vwCI+Xw5IvGD940FURl656cerfzRub5fRrTTUUWs5XnNgMu//Ly9R/B0+rVUNVJ/S7/1akcZrgiP
-ihM+4mdp5S6Jl34fKtg0EUxhiuy+eJ5loJS+gjNWJ9x7T5jvODg4OCtsdkDg+Ha+Vvse2N/dyQuA
-zpv/EZjFVVRQTmJ4und2AAYABIDnEBIAJJFaEgwHvOeDdeEOprnph4Kelyj+5ESCNS8StVX/r5Jz
-Oidc+7s7PEQE6sCmJhmKazHKgiaMsKlhoIk7PBk0Z85fiYqfGftjU2RKJLabTgyxrapJ/xOJhJys
-SRKa4gi178pQxSxpBYECGYShl5qtNq1xMimgwiiqmKQJQn0b9u/D1+Wc5dR6J3kk6k5maXuQXclp
-KUWoFzM4makjhYXiDowZEHaGoS25fPZkpzJKmpJfCcVPMhLvtWlXieX9mJjV5Edhdk+Y6zFV2rSo
-+ZYSvuGpoqHMJQdIgSjpHPBhrOonS/imb7vLK7qMPTiRCQkIQhBzOM3aKUyk6Eq2rVzH4ptfsrKc
-QYUq1IhAPU+Kle2HxNMgIOwySIiJDsEA67d90Vz1B5vpdvLOqWpg0u9PsgdcrWaBpcs2EZ41qcDz
-Tn3I2RjURyOVXn6ntxfRcrQRhTheSIlCSvmuzCbZQsmuMBEZqxu7RXrTrOtOu0eS9eRpaCI3UnGZ
-JI9FHXs7Du8gweDOJAO9Usj3P3H8aKj9ipQLtIcppI3/apiUEEFo/kxy65nsqG3dQLa/FUeyGv1Y
-wsnkrlOX9ZNRlJLxy/w+JuN+sy8JonwuqA6sDukrWEsmma1JEkz3kl9uBvc1oJSho542/ks8TAeo
-gDACSdEsHRZvbWNQR16wR9vHDv+py1OEUc7zdln5T4kmTomI0ZjpeX1cYrXZwZiummlCAYUFFRVT
-/NW/q9t1+GUmM8WCRbR1RYPfRiEYn867UY7Y0QolTUQENVxFIcAMiZ3BA8pFVQkNWMJqKTaDVbfY
-pvNSKEe6In0ApHfRO9j5rOFfRTtvn2nyfckbMqEaYgrTau7258u544d+J3k8AAOtlavpeeeXw8vP
-G5TUCiVIpmUkvslpJJJ5l3MqksHJTW/nz7ON0FODYxsMIKSiQoZjMwigtHdji5xpE687W17mtamK
-pCKSCftnyjzgBPySCeeO65IaN3x+P2mlfdRCmTlaSTn8HtURboGpX1pueU4ELPifNUiOd9xunLCR
-fDqWHaSJiBCCVKZSbSlGNrVF9Z1SJRpUllFmmlJSWANFBkrEyxmSTLSKRNVCJRMSTr5M57Bz449G
-++/rwyQTlBFJHFapdZ9lZ89+cppVgSLYeIUXpcoyi6iCjcvDMdGdtvGxtAYuYrtKkc2mSaejI0N8
-LKgCHvQQkvSFKEDwUkmPIY7BW66Ehts0ARO1AEMyOFc1ZXRJqqtWyy1rwyLzEmfInSX2WbVR3qjJ
-7X7tevWb41KGsU11isWSB1N6tkaKMUVuFn4LIduj2waJQEBhOanhtkPp6Ztm3ETnZqzK78QRj3KV
-LQ0yaltNZrsNSGlDTSkSpABoppM1qN8e3rxUFQQBtVTVyIV19Z6AmnRdGlyDtp5/DPvjNAEOP7fw
-bHpt57dZ0N8Oy00XZ4HKKUCECqgpOeYwlUAcb+0+gE25RyvK51VEX1/j28QAA+097at5ZEkbEEf2
-pJJYgwhUhYQsIKiFFSCwSoiKkLEKqWLIC0AatWLYrWo1AamUL63PSKT+CUibloFDjtAEDbUTMx3l
-uUOVM22MQACCAHSSQ2iZUzMTLd69J4vTG3VdrruvXp28V3rBoRhGoQhCEa4G6qqSlSHLcqREiCWx
-jmYgAoKpCcTUkEgxJCQhwMG2JyhySTMkzU1Vbu9ePTJ6QqhCvHp49Ld61yyqm9PC8hvPLnloTxeW
-+Ykq6tiFG+7Nq2200ohYiwSm6kIwsjxUhghVbY5+Hp3TXtr7og7fXzH49O2oqnSUjLMKnz6Mheey
-SXwcehzxU/DX98/VojSEq/LqtItYmUuz8fCDkFAL9viU9pR8So7/zb7ncw+Pc6FOfVPTlg7oL9bE
-ft2Ovd7SU8ds+knNi5n67ZQ7VDCJokyOAjsmL50EFFwKD8XvUoHNzTbJOXhPTEjnA3XvwhcPE8p9
-lCwSMLnmOTVl8UG13PvhiaOT6F6IpM+r8kWYPcHSisRAI/lF1BWcKSgtEbdUHCY1jQ6x0jSypEVJ
-AqcMRJMSIhwU4bJG6Q8H5l56Wu3mcNtfrdGy9hSe1T7lNKkskSKVHRRzka7vYb9faXKFQQ0tgHZ3
-h1CjnWXzBNGYIDDB0K4h6PJvPLfGCebWpdFTm2bK/uy5N0kaVInCwmD1Vili17e/DabMkKyZXtZk
-XSMTsrbfGyt3m4e9uNrvHhjDWKR4ub3Pcw8Hi7tRHgcn7D0cbPJ6uDfg5kSZeYIMFj+wgWFCYxEk
-YnXKQKKOCtPk4Ohu7kcn6HJh1f/Q4dnk6upyd2GMjke8TJm5MSB6SpidwiEwcLmY5QsGpmaPJ1c3
-vV4uH7noObsYPbu8G7xK/krsrSnDdw2d3R7lOStz627HJydk8Hm+F+i/GS++/X7zjnO3dxOcd3A8
-eAADycEucAA6c5zu7u4OJwOePHncdAHd3d3wvwK+obmQwwo5UsOJG577ugRGChMY6zcY3IGhwTES
-4pYmRFNyYxkKiZKRJjJ5CgQFJnApudCBQ1LSCgRLEjAbsIn1kSoUJHebEDzkSxI5kTuIjGoIRsKZ
-ECI4c1IihyNRjmcxxzyFS5kcyImIRFIBPEiQFMQcYc+4YOWYx6CQxmZkh0oMMCaGIyEKmY5j8NTx
-KhgSPZccwGMBTpIyNi5/QeIwkTmd5IgPg3Ozmx/S7vc03cMc3i2aNMeD0kPcQkosOx5lBQcGzRwc
-FlGwyhQcFkkjOivR+tPe5MdeHidlOjoxs5N1VpXdAyMgvMoJBRhSJ71TzljQvYVQoQKiMKFRxExP
-YRHO4ULkzGhIgXkWCJ4noPbi6CIZ4XVO7DxhGIYPnLySLLza1avPnAZRVFmsJ9x0NyZIROBgyUNE
-ALKfk9ncOJ6BVVOSh2rRfkq3dxHH5siIov0nwYfBL1vf2ispj8oDMvwwbCDHa2bQIxRAYqBDRChv
-C4zQUgnnq2IVTTAUD4kDjDqEAyEr5IX42+2IbsqZ1XVz2DRlT5fz7CAn97fKB6oU7fh9Bnw6nepi
-BKL5ccflN/u9R18BO2GVXms6483GeSZ+6J6hGiBZQSKBKPRSjk+CbpIUCQ5k43Y7UyoklShCtNDg
-4/Adrxn9a1Q7QH4o1RfzQnLQY0IUK01W/7dOv/P7Pm0fP+V+ZBU95IsqMUKqgofLIKr6hRhFQRQ6
-lB0EovwJH6z1n4CP/UaPI++Z+XNo/3m22tvuOiqoAfrJVRLDfQSRP4S+BCCDtIgSAmcQGPKSkf7P
-7S5gQMBYPAzwawcnJCUQo0bPLRDJ6HAZ2SEo0x4nQQ20vZzZTzrJsWuTbU3VOIH3kICq/NKKimjt
-3Lz9mxojUeY2w7hHY/0MxsIeizo/LIyVHIrxDMGSSTIxliTVIH4iBTgobg8go5TYugAlS4QIBMkW
-kUPhNCEywAggCbkz+oUbYW5gTE8siAQMVitn/radIcmN2ghuVIfR+v5Q3TSYuJwZFjYwGNSgWQDF
-V97LuRXTNUOViCBz5lO/3jTtM/8hgYRPcQ4QkT/dPzcmm1mAPPDS6EZmM0QGUEtJ2HiWvr+H6BvU
-0jzL8Z+0ZMGOefKXc6faSIN3t4EZjepO5ZkjDUciEpv+EC6AIKH3DHnCxI+PuyT+qrDCnlyPGvnU
-RESKm4L53MKMoxBMkWDcbkiN+Ir2fI5EoTKo+F5Vv85I+M84xWrC1S5zFI+RiQKKWl4kNVQMW83m
-oeSB9BqMfSeEjywL7kyKD5YIoqnuZPSJQ+8ZCLDcBA8oomZ1GJWWFl61HV8k8YdPU1O/w4O8t7Zv
-h5ULYR+mkN2pFzzKQ+KP2OSnXF7WY0VVgknlriaQsy+l4sCotFGFMxY8LdaSIpKESSy9MvkhjM2y
-eoDz6oouZj8nYzlFeXWXgR2jRvF7xeQ7mC6U0ta7F3pWmJhO85ThN40weZgsalaOPVfUUTk98Eb7
-M6OWanlf8o8DS3Zh9SIICIoKKKggh5RNII6fXDn67ffBPKkNlVX4Oek1Xv0THQi4gEH3yTHK1pz5
-zB2IGKg+9dMRV7K4VNKpNm01YZpIyZJmMGaWmm9+q18aJuYYH3kTAYmWP2kSQhPBgLBAYkMn4+8B
-KjByZH+rMUM9GTGUYhFjPoMF8GSzwaPAmn/Mbv0uGHJ7DDlNHJpp+/eyRI8nD47+TwY/9xeUSOjJ
-+ZzcJs/F4tnJCRW7lw8H79fpfaqkWFVUqpUUr7OHm3T536j2Nnsd3g+k+vf8dJCOP50O1InNSem8
-IIiTOw+UmHeKdQ57DtcWBcJncVHGHPE+Q/OMYH5BjE8DE6yo5l+by8f2KIpDrOhz5HT51ObHv/wa
-pCM45/TrPIhuiSUh7FI/k6/uh7v8OOW301fxx9userGr5Pmn9s/g2P8SfEdoR06dJYqmYqfYuMYk
-vfY/6SjfuOoYxTLuDIuRO4U94mWT5ib8zdvwrFPoPZ+k+PZ9UE6vcf8gjB87/XTmF7VqPEY/nAeH
-ylQT9h8ign4XyNg5H4RSY/ef2jHWoQNyjfd0+0+1WASfYcDBQgOb9BNxXD3pNHaVvJG2OZ5+mk+T
-6X+Xh2cwgOh5FGFT3xgcHgzZNg7KTI84WQxPp7/xGGvz8YL6zL6VmiakH+2QlHlRmX2t8aCBCSRP
-IetIQPDQnAda2se7u7hVcEN/Z+6SoIzN8/l7g+QIjBwSLuZhYSYPYPVIGJGxE6giXJH7zIwxxPrT
-5RHOuGFicVADBA/P0o6AU8ZiAIdYm8LyCqle4YTbAEBbIuinXuXkAD6d0ZNQxh7lPc5R9kII1KUV
-fDspOcTxUpiMI65EQ7UujuY9t7arqElVpglHZEkL3ygmkxKvIRKsy9TZ0iTSXetzSiRyYiOTQMjQ
-kXQBCQr4kykSMbimKWkPvIbEmdQzZyFgBRHZRuFHcyMrgxEG93BWuTvz/d7XtV3vY0AJE2wkmCWr
-VqywsfQ7NnmrfedW42dfsN9l7bmQc940FVYEfMdFFeZ0SZZqKNljJPeIOM2+V8nLiNmCI9AqoYiT
-B8wdaRCS+AiV+AmZhAhyzB3wGbcBgAxpighFFDqG0tAnAQEHmNAsaNPoCGYVJ5DkiRKbp1kgZQ5Z
-wT5OvabPOcd0tX3K3STTNK6OHk08/eRIJQVGDc+1PgwM8bdXLRXlgNymggDJiUU5myAIQ7CSMnNZ
-Kc8giPYe5MmgQLvMTcyREkKqn6zYUfSHUO5yJNEevv7eLtOaoHEqv7B7J5A7Ciu7t+kPwJ/VdRPp
-P8mf3UH+lP2n5D5D15QtBwIHw/Gh51ZAT5ypod5TawH4POwZgKp+HgsQzVH7iwff1DC790xj8j+P
-GEhExBUGFQyBQeDPmeDsZ93TuEdxQrMjkoye/urQiGIgyNzXKqsRHy7hwKhtz9sERBb2GLed4lz2
-uMSQeczDz+q+GebWruOFPUSnrhJ6+ufZ9f3YXCBQ/Y2Sb/J8zJyY6Q/hY7nz299+/hqdSYnAnmUT
-rFNRXglMKYrycpybuD7mmp2V46j5ZMMzC0W5lnumNKvXdZw5jOj1N9XcrT8qVSlOFa+OyY5jg4ac
-MaSfP0dWyu6Y2aaWc3Pq7C9vePhbsbqVT6TTu0r2ONO6VGyvGU5pivB+h4v7Xlvw9id5ir1cuqk1
-LmAfAZgwUQE3QE8yQ7iIdBEEO88DC7zYPh7u53C7o3Pow8pmIiKPbjg8HVz2chD90J+af13JbbJ+
-Va2Cebh87m/Buj2FQ+uo+Cok/E5keR+ayG38buIogKCogevmiISPHuPZQ86kIEOuHveefoE1ExZY
-/l1tbstuv/aIaPxfUz4qnmzO75KqqTGJsp7FdN8+9eeZNPixhzY+1VflwbO7BusjSdT500k22bj8
-rs3ePGnh7tzdfL5saVIqpye+Y6vqbHd7H4PwNu9GKk64hihSqpVKqtSRhMWVEoSIpDBBCxBEHNI2
-AGfkDg2MD8mTEexIUzAg8CYzo+0YV/MT8HEqSEmKKp07PI43hEzIBQY7R0TYcuQIkiR4yR0sEz2+
-Dh0YJsYo/XZ9iunzHIjmQBRsWKKilQ4IpuWInd4L2ti7rMwNjGICJucziOHxPfcKoHrHYlDgLj3D
-o0qRHOhSzZHr7tl7fn6OceHG87IiT2PPJCLKiaRBPF7eDUyClEgjIC3BsqOawVFX6+r5Ucdc/o8f
-2eO30Pax70V6+f18nl81npLVzHJ04t/ywmtFPmU81PT29Whx7rPGE/Ia2+f83J0+luOr6Fed4twq
-pY+z+IycNCHlnP24nOp778FnZU4dDlXDTRsPlww6K9fmxs+Z3adlHRU+Z+RBNm70VulK91YqTyrr
-Y+OseKtnt8vo3bp8PnSsH9XLf5t/dw9Xp6FV9ImYehjFiSlVZKlTZ/l2mtpOBDNXD3dhNzZuxjde
-a473VfZfd38C32ZfL4fHxd0I8FRKstlqUnzN1pZJFJskUxZT78ilkLWFaxiixS/mYwxcWRYtStX4
-K2bT2nnzIi+rk8HpHR6ofrscNn5q5le5v0x9Lo8FVRVcPnctNQ6wxz0fjTgro/fCe/jmJ4Ozqqir
-VK81x6Lo6k3MYOrk8iE+QRrYYVUkjFkgpXQ5qslT3GAnyHLkHpMRV85PqjtI/ivDkHP5/OKr/QMm
-4eOYS993QR1Ce/y+N0zTv8HKdREcH5mQp0GPBun0v/Jjoro9inka+nvpj/DL90akSHwS5sv+P8u0
-mtn46/YSq9PRPJjwRycGH21jZhTcmSHCgO/wFCYUF2YLFYEDtKESBLxJARLPYwScoyOP0DjQ/4Bx
-oeSxDM3ApOV1g+IwwQM/GIYzeYo2UIRJUrdElDKMGiyhHZFAsFBhjnB2JNG8dTwYDRgggDDDE7UD
-FgB7yyIEzUpkXCxnAqYHllALECMqFjGbJlMKGgqETIuTFKlSFY3LHtBgkP6LjlS/gejmQJlPFUoU
-FRjkOyvtHzDhqaAxqVGxSxUjBntY8mJE/MxqiIiUJilDdizkgcwUeCDm8BiBMcjyN4hYiVNTkOfO
-bmJbVcK7smNzmmPqOr0acuXJrxd/F4uJhGRcrEYVyMOuGI5gTOCxYxLpwEEQGKijHNwxdWWNpj+P
-Vu0b9HHveb31u8Ve5VG2gMQGFqmZclyKFDFTuUxFKjC9eAwpgMZlA8p8XqJmYZHA6HM/URSp+Q9E
-RT4D0lD9JEURT4iGpQ9gp1YE0CX7nGLmRGBgRQADknYdRiTIAMKJq3mqMnUvYXIHzLCpzOwgQue/
-gfaEE6MFBilzMgg/1T6CTXmIv5Emj3lFyMHjgf3cEAUPCBQgkCaZF5DlhjIUmCgJAuKcDSHPUKnq
-CAIe3CkRaFepTETmSzHQYeDk6RDOIOTN6kz1EkEYVExIjI4TPWN05knJGDBWFWXGObGVYxdNfQ0J
-sulBRVFDFRnPTnDExbmNsxCSXSQs7aOBCRVqE7krgvsJfA7HgZ9w+jk6EbNtJEnqRJok2E4mKpss
-5FI+LTJ7vJ6fq77tmGycH3mj8h1HYdxHahOjxQE8euiiqKqgUoAVlYGzZIoBIWWBrNYCCAEmZVVV
-XOJcoZtkqOKUGLRR5Gg3uc7pmOJXGgN2nNo5PFy5ejzV4qhjy7rqtG0q1oxSzMVTn5uGya2cKqtO
-FTGVNNmNmlZDF3pipVGywqpsxjSq3YkrZgxWpo3aVU02bMVNBTbZl0wKpBuVSwaaTSpXAUDIIwcF
-FnUi68jRwaK2GJZR4KChYKDhIgHnTTQ9fkibFm0G2YgPkIJqKAKKBZT2qbuYFCZCNPmhopA+BySw
-O1gmUPaowoysVldn83t83fHNPjjHsV5ruqMT2Olad5O0k8nB5Nxlfdtk8CJJnW6/vPm/bpz7q5NO
-35DcjPtVPB5sX3snshGlj6F6VJzWPpY7NT/GVu2cNcXZRWzk09zhWmpCAoXPGBolDUU1GGMXGNFH
-KTsQJCwVVqDZ34X3dW7hycnLHwVjLww2dT6XNMTYuKqQclJ9SuFG/Nu6Orntdaclm6wN1bUX4zjz
-fJ7jUmnM5q5TZOU4tjkVCTkdxyZEkKSsdZrKp5ihMO5UiG4qFM1Ofjt4TxgjnIRiR1gjdESUhqAE
-U2Hi1c02rsgDJ+j8fqcHzGewDO5JoUJG9j2s37bMVpXDUyKlTy/ewaeXq7G2LI9yk03ZXSLrFevp
-z07P0vtNnN59zkyGCxgyRHRJs0WcEkx7ij3FjbHcleWZX0akNnpMWfcSB/GKkQzZ1z0GNK5ptXMs
-WFCJQPpxElAgbqWPhIA0emIwnlgGBsQj0e44NNq3Zicz5Psm616KeqvyvmYdH3q6p5TTY03WK3ct
-mntK5uMxibve8v01J6nB54PX3FiN+EyabVyWDtObbSKBQvNSiVrZDXtGLucObGBWUggIhjAiWAmZ
-DGRiZKTISxGKFi45IUcRhhzEjYKhMhVjSuU2Smnu2cA8AbQkYp4NHrUPgXQOBioopLAKDSW1SgCb
-HyWIGdzMYfwNgYlt4sVJgUXKBIVA4TTJ7abi6gwK1dB2cnyZw3zkzljb6n8O/hHU7MMD7VJpXi2x
-usQYfDwfobvFwbWq5tmPT3Vv4tnsJTGGKS0ID6uU6jgqUgTaQ02IIoXhNZHdBzBDC+uQ5AqsFydG
-JkDrIntMimeYNz6u/AxoUGKDx5VD4EepzYwYiKA9fNZiCabTbyZZ7Zj7F0aVSA9EJIh3kpugoMoI
-VIm18CJiIaFLnxVEUWgVoMKVGMesiQHPUSGJDCYiNHf5I7FX5nqMSRRIj4fMdjnGAZgQIeSKAoRV
-eOzoozgJGWIM/vUfzIssJEILqeFANhCoWJp5yPcSEqLNASRWJTmRNokvL2PggMaS9paGpluUploa
-TloaTloaTmU5baGk5aGk5aGk5aGk5aGpltoamW2hqZbaGpltoakltoaTloamW2hpOWhpOZTiIlto
-amW2hpOWhqZblOW2hIamJbaGpltoamJbaGpJbaGpJbaGpJbaGk5aGk5aGpAluU5baGk5aGk5aGk5
-aGk5lKZab319x6TzkD6J4ILxbJxoAw63PgMCI4oSFPOcDInZh9z067vcrdT8arqw5q3bseLGNK+1
-u2dPobntU8qYUxuxiz1aYlVphs0xzbPNh3c2zgxsd3I96tzd6vc7tp2fr5OFbFWebdjop7PjjyaY
-8laUkdpAcCwKURJGh5SohgYbjFIC2WwULDG1VXCbzZXg+hzMdkrg0b43bTZXJk96uqtlk2YroVpz
-9t8b4c/E7nz9YxZn0dRgNcv2VHSp1Y0FzRRXMCowBIRUIjmJMgGZyzHlCFhnYhQ/OMYifQAkPG5Y
-iALiKG9T2vLZwVw6OR/ubsNwhZj8x5vH8a9iYnMwMRwRzsFIlyp1Egz4uDclHFJCtALtXNNq8xZ+
-g8j9AqjiOjiexJ3u12iD0Ecm4E7mKre48KeLg83VXI6K5dcXpvwcOqS0ifAfMgXRDMqTJArgpiXC
-BI3UxMEhoEiSc/LzyOl7M+juOrZuro7J3KNvDhnopiYV+1jOGmbIAg9C7+qJqETU8CA4pieUXL2H
-G3SMCDayY0DuJnlLyXEyKHWOyIhNTYUpcueZzZdnJoooXoZoURAw/jGepgoBjNHgoyyhH7UUI4+4
-YaOwVZJwbwJnc+07lkbFN+hUgTGicFixvMYijcDOEgYsH4TuwMOzXn39XfiajmJuC8u2R7LxIEyQ
-+OFAj10InYTMRTj5idlSZZJGDzLhlCEcMkYixz0hFCYuMRJEjsCZE94U521PZS5wYCiUBmOoc942
-LlzqU0LJHYotkOENcSIiKZU+0+k9J8naHyWYWRnl5O3QzxDNk1FBGVNMA1PMRIgTKjB1HaVfjThX
-i9DvFf0sdZ6clcj6G+mnSnfH4tzzN7yFKjnDihpihlrqX6nAiKCRGSTEhSIaGBTajfcKSHL3KhMc
-ycZPDEBLi2FgR0MMP7NEnOb8/FqsMLR6HRMdyQRJ1ejHN3e9+k0xT1buGpHoi7Oj2vJu3jZOPljm
-2Kru0Jp0xXDTGp4G7G6uGakMRJYViEI8yzBgwUbNBGoGYPgYHs/Ycvq082uGG4W0BTFsBurUc4iT
-KfTQqblhqlAU5V8n2uvtclcHr7ubl5nDm9W5WIxjCrdytyUkkSWvVRatXru+N+CualFTwSmTm5q0
-+hXbZidJZx41r2OCwi5PVgdZJCizGiP5UBZrzUxF+R5DGSiaIiCIk1RBOUBSR4qTLm42Q3DX0BiJ
-aJN8PJ5l6lN+euOBiWIfF4VyAJAokhJ4ruDVd16EhTAJAxA0NSxY2KlxxigwQSQpQgMlcOpZ0iaO
-Es9RxwxLmKIghU41zJOfWaKQNjYBIeBAmdUcfbK5hmJI7jtoQOh7Bg1FJgxXLzFhyHepWSiGgKdZ
-gl9zCbnPowhyEOsLgxQkKWMherII4rFoO6x1TWXtxARiRm6J26dfQIB3U8puuFjY6NPJtiuBNB7i
-UT2HBqYhuZmp6GF7zxdNjwwJaPqYD/NIY2I5qSFoWJCkCBMhmd5IfXUyOZiMYjiFZ4Lg7JFTIooR
-k4JMCGICL+f0rXxx0TrkYvhH7XzrC3GA/hvtS3o1IMRoYOQQoRfJIIyfYOMCgpKzEReBiZ+YRCUy
-PhQwqIdhCQV8KjZea8kjW9CBwHxRyQBCRE6GA5yPAoUIYrXNaKq4iiAh+cnxVrWZpdkl5rC8lKSx
-dsRuUrUHygRgSTW1taUqV+ZfwblanS4zo2WdigQhlDPkUUe8o+PGsbJMEuAwUIhggYhGjDB0YY4V
-wqvaxjZ9Lmwk2lcFdmzF2jDMYxjGzGNpw5q3ccOX3OZ+8PDPrD5ZyqJttaMMQaPoOxvroTPfg6Mi
-LIJIgS98zPNQyKgooIimJlnmDOWkPG+DEzhSMhPIOULaBIyAuUJGgxMfsHKCnykhGPhjHZJJjmcP
-Pp1ebZTzVy6JjzY0sNPnc2nR2MbvN7GjeU3krGPqrG7GqdyiuqCWJsJYmwlibCWJsJYmwzo5vV1d
-W7djFn9quqfr540+Q06o/fQQhf9u5wZiIiWHKlN5EILUgMxoo8GDSOiHlVEi5YgWKETwCwUIBbdA
-sgRLQDmDfHbtLEiqIoYIgXLFVIU863LJJM0mY9xArcwFDAMmRGhHBo1HsZKGaKMjEIFB1OX/SXtR
-fzgA984yahrDRTvcpUAId6EUataqvPxrOeNEnnfY2ZimaPR6q2ejq/Bs2fFR4zpPlJEakD0mHpNT
-0HwhoCYJgYIiGDDhcYwIDECW77G0zStDMUSwolOlrP0S8mqqOqKp0VI/l+wh0U+GDtPWq+PAZzRl
-JSljLhT3c6mbki1hfOeLxHFcq9Pe5XKYypZMWaFovJKSaK5muv6NqaW4WqqyiY8SfjGa8QsgTk7Q
-ZmGVWz7J6wrJsQZVagJg7ISFi/Vyd050Eu8wSzXdjyt0rRI6rrrtrWJgu1mQgoJJcV37+laxOglK
-dBG3MRgVv09G49NEcvJEcNd2Nm2rIoktlzHYqRGYUpoRHREKB1kyEjljzXTXzL7OHJ1dZpj6KWUi
-P44yJzfzsHFRipJ+Ko3cc3qcng4cNPNTs3eE/YXGOjG1N6xpWObTGB/kf2vsVOHQSQxwMcDswzHF
-wEudiSMCKkSR6SIDpZNFXB4O4UEG4wFGTZxs2BHI7OWaCSBqE3dxARxEgd52y6yncpLGgzoYFgWn
-vYh2k0rkfF3X4N+rq+b3hE2ET4kRREYFGFC7qb/SZwINEbdiGhkMOVUc4I/WXGFDcuKAlQgXJnM+
-SuFd05qkUVDHZu1McPc66cGMkI31gAnhX5Xvbcjqfb+lb2+HDz/Jm3ox0jm54bN2YhqnmGLgqKJV
-jgdCaPBPAsMULHuk2IlHRsoPXzPpMBlB15rM7bQ1JEttdvyNzyd2Zi03HgZKUqqV8tJs7pKELsbt
-kngZ4HjRgCUB+GeV2nu2vQRJmvIJZIVhObbVmvgMoPca9UdHcsNB4NGw5qTKARyWg2TutCyUNSw5
-2DER0qSJkYiLENGx+Tj79zvaMiYSZ4ixVH8KnsIlCMyZRUVTI5FjIJwFLjjDApoKMpSyTi9yaXJn
-QiajkUd2cRQoeB3lgmKLI+U+AbEz5ImabFIAwYkUbYFOA21DIUwuGxgwXZcG4bXRTJK1glGMLE02
-sesn4BBwcn0ljBmCLmZGDgMegs5ImPhgTKjDGRQ+dSpc0B2/Pc3Y2fBWnsY2bGPQd1B4AwEQ06rJ
-KpYBMIZG4qBI9evJ0NCYG9kBDMUC4pATCcIAalg8hENhQzDzcHoKpE7hesyZKnQ8FM4YW66URAih
-85qa8aETfqGKi8lQTmKnJZKV9lcdOXL0/RZwsTZzaaFYex7zznTpfa5kbq3LAIc41592ni9zHZXF
-j5MxjNng2Nujxe+bN1NnRW6ySQjxxUcUsS8bMdQTUsQxIlTMGTFVFc0Uhjwapodo0M9BgzBrRwZP
-PUlgQQayszbaxcARqCN4I3dXVh1c9MO7QkkdOrxbBecHcWTH05o0fZCMM4ODhnJLQKzks7hMxSJJ
-sCJDOKPB6CJKEMQeDyWuAuqEppa3uNCJfjKkcRzQ0ARhyhYmSIGooVVxyfS+TZNLedbyJTTrUdWm
-zoYabY4MEsEUEwehk1yUaNF9hCLNvBMkks2SSImEUZLDmSgowT7zZZRoMGDZ3yZLiBCCyTIboJNl
-WUScPg4MElHJpalo2dROaJ1bI/SVxOTdTl4t5t5erTW4wMZI0IZIzAkdijVEnJgkqpLKGOJFEoMm
-yR0EgySWIU4Z48FnoijZ5kgxGihnijeTrzMEUdpDsugoZjmTBD2MTwICCOQITYhCDGJysEAmeQ0H
-NCZ1kC5kZSOhU2Ll07hRMAUDqQoWcPkOs7xwD2EhkRNgE0J+Nzz9JmAwk5jEqDjgJBwVAELzKCic
-ASOhyOQCfefKMef+BARqKYmhkMQdtSV7DOFeDFUzGuH1a3f6FceLZybNkEYcJocjQj4EjE8pZzIg
-fgwMxO4U6hS6dqLZzTS15Ozh97HJNdVmzq3fLb2TmnTmSJJ/W6nV1cn7H9bc4aZSleSuFdn7nk5O
-QhEIkig56yIMQJgwR0G0xJkzE672cqMakDxjEUpcqeYtIodQKFAmJcUcOsUYjYPcEHaBwe4gImD8
-ncsGWWBztWTTas0aoyCKwwlibCWJsJjno95zgxzx7woDgikBMQXbg7B8bGauZXxDREEgDCmoS/K5
-CZDm2dLIVsw0pNJ3UxOfsxPo1joVw0HqMo1HsM4PQkJMljDaNlkI6HGBGHE3OZA05EypsDmsAknr
-Oq5nALFAYGFRUFFzNA0zJgv4AmZFTJLwyRmTZZKbLIaZgKZO8yWGA8zaGMyZ6OwdGjRk0EMYZ5LC
-JcJuQIyPssiDESpxAEugfCIoJUxLFzozovRp5PDx/5+BPX0buTqTGO6k3FV4Wfp1ev2QgOKq/cEe
-r4CXHHTjGIjr2alCfq/Pyz1Y5hgcGRkfmhyPrUVEBShM17ZHcKOaEjDreLUOwekkUjN+ZEe7EkiM
-XUuSPUVLQQRNKCmhhQBOx1HMBmku00hqSJba7nE2qJttQjh5CXq8Pe2204cMVtpwSc3DtwR4eUTE
-ThUo5ODe5CRrBO20jh5CWJsJybMRBGCJVTAyC4mAIvpKDH8C6SgaXPhGLChEuYKYmpYFLiSDIqSM
-AUjZwkw6DLrqHaWFgbcmJbxTdnzfxqQH7ejTty5uzd3ew3HYJHr4J47gzjHCjEyZQ4RSJcxIBI3k
-OOQe08+t7+r0V8XMqPMVySajtI4P536HfhEk+g1WIxKFtUtgjJImbKZ1X0qxuKXK0SYLBPTIJZJC
-hQCUdw7ncRbLJMYO1SXhNou6ycgHVYS2+H5ERBnMSoUL4IiqUrALhFuhl3p5Xy3qEAWtsEISlLhL
-VYi1tkWtshFu22WBCS1dcq9671eu69WtvQAi1tk5yhFrbItba1tkJSlQhfD6vbrr283t7eV1UBFr
-au1c6uRCLW2tbZLrru67uu6QkJCQkJF2uQnc7lckoCEISSi1tkJJTlbrW1u3nXVGjFMQwDYXWtGY
-RSsKwkrEGrWyLW2tba1tgly5XCO7uu3bEhI1vO1vKt53XdIS2yEWtsgIOXa3a127dW3bW7bI7ZCS
-UITudyhV1kyaTMxjRKQ0Q3ENiGmpOcuEIQEWt8LrvftfHXwXl4GZMyTmSap68yi/R75flCgiUFLY
-DEA3MQ+yKNIqi1KtV0VMmRTyVIOjZitNk0KSoU0yJFKkY5ac/mntnPEhies0RAAgQHJHB1KWMgyF
-JkyxzsOddJdmskBzUYmObj/FciDmIwOKMeQcxORQE4dFYc5zeH0HvKnudjh6q4WTSvi+Vck2jZpw
-7NtR+jo2cFUqk+p2eaerw7u5mGdR3flYTSAjzExB2OeeIjZZkZswcCHIolCJM9BMj1ChxrMcz6DH
-0lhGCjGOvbVtmzYoIxQgTLnMgczicyxWgowkAUTnyEVUOhYwEECpwMAjFS/v6iZEkI3MA1Ne5SA7
-6fB8m7it4I/Zx/Q2dnUyz3O7w+iXFV4ORMyBzIjFCRUU7yImhQ4cY2KjkyB8A588izn5tmI3sttM
-ySdUFye8sMqPdszkcCKDQsbHWRoSDcuYiRGG1W2FHp2s8ElozQMzDQcTYUnAzGHosCGgYIlNQGLE
-iZcU1YYLGPNu2fUrdj2fkPtMfnfrPvFf2Mcmm7knRTDhHD9b9bdyOabP4NNnNXZzbuSscN2zRpux
-jh3Pep3adVY6SnD3q6ED8Z6zEiVJH1n7jYiB9goTHKlBipUiOSDq6sdVcn+x9zkbPcp69GJMc3Vs
-2f3NNkaVWyjzcnI8HVw0j/a9j1OjfnbcTZXsU3ejq+D2OzdSuCqObDqe9jd2MnUSIimZc3MSoMKI
-QOxTmTCwpXsl14RPRDw1Wa9qy8RqeR1ehc8/m85BgYDOauN6ndXGIA9xBK0VvoqaOnvNHflEfFsa
-DHIXX0sknDE02EQUj3sOL6FUdlO7Y2ac2jyagxYOiXLTu7TfYbG8wxu7qwcTGe514dmyvufFuneu
-bhjHg0Jjn4e9jjdMf2KVyNbK5OWDwcmKp0VPFzYR4OTHIuMOdC5YmIkzMkMRKkXOsqdRIgYEyxIW
-R8AOb2MiqYXxIjIw5mSIl6mFixBRLQMzRmttJsV5q0rFTiq7pjg6dHTZDkpVTSvJ4f2m8hSkbO6h
-G3fDkuXJEBC1pFypYJGQ5IiMEgiTUGIDCSJDBkKFRS5MqUSI8RFIFwPhvNJCSJGzTs4dI0aKjhw2
-aacsTu6sVLE9WiBAvETMUSoopQY1KBoGgwxlYmfBUqYFwzV0lZi4pAraQMQIZmA44ZkevqpiYGUj
-ciWiZTDEKESEMnMgomIXJFzUuPX+HHEsYJIvAheFiTnMwGHkalDEYQsROhJyAxBjAO6c3Zzadnsd
-HldieErqrwd2N1cykOWSR5COxUiKPAjlDLsk4g2I9pebso7ehJuIg5OgZkJDJZosYjuIsvA5ESSU
-JmTYUFC6JPI8FQytmhh4KOSgsxjteOGmlK8WHJux2xjucMda2TXR2KKEGCzG5ChiAi6zySUaMGRk
-EeMGpQqYCmQRMCxYMC5fAocEhihIsQFMCdclFlhWawPjkyWOzZoZsLNHftZ56xng3iTIhYwCJYxD
-EzPAuFihg9h0UxLmBqyJ85oVIDFksZkwqXWgxEUyLimApUdhTc2ElmDz4LULoxyYESZOTJoo8yiz
-MnRZk0cM9TsZLNllLGE6MiLNSVvcp+LR7yifCsGQopiYVLGBgdRjItpTg3KAxEYkTJHYVAiREkeT
-NkmCOTHnutaku/J8WdxEI7MaVoTZv7l9Dd3Nno5Hk6OGzyY8u7usKREIiMKZ5im+tYESgWKOFSxY
-n3Fz41PBs8XOeTpt226+Kq9qehVVSvRTHWsFV3UqynoyKesK5sY0bqbtGDkkCJE9JuT+hip6YFDQ
-UNhTMyNcMiCa3GNjEvFaPRGd3JjTVRSA2/MYlEgFyRkZDJe/o7GjJJ0CECBkmd9pKN8M0cnQjYcD
-HLOlSgWKiwKFEOh+Gh1kTO2VCFxgqgYokd9G6V8HJj+L5zJDTforqsk9FklWPNKVUbMVk3sTFBoq
-JVRUlBVSMVjGJiWIPtVjbq1yafMdFHuo5DF3wWXk8yRmBIJ4jQZIsK2Mk9e0QgciZQIk3AnAGEc3
-J+geBIxEYZCpoORUYqalTQlgTQcao5nI/IQsKTKBMX0ClxdSI8pJMbwJTlY2NDylCxPJyZCpFT5X
-ctt+NsqGV5ytlQ7VNqkqp0FHwVJN3iYer3tvDt2cOzs00wrSp4q5cmFjIyHI4MLcYdbCgxcXsHSZ
-MYiZp8MyAEDBchRShBywMKSDtJX7QaJHinpPmGNBQ3FJkwgblTDDFYGEgjiifOecuHhoTYqQICmw
-wMJlcsomdAOsk4pmaDHp0EqiFiBcxGE7WK5kCYnU44pEj4nIyEEsT0KGBUMyJPCLsJRGPowK0iRc
-nj2FimZuamOykTocjDY7wUm6nizZKrKxqY8nZyY2L68mIrGExVVKo8jdjRxhyVpUVSrJwqJMVJVF
-JSeV5qY+ls0qoopvhjmpWMVUk9grP6FzoObRSY9zAUinA/rGNDAIlUkPZKy9w5bEOAActjDt567u
-7m05vexHsWJwr2pJJjHJkXEQSIgiENxUQsKm2kTWG1jIxMVccWNmgM46OVeRqozXm4mQ5UyDUBMS
-QYCmQQARjEORAIEfAUmGxCgaFhKIVRRMzIoZFJkiammAR5gWKnBALChIUyQEXAiqaLaYpMgZTVXw
-iiMVPWdoyUJgwpI5lqKYEjIc5DR3GOCgGCJrYxaJFUdzJIgLngoR6FUH9MUjLyzZcZLDk6LLgZJg
-EHq8W/rWzwUe9yPB8zY7ibKf4mPcp0WdHm4NOrT+dGmOGRhTyY4PF2dDgwswbdBYIBFmRQMo9ihk
-QihhR9Q26nmk6vuburk4e9jm0JTs7O7GJit3owNlSpaqcL4U0rr7ejQ5rzf4vUyYNGA6GM5EUclH
-DCTwSWIiiST2LNNNlY0x3UxY0qMoe29XDZXk8oiBHQiiaJKwx9DNjNft1uzUmREJQe8xIOVFJO04
-Dm3kQEgjnge00JBkbWlGGtD3y3zxPPmc+87juU3c0HATnBhs2I8wiZlhhhhiBMIKm0gPiyGrMUFO
-l3BtfFTBS/Fh+oBPWerh1SufZNNGFYY+9sw2d2HpWz2dkThsi9PKPpY4erzX9795sn8Y/6CHyJE/
-z+KdqAptrPYlA8ZARX9P6FVVbhUTZYqZ0ZCMWSynx/cyN/l8/ZTQoYZwztkohE93o+fIP8p9R+9f
-iX+BfwKH+Jf1L/noysrKygysrKMrKysoMrKyjKysrP3np5HWaow3BEU+QU7hQzoU9VVXvgvmE/ZA
-huZh+43iH6rge7E/Y9Tz7+Xv0OD6o0T6RXdk2PYaCIlxSyiIsQLy/nP9smAkAph/Wo/90FCrwfQP
-QXsSj7G00lNLJP+/Wmg2ck/jDUSR5bOkk3bJCiTR0Sp91A09XtbzVPh6zJKB9y/G9P+jDuV/s/ex
-n3GQ5W5HT6j1QK2/DjkvpvtRl+8IbGfQ+w7Q887y5qsQ5fR/Lw8d5CNzm/F5tdYsj7CvxsLYWwtg
-UhSFIfYfvw5ydDL/SafvQn0Si9ujEdHUOK4WBH1SO07SO0fSC/WMKm/JiWtXlJJLW+oPgqr2W5EG
-gl0LGMrGtGhdDIah+yBQ1MEiAESqmpzfB0yl12AhvI5CgO8oOEgIciFU0ECqmuMUNiN4UN5XlBQo
-GxACbxvIplhCb0iR27cjRNiokckCdn9+iDRt/817aRIrLVLe2MdqfM5NLtlzbmSgp1dgy4RRMAiQ
-TGJ0VF3NEWJqVCTRI2Oyn/Q+r9PiIKBfBeTJEMREkJ7IHzE9eYZmO3bi/uk3l7IpconYjeXjbE4C
-NrVv/u0cW1BTEX9p/t9OwnTjWkmV0zCYq/7Ms/oZbte17U7lD/fRv9T0NDdfu1smzg/18P16fwb4
-FeIm5klBrEJ5sYFoyr8p1DdQZG+2+aztk2P9WYNZi8Kd7OVjLMsnVjJNYYOM6b1tE2Xzi5NLPp1/
-4URBn8XN/9fVunJP72ivmzH2vxgjmSJ/ngjwgjpBHlERSc0tkUOrEBzQhdFTgDgDmgJmVVVQApQA
-B8b2r95K3yvl7/1f3vyfv/w74fs4xRf9IIT1dR0QE6kBJEkUlCEUHkLERiHJ+10a2I5QYIfR+X29
-UI3Ukn8T9aubq02hDgh4OpzNCbLhmMv2BGAIaDc1oYHJFaPa4bvhEkm8CwiFP0uz973Pv+d7f7+J
-CINy2x+trR/b9w35k5wHtSMHxSLdZuxyCIwigfsY7Nc7aNf3aNBaIIC5uZ65msLUTJbrYULqwfbh
-u4bSHddsvZUhvHzRwcpy/nuueqelq5WoSOJI9KPrBokdrEYQsHxsENYNquavC7mijLirYF87W3qp
-rKUYvF2WW0obV2lPJpWV1oxZ9lMcmW6/8YIHSUl83MkFON1wV3e7/iWsIjbm1lQJQmSSvJAxHNOB
-5mPHlb9yjC+REAUcfnytmQOlE67uAlZ1KSXZbdjFdjfvRQjtRhOlMhuYmkf6dleJm1fNUvJzxf4G
-C56sQHv8/d17HdC73ZU7SeuATaROnTCN7y9qNia2oMYp4REZ1MGklBa0o+YIIhsbZbUstQkqtMEu
-7IkhcZQTOYjEREozLsw0oEUfZYvd5Ls7S6AgdyAIcw+wEC6dR0/3B4B74QT+WXZz6ve0OO+c1Icu
-Y52oIFW/R+37vP42QYC0pD79+4c8OpVQOYfP8e3ScSp3R5pT4z1QUISUTzqWQJSPA8kZcHlp5QQP
-EEDKnl8h5pkfSMeyKdXPnxQ5IREOidR2HYnb0Q7lKrV1YLOxVIiF5d2CCy7vTlCAq9wRp077NjM2
-fEhlG5GD96loKsrht5p4j2ICemoP8YISqgf5QkPuV2MNYaTS6k01J3HWRyCMzB9hsiht/YCYQ6EK
-5T8ynSaOtaYlzEzKuMxcTdt2166XeXecikOjkO4mtDuFxN01dWXby8eXYuMZm2mtYxmRtFNRpbME
-J4qmtMrRljuKnbqHTW9nbzu828mtDorldqu0O4QjLE53IQhCEeeXndeIruXE3bdt23btM6oQ63ak
-nXkleSdw61d1muW7WXK25DprrXXOlJO4RliPbvPPPV5eed1bcuK1zqsRdzrtdctzuEd20mMrq8Z9
-tf73i2T/ytphTSvVzTp0MzMZDVyx1uOtG6e9XeUvJ3FKVOzTTWYViyrlZSGq1Q0uWKjMwzMzZ0F/
-R0+n+RV5w/6iQPPJWKKSWyAILJ3MVNyJhRO76ZFmsRX9f7m7ssD/P0i9FiKf54EKVjJAWJjaz4J4
-XlBDzIUhVj0f+TzENAnhzBEylQHRIichNWDY4fycw/Jpq29REsiJpEpKRNbSSUlKiJkk1lWbIm2W
-yUkRESkvjNrXSU0laWzJtlrEyJSSUiJSZKS2pTLERN7u7613juTbaiPxXe6DRU1NewGbvUqL+0pt
-KSHeEG6whnHht0FhsbbGF9LkzdiUEG1tdUKT8UARagCCdHMQXLFXbrd7UR2XV8KQ6fhkR+NnaCOk
-Ebsfs/1e82bP/pHO7f9DlkmKipFURDkLjy/HlOKSFNxWdDFMPHxyjGcwe5Ne7nsSub9yqkXEyjxP
-dQ7NHy+pMgIJUI5PsXaGR7TkmTHp5OZ6PtEFQhRIqTJRIMbMlSIM1Y0USIzEQE95iI+Pz+fnWVHc
-ur7KJ0jv6V0a8XesVdnE9e3zxBtE6HIgQiLyeUdpDjjEQo9K6+yoY4MMtQke49xuBXQMbA2rIMg4
-JZIFWTTqnMk27ybQwhupZyb96EEalKKvw/DSQgmyhTgrFUKGgMKJbzganm6txOUEckbXea5eXJdc
-pLtvykRLBBUUYjxVbwODhnEMsjbMJMras2ZJtZkM49aisBPLziAIPpN6fBwqk3qI1GLsRgrCjITb
-kyIhKTCTEqKHnGLDhsDTMgwoFXFag8GkKyGSSRUdlEDHKIFZQZcxHiPSksrz0Y44SOJybxBERBrC
-XPVwdVxpZXZfPzYzqLpmNO0JZ1RpN42jUJ0qRDsuq6pN7C3xzBa59v6nTqvijfo5wRtIiQ0YgJ1I
-CbCI7GDUlUVBNE1pAGsMiIQ2NKRrVVbFujb29deM449PDOy1VUeffF81VSk1m0kmprKgo+atXYQY
-dStwGiKIHi23cgCEXExsMhQlCMLS3ornxBt6XacZpZwOMrztwS9rWaBpZZoIzulGkPODtyUqJKiJ
-Ydlh38ja0cC5Wgh1roiJQkr5rowjYrRNMICIzUjZ2ivWnyHyJ8lo8L2YmdoIjKm3MEDMkkOajrCb
-bbaoAhjEjWaUQnNw4VIIgQYmkSjh63a3ocGlzbDEZJ2XiY4RN7sKipW6NBFhBrje+NmZ4utzg4ru
-jszT9oiKhqQKUVeOE4OE4nje+mRhskMYNNRhTI2NzYS26JYQMSDujKU58xwzUykxceD4illBEqIO
-Me26rtBG/Rs8XSdaCrViRSQ2lXWeJIAAAAADGMYxgYGAAAAAAABjAAGMDGMYAAAxjGAMYxjGBgAY
-AA93xFZHrI3zOUbzxanv2HA11XU6PDlujpCd6wSWEHR5LyTkck5XjyXnkW0UuqRRFR1GRU2Uo5Fo
-aQm2RvC6lnKPuiJBGpApRV11TU1TWeN76IiPnIe1k16cMNrtDD2eys8arx1tZf0DrK09vb14eeB5
-56cUoNWj1688VlYqWWI1rWtqqyqtgw2DQmWtaHQpNtqCFBCSSVKqptt0pSTmUsiCAkiZqq32jq0H
-ZekIOFV8s5/Tz6dCnu+Fn0cvxz5nWRD592POTl9Wk4SSbkO7Raj7JN44/dT8f2e5cIZ+PX/m0qPJ
-o0fX49PqG/T8ZbvwN+KDavRvSQt2L9/m6E1Xu6vyZ0ZxeTH8024XrWePBydMVPTBdaruc1t7Fwrn
-L5/ibPSX4Kvdl7l/ydMCIqfNeRCCj9cNua90vJ+xjSvlZpZ+U8ynHR4xZvnjz7v5vJDsxiz1pzke
-jeXs9TVUymztRHG6IPdN6O9IdvedInpF+QY3H5LHDnln1QUbzbT08mr99g+NTayxy4bSkV7LeWTu
-Jz+I24Ja76F7erHl5fR7U3DDn/ra/lt58/h+jweXhxJNUWpLYpD3wR+lqLxTImNMkCkhQkaUsUka
-gioj4PKCNjVS7ZLVShR+ZsczLUwIYQDsiIhvIf2fMvqSjy8UqYs7+D8n69YShmgCEpLe2Mr5C/T7
-a9nxZ05Q1hBsZaQNhQ86/FXHxCtNImzbCi7NJQNqHJDriqoSAkJyBQMkZcAi3fGURi9MMyUrrV/j
-XLBcd/JQ1F7vdrtP1+nzyEd2QkpDII5saeWo8f2dOjec03OXPxi3SWaCIMiIh0cYPIrKeMb+CJob
-CBc1rkr33pI0ipVipUlgnEEYMFUpKlFKiKpVF5/n/xfX09XEE5VC2Jy0975Vr0+lydoI7g6AwCCY
-8kUI/UMyAIRABhKggWMDw9EdOI8vr09fQ3OPb1+cEO876QaEqIpiLXxteZw5+/2RNRAFHWFudaQC
-JRAYNDwYyUivXjPNvj81OfQej8u3jt4U6kOIQ+dEkNEPb7cSfP64+bwM6QRVrEQgAzJiEGiIhmmU
-oKVCSjkXn7cFA9JugOxts4ICggSMY5ejB8+Sxty6x0kQPNdrhhnD6PbT3m9Hkt3dsdeofwPDmagh
-mHI6hBCx2nQoUP9Knbb9HvcddO0yRX5pT2JFoSPNCH4Jd3/Ex3nZfu8kK5SWKKN9iiMseZ+DxRe7
-0+y+383frh0xjlo5yVl89+man0TLok+f1Nt5POnN2+FUwUEnt3TpfhQXc2lM2jCnKMq6jH4fr7/2
-fj/JHxH79Gvu62X1lnU+CBULlOQgd4Q2O0Ukewshwd6VEkVI/Ge7AdOowDJ749xgJ+4ihiOEQ3GD
-wA+BT2N30ur3HLZphSvYqT/SqNn73Y/53m+oifefYbVPlU5dhp5PyW66kVTt8M1qn6AQPSAHpESC
-otD6WyI2Ec+W3b121DeCV/Z/Xdda69Tt5weDy+keeMwAzAl6c9evPHl3FKO7lvXajh53eOeevPAJ
-jGZUAQTEGrO3LDDbDpR9zfAkR+BH41CcwSg+5EE7kXzeTS+NTRJ+NnOfPGHIcTNo5RITu0lMzNc/
-Hg3QREqghgT6wcRAKieJ5z4ByBoMc+Ow28wcGx1EzmWLBA7yRM9ZTqJImW2I8Yw0ulB7l0kpw2bV
-r45idfNkIpe+4iSIUPl8+ufLtfb/FiqngcHZ1kRnKdnt1ytntvaSrokL1YrtJ3yeB36OfK58yOrs
-VE6YXX3oC/T5Nc8jvSTUEbpyRFkI5UJa623Im0Pf7eXibdb3d5XcDpwLTUKWQBjJSgQBVAhERTli
-AmvDtNB1vRUMVDhkOWdN/DJ0bqW74uMbYwT9ym1FkkkgJyBQ56dQ0NAWsRMmJDrvjBP59hxrb/HB
-G0jUEVIjr35+u3udPLrb0/zr08iIADD9t0yhZ9YOzj6VG+cs0lrI40urkcDmOFBrNA0ssk0EZ3qj
-SHkp0hqPoo6Jxzk6tZdvD4PPTrv3dmx0pPts+MkqLzIOMxO+fDB8O7boweEdsbC6w1HS641b30MP
-9wg/Ew/ojqn0T8e483VsuR7nygQ7zhh0UdUfyMeQbt5naCAyCKgCC/zxcMIBXHH2fCUEBQUsyJQs
-HYeHZ3/AvhhrpnhrOh0gWPx4KK/8Y/Ng+iB/4Q5HEAmM/rkdliD/xHy9NjYPLJQV9eiRFZ0SSP74
-WQiwq1V9pD1fpfRH9aH5+SinKRIn+J9JD/Kvw2+Wd/sPmgfmQafb9mx7/sDow6IDkPCWnyw5xtVK
-AhuZjngsQ8uKYqfhPgJPc9TqmM6NJqJkCm+fsa1rHlibe7bSNrNt9tDfMitsyO0RH2wR1WQkn5Nz
-EReaIh9zBI07yXefZ9U+1jsBzuGITOC5r7xM6Qobse9N1U6ieA0/oAunauPiZkoAvkmHyHhAASSK
-FzfwgZxBEoKaIpTYZMOdi5A/EH3jB1mkaHyoiCx+fn/cfVq4UPwHnZIB2m0JROwkaDDnP0hA8eLE
-jc+9tSpgCD6ySUNhsqqX0jmF1JI/LTxuh9mt1dXVu8P5+elV3uPisJHhA+ObNIM6q4seW7NsdtYz
-MXvjKtlcmHma/IEQwiIs+RJJgVMmZJTU1LZIvHHlUVfHJiaYkRGAVuDoYjIkDYnhpWIoHiw5Q9Pe
-ZNFmnkUQTllOIkjyUowfO/dRR5IpkLljKzMKTnctVShjzbNZs669dM5YwjDFV30YR4xiTTd2GcsM
-m4wyYj7Ue863txicUj4Z92kjatVM6Pp6puTmztpp8V7OfZJ73OJ50nNVLxjDs4aCRHWtqCJMxnK5
-0xm+MZc8sTzuljhsMHJYxAsTaZxYwiHagUKFCBAkFsVLSqtpm2l5spqRrHPab7sZvvp6WPy8NNkE
-fMCkKgKgiyrr/hdvf80tLUzTNM0Y05222TGTG2TGTM0zTNG22NJZMzTTNM0zNNM0zTNMzTNM0zTN
-M00zNM0zTNM00zTM00zNNM0zTNM0zTM00zNNMzTNNMzRtkxjRkxkxtgAAA7l3Ouc5c5dw7tFpMlk
-xkzNGTOnWtbuToA7ly5y5y53DrncA0bZMzSWNZa21rGs91KpPZEeyCNQgm0EbwRu6unjqYbkIsEe
-bZnjP6X84ni/JydHsT2O7xbPV3ruu7vVvN3d8TOtr4ScQhQ74mvLzzHGYot879LWR0xiXfjDSrV4
-NNarJnSmpJBAqUi6kmCKc4i7IYhAiEq18onienu86+F5PZKWdtW9HfKrloVFEVRasd/f66QhhvPQ
-ToghIRNJsCXVKkyZI0WYQkLxJ7GdD5PkNmTtpgw+B7ECEYthur5m7/zq+DZPBYx36mkeDWebvMO7
-hezPRmpaYNegi102CjA3HScjZ2L0VAAAAAEgbZtkgEgAZkmYAFaulklKUk3YT3U0vPJ+gu7k/s+/
-xafm9HxJ9sQka4p+UcbvxNgEfS0OpYKLBiwlDkOTAQ8QQ24KvLEfTc+R7urZ7baMC7bVXFms3H8V
-SAuMR5tg8XYMGSLpDXwZI75tOB3Hgf6vHxT1bkkhhNZtNJNTWYjGtRR9ml1a/U1eKIiNYJk0JQGr
-S2k0UkT437Pft776TJZD+wpP3oGxIMT+h5+Amh+JD/CCNH9w5G5I8u8+Zp0dcm6uECje+31r9ApV
-Pafy+n0/N8XXRCAU86MB+c2CAp6AIDgo/CexJr2zk2kK5JRoJg8HJqPlYaLCiRSVD6iSesqEfsJn
-rHE9+ZDHb3fvilmExrCDKHsFPBRIhh/CeDBYxHsDPcYoZgyUfkLLP4BP6W7H63Dh6q8GnBzcmzdd
-lUppdG7Y2bNKYqtlYwp064x8WPoVzOCNDPIOjyMFnPBooyINAgZJ+oswbP1s+cUuQJmYxUc6wsOT
-gxgXMCJiQIERiHX7xsnNTZzdmNHN/zvF5N1c27h2YriqkZmxIuQFPmKjnClS0CRMkKRIEDEkMdaJ
-M5LOvukMpX7WPp2E7sYd9MyvWrxft7h81XOnJSNOF4ncLhYJcE1K3ipQiR+8iEB0Pc+dwQaorXBB
-h1BCFUZjCMvURsOyfCekt1ldhUE7SYxXo6HVoxizH0N2NKteXNX0PTu+t+HSf0MChY7L1MiI0XT+
-EYcxIuqYH0PEXHYaK8GJQc6DMtGNp6uVkNSHlREJx3ATbV5JcbwLG5UY2IjEJExggZGIkiRAoORg
-SJfb7DEsEiZRisdTwaPinDhXvVOGngrg5qnNuYR7xGJMhZgkRkk4NGTRZgk9SjJRg+R8xcckHapq
-TKBjJRS8hhuCIORJm5kKRPgM0M2cGRHcoJ8iTAhmRmCiRHyKCijo6MEmTBYzQmMRQgR9JycCMAUR
-gvJooEYJ+GKMHmSf0SjBzIihmRH0FwekWWqrJWK/Dwzf9DWuZyn2p+tRMg+z/hP30C1W3UPUfYHe
-WEsfq+f/l/F9U6fn+/6q1rWta1rWta1rWta1rWta0CoqRSSOWnCZcPR9+YWRDVQQsZsiObDIi98e
-Lq5RD7oI+2R+DUAy2fg01X5V+iNRBxBHm5n0/bvJDnUfPtkjpIN0sH6osLUfQrreSjUn/FXeoqem
-wSgR82PtU9eLquxyqTg9FBjc2I/eRHeokANejdqBHJPG5CqmkLNzzdks1PbFbnkrC6lnKPdESCNS
-BSirjinI705TxvcxIAWAUP870gjItjxoPT23+fUibyImDEEdP3nHTZE+s2mSPpc5ITItOkuk/Fge
-nne2OnV1v63DrLIZKGSKgHpRLgyEFSikUU7ZiYjbTgoeUKKUA/y+I8zHB0IcoO6Bfqk6SMh0DppR
-6zyNneBClUqyT+rT2jzk9fLxvsnse/eHk/rDyR7fjBGDpY86i085fWj3eb17zYcknNfeVvdvPmzH
-Fm+F7cHfXx1xwYpT4y9529enf1B2CBBRQQE0DOPFdK4+OOua1dT3lY+lG78d87NHNOxCRFXw0xqq
-9PLaRSgupbYkCAhVQA7OwoiQc66URuHV1IVMe3z9Wkg7e280/SoMCIiHVE6zmo1W/pVb586zA5Cd
-fdsFEs/DWrnASJ8ntdEwlnNhnEAClRgDWZ8Y6GKhii7xDqDx+BjuO1E7CR0OZI5s6wLiAIoNwHYN
-snK4Q4OnmdI+EJduABuQuoShKUoShKTqlXQ+kfV8skYHXuC/AlEzrYJX24Dr3liy2ZGWJcmCYydX
-B9x+r0HcvNTmSHNnwg1Jpo8MRAOo9+Ae8gfjIPmkbp8vfcNvlhtvbaY2ELrFwAyVyCUVDrZVXOo7
-T4nLuP7FuFR5JKp2wGEB0ZXIGhKTr7rbsH5VO7QTM9QoVRACpS1RcOzB9Ktf0RayRPtJzkTb8/I2
-weXtPsI7xfpJE8wxMnSEpQe6WkQ+bvxGPZgHDJxCUieAIfWc4XCHlsN7Ez6H976G0g3pItTpLxZB
-2UbuuPWPJkdkI/UrA5Qebm2JPmukp8JB+j192k5SpyjlKcp98FCcQ+iHp020nSVOkdJTpPSChOIe
-kfGPN3AHscTB0sSNVHzSecTYq6E5KPxh6ATCRSPXGIQCo/PCm6ijwenFVTAlRN4VQwhBCIEDpCIR
-PAgV8XgIGGOt8qcXVXOePZ3ohwKdgbuhgckIKgn8giIJgcH+n9YqipLIj5ngUzFMdRTE/pvRD9gI
-yohx5OR2kkAT8RfQ1M+nTWHvbYlDrJAyqPID/vM0QbQ6JbFv6b9l8V7A1gFhNTErA0Byw2RL4DUR
-cmRKyCM6OYiP3w1RGRGoNLmtJoUC8I2jKVk/rTfaRbDgeMGBikJJg2FyIegyMi4lwRFdRMCyaJyZ
-fSiSiJY0kmVSpWEKlj+cOs/0fQqKpyRnFUcc6Ge6IXMuBigCH2n7z9n4v2/r/cijigWt+IFHDkcj
-d/fttf3DA+QjVU5MNSdajlUf1VJsOFf8GoYNIiIpKUom6yHjjUQRBIHJfz/1/p/bg/7Iw/S98P4f
-e/k/XObf0Y/r/qh/W1J9f6Xl8lNs3f/N/k/u/m+6u0pH8ext2oAIdwIgneH3iVGlCx+a60mQfX+O
-SRwSJfp1gfiAhYjGdZqqmIB/X+4ZEEVxg4xYVgRGTg8W6q5tua3m2XP5PwU5n6kxGIkmWEf7n9D9
-HacI4oU6CaieH6mz9Kzq8eX179nBH+l4HNWLqdZIu0Edp6Hbt2/UcSySWkWkf6nOPITfjg6x6L2E
-po/Q+O02bOKwPcJY2r/w6ZtU5JEzP+6lutfD2CKwgwiM+cm0akm1SOfjnGJuIajX9g9w4jda3z6/
-9LjlEibeXz09XkxTFe1SHwTbUnzL/zX0cGYQhgAK9vdqtOvsfP8+nDZsqtz3i2QVDIFJTEq5ENqw
-7QiCTQUjHf9Bybc32UDr+Xj+uDJXwpjUM956bmodwiCN2J3BsOAmc9HllSND+e1SkpddMYwImE4O
-iku3fV+fX2QZhCEABvs+PlX4F+jO/PXoxdV0328zgOxCP5iYkUI3vFEBguYQEXd1CoyBHHlOb9Ea
-/MRjrPi5UQAjurVzVcdo5zjmYyWSYWogDXNmsxAWMOuOxD9JSSiaioqKqqqg6+vt46+rNtAJtnRO
-RtBiTEuBkJfzk1U2XPPIvoRvBxvBu/CZvqIB2YcyOV5QKNC04kubF50W3ytdX2RAmXKxHDp5nzlT
-NRUVFVRFR508BduDu7zrmSImnYbKOavx2f7szd3qLzsIgjFDo9eTW1gCLNf1LOKMxnd0TXUQBcKI
-BetlQizp6Hqys8Syj2eUUG9ZqeF0MxHscErrrmjBvGMY1GaRfckb1xL+2zoIDFXRiuOTHIEH+OHW
-pj7WO9JbY6KZ2AgRPMQBIXzyq0nQQPEJXo7mtZvptuuwb4swcW6cudJzEAtW6siEEQRjNYiAKoVY
-zzER9QdCDer3mqquQsYTGKjIUpSlCMYxj+0vhMqcXP8X5/1Ih4CnkVBHe3Td+LrtwkhscZP9dqkk
-b6wtkI2rHHV+RsQ/t7skQOVIcNMREmVKxgknLXt11unLMsSrEJO+YgZaxsaqyiAVa7xGVkjdpSby
-SvNpKPLNU9ggJT806LyZ23OiEc8IP64F9lmoQfof8jHo9IAjAgaGJ6EM0hCrZhNXniq5wTMTgoCl
-AO9yXt2q15POtWu4AAAAAAAAAAAAAAAAAA67gA+PcAAAHu7cY+jr318p8fb5e97uir5Fxa/6a5aY
-B51vNYnPEIxRVJrjRfDZonG2pH+jZy1yaSDChlT00MKkpVWleTzzUr2r7RCjls7UWxOSyaK7Xwrf
-aY7WIzd4ab6xJ4SaRNjNs3s0i0OSmbk34QgjUpRV43pOYYbsgidG2HqsN9Z7IcyHtO0NtriXyhjT
-z66I5IDIO8TnrORwZjIs2CA2woPLIZ5KFRVhpj5Y2annU714cu2z+/dvXVTm+bnCIPJSVUTZ9h2H
-9Gj6z0ICT6FT6z6Dzfe0fL+HmlS5NE5IxyRP1CnQyQIHcedQdDxwZEOA34Y7cmpZvgzATs0REIH4
-kBNgEuh9pc/LY5Dh2AoMafKfyEsfD2hNEQETynlO45AJqp2fSTD+LwER1ERFVxRu//SfQH9oqfR7
-hz/YUgfvIGB7j+gcZxxyYjG6ZwGj+6aME8RsX9XgyUbLLJNGygQohHJdq/bZ/cpLUJhCiGRVFqFK
-QtgLHJv22T/a2dHqry5xu4w6IknyhHZ1eXDgypyrnXRVVPFz4z/2V1yjKM0uoJmKkBQQHARq3hoS
-NomxcchQ5k0JGyjKO+SxCieCu5wSaLMYMmQ3S9Cqio5LJIZJIw+p7tYOZDHIIZJoOjJWjXRgnfJ3
-IIIioIgg5KOzO4hjNGzgWaJs6x0dG0PsyRYGWaJKNmdmaNGyjv3GldWDMvcgWMYGJEgNjCpARADC
-zIiICbkLDzpBlhGLDksEOaxCc3Rz0kN2MkkR+pXV2xEYsgmykOqREYElFIkEMJD2/P7fd+i+bWfc
-H6iPkGP5yPz8LXGlg3+tZiNlP9uCJLzMr9sy6iQzlzW6P7dGI7cfu+zr34N7t5Ym094f55QHKmU4
-gOXLOVuAFzxQVwecWAmVJSlMqxbIaNFbaxRtLNJsrLVFKRasstqMbakZSqChaFoZqG3POfdCiD/q
-PALaaua5G7fHhT6MckQh+GDVaZGiiqiQjSWFoWsa9EUoJ3q5rz3OVqq1zfCGtoBHHCfC5QXcxVWa
-Kot5NCAWlaJckyDFi5MsczmcyJUKDo7gXw6uuuE4eDZ4NODh3VpVbGORQsTHIIlyoxEU+pPr9327
-QhCEKFzETE2TE6xTBR73LYZpEJLKRKUohJiwlNhi1yDgpuKHYoo13LGURKPaxeZIyiSyOqhL6TBX
-vJOUeaHDHz+WOS9mJlTd3a93ernpxNXVZLhDTalJKlrclCwIXWJHNeK1PY4rpHvZp5IQRqUoq9OK
-TnMJKxsnCjVhQpEQxrPYOIXy3MXqYFdBQEFFcYo4ggWS9N7kEifi/Rg51YcjRZv000KBR/Athkpk
-IDr2qzheOVMFKDIP5gf8CFPXWx/jIfI6P5PFJ+5J/Yc4EMdNM8DRbyZCCofnQBP4w1QBOXu3PV9K
-KH6Q+r79j8Xg3w7fCC/jFE/WGB1iYh7u0ZP9f1qxJEkyfAofL+4/uIB0g9JMNHkCj5gHo8H6B2Uf
-9pT/tmTKe9ORRkTR1Yf+g1JZHwf9hMkeBPaTCkpU5G/8DLLfjWkmyF8zU/39jt/6jxj/pd1V4GFN
-GcE805YqrOrDvOUiD/sPSdoMxVWyr6vE6lc56MGIz2G7Gg0UaaNjg/7R3N27kG4cl6hwNA+cztGQ
-IhaVGD/OLZHirwxjtPY7NgouKdp7pomk9I82hzN4Swnc5wnIlf8auDdCck/dIOPZ1hOB0OT6vlho
-fZPDx5CiOz/xDxO4EzzL1Cne/8iA9BE0h5DATMlAVJTcw9XuPE9iHq7zzU7mMYeLgkTeSxIafE7J
-0PZ1SHc7rITVkNKYVIx4wJ7E5ppyPKSYsqiIwMCMKMDgcFx4Ue5eS8x7XQP/YK80T53kh0PYdCHd
-Y0/8s5GxsQ8fuSVP5ACD88H3H+v8pFjmFEYGOfmcXUNo1BH8YI1BGQRkEZBGo8np/V+TTH2NI2PJ
-P+5+KfVOYNJk0fNqE4SR+R2fv2Qm0c5G2jnCT7HZwqilHNwZC8OENE2fh+E02hQ3Mh8IcnE/7Ocm
-k1fcZ+u66pUk1Uda7PJ9bHdTdvN27HtbsVpw4Vskb0/V7sTdPBiq5nJFaadDUjH8Qh5EPSR71VVt
-fjDo00rFY5Q2RiSPE2ZCVO/dbGxsfU3TY0aPB3K0fYUcQ6+MMcxw5FVh/JX6jwRIpVGI9qPQcGP9
-pDp1oNCutYLYT5vwRw7o7bloFLeg/9dzaMfn3TsO7hVdf9a3tcq3/ozrNf3EBjGGGjQhEh80hdo+
-LvQpQAlGCIySMQ82Z1yWvOaa1a06to6Y2ew2o9ojSp9x7h6FRHCpDglVFJQHsQeA2UHYSSVPLlz2
-+T+nHkHsg/E3SqWpMT9JieBsx3PV2fzfd+on5tlfcfQqClSrENg2Pdfi3/RBHKCP0QRkhFgjII3T
-9UfJYrm5aNvvwRhJfYkdhUv8GR61EHn+5QR6zqxO4BxIn+hfPzx06YnN6My2xqp+lX7t0SPg+D4P
-i0r9LGPhRMsLUV8sjKsWc8YlV1fQ20nJuY6MZxLkqLdl7fxeJpPqNBCxSHeJ0n2qgKqpYRPZkR1c
-KpSzpKxk2jE01hX5/wZXuboPI6iqnV1VVUrZPxR49OlmXPz5k3ybV+fMmsv5+7E95TV9iR2O5I3K
-UWRUqKT8RtT0dY5JsOQ8kNRP7LIeth+2kt+dzYTSyFUFvRjJJ8EVA3blfy/Mnitrwjfoe/nw8Nmn
-71VSHUqczcpgUeR0TVVE3YVVUqqrJMYlVVVVVWOk8Z2cnJUfpkrg5u7eR1mp/7Pdwbn1TyToVFPN
-LMPnFibmpow0beg3SdtzcbxxJ2PAqfrd8P7k/S2aqn5A4M9baWrChRGjTMBUMMD1XBBI8iRE0Sfc
-JB9yQzCYZlHeiePpx8IQdDcP6D3G0ByB/zkDwHJkhpCpQc8xUkLNGMGYMo0SsiStLlWfHhi/BlQh
-yT+6BaKMnMAAfli+wuKxrxkwSIMnYRIZMh0I78nRRZZ4LMWccmDYeNRshydjLEuE3KEuO02tOzED
-K/kqeDs1kwVrEVK33L0PJBHXZ6X8njCJxr0nsSWdDoTE7Jy0aN4YSMJFf1kxH8CToebWTlZNKnlN
-bB0KxufU6Jo4TDImx2H8nJ3Sjd+AqqUqpUYFiLDEwqbmpy9D1akPjAOaHq+LeSaPUHSAcngfB+R0
-fOxibyH4Dd7UFXff4s0j0NwTudnod5HZ4HvRimItkmELALIYOrv+KTrIczpyT2oslKKklnCVZVx1
-K/K4Y0qxjTGimjGDPBOwJ6p4QnvDyHmSc5JHskd+53VSnSJXdyHKaJ4jT5zZsUmjiPzJCceUpcHR
-p8uq48j5uTJtdmcPVjZscmnsbtPRvzvURTDELJSVYnNUuWYk5sbaVnJ0dGjGzo0lVjdyYVzc0JyU
-TG0y2SNFkdakm1QtGmbYlTwc0tOsJY5w1G4SyHqaPiqbHOTnXV3Y75WU0xpNG51eaaDqm7Elclmf
-Mcm7ccxo7pVcMMSqr4PaVVVVVVVVe6SO0+L5TZNjdiqmE5GYjXkVpVFKpSqaTGNoQ5qVKk3PGR7m
-jyRXpCmSUxg4L6HqYROfBxJvxi7ym6iqhq3aplha9izeOBzROQ2cFWPM+Bz0ORtOxkhybpTc7Ddh
-uN5LE6/A51wpXQm0jo5uHaTW2bLK02VlVZFVwczoaHI1JhU3Tc+CdjiHE3cGm2hjR7ynQpuqbk1w
-PHY8pP4D+Y/FGkZIRU/dWv7fYBZYDYBwAAL6H6Tg/M/pJNjSE1p5eyb7MOWj3oCd/eQPtIuH+H2j
-2KqntYyVimUUqqoqz7YV9+h9r9HjJ9y+EnKeGzA/X9EPobR9BZFWey46dO1v8Nxu2U3rUPdXifkY
-dFcVTFTJExiVWcpqHhEbQnmxVWlN5PYeBiToqTgk5b6GNmEm0pOWzRo9jlN0w4YVyKxKmjhysSR2
-/XPrsfP/mH0BTiHwnmmR8//HyNE/lYfqsT7gr/HYkO9ESkV+9A90H8T889rSX7m2tW0tkjIfO+J8
-HRVVSlRJK31uukuzpJJXddJJKqpVfYbp+s+iOY/Sc1IdGpDkVHVPuOOSOTudkIfRYTbe/zNZ9+NN
-a222nByDtJ2WlnMk8nJiHPP2mhs0w2WxzxIxuqoloLVwopIS5m/hlhahJJAhQmORmCSUlIhDhw8l
-yMEkkkWezzGCTbu3HsvLvDeeNvY16tr2sZdXFZl41nWeLuxislx5U1B4rf1Sp04OTQm5CmQfhGBN
-n9gdBEO4g6kBJ7yNMOa/BHzRSVRbB7UjfbfwPwP0lVVVKqqqyGYMiHxUxLHqqYm02hPnx+R1eDrh
-H9fM9h+6HN1SpLDrD9Ukweoo/xp3dmjqczZswxiqVVUqsNnkn8piTzSDsWE4hwNJHSToqG7FiqbG
-6q87GybbdLpXbb5XSSSSSSXM1I5nJNEo5Jv+SfiGI/Sp+hTfj8r1Yr8r1e1w14fXJ6Jsffyclgjc
-qTZOZU4LCflPY2QeE9XudCGyWTlVUqpbij8idhy6/f8WTr2R2THDwP1NiD8HYaiTC+pZA8ozU9IT
-TaIbrTqdXVuJqp0TkhMSG5/6m5jhiLKExiqqmSc5UniUZD9jwVWEUi1o8To8cK9r2K2aa42P0SRX
-1H5ZtOh4vFhpI00qqrTGIqqo+19v5sbxDabq5x8k5m48XZVKWpKqWWpSkk0ai2WlRa19W05HiTwN
-zJpHQ3iD5VElSyQnzOsRh/KHY8beTojwnxhNHL2wnSE4NkKngclTykcDdbVVNBwdw9sxwHZ3oqp8
-wBL+iUH+L/EiohgfaH6T6NGmLkAbbVGyH1BsqJibSH5xDVUygEAA+Pyr7d7X7Ct9q62uvwV92/WQ
-/JIg9sPlPgcoN9SmWSnMcfB8zMPi00x2yZZlD79N2q2uT5JhG9km5Vbb6iRrdhjgxuab1VW5clsu
-NtlrVY/a0eEnzyew/J+WE8kNJsqV7XkqqqqqreR5SGmnJ1z8fJPMf06/ZeB42SWTnZg/MuroyzLX
-kUw8jwgHxbHoWByldEujRkclT2MPRtU2kqmhhtNDUtRc9ZJ2e13iT9/yxDwe24ZL6p1JTT9ibGiw
-OQbHX9mBgchYOufMbMVhY6Tn8Pjb7zzaafLTodYTwPRYnwsTkVJOPcmJ4huoePeRQ9Pbg3knCOiq
-plS9mjoyIWSqWLHYkTc9zdh7JHiaTRz95bDWNGwsm21aNJTbRo0U0lSp5aNGzB5GSYVsuD0Y5Xjy
-kk+kKfW/me9+9p/DeRD6egX70n8wf4QdoNSszMuXLcuMRzpwu7ogjnOXCOtvu6wHI9iubxeQ+uPa
-3Er5j6Wk+cfNGwktjYwNCoeTYEKwepR3NyIiNZO40xSq0OZ85ST7ZHgdBQ7KR815A+fvOhViqTpA
-OsJxCL/veWc3VN5PNTTQfQfrLEqWSKoVVWRRVWSPKNzDRQ7FYqopyQep+o6SMJ4Nolc0mSR1piGx
-gTR9zsPpkSJBzGEJFMAsIwMF2BcyQfG/ASj5I/h/rP1/61lnk4++K9i2yPslgaSnsIUsCpP7Ygqe
-2/hIsf+nmviD6whSkPCBMIIg8r7Ms+R9Y47C/KYKS+h9yn0rvbUY8Gsakc0rapFqfWdBIwdpyDRJ
-FHzmGNESlQQkasw060RA2gYdCmoIaalQwVWFOs2mhUqba1JViLJGwJh0hLIaUspE0VK3MF6w2Tgd
-BKltImoWB6AiPiDKvQQVstztDSJqg2DkPCchWebEkRMkREJYdB6ERBBPBgaRNmyRqEponA2JpotU
-MSzaEpDKSQ6RIjgxsaQ3NSTUJg3TTerkjKSrDYo5GpiYLBowyOCkMK0bHCxs/D9yyfiz6jUESAk9
-kCYKKmvrivedQUcJp2qDA9t6gnoAQKL+5UGRVeZ0MWI/pgGSBUJI9ahNEiR5x6SFJ9iqB6PyHz6R
-dBA0GjfFSgU9j+Qm4+cqqrIPfC5EGixPzn01ygGYyCTCbH5G0j9RSeOxzOkkdo4pO6djqbFP3sTe
-cN06OEQ6bD6YoG0js9r+FUxO4f1vzAc9JyQO4Q69CmiWQsI6KmzyO4eOjsdBUfi8VVVVXey/pZtJ
-G8OIT0205m0/k4YoeB2TabEx6RMK6JHkbJDYdJ1q+blCZrPZpsdS1IpbBoskTiSbl4I6JE6Qnij2
-/1u357/HdHq+dsT4fwk3G7ZnDJen72x+g8HzvKHlJD2I90nzobDCe8v3A+3yn1fakSQx/PT1b5Vk
-/H+pzv3PJ+p2rGiWWvZJPbD7XtGH8RPF4NH6zkaPVNpGQlPVUm9iYqGsZt/LM/9uTc1X5dLp9DVK
-kPs+tatcGjux9Kfitt8Ew/GQYjBwcOFVVVXA0/YYTdwF9AkG5IninT0hp6PQepeDCF8fRkke69Bl
-V9UJ+Ox1IdkckTqdR2d0yRNCyez2f3acOGGMkycRzUVT7SxPUTzI4hPkj3rJRUVRKksSlibSR2bH
-y+WfJ3N/lkjbUNSMzGkl6u58x4nvjRMNimw1JU9en6p0/kD7SkHg3ffH/K+P3z9u9lDrL/PKhzU2
-liI/mup8/m1KqU4jMZ7p9PbznJyVTJMYqlsqqr6IOZtsux/gWQ3N6qq+dTCyiskrMkTOcJo0qRpV
-q3mYfQknwQs/e5H7Zkk0PnhMQnNP3wk2MkScFiHJ1Nk0mjUqEyE2I42ZKeX8vJv88fSeJI2ex6MV
-13DOngjhoqqptDZvwGRtl7hseRClknJscRXIc5Ob9rR+16PMjsJHI0D2GjZZKtVGyH8E8RzTebzQ
-9QpFaJkk0WRKRpsD9TmPTQ9CeyPUjwhg5wnWOsJkhMJzipY8FSYVUrFTaDUTZHdjYTEYs8z0Clep
-VVXKE3TaNl3ThNmInMjtB7Pd8eccOtRViWVZApSS8Ac2cCXAZ5mOg0mBGoMhSJVfuUmDcom9NFEK
-U7Cf+F2tXy/Fqv1Fa/T/pYQIEQCSu78vLzEcIH5TA84B2yhSzILCg/f+0/eZ86SSj6Ej0bfzSBLk
-aEsiGJCPnKKIcH9EQUWV+hVQojJUmBGCTZkyUYJODkdXNjFOT4OvRpdmPkYfR4Tr0mG1bJkwawaK
-UCbR89liEUI7zGMXIEF62HFm4UqfkQZOu1CciDgkO6OCE3auiiURGizIwYuyMIxWJcdyiRGTwdGS
-yO4jgwSUGDg2UFCDZs7jNFkmAQwSqnV2MOYzCDtWlT9Dfdz2ZOspiXIKVTSMIzXONpo0EQS4qAiU
-VBLlWMUT7u75hBtsv3eHtE9x7ow97hPYfYb1Jw+74w9kJ9zoqpwhPcnY40bt34Q+Ds+Cp7n11HN9
-feR3TmU5nnO3on5P2PJsqlVVVVVwenkPJ2TvKiqovJyaR4vnKlVs2ernpoqqq2qbDGSZEK8JHNVP
-LIT0WO/gMhUe1L/t1oZjK1jlEOkPSTdH8ypDc7DDd21JsV3lVVVtJqG+J2xwZhNJw4ZDRUe3T6eu
-fRuRlhMsMe5knRY6Nn+5qT3POeJ1jjiaBwJ5pbnNoB0KhwIyidEUIsmeZwJ+gvo1av5PkyIQMCQ9
-aq9hQmxUP1vo/c/ExtP4vzFTlB9WyRH6HeYfXL/YRRNJhTFh/dUP8nXCSZcsjVCarVRqxGz+2No/
-0xEaOn8rh9knxRT32TYfsgyP3tFT41CBJhlh77s/h+Af1kA8wnpIPvbMfobNMHCtn3tnG5Z+HGtD
-OGmFsmzZuoCLDKjjMwFqdpzM/3Th7wciKR+sWuTAGzQxCCRshkFFmRkkRbjBhpRe+fI1vpxwSJqE
-5SR+D3P+o/QaaT4HU6xDpJZx/kfaw/GsXnhcXWBvE4kI/gmIx70p4PEw0eDd6SPeno4xik5TYpT5
-SJkag5zsJyCn5YgwJ2LIR7kTB1TTRK+SvFQ+dRNKiVYe1+og7QmkO7DE2TnJJtHV4DmHCeaI3ZJE
-0OePmVVpYoiwbG45ip8ESTmnKE/enUeh7XvYaOf1B4JI5J8aUXqnESHwSTnPApiKOzrEnwKdwycc
-3sbwyTLbVWLKayDV16IKbJWSbvKEreE4ToOjoydHiT0/znMh2TdOndh8DTR76jzE6HkY0UO3Fs5J
-NG7N1ScymhsODJOJb10nA5zkacq2KbwDziDDc3MTlGYbyFTJo6bnPa0fnDyfrkS/e/o/Cfr/K/1m
-fsfisQ1r9vKrbUoESykpoRERH0W+Vqk90fjkEoyFG/qsGgV7wSPmkxAPeGEEQh+Yx0+XH87fgzkb
-70/xLOnP7Pd/l/V/Jcwng6qtqUplKs3/XC0Kuyr7tG+tv1xbqUYiiCCJxQ3ci1gfCZwrrBS2HGN7
-lLNRYXWO9G333344phOc50xWXCmTthi+6lMsMMKkaRjGOm29s2iOpXZmzgLDXDDDG9q1YUY0w1fD
-iDynwo45AerzzWUs7vw9Xq2F7PeTMM94OY6aaQlhhSyqqw0lnpm5KeajkcyI72pnPfTTS/EuOLvg
-suOM4x34mEDLLLTTG2OOmULrmuutX10Namw7qtoKYWd9ttttpZZbXY2ta1o1KtdR9m44bPjbcpaT
-uzLC2usox3sxSJszRnZ50xwgT4z0rHjTjjh8RdGOFKOyws+9a1helXnk2sN1L3vem+FsBVhq9sMn
-33jvbPfTTS165vuqOQN3u7PxvJygzBk8nRVcbFrZxTWRQUem7LaEpcKbbbbVrtbBV4a2G78aR2rn
-vpppa9cn3VHIG73YkRbXbXeJSYqx3eFm2WVpytZs889dbxjGOk5bri7bxbTeIw8NCebCEMsssspi
-EkiRIkS6FVNpvhB8yAmOrEcEIEnFN8ZZhq0XRVcbRtd4pvIsijrfRzKJcdzSC51d8t999ZY5WU2r
-WtY0o1lfZt92y312KWk7sy7xN4kR3VcIKbWd9dddd5ZZcXY4ta1o1KtdR+G44bPjbcpaTuzLxE4i
-RHdVwgptZ311114lllxdji1rWjUq11H4bjhs+NtylpO7Mv+R/JVVVVVVZA+RjDb15/Dn232vl139
-vSE69OfPnzuUW7LjOc9pyajzWCrDjN+G5y5q8dR97DwIjuZwXXZ311112ltlZTeta1jSjWV9W13b
-LfXYpaTuzLvE3iRHcwgu1nfXXXXeWWVlN61rWNKNZX3bfdst9dilpO7MvMOZ7APUoIgh8IfEgHyC
-e+Ie0N/vgo4RKsbhsh+YMGF/Cg/uP1qfxjw1I/jMdTg7wflebZzP3yTs/mDIp/QR+pyrSeg5nB3R
-QxDsxIn0hzep1IPciuL47CPedgRhURrdOFDmg0jJI08TccnmTlEhyRKVEdzc/b+mJg7Kf2q9lTXl
-OqOx7pZPgfyQrhyPF04R5Rp0ROcjhuWdHRHjsnp9Ak+dRD/bbzQ0IajFjyRMT+PNJ8Op/5qec4Ii
-IiIiJR9Qdo+wRDydolJ9Xv/s2ZZ7wnVwdbIeNhzvu9F4SqL2WP2iP40lQ7gD4FFEQwtpSMkk0yIi
-lBDydEiuzFVVVWiT2hYgfAeKMJynZMJSVOD+l5eE8b/W+x9ixPlCaahNVZJ8LXs1CadZBD3EsSHi
-j7JI+mcJ8Aw9DROws2aNyDoSTgqfUpX3EyPAaTJTmw7RIsnh5ENT/P2If738aW2ltX0sEcp+g5H/
-jMlNs/x5/3hDdIf1wiokc1fw5W6ai/z/zu/8l+X1VZvlX3O/1qN8UZYxd1msFre/14Qu1qta/y4H
-uigOv7u7weI8Dma1Gs/CyqJ6P9i8aX8zf8D/J8mz8Ccfq/x+DD0Ptu+lCKAEIyX5BjqgjQQ/iEQE
-/tBEQPRURkE6aYerd/1EOEiwiyEagm0EsR4HLju/ua69rHk5cPvcYO73OWcFTz9RsflYgebtZEEB
-V/12+3nBCSAIbx3DqMp4/2LfwN+c8Z25r/OKu3+oEPGBC26Wp6FrvxNGYuvTlu36PDf12SQvp1Ia
-EOtIf793ev6PpVDtmapQiYpgnrYEJ8p+r6/r1/RXuq+gMTq6CG/Pjd0vPpcjaxyIfKFIc+e+7neX
-O5G1NP/ldgdyDYiNRgLBGgUSNJ1SJ2ZZQG5EGYAgpk/eQEPfN4nZxX3o0zT++ConWtJe3pSc5gBI
-AIAgOD75HiB9wekaXUTVJIMgL0iDII6ENREikKD142oSN4I1AZYMgioZEQ29UGLGnpUWpGEGoJyI
-anrUhzkTYhsQsgbVCOclgiyQJVJlRdAh5zvLEBNlUA2BUk5kIqRohf9nMgyQjn0kRMggwRAwg2RG
-aKn1eZ2c17I0zL6gqJ1rSXt7c+XJSFYQ7yJpJe8kkR0IsCqQxHklkf1tkJyRykQWQgmCvUCuDTn6
-U/vTw/tD9gn8Aj+Uf4h9yERf42DDmbwfzmERoP6j5/5g2XamUIlhW/U007lRkS2SuiKcp0O6VyeE
-5BUiCkw/KLb8tKO7vDkaZAfLgWCrAkEXBVVQUzRGtkVEDJJB+ZcxUQEpcG2c0iLayKxCYtg4D+W8
-KYshwmvOPMe5DgP/HDz8uniuDDu5HWJUkh/MRydqRO0xBAgyjImvFvf6dqB6dzvHnlvXrr0RHOie
-SY4c+myG0RExrHDNzWm6psXCovASdGSzY2sUUMosuJQHMRSBMJglonP2JjmMMc3ZtJW8kU9g5Pwc
-m6lLFw9R12uXU0FOZuQYYcjC4cHAwKMQHpTZu8FKpSjy9hXCaR7VPJo0ZEIwFgwz7Fr43ea8YlWW
-DCNQdRFCx1GTkNGSzYSWMsLNhsiMgwkNR8Y4If5pvOr4vi6Feqe8w0c57J5ukkcD4zHq7AeAx6HG
-PBB7gLwVeo2oKqpmSfZ0+Lqii+XuPTnp6Hk6urFYaMJ6FcdvdjLZWXFwzKuVVVl8zY9x1/R5DZ7W
-MVjBK6vaqqpwxj71XlNz1i86jMiMrNzNEWCje70tq2ycjl2OcnvaVTY5FMjmU5mvUbHDSlcnuSpw
-c3V3506m/En8zG5pxfZmjTaPNXg0xMaVpie07NHuFQR4kKQ9oxMOrqOG6t3kw0xjTsPbT3HKejod
-jeR7Hmw6K6vBkSri7NmJurs6yuU5WptHRSlqoerBuNMVXGCnCdObmm5zxyk4iwf3+s4k1t8zRydl
-UrHR0/5WnIrof3f3dJ2czkaOSeKdVV7CHvbHNXdVV6lPc8vitt7m1qpUpyMmJ7Vm54nvbp1hp9Du
-81dYOFPhYhkdKi04cqvfbtO8Zprb0jka5pMOxTtNjBs3VYxBwRw5FF+5esODI6y6JWigMGAjZJQY
-O3wF+CRgoj88P4z4NVVV+/QCb/kNbUCaLESWollYoiiVsoisRGKioiIojKRBQ/Q/yxv+Y4dkN05O
-/5MOqNESok/dj2Jo/f+avzZubKGyzupJxH3938aGnrGm9jQ/g5ThG03slqchGm7aRs9KNmi1I6En
-STodAaY6Txr9BqWDO3l/UZlzP3vOm5aUvEzNMzaNon80dsWb8zmo/PkSjskhI9fefd3APb9RKlbg
-8I2dddCjpMmVcYULvH6SEDhiKEByv1b07gUN8nqVEHC8VnJjLatWsxntU2g4Ovw2eXlznKNiyzw+
-OLankxs8cE5dTIcrL4MniSQYHU00002bp6g2U3IA5rCkdjG3m56SWyPhOkfLPQ6Nx62F5MxZMwO1
-NGqMTHbmhy0R2nnP8pbHHeWVO9ijShHKPB2b77pmXGYx8yWd/J1dl3GwmxuimKwxDTTdq6DdeRo4
-JeoJe7nG/Lw0m0VRsazDM1qcHbWapMXo49kAd5sKZ2h/wj+bRvByZKYmm7XAXsGdTeHSiKtBvusM
-Y7xq/v4dp6tld2GJCZpo5eB5yx16Sd7t9aeBo6iPHinEREKQEZIcCjX5WSShejg1z3hgw7eY0Os9
-/LodW54yhx38+5dj2jBBCxMSRUVyjOVY/wtt8NE1X9dMgTT3xqO18CeKRKZOiDMGViOivepMY+M3
-3koEjY3U+QjCQE2JF3kR/0BBpIgTiMDaVA3JANiXopCpvDksN6ThST7m5DkksUpJKpar6DHqhNT/
-XmiBNDJHC4JyJQPoD2tfe2t69CESQVQEh7rCPqlj6MGkPPpfFh9v219rhs6ySH3B2bHrVs9VMzZw
-4+YfAcnKlqVTJLTlZhuVtS1tFKbN0qlcTU2N7FzcoyURYp7rrlpeWvvVOCcpOTEybHFmNLg1YqtS
-Pd/4nSJOSOHqz/tLaeip+sp9hPzFVLOaxUQZgmRTIKQCimGKYKCbGM1UWoqj6oR+hUR8ib9z9fEt
-kUSY9ynQkGlNB6EeoUFOt6l2I+ch+X+iGCYWQait7Av3358mRVkxh7y0UlB/c+T+tP8eaNGWwZrE
-KQd2UMA2MVP6XrOpVfQQJ5j9QDQQSqVKkqQ+R+7Y/h4EMHUaTYxTskPgewJAiFVpGJQQiVShEoSJ
-qlIkcfR9EFJ8fYYkT/5Ai2wdg2NaDQYEEklimywZDolJZjHb1EiQCAB6116uvXq9V6q02TTTU4Hi
-n3Qs6GpEqrKWV99nJ9a4op8JBNQBuQmAkIC8EZJojIQ/I9buj5SpzOAD5WaBYgSEKlUgIeUPV5z6
-U4h9VkpmGFZHCmPTGWcljN2QY1G2pOghx3Vts4Je8IZnR6gsNiiGHqweqTUk8GFBxRWCSzjQVgow
-IqiTBRl6SURSISUzmWYCjmKazFM0iJjkGpTJyTLw2NtW8jcc221s1YxSYsM3IIxER0bOZG+nqfoV
-qTqn1vnbNOingiObZCqvdg7WStYi5gVUxZGjJlUq2rGmNKaSPy4xJ7lbkRRuSGQaVDYHR+w2XoQR
-Lwc+jstNmzlJI8z+qEjq1J+Wk9L5pIn/YQqSKRSCqhJZBZAUhYiJUikEUQpIFVZYLFSMcDxBDaFS
-gVP0e1Tf719WJPpM0U+YP3SqfKQOEIuQRJE9CEXC23jWTFoq0lZNbGlKtSQhqBXRDqCEEmimgBCU
-VIqES1CKIkWCKgi0VESaIdEKZIJSUyQMyAKMELDiKuA4QxKHdGlBPTh/1n9Ac1N0Td+17hybPNkN
-NsmVKtiEbqMG+l022hbimzKTWGKiaVpZSsVVh/Bszhxr4z0VlNlibWYxndp8uRt8wclcmGIjqRio
-wSKDE/OSGQgQSH+ecIQywqWWFFnangshtYfJW8pKKjkzEVJusjCSx7toTmefH+Y7ckmm40mFXtEf
-RmD+CqFfU5Sex/ldG6ROgnR7Hr5j51/O6n6GHOOpX9hv09bVXUObDQ74Eg9y7IByIZg/0jwmjdFE
-/X+/7uRHOvmV9wRLGu66aT57PzZ/9//Z3+n6DziPgSyZPVIlj4/I9q+8Nn5NSN9RpR+UKHBEH8gW
-ExKSZVsi20KQUElWclOSKZE7vRUdj9BKl5rwsj9TZ73KKIWAthJusTjS0yKJppZ6j/JN+w85JJj5
-nPha+Y2MNKCulBXR66T5Vw+g0YGo+wv7P14I4cuQ8H6nxg+KKke170xGLD61WP3ox5pP7VT+b7rk
-J5PC2PWTHm0w1Xqvr64e8+HtaUCSVGIp/KY4MntX3kaSFJVJMV7nVf2SrUqpR9b3rSpJAyCQgB9f
-fNtfBrfW3MYp+xT6yjTpKY3mMRMUhim5Liojok+Y14v63ofOniF+3OQWgwYwmFNGTNa/CyZJJ2Wd
-3EcbM2Tsfsbpp3fJfcPNYiS2pCQVmQhYslCyT2PtcuhJurzVoppuySI6KOemO1MsJVgVu0xNOSwb
-KUsqVPoAdjY5cJvDyINw2GR6pVfIQ/ESIHnNI+iTg5doecfXGQjQywsR7FTHr7ng1NLs1yYm7bPh
-WlNVlh91OVm1cMY2zDptkLdO2JDmsjQsbOgYCak0SRFIcEORso3MLeMhQdlHtJGQUjW4Cm2oeCOI
-8Dcf2qqxPZANp3wHqvOE8JLBHBHm5HsKnZ3b1avDZT/vbNLNJswrJHOxNmsZd7N1TUYmysrRiwpj
-GCsYYm46EIh2JNnCWijRmFyCbNNYWyNlkjemSobFU1NxN9FVI89pI0KVrfjfaSKc3E8lZSUbnWCe
-5Ob8yonrE9qAkHz/hf3ICe9q161rRjRsbVQGtsaNJ3J9KIPAkT0GyP2v9SxMkzPmkR5Fg9ejJPOR
-7E6yfVhVPcqVphpkkox9kBsB7zZ0fKqvsfYB79Krh2EmQFokUC1/Bm6k3PY6rGQcv/S1/32H2Xup
-i+lvgGjD7Iw2zNSOe/8Kf2HnPA8wedQUOfy/k6a9am4riIC4EI8kUJCMkST1qQk5tBsTN06Hru2H
-ERZxPq/n3EdN0U0SYGLeMIoKbKqHCIw44wOp5Bfi9Po9Bsdb/hA9LCShATDIqLTMaFHxRT0kK+VB
-ARIOECYrCGEo4RhKgbDKuICSkA7fxwnm5480zIv+3MmnfO+3tzBlPfe0U++IvtvtyE9R02NiCtsS
-djNFBWsSdG221SelAti5IspCS+AAdYo/9Yo6OD7jD33r/maahOzmd4xqKVZGE7yNSaJRqe1geDwV
-bIanuaOjefRY5yElgiwRYIqEVCOklh7qiPBQchABPihirISCyEqsqsZ9pwTGH9JRQ6DZJ7RVkLEM
-cA4IgKqT/NuYtT1MRaKXgRQiwsF/nfX92s/lPeF7s6J7HiJN/298s8Wzm7m2qJklE1Ds64nfaMic
-zisyjxnNvZpIEYhQ1KiMiWzvruStobkqioY1P8dlsT3FN1dycRPIgVHlHFsByTDYPU+l0aCNWT3k
-qe88WB/1O2Wp9h2nkr0eSzPf4OSO7AwCxYwZx24UIlV0cEG6+l9h8HCq+zh4d0keQrg5NGGpKsKm
-GMVkisTCWZFUmZMSpjRqtXlLwWktVllJqRJLqWjWJ1sOCEqKJsxDG0EUQaEURFiOwm7Skhs/siRn
-NwcqtcMyWMTMVRhi1UxgxatKrGLMZI6hzU+MWDfdxo189sq1706cOzFYZJkm2DS/JWIqamH/MzZp
-NppjJKqqsXGMblxSpSKNqktJu7NO6sk4jd2kelfHIr1aatqTYlGSxydi91TZpZITaCPSRDSAkAiv
-+sEI0EXRugaMPqjDaorFti3UgqCoK5ubYa07+AboxPSNBgkO8lMPFp5om6SVd90rTa7WL4/eUs7u
-WqRcpVLrGTQtGYjpzLJ7zIIsEWk0m2+7eDWSS/C3cbpu0GAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC
-gLBh67cK4cANgAKALYwAHjgGADQGi+r6k9tVF87bG0iz8V2gi6p9IJbALRXN+flrTCUAMB86543V
-g5W52KhrXlHIq3WDxD2EKREQIkQwQLEqFCpwh3Rswf/LT/3/9/4P5vL+r/N93/9+Xjq8Hn3fm07B
-p+/6oIw/3PVjSha0rSEaxHqVetuYaMPVGG1JGFSVrgwlFPmCD2GkN6eHk6NBGoDmWrWJOx7Ntqlk
-WTh/NWCNxUP9hUmnRiQ/I/LkcU8zAw/BCcLLoSHaJguttBrrvuNjv0efQYcqSMIpK2jE08nWiljV
-JEwkiElBIyRjR5C/hx3/FU5cp5bqREkpbZG3nG298G29PbxvDbbbbxJMqqx2jpGwDKZ0xaBfSfdz
-TQJXTIrmzS1IVSmGEn8Va2yZKDCGAbEagapJog0RUJhFmIWCGDc1i9xmAHoBl3I7UtxupFZF8GB3
-F5GdV5PnEwPxxRSvefk/b2T/QslWESP0oTzTlH6vF2YFV+ld9Yi00i+l1HII/CEhrAxEYkZVpKUk
-SZZBUXTDIw/mU3a7L3M0sskqRpLWTZhsjckxyVHFCIIqJE/TAIclk3giwikEosEUVZlhSiTMF4VU
-fgPWh6U+KPI0+MEekDx148sbThI9HjJ7C/Z5Z6/T56lnrG91S0rTBKDchnE4wOqMBCiFagicNZFR
-ENVcn51qy2b1hyzHG2qalTljDlKmFVWMYSmMYpjTGNGFUqy87GSVTZRwxpON8asqjlRxxnCJU1Lb
-s6BxYW1tydGo58bnCDsrGbbY6Bdjc0rNKyuKjFSrBUKVYVKkUq0gVEu7Vw0le7I2rRYBEkWKsRGM
-CvEqmESghCpYdMTFlNjbSZoyVVkbKZNXDhSZekpMKkUVVhamuMNVuB5YcBaNkwSqYIQiEiBYiKc2
-JlilRXELs1lm2ts5bYSxRt9t7fbcGWFt9s4NGbwY0EUMOimJRq4lUqq4ca1waVJxW021hjisVWmF
-VixVmJgw3mRxLGhBIKIbIYyRBgwVUU5AmGoGUSUILnm8mgZN+WjRJRwSAZES6McVViKWJS3cixIi
-TUq4RRBBDBEoagx/0FrfK5iOtYakyySkd8DlG+9VrcHZYW321rM3y1kCPPN22thMzWmLSiNvCboC
-RhBxCpLsN8zTYlkvFiZvrffaNyUXIIqYIduYgAlC4xMR0ou4lFKBiDgoNUuaOSO48bYaBltpHN9a
-seoHYMDbMFqzbkF6Xunnrr3vd571enb2Td23RkLTWG1xSxJsqGKqja5NsOJDRCRJ1BDhBim06ODF
-aAFwzBXbMHRK8tVjsBsCx17dfLd3HpZlk/fDs1vRty4ROuW7NKoqjZZNLpG27SaVCtsZG2re0xII
-4kQm2gjSoMA8bKOCHDtxVSAmpEEKBBHcMlN1klJQxoSBJiR4UnWRwkbITxiPGRZ5WBWKphh1NhD/
-JHVEjsSyJIb85Pr9uP9lBEJ5Q7woPRFOpTmKOjguiyB5N78lSisYrGCrJUlwxcVKiurpKmSpLXS6
-S5Mty4hMMmITKWQEkZShcCQVf6dCYJQgiOhIyVFYDp8P8GKeFbZ42ffDT2NMNV7l/H8Or2Kng9jH
-wYxExtDBXowGN0+LN8q5czLjGPrryKofTKihTEoAh6xIyRFYmJ/bUI4bsgMy8rnZxDdjTU1S2RAQ
-AIZ3JiTGMTMttsmWTMzKSSmxQ871ZbyGfBPJ55teRllsZhmIhlljAgDGBa3rqEzMRE3RPZBQxKAx
-H7fjhBB40flWFTkwe6/cyZFVN5K+DTE1XwX4e+SMQjCUGIiRjJBowLGO4ZrKUZhwxitffHvfPJB4
-78uPPdCeyR5IkkOZyJ+SudJsse1EerHat571nZ548rNx807rO31GEWlrJJPYYxSaaTFVGzG/KzF4
-NzDRh0jDbM108H7z19fVGRbnveCexgwmKLGFiDEBKFIex6iaZ5/QkR7H5alh3mKusYksuvMSqI/B
-oxBg0ZAwaPwKKeECMZsivRFlzhQx1VFJOZUTJVVogwEll1dETUVVQVUVVfQWNkv2YZzGc1lFFWEH
-JUcWXmgqiqrIouy7oKoqqyTIkBQUUSL/t3NxzZjNWfFYgRuIFECUH3rPKx3R28PhfnTlwG7kdI6N
-pZVGQ6DUaFTSm8sg+S2h9qz4JJE/BEC/FVPYR173MMFNG51qacVGMgfZCf0e19D6K+Ld9CV1Y08M
-bO0xwrfTaJIgAKCiIAUSnkMezIiioqZHqY4USUzCNHR484dTrKmx5idg3ourEjkZqkNiE6EEX3iH
-IWo3HFHCWCAopXMDItbs1Jq9+3X464bbOEPhSeqiiUH/k7p5WxPRjJuY9j2uWpPYsR5vP7ZXVsoV
-8yqdDnEvbHGwoOHqHUBmeywCUxaz0JHWw4kZBiRjDiRjDjLst2mml0Ldpdlu0uy3aXZbtLst2l0L
-dpdC3aXQt2l0LdpdkW7S7LdpdC3JGMOJJJGMrQ4kYVDiRgLdpdDdpdDV2l0yW7S6Fu0umLdpdIt2
-l0i3aXSLdpdS3aXZbtLptdpdC3JGMOJGMOJGMOJJJGMm37wxkU86iHU7Z/J++38T+3++Hz/B7P/n
-s/3//tv+H/Brf4K3Pj/CByTkETofLR/ifvz9lh+epyFJ9FkQfaVKolKSfgbSVqjRHufwXNlRGleD
-8Q2HKfcvnxEg8ZYezvkN5/yq4hNb8TGpTa4nELSnznI6Ci9BEV3Na19JmFgblLVYjCs0uFlWU0/I
-2Nk8oiN6U80j7pXI2WEnQc5Js0ycKxA7Kkcr/KGfuL6ZllpC2I+7n12z9u2X9Dmvof72W68l5pSj
-UAQNbes3qrAgk8pIjpcQBBVLG5mwwPIl2xcOy3DJUhKJUREpQ2QxOSkf1dTAMRSSxjV3Qgm7JXPL
-dxHK566dNa4kOqOq0gpZ19NOhRZkUjq6+R4hTrUvgmJEtJwnT55ZUWcpwBAs6FCNep1PDjObk9Zt
-wQ2VMzHg3cSGm6m7q8VbJsKo3ftY5Obhp33acmzsp2krdd1xpk6KlaY7OHdjdsYptObBA40EkSHB
-QcjOAyM2QizMbMxDNlElceTs6b7a4faZZzw8lbOhkjIKiLgQhCUEDMFJHkTwSbMGy41Q8lDs6B8A
-IeS8EOGUMSZfBuO1nBUIQSGOEeSjKaXAoJDE93373ismxTGlQtqDBRUWQiKoCjYwUkmzY4wiiYiD
-BsmPKFUcHEVDMm+IdRB3Ma4FFeaeYgeRRdUI8KlW+aknmqQ2Kh5CFJI5KJPGkc5STssHCmqJuqdF
-SaWRusTtR1eU8GpI3UOlkc0pDSxI4eTCdRDRknn1Y5UbQ3MRPAdXgU46Nw8OrsndYnZUqjSyPBY7
-S6I77MDKg3Au00zkk5Nn8x4MHYjgvJYxHI7CyeCKYfp58jYWLwIpcSDA2eMc2Ly8GUjo7BZvRJqj
-uGSHkoOVGhGTYwI6Dtu81OHTGnYzksdSnRZHJ2NGjfjFem70cN06tlZ0eDh/qmzrN8dlc17WeKnF
-TFdF08lMcG/ZjSXSmOlk3o3dHoxpVm5ZXVrUVXguLGmMcq0qMWETTd1szRzlm9aVtZUToxyUbcSt
-zThSqPRXdym7faO8sQbK2BWSWdtGCKMmSTBICFGoZhxLixmNyGAQGKLuqKC2Sefcuy4SO6wcHDEI
-iR4q4U5KeDxTFd8jku6U0rY8FRMEGeMMIjig6JgIkOHplwQxDzBsGbvCsjtNzDqxiMWJlhSbMTVc
-lmqk2b10dGwxTebHJTSJosnolC57lCclkWHAiCMYOgwKJ6fbq+qjhBJls3adNq7nJKUqpUxwmPBo
-7qxqAYyEIgoUQbdww7lSEb6Dk8hD31ee2LxXRDNjNiq/VY4mVfaTl8c16URO1LW0ITF2TQ4i7T25
-tCFYsJoNckwEcGDkoMbAjkvyLGTJ/W5g8ERQLCwoMvRoojkUDhkehsUctx669mjdXbljZTvZOapw
-IDx2oZBkZ0HYoGIjagSDByI60LPicNllWSUqpzYzkqdmpsrRU8K5KdNHVyHnXdwOryd25vj2K9MY
-jvhxhpTwPDDQ3VXNmjTTHDTEc1eDaOzseDxdlbN1c+VgjwYbeC1rvuic+NTkOHmrJG4rCrM9ebZp
-e5Td5NOzc6k4Fqd1aUaY5ubZOHdyc2zMY7rKWTFZu21s4xHkrhpu3DTYvPDzsO0J4sVw8jHZptVq
-c8kLXRTq7t2onC4bw5OnNtUilOThzSxmlmjNhjYizw6+QnLmcnhzg7LDTMOio81jezol53VOydsn
-JPBhGwrnYk20ydK5a5Oang5R0VqRXiiUxxQjuHBCCDoRZ3NFmLokyZCyS7GMQjuT0C0I1JmycCKs
-QzuS8REFEs2SxB0FMRyGiS+DJySUTg7FaOBGStBNklDNRs3Lsxu2YgQYszgoEGe5GAo6JiARkxsn
-czooNyTFqzyJjub2ywwEnITYrMVh0VXJmnLdrSru3kTOEwTUWSSKoVUGxjvyak52RNOWUi0uDokh
-iCjsE+aI2FcGQ6ODSLMjNmQHICaEsxzMYIlsSRIcUqSFYJmYUw0YxgRr2Ro8awv3D66N3jmZ7wFC
-iIEoM7mIhqIjOk6xrU5FeYUtSe5SjapUqczAkSvXHU7KbwDSCRIFJyhyUWIrIMIUpzqzk725xnK3
-jdrjE0BwSpSEJQGZcCiOcSzGC3xzzazvBKuZNiDzL31tpAQ6kEiCQVIJEWCVHIkhhCm1khDm3c7a
-NXJDLpmHVLcqQykck24kvGuWm0EU1ucWAxFcpDbcG3eWOMO+IbSXTr10436dBZ0Ys4luMRwWs4ax
-tuuldIhu32SmicY1vFCJxZK3pu4DK53XXFPKiHCOVK1WqBE82W2+ebxWFdyNVAXJO+XzxTyohxl8
-VxxfFRykIskICZQ6nhnVSIhGoiIi7KqIdEQExJtOATmIAS0GTms5y3gwUVBeSSESmRp9xFm1a0jp
-VNOEiG06fYW/BrGotIljSR3YY0vVSE72a01UlILsRINQWIiUEoMI7IpAVcBnSQynXbCd66bYRtXL
-JMV2uO2c80QSy0SImIAJYPkKslyDsckScEynFyhesjZhdo5ECuiCgeXMwXeCnhRkoasyrU5U5WRO
-jYIhN2pHNYHaVGzQcNNY6M0RxWVG9SHFd672I34G6cE2nNU9LqnRmBSiIDrqY2gk07VKJUTyhmxx
-o7CGGw9AUZNEqMGh0UMQjKJjoQWM5HGFR3MUTRYjmYY0tyzkoJCzJZsOizjMEgnNjHbkx8Q1vrx1
-vEI5ZkQcwdLIjjPG7x2QsYvF4ozuRKLKyNGNS9YvFGgIGUR8J9Kyu3l4cl7bSY6ZoQ6ER4dSTJUI
-lSkGkOcBhKlINIZzNEqiLy5i4Rw6aGDQnB29Cblhi4zpx4eG2/EEwSN2EOXhkgjZYq2gqpVQB6u4
-AABIVUqoaaSAAAO7imYgFCICLWnrV6wQBYiDJMyW+CRwUUMrohCLrRYqGSWBCxDSwvC6QkbgPNrb
-lBFOhwJwTSgIDPMpNEtUNYokYgQhdEh0clbqAnAzg4YUWIRzzXG3Trvy2qym5DMYIY2U1Jz63Xax
-tI6TpAYEjiCwdREgUQGNMNQgcAYI8Sc1wcSQSbxBySJIbRhv6JwCaNBKJygBpRaRDntRz7Ls6sUg
-iHdtSqurd3dWVVuRq5V06ty0TUsRVW5m5dXKu7dW5Gi7qqty6ctVdUQrqaKiamxXVq6sRdWrqxF1
-aoot1curFVWrqxXVqIiIixEH+1EEalq8ZzNWdbI1KJXZTClAKU8OoipVVsq4AgRCgADOavW9+NuR
-4akEcJNsiIclgjRYJYN9uII2Ikmo2hBMgixHfXDeQR0zlx0358hU2kJJQQYnOunKG0Vza3dZIjBu
-jdseMq0mTtHU46zGOx3uzpA6JsnUscG2GsDHxMMXdF4TNOojMTmHGyqmx4Cv5yV6kQ9MRTZAe1a9
-rzwZNhNCPLrkhJQVSVZFU0/6w1JPAjwxsUryk80N4lbGwqnRkkT+sn+t/1O3V06PZnOPnUT0fS85
-P8OaSQ/3HaE7QTm6FOoUf7BO8g8NhwiFjQw4sSRpc1jG1NKhkkT/kkLAqFJFQsFQumQOu8XiblKl
-d2ZFWLCb1BtJyl2R8lEGm1k25ZrmbvNI3fP1y1TZ4PBormxurSuFRX0mzTxZ7+TY6HNuaWtmZVPG
-sVKqaYw6Kcl5OBM2eL5u2z+tXVKVLSL19z6HZ5G7hhFfdqcdXk3k6RuZTS4rpXJR8GzmqcK4bs00
-2bSF5TFqrInUVycjK0b8nUrbfGV4NI83iyHa8y1yyQxBJIxgMYEMZIiX4RQhHQzqigrqRYJEoDAb
-N5iixEI0gmxaiySMikQHAqNkG+sHJ1s2UVkNjIhCA2UzrKRsqRGmExZFHLJmm7WN3YxARgMiJOTM
-gxjhHoI26MsmM+hLLDvWmjoVhWk4ZzbmbThw7K0wrGxTkqNFZr2NMbOtcFbL3U009GmaeLTTs9Gz
-Z2WOriTHGp5SITpIneTU6+K+O92ZISQGGMwAjYZjbGADSWAB73Xd1G4ruKPM7DuR5CgntfiEXkuH
-2hfPbEKKQoP+X8kZChsbmBwOAkCB8mJ2boCISMRPoVijGEhkYqqyEwTFlkisMpPjHvVwsVVYmmz5
-TunxTY+YWrJe5EygoyZL7c100kETOQALEgqwTDQNJIjrbprVJTJU2umrWrklNRU0kwUYKIiiJsoo
-yaUiJBtJsk2WWpv3Oq4AAJYAHZ02sdYzTjmzdjbiUTs3azsHOHOHHdkOcODE2hIlRNIwiBZBQUhM
-tNCRopNGjGMhabat8989htqBD5+YsmpEj6lKsbEioL/v7ow1Fj6ESWB4kjSJppVnsE8nLlttED1i
-KyNI5nmRpJDubOrZTuAeYD3G59MfJMUqKzTBHKMo15GjUUNCU1rFFELAwYgCiISVlKVliqk2SDqj
-8kiKRH5/agyVK91eQ4iyCSSH70gfJhNID7RXwPI8jF9AQHQ0nc96w/WbkKirJVkMdPk3fm8J9S/s
-/wweckJGz7cTWx28z2nrNGmR8Y75DIyczCwMJnICJg9p8DSv9kG5LQzrHJNGZE1mYUDUFBCCkhue
-TiI7EC1M0hTSDKEoKbiCdCF9RoDchyhD9X1f8ZU0nKfU7KqVTTBN1nh/3G4mlk+LZ5abNUzVZLIN
-VJiKluMVc1hhZXZkxpTJSlY2yTFTBKTTmprGRw2NNDKJCwsT86Xq5wRrGSRCVqXjq0YcjExRI7If
-k/Vb8szSR1dJI9rs+31d7psoJ3CnN+ZCKk1J/mnV0Vhdghjpk1PFYxvvNRlDeokmlgNMWVNeg2Vf
-acPtw8CzWBpT4Oy/C0h799nY2AijWZGWO236Tm8+++7En8B6ttifM9ack29p7wEPEBaFChBggBJE
-SUpYkTZOU20fmSNOqtPrJD3vdI+T3e8fGWVGDkYBoUXEIQsmpZzIpjBXz2FDJ3iNRJELJprZjlph
-immlQxEzapIIwhsqAqoh2DTXBWyc1K3RyV5FF9ZfFDTHurG2Zr2Zzk6KdZMyhFBFDhCYSUqxoeXa
-Zzpi03QNGHSMNqSMKkrX6A9AaQrP5Rzfwfadkkng/ap5nslUk/YqSOGkhP1VNRULIfASixHBqJ39
-8/P2/HD92zplrTSDWt55Kxj9zlH0v1zjdU5LO06PpdmG87TR1vKbaUxiyV9N11nZ0hXSujfs11c3
-UprG8VjIbtMK8WbuDnSSizMKgwIg1KVFYMEnMZgDIgyijZk4MFjgsj9EkkWTEc809m5gwKEaOQwY
-l8aVWO6qolY89zDZz0xXVt1biYJ4rwdWV4q1i5l3eCb6a55UsN7ZhjGORnYkhQCiM5kOGYHGoAgW
-h6GXA3JgroeTgsDIjksZQgOAs0MsRI5GScRAEFBo4JMrF3EKKpkwMbEFiN4vQigsaJFQPQsWRATC
-DMa0CHXnIEwpBG32k9G0kRtSA2YIiNz0BhoJASUeaC7omCvNDwWQqx1NiY84JMg3STlDh3aVe02D
-c5KJCscxXR/oEiCHZ1JGPuYJkQSg1VWSITkklDz+xzQrI7P1e/wfi+KSfNYQQ+PPnjSYRSo88VVr
-u282k3QrTN9MbUM2yBEZBEm0OawR6HceYxVHB2OB1CWWCfBiYo2Epy5kyJ7Pu+L4ufXrbq0GIdK9
-wBBTWDE+tDD22SWQhGzAzRQbGaQ0dKQ0UHEPgURorQ8EhkME8Y0xjKyKP1i1k0anlm4/ObOB5OSg
-fAFDgWWY6JORGChGFhRpDD6CxmzmcmEdzgoN4LMmTQfUHc0XUmTscDiDBZIaEzNMmWOKBCkQbJBz
-wJBRLjxEaKwd8GUOGpQjQGgMCD8CBicVwUbPD7GzAWeRo6GWjgKEYEUKSOiQkZYzZnMbMiOBGDzK
-GJCCgwvUo7kbve5k5cG6OZO4yiXgZZmbFFqDIxiEMwDEYIk8htpsxu5Od5W26kZmoIxpcQRdZBGM
-xBFy8eNqzpZurm3Y4znzbYs05sL0ZLowZiOSihlAMQhBuok72WDJkUVtyIZDKGIooRg2UG5JOLiN
-aSSzFkRUUQEFJIgLQUFyUJOZnCbSmSe745EiR2E7p0U58p4oUr2NISJMkanVi4l3Um0JWyq64J+t
-3k2otk8dTWoyvpK1mh4bJLX1+BwnmbzeNAh2odjLwXXaZ6+YURTHwqrAn5fgMsVeUUO1QM/oMoFg
-uJYiUJFmXQJULs1OxrZULSUsiKWBJtYZGNMLAqkCtBSJPM4AdDz9ry9t9pb2W1K1MAAClNACkBAC
-SQEMipmYAQKUNoAKzWICJIAAJZsNmyQASTIMk1JsG01KDbNsmACFpZAZgazWAAAGZJmAgGzEmDNm
-xmZEmaqqiq7gFcf+nxU+k1udovZJHcwwxOcRSD3xxUrAk+YL8tOJFOap9TdnV/Y3l0SQSCQJIqyu
-tY5ppMTSt1UqlThWFW1iqonpIeB3R9Cc/Hc7zrU61UAXuPwWY2iTc+Dk/B47N0r3LN51KilSVUVV
-OjmdDJFUYqKpVVVWKUYgqCMcoeqv9Nb/s/S/LVz9EMwNG/2U/c/a6NBGpX3Wn5D2aOCegc7poeBY
-5Ur/nYkmUW9cmFVjm1paP67iIkoJIiSAkgJICQKNIRZCLBFgiwRVej0m/3mRNq9t2u0CpTawGEjO
-LJKU5mEwUVkjcZosUon7K3fGJ0T0j51f9kB9J6fug+gkIGcakyzEwXDDFymUqZkMW/T1fR+XQNvz
-GypGlQ4Ap2EYJ8uyrjqh/tHBXDWGmTURlYrDWlSIWLDTFRak0sUMGEYS6VWFNSYRgQSgOK22UVtb
-cWZdrsVV2u6NJIFMYSCZzMMNIZBMRkQKLMZkEbacK29mN44f36aRurFIguViEZJ7GSZK0xMkItpz
-F0ijBUgxhg0mTEaMXJANFkmGgxZUjRBGgwXAMWiXEyAyAUXQgxiCAaMIokwspoGFmhVJKpFVBQlS
-UqKlCqVZIVKUOzWNLJIqk00yaU2aYqjSyqqYxiqlTZpNLrDDCuSzduuzo2aaMOFKKBr+I5GKugAY
-KiJhE/BHacyXJFFJSEBoBWgEKVRAJ57mdFbJ1qEYihEPlSIZUEWECIxICbSKDkgrQrQINCohSA7E
-IHoJUEDUKrQrA8WRMkd2Sb2RPKyQjl/rBDCiRLBFIUpClQsEUhUerZA+VATooLyQE7kBJ7VQn+Mn
-NEHOgmJ2U7QfLEx47pCZE4j8/RGXYdKf4G0k3ayRYEKQ9UHQxJ7EJh9vpmPPWpqszFoXlv9NrT0r
-eFtn1cs51xjTeSTqqdFR+lXZyvG7Ztam5860Iu5ABqROm5aos4PK+o+ir99TCX5JEJFIUYwfPuXM
-zHHlRUOeym8Sf2zxbN/QIhMnLbBPNXorlybrTlJIiTYHqIFSMFHGF8+OJ9oEEY1hos6ImTh5mxld
-ozd6CYqd2Oj27eO+KncRBIrtxwaeRA+AiDNzGMCZMFH7VVNB3UAjsiSfgqCpk2mtZk0mzn2r+5jJ
-Dh9f+s22S34X58iuGaUIQqQV4PoiI8nbbuBiBU7Bw2knrW31rIjCN6seT73Zs/a4Qe1ybTySI+6Q
-Q7C74cUEgmmSJVhk8FNKNVWMzKYpKaimIS6zCJq+EBijEMCUgQHmnQpLDSlV1pSY8GlW8XSuFZdX
-a6tRWB7Eh9wyvnICFAntQI0yD0Uh6+LP9ip/7rDwrfMXwtwxWTMauFRCAuqiF5qe2CIEYIj7yvST
-x2gbSQlfgUeCoOUjt72RXtmTKurxcVr6a+t9SAEIHbWvnvhrPR4CDI1JlQ8X3qYTVtTwlTFePS7a
-6W9SslakrnJbayvvMu13mXSXW7LtalEdW5krEZgcWRBDpZlQSIAhyNEpkGiVCUlIwxVyRGASJiAh
-YkkhGIEHONGjjRsugwlGMb3JuUf0qxVKqyyvXGDEbcTRgRYVSGC/WS5HRkxEkQ4N0qwUpqTomanU
-3erbbw5V/DY4bxusmB2mC4QhBIsSineonxQXnKn3FQkfdUOy6VIPceDhJPuWRJaEXy04PeMgHkPJ
-DDzG6PmGU7le4hO+HCXfdODmRkSUREUW5eQKpUOgUvTiBokDRJ3ED7z4fXDpUdyThZkjMxDGQYIc
-hU+n3+Bo4ldQMW/ocOQNq68SOszRS7I94HqXzEiHsdPZEcl1tMPxWae/dNSFR5Hi6NnVOkHVUmd5
-OU5yWucp9qNZljtECzbfHlL+PV0URUrl73dcq3OCsaVoeR9pIBVF5oEOlUzKSlJEilSpUqV6Hdee
-1O8c5znOJXZzz5aX0rKNqbO//v/5vNu8X1vI0s/NZiP4q76RiyOWNlRA9XuwPE38/gFHMMmTCRJW
-AxKWMYkwFADI/2BoV9RyPUiedOFHJIWFrlTjMj1fcse4/NS0pX3RtoxYKxpps/gw0KkNyxssMMZM
-RSmiimYRZYtLiTJGLKVaXGMJcMMSt8ZJapVk+lhMilS2FKsjKjFbVitmMJpjEsmG8o22mt2xpuiY
-UUylxTdvhphhsWsbabMVVWNtq2aZkqhs3aak1JZgsotFU3TUYJpv80qZJoNmE+94xqB/5gqY4f1N
-GknRAWCLasOUkg/UsSPxshMZ/nbI9SxD9kLieZyabZJJJ/JFUzbWSpJZUlkpZbKiIVYiIVhlUYWC
-ISIaSWVKpSWlss1KSmqWSUlZJKTG1SUsS0srKSVUibWktaktS2Wk2tSattFWkqiqmUQqESLECp1E
-GEoRIEQIkQMShEixIkSNAiYMAmEKRMEKhWEmBIjhAeaKKKCk366YUiPgbGjQGo7i+z68TzdDwGGI
-CjgBkhNudzxJ6Gap6lN3moppD9dnE/7k4Q6Kieh6qZJkyZarpWWFLLpRJVza+rLvAYRDtAvpJRIj
-IbnsFBRolhwixQkzj2Ipiu7GiEoaN1O3FX2JW74qreIOZ+qkf8ahwVfZL5DRh5RhtSRhUlanoAoA
-eQCK9L5rq86NvpyTSSyypsjbSJLSZYszUqaZpklStimUkpSSWi0pTFSJj4Pc9EJobKVJE5zmyETd
-oTYMNNlKYSGSSVssIkKsJxPznyF3UDJQff49bxCLxEYoJIdp++Ztex7xPNXY8ORWlpZKS+cSRos2
-Ypypiyf+9rHdtOq239WS2Hq6MKdXJ6o2NNkjafd9z7JrK8lYd6x9qve4ObFPa7KhNh6yX7DdH9in
-RAdkO4NiilU6frY3Y9z6zeq/Oyrdhxzc4zn0byRi2IioVYc9rCYkn+YpdkBGbSrFRCuuT9OmK/xN
-YnZsxVmq9qpVdFY8pkKqthv4Km08XckLyiDYk90boRsdnY9hT/Om/WJ5Je5x5UZZR7SawNCzMxaW
-rX1k1kTYmYjgDhgLhBA5imA5iP8OR3GqTh3lyJaKLIcmAgcwQ9YOYjgOYjyBzEeYOYj+O1NGsxtl
-wo1jgUBoHWK4QMVFYYjiTMTyDwV91e9+Y76J8Mp7uDhpFVN3Q00s4rG7Oz3JNJGnD+ITuh3Wwlg6
-IklQaU5aJ1H/Mr5mj3FJiynDGtY6XKT4TbetS5y9XXbd6XFRXUQH+2Ug6wfT5z8x9TICX27GnzDR
-+tP47B+c2QB5Wifq8wqZTIREQJVAAkCNIUgpNobGNMoQsKG3TEQsMCvx640AkyTRbb2ZKWZyNsi0
-ENwYnFQAatiZdaZWqa1I0pMuKj9ag5FkKZANoRFORwZYGcaUcYiFPy5rsqrjFXOuhsMsN7DfY2/q
-sNrcnLIxt9ZpnGMazi7K+v9Hyj37ST3zQs8WMjCtWSTwnjb3z+E6P7+QnJIOqiVUn1/V89YrKVKF
-lFsD5U8HL6EiY9y36IS4zSTIKQ3LklW7fDq/D7pD3ifUidaodXxO1ehzVD8+/efoYIH7VPuPyEQP
-SAScEwZJJJCzunKlsaRN4BySliAfJkdELuRgQa9Iq2xjXLelW5XjReMF0lDjmKiIOWQIahAFdRqI
-lDEGB0wPNwhoUDA0REjpH5VyCaWRFVEH+h4OXnVdoiDCyCN7CbzoTaqoKinaJvHOkL7Hhw+16k9h
-4CbQpeJHsZPa0sie5A5BCv5yHCRwlNnSqfEvfhZktmYfO/DWpKn/Mn2fQPc2kqj4vy5r7WFVtY0v
-oJZEnlXFNn0qZW2RGLSlSmWITksmlghpWKRVBH01OyXRA9MA2ULIh4B2EhdJ8/WO2Oj9h7l7JH4n
-RT3bHr6dVP4HrdGgjWOGJGFFvmX3evo89dd12PaF7oek9cBuvWbn4vmPov8Ts5vnaf2MaWTWJ9qo
-0rFHI+Tvn7ZvYlBnL/9Tx3ff/ec//X0elyoBPKmLyb0Bow7Yw2zNWUyUacwtgxw2jDbM1UdlkN38
-8J86iK/MzKksXMjAqSKLKBkMg2PyKSfwp+M0uRQPPtHZ/AVdtQP4x/EdYCdX2Ke6D5pR0sMfExpH
-CTWiwwkdWxChgQKfOmOxGX0kFAxbCmIqOYRsRhs0jH5jsh5/p6VV+5w0mlbMfkbva8sam6uBXEYu
-0YX8jnjRprGlKrkwyEZMkMyMtOT85UWdGR4oUjD5qO3pBeDHA4uv3zgoQ5JJBnJsyaMSCH0iqyyR
-R95LNySaPbJ23kwclxycmhls4MnVFgiFAUckEsqjwM5ZowUdyRssEIEOJNHG3U8zYOAzol3HW8iG
-IAoVaaQ4gixljvXGsmzHLZu2bqbsbWY3db80vV6kXa73BkQQASHjGkc2LRGBLj0zcNOeAB7i+FPt
-fe6NFaqfF7pJUbkkTQ3X3smKryco3hp2CDUesVbVrEjYzRT+rwQaZqiGkomAmQA0arfEww3NaKfe
-dRjopi3bcNGHyRhtmaspi02waMNokqZalKEJwqBklIkqZakShCcKgd16XXru8cZPM9V5del167vH
-GTzNjTG1Y2zNe/6nL6G8g/SLJHp+lgRlttyN0MPzUkl69+/LdKOTH4uc2auvC35bC2da+/d10Vqa
-4v4bNuUYfgck1edk+kQgce0678V8zKboUh1KR+EtEpokfOjH3EYPijsjpdBA6hXpHyntPdrinh5O
-jQRqB+YUA5HeSIRNBS0LS1kGSrSmrSWUqkS1SVpLaStmaqktRJslKlRLHhgqmEgRCJhDkM1SW1jJ
-tdSrpJqpNUikSUYkQYIiRglAQiHFiRlRJ975U8VpNlP3V+DiHZo6vgrBJI/I+LvE8EfPY+9KqluY
-wMsJJ/OpEfvh9qn4Jp7EjuxGo3qTYV/RGwm6/YBEREFCAEStESlMi2bSTUWtka2ltpXyyGIkDCsI
-ANRIQoSgWVSbW2lLFUS2pallqiASEIflMH0/IWxpI4Vf1PcL9iUVlKp1WJ9R432FrkxE8eI+s6mN
-x9p83IFfzkLkkEFIBStKOZgFTamrYoLGiiKJIwRNBQU00yJn2/DSAvAo+q30ecW5RrFNugdvtOyn
-kYP6iNKv3/wGIcawTZedmK2spSQvVpqc0iNHEbN6bsihIHGBUdj5F94SPXKJjIUAFICozKoRLEL4
-HmzlmZmZmZkl7/eeeADGAAAPkb169evTbmZptuqpKiVMqZmZU0QEOX95ENthBsh5yQC7HdB8Ekj9
-lk+sStlkk4eQTq86YHpVsklkiiyx7WkB/SRU8WxG7vPCOzIx5jSN3LrViJ8ETmW67IvqlO8B0K9p
-p2GeD3nzHVUfTIhO8SQfg0/BYnxeTfuSYxzYIngogByPD766YQmUoZJmWaKzUhR8kpx7alqUqWKR
-7CxjOTSNH7NMNlbt5jss23XZqswwTBoNGMSxBqCeXmNamHy+Na1AcY8wzHps45U+Wn0kBokSiCIf
-2EBOH9/QmxKiywpSqsKlTwYxcXMMiSN92nEidE3JlRvqfq/HCYnw/vm51HjwPrsXMaD8K59y7LkL
-EtLWgyEui0toKd1yaDAycXIYhMK2YimxjSql38HOex8XvcnH7segl29jD/pNjoQ204T46NaxgwtY
-YaFv76Irh6z3jhdmjlVbSGTSkWRrWanJ2drGEqpVeKpHxUaVPaps3V9bsrmig+qQTmGTnVrRzNsH
-aMISlkjp1bG2bO8RLEgh1FtocOIxWkUFfKurqWaKbFY3snTrpW90YqaUy7VrTGaw1rYxjDTRYiWm
-KxSVhpp0rOW+pSWrLwxFapGlpK55iVmg5G6bBLDUkRsJxu2raGnGc92J8VxuxC2Riyb8MhyVW2Bz
-WTFKtuxjFq0cyyDLgEFSWIyUZHgcAhBElEyZbdoZjLYySpmbajFiq3m4hYaUqnLRhKo6lIt7JKGI
-ETM0oaIzlIqIaOqdjRjbw5SkWXMIgS0ryMxDnCIC6NZO85hg8bLswYzRyVmxSy8LJqKsazDFbs30
-nGmRJQtGZmTkawMBATYJQTnwmKibKoYOwFhAwGPkR0EPNs1tnbsyfYAAeD7CL0PJgvXdUemrL999
-U6O9epF7gPbKg7e0A/BC6D2KeBud13Yk95migP5IfiKPnDuoT2ibAaDEUA/kIAUaWCk+4zIWwxET
-CVFDCTIWgQwlTtDzqsSScCVR5P8p4NnsnxI5Se2vBSR0cKBsaTtUndxV4IMIF0RhLaIwNIYoLEgJ
-KSKIzIog6UsZEQ2JFFcGT57vzDHBsKnFzC5xi1Zubv+ta+C8l2te/qbqbrqkqa8m6hddd7LqGkly
-t1JJdcu8aevLgryXtXnLvWmxhiQaNYGgiCPhrEeI2JMmpYwtzGFthKrozFqF4YMG7Q1pWfmY5pSv
-ezFTVibjpUynGMLr33Td2s2r2lfEkniUlF1bJ2MDUIGjRhqnS5mYZZY6I0uqwbpunbUW0253B5a7
-zXmmtYERBzMyyII1KYQRG8lDwSbm5jlEiKLhIbmGmNYW+nDYKjZMXDErJMYxbaslUrgZpFL11Xvd
-7evWw2YhGzjZUbBsKrGm4QgdBA749gdQ664YOyhkt7zHJV5GjTStJiaayaMmjUrNGEuGOkAOQq7P
-9AHIBTHR9f9ueByVOfI0dA2IkKiTn2YC4SNNmIGMXS3StTKGUWLmulLrq9lNKVSqmkmNNFnmfdPN
-1N4iubiHjFjQ+VIj8ZBHz6mlffqeLZJIh9Mu9BElqchH/J2gnWQSSQ+93HNhD6UD3/o3wVcD7pDK
-Z50/w/H/v//P66IlQsoMCofkSeshbsx/3+9VD4niYetQPJYV9Sghie96oTE6HtFnzJSPzCcmff9f
-17XPPbe6phM/VWKRRIsUhGgyWGJEYeMNt2xRFmaxabbbqHXpVUqqmPBxWLV3X9QmK3VzMvEGCcXd
-jGMoqICRFYW5gUbN1SSiP4zD08youzdX1umo1+9kw0nWNaLFjVsIxqT+M2M2SNlhoeCHgzB+wPUR
-1BO261uuXJnFaNMUXGELlW3WP+36f1duYN+csj88REbaQ58iiIiOg5YLbvi8iIvOuouytdu1XWNs
-7kjualIIsbvDRh0jDbM1GBp2dGgjVJGNQnuAU957iYoVPOR9uhMUpSqhVMVidn58Y0mLEqiEsbLJ
-ixVUWVUaUxKfJrA0EyqTEQuEmSMwTEMpLFkpKaUvbquUvLttdUl5LczWUqSmvJava66RKJRqY4iT
-UUVVirE2VpUJqIlCCTHAxZB0QselUPyKh8/907H8x/B86T/pV/O/a4VfWz25Fe5mr2GQxT7KwpVG
-6bps0bCmy2Kwq2Ps/4/ijVCNK6fI8nCVPQ4J4esdL6gPY7+mfcf4A9gcomIk87umAukU6wCWg6Dg
-W2WMHTExfdJSgwXJKCS5iMFhhGk3CTTpYxByEmOI0m6Cm6EQiqSHvmCA97vBEqRClCKsMohkWf4F
-6SaQbbshtIjTwOoUVxRVU6HvIHH6n6+zrXQHPbR4kabMWH0sd3JlVsu7GmnJHJsxU1cZFVMVs9rT
-St6WxipVHKzddODXM2MIafj1BrrsI1NmRZYURo7jMjZs0+T3s0pSzZW8i2NMyTs5Mk0/QYqstosq
-KnCnCzVxY1jCtblmKuMmpdKRiw2VhjZjSY2XVPCPS4b152PJDed0rzuTlilXKxU3U1qslqMXLMW3
-s4Y1Iwl6h05vCalTNTyeOlxXcXM7cl3a1XYxiIiIiExERESVrJdNnCRXQGgJTjB829s7m/oFPo81
-VVYydk/2hR1b8n0vxVynV80fY4/0fKJwntLMvzlkn0zEGAnMn72ovrsu369OWopzWt9pmRdv/HRp
-/Uo9Xz+2TH9iMNoj4uGhwRHteJwPGw6CVxAlPRY3WNcSVQwB9qn7g9AB2EJEpEQsiMUSJK1EcD+m
-DTo8l9PXx7b9JInip1VA6FiYoNXJrTVLJNKTSmRUiQFToQgCjwsmwdpEaNCt0/qyTyntMWW6mVme
-HQZFHhgYsT5JyzTBM4tpo5syKbrYrFtiq0sxILTbhow2zGNqSMKkrWyfO2qCNaM0GQvKRMd3YzVj
-ODiYUZIsZD1ewfa++tJPOaayU9KUwm6HsMBiySVZEFSSlcisXkljCXK+9iZNLGKmmVo5NhkWX2I5
-Uc1giSc3pF8WYk1IDZ8ZPdBGyRraEfe6ukjXvSK4SedbOQwHsBKqa1Sra834lfwYxFJksghISgMw
-DH+5zCEPanRQTDkZzEk9I7PDs6akCY0r4n7LYlUsLJTIkV+jSjeWCHmQn8cnrCQE8QIeL0GiHi0e
-RI1CHq0lWVLKTIFAKQzoUZBkdYgv1JOkiSVqR9aNOONlPTEyYJS0Zcsfg6n4vE/DTJ78OSRY820f
-bn+qbQ8pKjlffiRyM0U9yqeL6T+TZLc+s7zkKPUwo+KegmIIgR6+aYRKSRDi7LHZZQFDKCqYmNMY
-mP52NOG6YaVVSMYtXhMMrAzTTZrNijZjGZi7Npoku2RwshK3Y0hiJGMNk0VMWRKwiNNk2NlStKyY
-oxTWmy42scP1sbHDE2uN3Ct5NqaKZTdkCMNSt6rGN4qK+DYzdtNJG7FwrTaYazY1itlK0yM2NDZr
-YIxqMxsqKonNu2it25mWN7u1eW9ep2RFeVq51SpaqPa1HIUyYoqRkkoSJjJNDLFMg5CyUEirHCmN
-aw21s3mKzDDMTGS5drWpmpKZS4zLppkEaZitmoG00mNmxkgwpiprIxSY1s1s0otxpWbtNm7dEqbq
-2aYSsMNiz1S6688vEYk0mskmZstWakskiVkrGRLIiIiVZKJoy2TbLSUkRNsibZEybJsyqTWshlFD
-YSTJIKQRRJQSOiZIRJdlFDVTKTJVWMWb0k0pJqUxkVhpWlNKklVRMY5XUpu/6GG5DsTtAagoa0RM
-xwaFwh2MMlVVWTZyZuNYyFkmpo2mmtH4U0DZFVYkKWSSuGM3Ym10pspqfFczkzI3zIqxlQDSxJGL
-JNGkyRQattlZprFY22yo2StMY2qfcvGyuHIVorZEyZMyCMMyUyxMQRkYJkhFk4l1qtNeS1Lm7cMR
-sW2OE1UkopaEqaYJkkoyoWybqaUrWNlTJZIquyptKYqE0UYphTcoxSlSyxJWyskoX8B2ZNr3U6zX
-TdvUq3Kkclg2J0YbKmhMZKstWyqqyaSktklpbJJkySRWpFN9oyLIo6saN2zZka2YPnMJHQxEwgOa
-m0FCXIMyWgIpMTlgyUrWMkqMpcYqWGUtAUJSFLQ60ZqCkpUiURNhkiI8/ze33GMWVKLuYj8yVjqY
-i7G5KRaBOvvUUVvWew7y1SiVSyeeCIhhIiz4XRPrFFIycFaWqmNoUtkWdlAR+MmYjQo4k3rXTREu
-eES5mZmZiZkbbCkziANoib3MzixCic3dQF1VOoBCOcf9JyTCKtxs+SA43wxy2RrgWQxjDgNakwgp
-GWY1UIiEgjGmMEEaJUxepmZGIuq5CjggclKLqICRRARiRXbiLRSjul+Eq8fQDbYZl5LQpf7Qetfr
-OOJEiFqQg6x4oyNJJTVQF9v17O0wzJ94g137AaIhhIEXziIqRCxGYQR5lEjSnM/LaiJiikpCcNz2
-vthc2i20qfBpX3hLGSFlVLFUJ9aHkqsUxYxiVYMiJYiklWSfgFI0RN7VJFqAwiPsVLBFHDUAiIQH
-FsuLG1iWYhkukCMMNLLTFFWGhlk1RjFyDUQ0QoJhOodEak0oDEAwSJKuiQ1BhkGBDKxZGRa0NAan
-ONAuNMETqVpApKIMMbRiZrroaskVutXYWi5oaJGtVFsMVJJMwZmS0XJAuDSZGl0MmXNM1pGWNGlk
-qKSUutDTGBmjIYkKyySwmwmpIk2jSq2bJ6qbrIit5IxTnEkQ3cbkMaWRVkS2pKSFCgVNiTFRJuwW
-Fbt1m0SYgytCyrKZSkspsiWRNk0klFlVFWUpKuE0aumlMxsRG1ZVtKVrTUpazZZMibZLMbbWZRer
-rpTLbCZqAIDbAQKDCChVYlQmRRja1LM0sWtVGtpapLQ6Mh9imljvYl2ScmkjaJZIfWpMKiSRRyRR
-HBRTEHYiIj9ByfefZ0cvLHBiDDwNaKD13/5JO1Qe1JKneQxf2rJJlAYsIxYKoQMMVMBQcJRTzEdy
-gbtu6R8hxUxV0KwqRhGHJ4DBeNk8AP7xtsb+b2NmLhheTWipRtJxUjZurNJIIJdxVEww5Gl2CAhS
-hJIGUYoIECAZA2ZegSBKH2yi7kuiMI3NG6wopDOJ0XqA9shh7GR84/JsR41EYGVZmF5VVq2iK2wt
-YV5WVrKN9ICbICfLAiUg0gbggm9sIi5vRUVotVGWWWqtuAMYRJLtiOo8UZC/lZICexUWohVNuyd9
-fFfKQR6T05Mh9xL6CTpGHBhMphLgw0sbmIrSmNNOFmw0qRvd1kKWRTEkNIhuawmzGyrDElY01FUs
-UgSmV9uZkhrVdd3Utal2+GjIm67VpZjTBmYS6XJbGK1ZFxnDAxstlmFbXVpkppqGqGkYUFCwMEiE
-QUlRAgI/VIpEcm0KobQiI0YpLByUiNokioq8NpVOScMFVDSVshlNJNSSOIJUhstWEJB71/di8Gy9
-gpH/bKpwq8EbvMHYKEyIxIpOT66iNhS7VbPvnscZmfi1kUshUw97B6LIn+JjG9k4LnLGMAIm0p9x
-Bzg3hwlDcmsl/0ZgP9Lbkm3NuxQ30ml0lSyJsYye6xI3U1d7HUqcaYnJJG7U12sirDFjbcxraSmf
-w/I31a6LJE7rGujEI5IQ/xQnSdNQCRARCOZjQ514689ZId7HWppzx00xiw1LvpGmn91jF1cZdka0
-3MNLKisVllkjtvMaN/KO2m6bskfq/vUyVOS0sGfF/C/XFWoYD8l+3X3l7CUkiEgJopSRpgmRCYgs
-IqDIQ2k0WOiU2PIhCCReoCFVfOgSAUVVAAAkFba3lNVq82rb0bxDR6R3STeRJqEOLCIqpFSIfH1L
-PiRiIkoA+L4j+0YMAjCqaqYqqKWZjCpUIqNCsidMmhEXSiiBpUDSqf8TjsbEskJrQm0kJ+R2OSHh
-BvA4kf5EKZ1qd4Aq/DmqH5x0nyJ/f8R0fIAhis9rlF83ikj+nxf9pH2PJ/CcEk+CfuVzRROZWxZo
-jxe5/cfhlMxunJ/qY8Yh0OUSWTG6yYyY2aaKrSNLHojq8OBm+dWaVElbtnF12q3Xe0qsMSaizT/g
-yTaT/DkxYtT5RjHu8xoSTcpC1akoiiVRalLIEgSqhEfV5glF2IEyOszAoUkq28vuS3axVXmVuu6Q
-ubiWr4qunkukzSbWndbhtVxKhDji6MMFijIw0QQxKeWC6GEfKMJEIkQ7n5YLFHURKDKEzJ0MxRoi
-RSgB7gGRH1lEjpbUPkobqtEqlVWknAVZkBID9BgeAyr2d4DiIxhIfMiq8uZgYT2gYmICQjhI4qA5
-IgjhCqh8/7dfteh0R6IeTKkpVWWR1nmqJW8R2czzkqFUFFFm0Nn/CWGSiWxJJySHMqs1PnRUlJtA
-2pQUqVKQipFqISyEShBXNkgywewcTheHNfqdkaE+iv87FYmtaRyRJwbzFjx9zIGv1u6Gwlkh/j/9
-HI9ndOamN4NAPARsw9DZ9EolKvoPWGKazFD3mzmSe2ItRObnxER5WpVUKKYyYxifFmGhMpszq2TY
-kq19xuyVEo28ldSrxcspbWiw+iQw5ODGH1BGkWIgh3IcnMeboxqI1i4QRWsHCVNJgbmjCkTksbKq
-yTdwJgm42TJhGUxYrlzYaVIsUUqqk2ZiqGI5GsVwkTAtiHZ5mjRo5qmEHz2yxNbtNWUnqHyevwiT
-kf2yf7VHaCwen2N5ZBVkO1eyxNJ9GI322uYg+k3fEWSzwfodpYnWQ+qyE1O4dJJ9bpDAHuCneTfk
-epVWPZJJPbJZEAqq9pnMVPyOzjwWrJVgixLLB4kLEpEig4lQzCCQENjGJJHi6rLCx8L1eyjzrO3E
-iydifB2Tesh9gny6OaHuYVhN6TQCYqNJZVqhWiaainJs0VZFVUVGwmFklYJiYbf0NIfcGgm5t6SG
-KRhITd3bmo5Pnh5Bzo+hKfevWbv/nP0xVVaolUtFWFVKVKJUjwdCve6vGlfL5nvMUOEDkRAhQngu
-0nuMMyISIhKYyQnzCFiRiySJ8GJId496yQr54QsNkqvZ9zq9j4/vaROg4ZvMlpjN/VP9G+I4fSBI
-0lSCURFNBCmJq0gDWGREIbGlIxJFjVtTatt++fvhIqkVUiqEWCLElBdVlVNtZrakpUEE21ChNQWy
-Us2ixTLWlFRSoS2SBmopWpUqEQ73QD2diYg5ClwU4IHHG9e3NZrg44+lJ7DvV7uswcgKcjRt6ZfP
-DuLuqejh8KxqawmsVoVWZGDUSRD9UGTUT3NmIqLCuSxNp6qVTYwjFyLMglDSC6fUdmMPtFEwYlSS
-zbNSLGxtKSS1lkpZWS1Kikks1SsoiVKiUSESAT7nt+br+bVRgfcYdgrSdmTji7j5zYwtWm7PDmzZ
-wyuWZIRDyJPAtW4YR0NcRJXAWVtZUknOv6RhRGYJMmTCcxwWjQzAiiEYRg1pyc26w+uSOpznDec2
-jY0jUTbJtC6MS0IAr4PqEh4DvOPLsdyZZhn+OwkihY5EhgnvvZ3Dh+wfxmg7E2P4yU/RJLYSosk7
-ELHYkmiMI6xSYK7JiuJpIcaGCNDGwGgwNlMNlsVirYqtLGGptNNFarCrkujTG1Y2zNZq6Uq5LsaY
-2rG2ZqymLTbBow2jDbM1AekVdfIfNbcPbu0//u8h6O7Hq2n214Sd1nSNKrMsn+fTSmiIbrYsTAlJ
-HUAPacN/pxUXR6TjJ9f4fDGTaZ130Ki0KpFitttDSReqUYjXFabmMj8FnnxJHiqf6lclR88hQRFF
-FB63AwZlRWC5day1RaplqsbVRtYNtsUWNVsatEYozNbYkixtq1FVRpJZVWoyoQPcCew8hVDzEhsb
-PHvNI8l5npOGiyREqC6Tc2UqzH18mhI3bMbSsWOeSbNQRxDofpYdT7W8kE0nITaU/k6pjuiO8RDQ
-U9yUjkrlJ6EnR4FXmsx3cpuN0ExZFeD3/0t4DZ5vM0tKqrHVZKsibSWSEOpNHMFjSDPACmnDveDu
-JeXDyR8djHOpJzLBlhiYSIpSCMiQQAjGhtIQgrH2L9B1mOH8MD86lesRupJE7ni00cLI2hPbJkcJ
-wdHzpD+lg9qMB4kDsRD3Hea+lGXneSqh4ncMOOpzF/N6fEX2yHcIhBUDt/D6HELoi3lHm9JRkSbS
-m1s7TU00Vqon1rOqPBZHgJWhyXgYeBwVgdgcHUKlI9jfJH9K9Hs+WHtuHxpk5VhZlvBv7h2YORiB
-hNVL/1GHNIDZ2DUoUbbm10q3Wyk5a6yUzVOVFrGtFjaKuKs3NRa6UaLSauajaNRaI22N23dACRjW
-Kgq7X8KS9crxJaoXXadut2u0cvLdeTo9cbr2InRV6hvwisOGK/YBEgRDBaExchcGCJXAZHAZBwEi
-CSUU2MXQPegdCE2wRxglLmeJrQBv7M85p9fuYjKzBlyMR8syJ0ZjiQbiOa0GKemXeD98nIUuOs//
-n9n+EIp7EZrlA5RSCpcwnmERFIojB3ChiIdA5OPWm2wv9Zj0REhT+cEMRDCBJNj1q8sPlYtmU+Kg
-ytbJEZasimAYiIiSISiTBRzNJiLgtXStFmq1WmY1qsRpSq0WpqkcJafhaDRhhgYjBDFTEESmxk3b
-rbqtZKJKk1+y9roTpiYYhgIpViAZTcJMYKkjby627TJUkiva3l1uyl1VhikmmzGaku2XUBil0wbS
-ujWGBKCSxtrNSGQYUiRFNhMcFkaVNMI2amKqmiVm/brSliMbM2KSZbTZLKTZkRsmlkpe50lrLJV5
-dspXTXUrqSJGrZV2O8FfLo1oaE2AKOVglrAyDSUy9OvWm5q2u2rraOtvVPPKPUdkmwyAmOZqTaNW
-0YE40po5Gg0TvK/wYo1BERCfMWTG5gIpxFDQ77YJvB6BmUIjWETW8YBLdb3OuTs7rVZVfeVzurdZ
-6GzLOywRjWAYwHrV8EQzDnOnOZBq3UDiQdyQZkFaVV+0wMGepQP7p+0dn/AfV9sSH2ngeo8u2fdb
-YOV5gREOpfMEMQyksyBEJVBO7+yskSRqIsValJ5iuvJ8FOQm8nP1hOciI9z/j2J/KQ8rOU0O6wkV
-U9ypJOakI7So5Lti0wYi7hhjpE0umgiHkCj1CB/KaHn7GKxRzBzVVkhic5E2CTGxpEQQxEQBMppB
-cVkSIVx+XTJRbJ1u2jFw4WMQi1lVWFNS1LFhKpRjSsLNJkapGQ1NNZMKaaKqqjQ1NaKsxrWokxcV
-UVc0MVpjEsuCrGNKKrMbap+ib7Uutr55wQ2mINj1taPJYw8SML807R2F6vVnFviRyNGopT8qeJg+
-R1h+UTEk/MRBEk0UDR5FescQn319gfEsQjHRh72moe5dE2MXGTTb8aid30CH2GfUJUaT6mIvznBU
-vkypMEwH1ynqGD1MkyREERAbshuQ+4JTQwW6Rsw5FYqWxWk/jEe1sbxW6rY/KphV1LzNMfPWNszV
-ypZVpqZsaMbVhtma3MV0jK2yMj96BdBANpBOEXSOgSVolQ/MZzAdZb4kbmaKnue9snaBsTiK4Val
-tlXJdjTHaklTLUpQhOFQMkpElTLogkAGqmCNGaKV+JAn3y7Y+Qg3uWODEOHI1ope8RFew9pCqegk
-9hpMGMjAhCvNP5nJOvSEjA9zdGDtT5598mwc9o6qWfW2Pht61GHtyJ3v6amz+/8HNJxN/GTRzR+o
-gebnr0OrUiJhUApkc5HOWMoRatFrYpMzJtUyawl1phNtk0kWCxAUkSokSIMSqYtNZMYyxXJK5FfB
-mPR7USfo961pDIjJJDUCmFsshAqpFiUkJEd/kVE+ggEBOR5PQRX4vtGetQ6Q3WYgZJQUDQHNT8oj
-juY7CcG59aiqjFSIaQ5IxJ3Ekj/iI3khYn6aEkkxBTdjEfznJNCvWG8EtRBMxC4fBCAKWTosyRsr
-dcLJWZmYYWV1TzPgbGykSKsio7wDmQpwhohSWRFOZhixCIrAIpyIQTCdCKxSyu8R0zEPzuZ2UssF
-sJvaqEyUpQslRMiPKBOh4FDEle3xF9w+gaGJ9ih9rrEn/Ep8UA80rEoeYU0qL9XQ8X4nBKv1yVEN
-CMRt7jkgZ81MXc3mDRh8kYbZmrLWPQjHc8NzYnmAdO6lEiTsUX2B7EXyMdg/wSUSMMRK0BCbG5to
-d4WGD1oCZjpkKB2jCiViBszKLUTWyCM0WQwkkawG1VUSIUiFlUdyHQJGsaad9SY6mYcVwlLGnRpS
-NIhijkNjpptIiWNigmME4TEU4YVclVMQiJoQt0sYWUqYuHQ/2OIbSbbxFSVwYxqDlIj9EJF6+tqn
-U+sonjKm6/wsOcdVSekZuq1O1LmKsCYtqLGNtMKwp66xY2xg2IyDThJBoh1GmEQajJXddRMMtWk2
-punSsBYSLBKswVQmlny8Uftjlu/YuQZ+cva+PjkT2tCVTEQGUREBq/wzTxdTjFPWJtH7Ly+VzwbZ
-a/Ss7LuqVYWH+DvfVQBB23OsDZrJ0cFGReyJBE5NGyySz6TJ4LLNq3eC9FHg2TFdXxYumKdVeCm7
-YMEBSwqeCoaqK93LCiKX0ls6oxG12+IUKWq9VnZZ/3QR440d2E7qw5MV0bvEaezCYAX03wJiICF7
-XZ1carOper3VpFibTvSHScsnJXHbJyU6z/izUEazlZyXThkJ8sJ4YjFmo3oY6dBgiqCGpNIozkVF
-FEq4WOQCI8lOPGqNCEZ0MJ9TRoTyt1AYcKWSIRI0TskbESdqHR3FGIEdhWgEffg4RgowSeroqbZz
-xNBRnBQWoEbgbCpyOV4bJw3rbUaw2UK1Ve5XLdgaNCJKJJGIYHXEkiHKmo29hWT4FRcPMNlbgojq
-QUuVBizBMriOBsSJlFZEObdu44aPaps03ThJOG6JDHuVu0yJ1UmjRiQxU0eTlW7fs7TazTPBzx8S
-9GMDyLKvQxiPMRBCN4MDLCy5JAvZhkPsSYDzGdGqI7nuPMo62cmgt2Jmzk2dK8VHKqs65nfpg5da
-xOGPFHm8ljFBnkZ0UaDsSYhhIhgMYvJTHXbR3rSucDGT24q1euyWYKEQKAwWSnGBkkLI4ZNCilK1
-0w81O7dhZN1md2tGoTaZw2TEu1WcJnPo5G8bOEiSNMjDJZ2aejkylVpOta1z00pjUmeAmMbZXqun
-fDs34Y9HDu5HR4unhJVqtGDIh6MHJXfdhuuK8mujR2NSJ2r0VNq8cZeBNjJwbKSq5s76NSJp8lOp
-Y2VybtGpJJHIwxlNdHfW6tndiOyljlnnpjl5MEczOHqrzU4VHR1ZOymylqaeeRPSaYjvFvs5PDZs
-3ZlVDGzTlMYbFexxjwzYwpEiYIgu3LgiRZPUYVXhWowtF+Qw8LAq7yciyKktTEaongjNEgSymESI
-gQuXHShqRB0Yu6PcKjFRbq5mTHDMsG8aTpXk4Y5t2laTkxh6FVU6ujzdWxUxWSefk5uGNzs7e70b
-O82cOTq3V8hEEcSpIAgtREABLavFJ0q7bqZmZnN4zTzPlDJBQWg+Ed854JMwBBkskLvLTomAILMS
-Lo8mLCvRUxiSAIHt7d26nPUwBA6xJiiliauiAILV4nCdBvi8zrPnWcTovrPvuYIgqOJCAmGLBxE9
-suKN2YEHBJ352WH2CLjCOYAg42+6vFYnnH+S7ERoMnBUUYrMjFRodiDuKK4wizJIfGsE1NSkYqQO
-rXcrMicihkOJaWyCAYdCYTnlZgudBhW7FUx6PBzY2cmMcK8WzHNT23lm8rjD8BiKNzKcEC0jeBll
-GhHAjkQcKPrXV1689Ojux2Y/0tJOTTGKd2dnwbGj1ZDHbpdDTlzisa63Llz2DzfGwxy5W4y5z82b
-sIiIM4MKrJBE/MRkcYiA0GYgzv1vhc1C8lROj6w/F+tX5kqk0Sc3y7uvrwusrtqrMwgIZuAIbC0r
-JVlBZKAOqJwe8psc3kksYI7fPEQatem86o4KMFiNmSdXXLjl7/hqxXULYI8p6SETnG8RHJDHJZ00
-vW6vlOedvTlrkCW3lkQnNISMC6rWCr0nzBPWEHynHM3Nz0rir/i4OSlhWSYk9ZH3vQ05xsaeTsTp
-OXDh2u5wOjZfgeIdD2m9W2YmBVh8cqaMM627ZbpVXbGO7P2/Ph3XtRckhIxT+bsn0b/NCR4lsh6v
-qbGKn0OjfaT2xKe4xYjOJMMYEUViyWCPe2UjAqGDFiAi8WTILASYMFDJhoRJDRRWEQZDM2InEhDG
-MYUIwIFFmLN51MkKBAFbwGxjrXA5o2NJiOhBU5QWxuvOMUjw9b65Fe1mlqHRJKxNmzWl1XiXj49u
-nhpInhbkDoMDeMHbHNRg6DYDRogiZDQ6B06YZp0aDWooWpm02g04bZgRtSRhUlal3Ow6ujAYxWId
-6lsnkru8qySR4qJHJRqiuRiJpYZD2Oqfci1KRCOwKeAfn0h6yXcVURn9M/FPCMJUzMEolR+p/MUN
-OsCiRRDhMQ0xkjcjJkcyMQ2SxDZLFKUIhySxDuRrtdq0rNsaWNWVsjEyCMgjMuMGEBobVqNGOapk
-rI0WqYdY4GbYbFtTDtYyZhmiy1GjEzVkaIZNJAwiY2MkkxV0zZWtM0rWmaI1pxqYcxwDDFxKyNFq
-mHW2GxbUyVMO2ONZGjEBdIDICWQjRSmFGhdXVaXV1WlhRFhNXVaUgZpmly6rS6tlCjA6BkHQDOac
-DMcamSphzHLd1djl5PHi8nhmhmhmhiVMlTKakwCDMcQllxYHREIYhiBgiWSxSmhipNDE00MTeLyX
-peXdeXXYZrx2Y5eSuvLdskstDNKqltUcvJteXlkKMhgaRSosy6rS6tlkLDbNWWtJLLXnbsMru4Zo
-mHMM0acLTgEMODA6BtWo0RmjNFlqNEOmSpkqYQkZHSMA6EbVqNFqmSpkrUaLVqNGOapk2tRsRmxm
-iy1GiM0ZonJkgUtMqMM0q8ptrjl5d55G9Wo2La1GiDDQ4OY41kaIXDS5rHC2ymr/S1ktmpjGzDIt
-1WlYxhNFIUQ0QwhUMIYIaEIUMI0RoJ0zph0Nq1Gi1ajRatRojNGaLVpmoqAPgejCQ80OC8Xm9z5G
-GlZWIrJWzRjj3ohYmVHtpTaMZYqsVVJliaxWEwboeeKfiEmRSJ1SIgaIe09x/kxzRJP8Q1IOSIQi
-PLs3RKqW7CSGE+Y4orxnnx/qem7G5xbj75FJgpKaUoorKirBgtFjbGJLVGKQHU6znsbFEQESNEQd
-kdhavhiR8hmikHvovgjo6/OHxE2fEvQXHLAfH+dP/Pt9jcTzaVT8yyldX5WJJHugQ9gioYD9xI+4
-4I8DqJIlY+o+9weQPN/wf1NPJv4Ovx0MPBntUqny97I+B9jlkPiQ4eIY0RI3Qo0adwzE2TgfYdae
-Q2hHkpVVWKwoWpVEtSXd0YGmiTZNnxaR0k82h4PyDe0tSQggvfOE6ThPrHX7xgH6RJ/nITwTiJkE
-8ivOZgls6T2yY0eTNqXyFwYUAWCIhiIh8DA754lQ9RAo7gcv1+JsdBRN3xOfx9Cj/m+3n6C4O2fD
-5Sfj9Hd6APlZPJZ9lkhFpCGVBVUGIGSGIQKRqSQEmAdFg1ZCNV0UkQySTcpiyxCrEKeS8SGoz2LM
-k/hTIn7UGGqD8YSu/rODMikwjLKPcYc9VG2aM2hidJW2F3LvKpqbRN2I0bTN9N4NodEYZrRazc3K
-MQMmk0kIlmNuk5rcKtvWecu3i68t3lrkduw0cktctWTNKrRe1XVvFRNjzi4BwKPmQ0SMnqvbiT3n
-htsUaXLtkyVWNNaWpEbFTIOSR2g6uZGd1q8G2ItQelST0fTtqSHhC94Drt54E/k24AXYfgG5P24V
-M4SYYh9R919IdSq7E8g/rNMcuZrR2mG00kBssp6lPVVU91ObVpiH1vHaWIqyNX+YYk9mjnqU/XBF
-iSJiHiK+QjxJdEewokPA/Tj2KBXgj+f4bOjPQt68vjfoLdV1718V7vnkvLy88AAAAAAAAAAAEB55
-54B5554AAPPPPAAAAAAAAAABmZmZmZmkXyIPNH3ou/AInnJrnHdm7//v5v8Lg1pTKNmxxVRC0xeX
-yPkHnBHwMQBoRAcpeZR9uhwTQ+ghpfq5mj8pHXA7eNhlqHCNvUh+Dl25h8zHw/ZkfB+zaNrThlrY
-zYYqMXuajkDYp0t7je6kScTFD5+1hs4OUUHJ9ocHBQaNEgSIkKNGiihGA0cmSg7GCTkMEhwUUaL2
-6IjfBe846h75NEmRCLjPFB2gIcYyRiORXkxsOjHCjFxudkbikIN2WF3gwMIxIOiOMnL2a/8iyg7Y
-k7txjaObprVnNCSOWNbujIcCeDqxyNCMHLdFGAqEV3OwxnEmhsOCWM5GbEVoYZOQIxzig0IgjFCg
-wSb5MwoNnZ4ITmcV3rpjk1OrZZP97tjep2S2d2M8hvtFkFwFwg4NYKVRhD0I3AIRFoxhFFhgMCI2
-IRQ0zoQaMlFuAj8hTjw47uExswxUm4sLxe+mzmwueOLy2EpJBXKEyItWriVckYlBxc7TkJObFr5W
-JFBiHwQIPLeCxFl5EbOsM4OSzko3pmBQEzzzURW8mCRFgKAkBEYcc8TdYIoKqqIqMYOPIzgs4BHI
-iMiKRooMMCEd8jMnh9REaL1F0bKskUUNIpFlBJUSVkwCCxllxERkooGYLGIgREYOwyygwMYhjNZN
-scI6LMkYyUF9yR9c6OiDcXHa5OTJseOaL4GcnN2UcldOYWA1qQNHJJok4JEZvBgsoswFmqOTIbgM
-8m7c6nadhu645HNmTZEyanVjnvunDhkN5Tspyfp3b7Q34bGmxsmtUulVhg5KU8cOy9akkjFkQsvb
-Ts75MVsV2rTtYdXZ0E7c28rk2nQwrnWLg2YHG4wblBZqIJKJKKIkghGzJusnbhmikBCOsiKXBJ45
-gSOZ6XEXRacK2FXZFhi8K00LzBGfMEdchGBQwgg1AjAVTXdOggXQE0SJTEm0mE4XTWDpSXiHnAcF
-sY7mjSKiHUiRcpasazWbcmdkrYu20zm2kIzdK2TjKBR2g7KeTeB1tiMYI0iIMHJkOAqCA5Jjjk5T
-izfOzlGZTMk6wTohFRxrUAHMRAmciI8RUM6NEsRsZtklPJzUNCxIjdmKfAWBHKjOkYTjQHcqOYH2
-7kcdo2cEnc0aBiBFSGCRm4oqm4IRksnvWOhjDJBcgxdwsyDi4DOJhkCoXcRpZ1janOTw2052N6YS
-uR1cpInWkS0hEYyYBEzHNT0Y1EPk9QyHFXZDjfPRIqI2buGFVpMN5ezhy77R4Ic0EZ3YgitDQcbR
-egaQaiAbtBExggMGpCZWXO5KQk2ilLCpUqqJTTqinUTEJQnIqZVQTKHVKVKQ4qSYQiqaQ4qWkmUq
-ZMDljiRFSTMqmVUTUiplVE1IqZVUocpunIqlNlVE1Kpm23CIbZu35uFcb6SIbK41kREZmEaVJEwX
-qSRNCN5HOjkqGWQ2Nb5VpquVryXKI1u86LS3UzpKvPfrqq5GsRERVpSBHIGZCJCug8jBTfgATHEn
-eAJWQIhoorRqQxV0REW2Isb6bV2aTTKI0e+CVWXEgAroIQEDIOWkFPh3v+74fbGztmZpaTUZmeVv
-PO2GzMbO2RDtnJWvLqu6+VtEn0WD8XysyB5lN46ySGCwjuTush+ZRJJtXevB8nnJBsLUtUVSxFQ/
-1SPdjpSSc3j3YywyZj9z+rPP8jfJwbKqVi1HKInxfBiInnBHuJRDPFxSF847ErsDpgDwDbZeRJiG
-nGZUIhXdYPxS6IN5TDcBxTIHc0BhsqwmMO1mAOYSWCqo5IoYSG+jA2EkwCcVE3TdcFNmVU4FPBcP
-DZToG4YYEOl9RhHLtMbnTjZtVGSk2KqWCp1ZJi1zwxNzGNYs1jdyE3ampUxwpmlNlc1bKDdZNqm6
-bN1cm1VTkw4pw4XE3cJJkJFEsQK8SJzonl1IcBCQSkk5MExK5JGYmGYJRMrIhKK/KebwuY+siJ9S
-aTRoU0tisKtk5uR4J9SmvoeNkUSEexYPJJJv6+jHP0bGujNpOSklnqUbKC7yDIYoFCECJDOwIsZT
-Js01w+hzbcbncQGRG0klgeDxPKec00Vrdm8RROZNPOUtpUpF1KSSWWk2lZSymzUtJBBEQkNKCSCm
-wK951OncFSZtOzGyt2ysYt0zy9sEeDxeaNWLNLJCSammHPu/nVHsX0L61jf8G1bfG2PHHHtw12SP
-+uakl55HOsVEdTgrxQeLxgBHSPxlmxYMYrErDzskbyqsNpVUtlQ2YxXqysYrJdeq66JrZZeXVes8
-66oxsC5I42S9FFXCEV6oQVD6CVHEQIAEX5IUfyl5r2YkeczRQv+5YVX/D4HeeyJIcIcTVmgh7nXc
-A6NzW+h4UjiN4ig0g8HyhyNKd8oB3yq/JcG4qPCCOh0q9udQmjkGCnvPehWwS6VUTmkpVnecsgj6
-vFyksbckbkf0fFyLksNN4dPhOOTiZOD5PxbHgbtjcqcK+qu+xz43bsrg1gxuwct4YsJpWFbPDq5W
-MqcWVUymrpdps88pt15a1apZry13l5xC5qWTStFRVLhphpUaYwxjEEOxaCF2IdksxMDRiak1Fq1m
-aVTVVpqzTVaKsFpDVkS1psxsStKymyphbljVasLVzWZMzRQamhMITRqVKwDUUhqDVqFvFePIchuO
-tt3XbuXk81yueQ43VW8Xli8ui5LuXXXk2t5PZt3o66U67KVJZJVKoqmzGCqiqsiaumkWoxZPLq7W
-TeSrhhLAWkg2kxEkLt2m1NJJXltb2vURk01Y2WTZszFaYampppppKaUjBSjF20aNicYXYiAtBCFH
-JDOBXgfd2r6lzCPLSGBLXrDIGjyQwljVbrkTgRGC47HLKW5Bz7DsMmClCp8xhjf5tgVDwRNh4Ajc
-2PBR/tI6eP7XupFIKIo6EghmWAquTEhEFAuQihgSuSOSgJlhBQCfTBkqBpHt1iuBIz17HmVfOX0N
-MfyrG2Zr8GO8kObJiPgshqSieZGxPzqSqfevPpkfxZMlqO8v9WRmZfY9yTzWO+IhizuoiJyeMkeK
-Ah9w8tAYJnvwMX7U+EvtA5rjsYv6pJwJXME2kS2JKBCp4SKmywilkCqKpVRVQV/nfInsWHhVEd1E
-5OlYCUfl9wR+rUl6kbMhJ5K72XnjyPYw1s00b25j1lmVWbPY2bF2WOStcsi8GSY3/Xg32xLLtu0r
-FbX27dHGKpzUZU4WcU3amG22aVlTaaybErbRg5RZqY5fpm2xI2PeqTJvRVXRGGnsNmipVKJ9B8yp
-wqqflFBWaVRHY5naew7MO2PYcA4bHhzHBIcHYVFPSMCqESpPfz/VsP0qgw+Av10XCcxjrO5BtHtN
-tErSsZlR1SPqR3KhT7xknJYDRFE9GdsBxJCHCEoTqI5onk7xPae1QHD93LPm01q1VvmP3pJ4vLUy
-fJX6xsbHZp877Ukku+SSTMhIjwHtf50QsSah1kn9zk4bSf2Go3fEVZAdBRWgUYgQhBIVOzMRKeuE
-1A4yARL4yChtBqBRMhKQ1KqIxLrNIYhpKEY7zBxO/q/Mnm8IbOX85yzj/SqqtkIFqTUTmO5qG3RN
-e094g+AhskHWqJ4HfAtSpUbydVOr6ooqLKJVJVhYsIVygpmQ9+jRZ6tk+dka1fY0Jw1E7p86JEoU
-sXtPargJ1JB7U/95AvQ7QXDDBX/DIkDFIkRHnEJP4tkh6NCYj4skiPi/c2j6b9sfb/kaT7qm9fo/
-y591LHNk/3ey0VmODwacz6wRHQdxJX8xm5pyFllYlNCQ/F9J81kZBFKsiQaT/VNnKNibrI3UX4Ee
-9QMPkUDSCHU7pC+EYw7BDz+e9OJPiZqnYFBToi8iPch1IHzCuHqp9bdkTFiqk+n6GET9ipP4qFA+
-cleCT2EibKPuP8f0ASlB/xCj+c8FHl9B4PsEggScQcDIMlYjEJVFkGKhRjLhiS5MVFLjAmRyIYGh
-BkYFXmbyUFFLGHwM3QDuA9OOi0YuIqIclVWQ4eDj4Q2nCef7jv/PdQ3JB/XHXKH1SH1OFk7chOHy
-aWQ/RxJ8nr5CNQVZImYilk4YpkESIdph8sPsFXdghYm4aqSJ+0rK0KYwvAhY+ckTZImxInIhUgmE
-KIVImyGy8n5GfbJvEbq8CyMsnOg++H+N8DvXwX2kaInWGOEYQYwSpAOWKMwysjC4wyWrPQ/zM0JW
-pMSSiQSVFiS492imGFWdGTGPRWqidmkxKrd47RTZsf8TGJDdDhM5FK5usL7GyVdm6TZppT85xyRI
-4ODF42FOHmz1uKw9Y46SZD0/e9GaOax+L8nl2Rt0vbIrszS2bM8eiqlZMpLMRMyNb3LudEUqpR/W
-Ww4/n02qqhJCxqJ1fo9nxkQcRFdhB7SDtk/gQeph8brT7joPUbGyd1Vhh/JkHKySOyxCrJPzrIB/
-3JPjPjiT3map8AXuqoUPr0qoveSTxJgJteWMgeLeSehpUq1SkhIPS6sSORmikqY5mGAOy4gSRMWI
-bKkPBWnrW9dV+z68Q7RJ3WKoR74ni7LD12bpf6T/FWitMH1X/bWyVU1iN6MVvT65X1qcGhjet1Zx
-kG7askhssBipoo1pZhUPJiID+mSmLtlEMJHYRFYK4VzTSTxe145VT3rS//qbNQvzK+MiprcC4JCL
-Q/wNsjycMPLXUq9xUAIGzofGcpporVy2VcaONmxW3xa+Px34bc30wqS0lKtgWUkLSIddq01XwB+H
-fjX4N69CQAH19a0sOkfuU9Meu6s/E1G3z2a1GUazW9bZmH0mxlbRj8XJs8HBH1uTZI5ucrKa1qdJ
-rRpimQJZXNm8Vybqs300qgRlvKKC5BGbIkRUlhyZGQyzhGChs/PNf1Cxs3vCtFWV0MRvyb7tiuvG
-ZEh0M2YKGhAUYMlDiFQI8goZzTSaYreY4VpRVU1Ldq1l1pzcxN27fcxsxhs4hOHg5K8ETje9kTnM
-dHDHIta2RpSuysUqVtjZppXmw2aVyUVMUwqMYxipmTExVc2mG0ZSyxUqmcaaK3SV3cTY09R2FnM1
-GRm00a0wIuQolYyhcQJKBp0hslKGiVCuFAECcvQ6swLGLRQynSYEjFEii0Ik4mBnJkkZviwaOA5n
-M2qeMxwNnRvKbQRMzHGzfW1uq2VqzfZ/1fak3EWMUWiF9q7nd3Xtvf1iluHLQ7HbcO0FNmOZjk00
-PJ5OY06PA0/aZqSdLmDHgiYEKeswTpoqMCcGkwhs0ZNQYhJLYhKtim4Tdjw8OyRyexI2Fn5SnROc
-gPBGQ/2AcwVESVKBZQJaBVSSBCyiwsqCkkIoEovgEJ4O7dE/mYdE5qtBxEcnCd0jYjzdp3m4eEEy
-lERMxBCQpBEkhMBo8gHrUfUfGVe4hU+2O89r4/tf6fxIo/7hIIkiUQP6SSlO0hE4lEQ/vUARkD5f
-7/1dPr6mO0yMvAT8WQzInk/mWgosafWn3XcYjE0YeD7pwtwfWbYPuT9YiK/tClrntMoydm3LTJhR
-engR939PRjqjf8sCSDnk8nhdugu+PsIcH4i7fS7mf7DjNTgWV5epqiuhTDmcx9oJiPyg70YmWusM
-zD9GDrq9EHlYTKTmUyTf9eq1cyrNKF9f78rrv671xuZJBzqOq0sbecXDFiNeypKSrIGaRDF3WhF7
-US/K38M77G4WRFLI3finhJxdI0Q9ku8KVqi93IeUf93s8760bFKn6K+5kEn//i7kinChIQ+5xsw="""
+NEWMOD_TARFILE = """QlpoOTFBWSZTWYahTA8BYP1////9UsP///////////////8QAQgAEUoEgAgAhAABgigoYW9XlV6O
+9zve+yWu3M7qPN202B1Nj3a7r17Nu4ueet5s3l58U41587mhUvfOAOex8A6utmdyA6Oee73hkrto
+Bz3d00vZ0cFdWytaprItnoDh4hbUG1K3PbgiHqQzWtZK1S2+dJx1rbK1GimtWZCUKNIyzMwrQCNj
+JiiVoS22tgGZSW2jIQtFuDfN9sp94olPo2zEQtisLFGiplljas1hCrbMylWMWn2xgHcxon2webZ4
+6Y6XV82xVjvZ8G1c93XIoz3rc8k3wN15vuAXWfTY2t3cB1d994r76+bO8zql11qbLWDtvgfRb7vf
+e918TWe870tlNCzY2Tudy5nO0XJMsUrDtrrXQm7FdevewG8a3hju1vYtx2DO7t47lVUvNegAAADp
+ooFD0W94XgAdUAD5AH0+Oe6hX0A+h2xqlAaDQBUgiKF21QUoAUp2+6lUAevT3eOAAPPeHoKUAeAO
+ihasu3d3NDl2M65zDSpAUO55A95prUvbEvTbZRQ3scSdaJmthQoFK1qkikilUgIOmlXWBRVgQyrr
+65B5t985ykb2bujp2ySV2ZXxPRdBmm2R5RfcaPBKgtBusCVKiO7dKBCLcbsYUw0Yqy83ByCDOxqg
+OKrfLl6h03FrCIBF6Mr7OSEdUYAKJqp4BbRbUKq2NaGUQdre7p1VVes1lVKR32dClDw22trZrM31
+iQqRXM0Vs2mKVKSJ8LOl2F2uaWWrEw+cNUlFKusnsB3MohrPXXdsuzfbfEz2yZtJdjCnBtSqJAqk
+rsAV9bww9Ns0qW1wDtVVV0NMrNFSCU1kUqRDbUqJtMaKhLZgpRTQm2bVMzSJ73OXm0JVSrCB9zXZ
+bVmwfLVKdmRFKhaaREIKaxbfEfVgsxUUCEgNNKXpTG0R92+9vbLlNmvbOda25wGJrV13akXhDwdK
+UAVVMQGpOuees9wYRUg7YIilK2jW0GzUrxmqqklCiqdmoUJrSoU620ENk9OKL7wMEoIBABCaAmmg
+TJkaMRojTRU9o0yehU/QUeptGJinqeoZAYQ0PUA9QSmmiCEIETQmTCJ5T0mTJT9J4mlDynqHlPU9
+Q/SQPU0PUAHqPUPUAAAAGm9UlEinlNPSHqGgAAANAAAAAAAAAAAAAAASeqSpEEFPTSZDEDJkBiGg
+AAAAAAAAAAAAAAQpEggQNCZGgABE2hqYEqflPFT9MVPapsaU9T1NPTU/EgI9ARo9QaADQKiSECAI
+CaABAAE0TJppoaaqfjUxqjZU9pJskGQ2oaB6gAADg//hf8ZEEKRC/ulf1oab/4H/ckz8VSUsypG3
+S/2RmsP7v+L/nzXLkdkh+YBPxF79k1JQchRsKJpGUvARUD74Rfx/Qfjh+IfqO39WWGzGJMdTjOMz
+Yy8XZUZrN3E0a+6IgiEoD9GGFB7RXYCdouCocx1ahMhyFkEX84G9zwTfOXqpx1l4lTqqnUpNKJSH
+nU9A46poUYO0VklmmFIJKCLUlSNGWZaaJWlSsthhCk8JRBUoEEMhRWhWlQClUGFBnRKuoTAZENQm
+AAEqLJKiouQICjgsAIAgj+te9BxEMwHP42BlUX/x34OU+6TqvZFp1z4+s+nGfd3pdub1Z9qcnt5+
+OfbnlOd2fcOz8my2Ts5z83fF+N8X+H5cBvp7/C9AQAAABh99/i68AAEARAVyz7LVVVUVf7cM/6LK
+C69O3xId4HGk2pRHqoiB5r46XsBI1MehLzVOv5AwPX9k39EyI5wXk1YZXMicu2NJRQkt4mK51IxP
+2KgVUQKw/1Oy82saqP99WV6dPmdzrjdpu83+rj73+P2j9v4J+wYj+oR+8MoRRQz989TVUFiMDJmG
+TKEfTUjVCEfOUMEDKECfFUDKUCEDYylluMfsY0NVbZSsYrGRWypjTMsuK/4q0az96vZpjxVipu0w
+GHkIqHP+Yyey9foWLomUkkfmPsKEP0ZJZ4HHNxhosOcyBiQGFiwTHNDsi4cFscrqj0SEiNiNFGq6
+EfD7D3DPuFG+5oZyeCzoo7jeGHXtJH3S1RQ+6DCTl6PIczo8F2LkncRRxJ/L2d37nBf5/+u4P82n
+ValLOhEURJngureKAbKPwvFSR9j6WQ9Fie9y9rSYlSOioVh08cbIn/Ur/zU1LCVTSyZSkqnLjDLR
+Irh+/Ad3548pIciA3AYGgr74Pn6Y95vE/GPqhR/PKIUHT0/Xru3KPfMEqA/CEnJRTASnHUm7sqe8
+DIl9sH0rcti+lf+hpK/UyJYUuFVWgHsQFE72Om9ElJYH4zQVREr5FG8e748eiMGJX4W4ShJCQnOl
+7FAMuf8c+Z+R0+rVUNVJ/U7/3akcJreiPghM+4mdh4y5Ex7r/oWwZiKYQwXVfJE8FoJS7MRmrE+4
+9h7jtNzc3NytrYaoE+2CbrGB0qR6poC9cwctL8YzIoqqoIpsxPLp3dgAH2FwAEgPOICQASSIIEkI
+SUwH3MzPx9q+E9H2V86PsZp/wREVE65s69a/7PS+o9b7Ofh3d3iICdmBTEwzFNZm4UmLnQ2WKTX2
+fvM1678Ofk4JKPVR+JDUWRKJLabTgyxrapJ/ocTCT58+tzz69a19GUoYpY0gsCBDMJQy9qtNq1xM
+KCSqYiiqmKQJQn08d/HJ7fHNKIaPcotQSdSczNL3ILuS0lKLUC5mcTNSRwsLxB0YMiDtDUJbcvns
+yU5klTUkvhOKnmQl32rSrxPL+rExq8iOwuyfMdZiq7VpUe9YSvuGpoqHMJQdIgSjpHPBhrOonS/R
+M33eWV3UYenEiEhIQhCDmcZu0UplJ0JVtWrmPrm1+mspxBhSrUiEA9T4qV7YfE0xAQwHGEREYMAQ
+HhhjWBC69DR71wznSC0ZDS70+yB1ytZoGlyzYRnjWpwPNOfcjZGNRFw7LDTY3tG8uK0EYU3XgiJQ
+kr5LqwmuMLJphARGasbnaK805nNOdo8F54mdoIjdCb5EkjyUdenpOzrMD4c0Ow908D6dek/bG39d
+uS78DttVHX+/eiUEEFo/Xjllcz2VDbugW19dR7O2SvzPCyeSuU5f0k1GUkvHL+/4m436zLwmifC6
+oDqwO6StYSyaZrUkSTPeSX24G9zWglKGjnjb+hZ65D1UOBUnRLB0Wb21jUEdesAh3ykX/KMREVLq
+yh5l9kj0nUMUMRkSpimKmrt9HOHrw4NdIvvSaUICRAhQlH9XPX2/k6X48Yk8sWCRbR1RYPdoxCMT
++ld6MdkTSi1QZLDiAhoveRv1AYvk7QQ+U4pCKkGmokKFWRbahJ8CzUEUI90RPpBQndoHuk+P3Y8y
+Pig7uWey7b4SKWYCommIK02ru+XPsdzzh34vengFVVgsCHdrWjpo1rWs5ZuSdWFmZVfglpJJJ1Lu
+ZFSWDkpq/Vv7sOIgg7oyWTnXSjRNRZl3dCgtHdji5xpE6+O1tfQ1rzINSMQT90+mPQAE/HIJ1jwu
+cajrx2fT6c3ceEwpk5Wkk5+f2qIt0DUr8CbnlPuuyBi34nzVVO/tya1trNGL8e/NHhiZIqiillE2
+lKMbWqL7rqkSjSpLKLNNKSksAaKDJWJljMkmWkUTAtZasqxb8+NvqzpudOXHu333+OMsI5QRRTlG
+oLWfJGe6z3BgYRIApUPKFF6lzjKLsIKeC8+Y6M8LiNm4DO+O+8ZUjpo9CbUiyNDhfZUAQ9UEJLzh
+ShA3UkmHAY5CtzoSG1yQBE6kAQyI31yVldEmqq1bKzrTJyLzEmfInSX4bNqo71Rk9r92vXrN8alD
+WKnlWrZIHQ3o1RooxRW3Wfash25Pa9olAQGE4qGEGQPd1zeb5I9J1OR3chBMPSQQ0BJNNS2ms12G
+pDShppSJUgA0U0ma1G+rq+PNJEAbRU0ciFdPkPKE05Lm0uAdVPDty7IzQBCX9Pogeq4nv1nU4w7r
+TRebvjnFKBCBVQUnTMYSqAOXGvafOCZxzjneNuqok9PfV7cgAB+ZfQ2resiSLRBH9qSSWIMIVIWE
+LCCohRUgsEqIipCxCqliyArAFrVi2LWqLRoSSSNTMyT9LnpFJ/BKRNy0Chx2gCBtqJmY7y3KHKmb
+bGIABBADpJIbQUYiXOcRqcUtySZZkzJzjLqTOULBCiFkEEEEELMBck5xOXlmt1UsSyN2bNMySTkl
+UhOJqSCQYkhIQ4GDbE5Q5JJmYcc5y5nNcVHEEkggk1xriXOWYlSSReNJsF3ZjZYI1Nl8lDBDYhRv
+uzatttNKIWIsEpupCMLI8FIYIVW2Off59ya9lfbEHb6ucPw6dtRVOkqRlmFT5aMjlQnVkRC7OPQ5
+5qfhr/pPz6I0hKvu1WkWsTKXd9vhHYsL/k8CnsKPgVHd/Nvudxh8O46EHTsHzc8Dwgv1sR+3Z28P
+eSno3n0E5suh+u2od6hg5sw5mkHvtF7YE2cJJ83rsgdotB3cY4ds88COUDZey+FweB4j7aFgkX3H
+ecGrL2Qnt+V7yhE6l0Ugrnb5kiSNwvVIXTRAY+8V0KzhSUFxE+igYZJ4PB8Y4vXCixRgFHrJZxjh
+ueqnDZI3SHe/KvPS128jhtr9To2XsKT5lPtU0qSyRIpUdFHOQe81CNty4oVBDO14dPYHQKOcy7IE
+zZggMw97p3nm8X8OJ5cYwTza1LoqdGzZVs2SRipE4WEweqsUsWvZ3cNpsyQrJlexmRbpFTsrbfGy
+t3k4e5uNrvHdjDWKR4Ob2vaw73g7mojvOT9Z5OIGRsSCO5xIky6YIMFj+8gWFCYxEkYHOXBVaFaf
+FwdDd3Ecn53Jh1f/Q4dni6lgmXjDGJwPkJkzYmJA8pUwOsRCYOFxkOULBoZA4QyLFDiKYkz5zQCp
+UGA3WJg3eBX8VdlaU5N3DZ3Oj2qclbn1N2TsnZO5M8TO9O1O96Syzw76bNWqrBbKq0UPPAAD04Jc
+4AB05znd3dwcTgc8893HQAzMzNQ2DE2MRhhRypYcSNxL0wggSGChQY5mwxsQMzcmIl4pYmRFNiYx
+gKiYqRJjJ3UCApM3FNjkQKGhaQUCJYkXjdJE+siVChI7DUgeMiWJHEidZEY0BCNhUxIERw4qRFDg
+aDHE4jlYHcWLjE4kRJBEUgE8CJAUwBxhz7hg4ZDHkJDGRkSHSgwwJmYDIQqZDmHy1PAqF5I9Fw5e
+MXinKRialx/pPAYSJxOwkQDkRC4oMfWXnAciSGKGJAcHGMDREDgCDECIYGhAIBYqULFiJAqE1WOr
+djGjorzfqT3OTHXh4HZTo6MbOTdVaV3Nng8Dtyc02rFbvzdH2uryduq0aKNkSINjIjsfaWM+8IOT
+J20YKOcHAWeB5D14OgiGV9yp13+EIxC98pd0iy8WtWrz4wGUVRZrCfWcjYmSETcYMVDNACyn5fR1
+jieQVVTgodS0X56t17xw+nEiKL8D1X+qXne71isph7QGZflg18MPfzyZs44UGKgQ0QocQuM0FIJ5
+6tkKppgKB9BA4w6hAMhK+GF+S43iHDKmdl0I8Ozs5Bsyp8f5tqAn/j4yke6FOfu+cz3djxUxAlF8
+WOPxHHednATrDKq8mcufXy6ewun1OdrHQSCJKfGyO09drW6JKKeudNm+LMnDLIi3ajSdfgO/jlz/
+G6bHcB+WNUX8sJz0GNCFCtNVxjn+r1/Do+P8x8t8SKp78iyoxQkiJD6rJIgj3JEokkRB2EdBKL8B
+I/Qe8faR/yGjxPrM/gzcf7Te9b+w6oiB/JUkiOrP4uJP9bt3Nto1nDZwOT27En0GMH9v9hydFHQs
+HgZ4NYOTkhKIUaNnlojTO5qHLowytMeB0JDbS9nNlPKsmwUczengh5IPwEgKq/HKAKmjv4F6dUMQ
+0eRUncR2P8vMbCHos6P0yMlRyK8QzBkkkyMZZGVFH8JRr2NHqDwGma9DmATo7GzY5OHXhzfpeTbk
+6ySRBPVyf+lWei9nc5J9nDY2MVitn/xNOkOTG7UhAiCoiB1+vmgRTOYuBuYljUvGNCgWQDBV+zw+
+BtPkk9PYbQ6dCnj5zTuZ/5TAwifAhwhIn+c/Dm02swB6YaXQjMxmiAZVBURVQvNhX+r5feN5mkd6
+/MfgMk7zywOWfGnY6fYSIN2t3EZjVTrWZIwwHIhKb/aBcgCCh+MY8YWJHz9eKf3VYYU8WJ4V8aiI
+iRU2BfG5fRlGIJiiwbfYkRu3ivT7XIlCZVHvulW73Ej5jxjFasLVLjiKR7mJAopaXgQ0VAwbv76H
+dA+BoMfA7ZHigXbEyKD43ooqnv+Lp5hKn5BkJMNwCB3iiZnMxKywsvSo6vknkh0edqdvdwO0t7Jv
+f3oWvj+/SGzUi541IfNf62Yzvs+OJPJJVGHjz7HlXEr9p3IKFpEiPAr3W5aSIpKESSy80vbDCZVx
+r0DS+BAizJ58Cc1IZ3zeQpglCso1lGYYl650zta5i56VpgXzunKcJvGl7zL1jUrRx6r5yicHuvRv
+tyo5ZqeJ/zDwM7dN/1oISJakUqrER9aeUEdPqhz9dvvgnjSGyqr8HPSarj3bE1NkSZAp+hY7ce71
+L34d63pWQr8R0xFfQr5teFTSqTZtNWGaSMmETNNUyQkk9EBOw5HoO7n0P5DkdwxQifgRJCE72AsH
+XEcmMn3wASCSLiY/umlDPRkhlGIRYz5TBfBks8GjwIZ/MFn7hhhyehhymjk00/fvZIkeLh8N3i72
+P/pLyiR0ZPyubhNn4PBs5ISK3cuHe/fr9D7FUiwqqlVKilfXw8m6fJ+k9Gz0dzvfQfVv+GkhH8kO
+1InJSc/PeIknJ8z95QOwU6Bz0HU4sC8JnWVHGHPA+c/OMXn5hjA7TA5lRzH97xcP71EUhzORx4HL
+3KcWPT79EQEGlTsi214kOESSkPRSP5Ov7Ye3/q45bfRV/DH2ax6savk+af2z97ZP8ifAdoR06dJY
+qvFZ/Te+MSXpY/7CjfsOYxgmPWGJcROsU+QmWT6SZ6CJGRWKfOen6D4dn0wTq9p/cIwfJ/wrmX5p
+Kj0DH8wDyfGVBP1nwqCfkfE2HM/eRzNdh/gMc1CBsUb7uX2n2qwCT6TcYKEBzaoCRBXD3JNHaVvJ
+G2OZ5eek+L6H9nDs5mzUfUowqekYHB4M2LXuykyPzco3IYnw7fxmGvu4YL6DL4LNE1IP9shKPKjM
+vsb50ECEkieI9CQgd2ZNAvpVZcMXiiwigjv4fiYggk2jd6cQe4BEkWGF2MgshZaBBw88gYkakToC
+JcSP3GJfhgfWn0COc4X2JxUAL0D8/KjoBTyTEAQ5ibQukFVK9Ywmt4IC2Rc1OexdIAHz64yahhD4
+qeJyj6oQRqUoq9vTSc4ngpTAZEdSCM2GJAOpL0dzHqvu0WoSVWmCUdkSQvZKCZzEq8hEqzL0NlSJ
+NJdi3GdEjjJYzMB3PIwcwBBgT7GTVl3yI7RxgfrgnsTOoZs5CwAojso3CjuZGVwYiDe7grXN3+j5
+/K+VXfQxoASJthJMLLVq1ZYWPndmzyVvvOrcbOv1m+yr75FAg2KVCEIgJxMCBDQwGJuUSBUiOMch
+Bxm30vocuI2YIj0CqhiJMHvDrSISXwEMv0EzIIENMgd7xm2AYAMKYIIRRQ6Bs7QJwEBB5jQLGbT5
+AhkFSeI5IkSm6cyQNTlnBPi69ps8px3JavtVukmmaV0cPFpnxESCUFRg2PtT1XmWFujhmryvG4TQ
+QCLpgNRjiaoAhHpJoycVkvHEIj3D3kyaBAueYmxgiThZJH87ZInuOqbuSxpXb4eOcXvc5xSApVf1
+j3TzB2qK8O/xD70/puwn1H+bP50E/gQ+J858558YWg4ED5fmQ8asgJ7ipmdhTWwH0eNgyAVT8W5Y
+hkqVIdYwff0DC7dcxj8r+EN72ETAFBIoO4KDwZ8zwdjPu6dpCO4oVmRyUZPixWKiiOKIYmxpjVWI
+j49fwWAFg25eyCIgt9wxd4PEvPY4wqChsMxt0L2to7riSRDoFRDmogqXXKnT6PlYWSBQ/BsU29vu
+ZODHKH77HY+Wvqft3anQmB7E+2p8Veau9KYUxXi5Tk3cH3NNTsrw1HxyYZmFotzLPbMaVeu6zhzG
+dHqb6u5Wn5UqlKcK18NkxzHBw04Y0k+XR1bK7kxs00s5ufV2F7e4e+3Y3Uqn0Gnc0r0cadyVGyvC
+U5pisD1GJ+UylJTUndMVejh0UmpcXh8pkDBRATZAn2Tb52570iPF5sXxbH0fLwm5fCt34Y9lllIi
+KPbjgd52HTZzAQ/BB+x/dY1S/WVbBPJw+Tm+9uj0Kh9VR71RJ+BzIeQPslDf6bgOFCCUPq9SpyPm
++A+vofLG9m+cPk8c/IJoJgyx87wVYCqr/6wEBw8p2jdAomYzdz4qqqTGJsp6K6b59y88yafBjDmx
+9iq/Jg2dzBusjSdT5JpJts3H5HZExk5hwiERculhxREFFEmcUYsdpALzU8h5DbuoxUnXEMUKVVKp
+VVqKYDhMJKEiKQwQQsQRD8XSNabhLPqOzq0OXDiexhtpwp4rocvPOOEP2DHQ6MpISYoqnLp7nG7Y
+mRAKDHU1J6NOzZu4cPukjpYJns73DowTYxQexU8QpXpCYIUIAo2DFFRSobkU2LETr7V+Wd+tXk7n
+o79xJu5uK4nq+e8SSD4JsshwXj5JpqSKrnQpZsj19uy9vP83V0jw5cPcIi8zy4oJSomkQTfoDvw1
+NQJFqwiWCS8NlRzWCoq/V1fGglZvrx+bGHWbjHEQU2z7pmXSqaIqisxMrJV/IgI7godIoZihpvYc
+CXBUxQE8wPDq9EyvYRB1fOryvFuFVLH1/xGThoQ8c5+zE51Pdfes7KnDocq4aaNh8eGHRXr82Nnz
+O5p2UdFT5n4oJtN3mrdKV7axUnjVlQ6HYxFIG+XXEiJy6hFGA+1ScemPCJsaaApHuAcwPMGGEiwR
+EsMOz+Pbra8ghmrh7ewm5s3YxuvNcd11X13293eW+mXx9/w8HchHeqJViSoUq91mIr1V0kUmyRTJ
+lfidpTaiwrbGKLFL+VjDFxSWLUrV96tm09p59CIvscng9I6PYh+qxw2flrmV7m/TH0OjvVVFVw+T
+lpqHWGOej8KcFdH7oT38cxO92dVUVapXkuPNdHUm5jB1cniQnzBGthhVSSMWSCldDmqyVPaYR9Ll
+5uZ7mokk0vaz4V3q/zV58zp9vokkn+tLPU+7yOPz61E0oT39vbcmSdna5TmRHB+RiKdAxgRE7D9z
+FRSpqKGRwVIdmDjH4MvjQ64ddGBEQOkRWUWMzOE8I/d54ojzKTZjyxeB7ARxS24njvHNBChMGCKj
+EBhTiTJDhQHf1FCYUF4MFisCB2lCJRj1MARLPeYJOUZHH5Rxof5hxoeSxDM3ApOV1g+UYYIGeYhj
+N5ijZQhElSt0SUMowaLKEdkUCwUGGOcHYk0bx1PBgKEhCAMMMTtQMGAHuliQJmhTEuCxlAqXnfKA
+WIEZX1LjCjJjQKmYqETIvJilSpCsbyx6wYJD+S4cqXdxy4kCZTwVKFBUY0HZXx1l3kA0NAYkVGwS
+xUjBntY7sCJ+8xoiIiUJiNR6ycMwDOkOoGetElGRl+49bDgsxs83tbP4vViW1XJXcyY3OiY+k7PN
+py5cj3l+JiSS94yLishhXJQ5wwHLyZuXFjAuTcNpDHRTHNwxdWWNpj+HVu0b9HHueT3VExFOAoo2
+sBiAwtUyLiXAoUMFOtTAUqMLPneOKXjGRUPEezzEzIMjcdDifpIpU/MeSIp6jylD+EiKIp7CGhQ9
+ApzvJoEv2OMXGJGBeRQADgnI6DAmQAYUTRu/7bDpzXqLyB7lhY5HUQIXnqwLwgl5IgEoLczAofyH
+UMU0FI+IYocii5GDxwP9XsUCD56NFRRmO5zgZwSdxGSibOyvYzhp+Kz8TYj9Xdz3Xm6fCu9Pc48D
+gkdMzqw8WDMnrsyev7RmCGKI7mCYYc35Ge/m404dzBWFWXGObGVUxdNfO0JsulFWqd9Y0/Dx273f
+nuZ6Y24nacFnjyYFYNzonclcF9hL4EnY8FH2j6OToRs56trHqmObGwnExVNlnIpHwaZPbkafLfEg
+MEBJCdY585YvMRS7BAZIGyAIbXkQQEKUAKysDZskUAkLLA1msBCKqqiJmqrycHcdTrnhPhsw6mHb
+ydczMb4udczHErjQGuSg4TMic8DMUxFEBjK8uq0bSrWjFLMxVOfk4bJrZwqq04VMZU02Y2aVkMXe
+mKlUbLCqmzGNKrdiStmDFamjdpVTTZsxU0FNtmXTAqkG5VLBppNKlcGxpE4dWzd3Yvd5Obq5oVCT
+OQMiAQFkUHCRAPGmeZ5+6JqWbMbViA+IgmgoAooFlPWpjtAwKlCEq/TCikD1OLJuuJ1uFCp61GFG
+UYUZS893DQwYoJzYY2Fea7qjE9XStO6TtJPJweLcZX27ZO8iSZ1uv8D5fs059yuTTt+JuRn2qne8
+mL72T0hGlj6F6VJzWPpY7NT+srds4a4uyitnJp7XCtNIb3dTs+bd5Th5q82Md+iTyQzWeCjAqSWw
+KOsC93BZgyZMyfEIll4YbOp9DmmJsXFVIOSk+lXCgvRZs4NUmzIosUAFiKQC+EY8j4z3A4hmg0Iz
+FEZjCUGTYYZfqMyWYEY4PjPPjo+xzcj57Nz1WOfjTn4bd88II5yEYkdYI3RElIagVtrR473fNtau
++6Dk/b9/q6vc5d408GOawkb2PYzftsxWlcNTIqVPH9zBp4+rsbYsj2qTTdldIV2FNtKOXHqO8IFD
+O8uJhIiODjCl4xUoRLDDJwIHAiO7jxYhnNl6qMFTVkiegYD4ipEM2dc9BjSuabV5ODgQWaD+92Ix
+RR6osfKQBo8sBhPFALzUghocAkDkFIjMJQOZ9c3WvNT1V+R8zDo+5XVPGabGm6xW6cBzcFKEmYYS
+JxMvogxsWNJG3AiKVyVxoO1clg7Tm20igUL3o1G98QefyknLPZnodFZSCAiGECJYCZiMYmBipMhL
+AYoWLhyRWkxjTvb9Tocm3RjSuU2Smnt2cA7wbQkYp3tHr0P0XyPYx0VXHcc2cLapjUBNT57iJneZ
+jD9pqDEreDFSYFFxgSFQN0zxe2ewugMDs9cwuJnMaRFqDTYh2n0X4R1OzDA+xSaV4NsbrEGHv735
+27wKTOhSSqKORGNeKkciBsSmMMVloQH1cpcexs1RmcE5kqEHNGVg+9TOoOufPuMo2qXdwxMgcyJ6
+zEplkDcejsvMKFBxUMs4I9hTYuiODERQHr5rMQTTabeTLPx5H6HMTjZQ9QYRDsJTdBQZQQqRNbry
+JgIZlLj2VEUWgVoMKVGMOZEgOeYkMSRhMBShj4lMCEdDYcVIokR8PedjnGAZgQIeSKAoRVeOzooz
+wY03U5fp2f8K3bmKp2r6eY9EdDq5TxkTrJCVFmgJIrEpxImsSWe50RYBZUVd2gptN1abZtuts23W
+2bbpdbu2bbrbNt1tm262zbdbZtN3bNpu7ZtN1oamW2hqSW2hpOWhqZbaGk5aGlpdzMbu2bTd2zbd
+bZtN1dbu2Wzaxu7ZtN3bNrG7tm1G7tm1G7tm2SW2hpOWhpOWhqQJblOW2hpOWhpOWhpOWhpOZSmW
+m99fafhPqKP389oF7ceGzYxq9n6Hc3aU4V9r2Mk7MPtenXd7VbqfhVdWHNW7djwYxpX2N2zp87c9
+injTCmN2MWerTEqtMNmmObZ5MF5QgSBiAXkw5CkQibHAvIJceuZI8TEQqzzcMdVPX448mmPJWlOH
+ztmh2K5xGDzOjZB0depJqhcLgNHBJSEIwRcUI73zuZjslcGjfG7abK5MnuV1VssmxhSoKOU3XFcK
+YheHVZBhUbr6C8a4u6ajpU6O2heIQmdGyQDBCgsZ2MlB4Pd4Hiq4JeNub/Wx3p/MJt93Z1bhe9Te
+p7Hjs4K4dHI/5N2G4Qsx+U8nh+Fek73udzvaJp8wizk2fAwHj25CfchiMCmgu1c02rzFn5TyftXa
+dZ3Oud7Hhvve+R6K7OkJ3GKre471DEkGZYUmFRSdmFrGQSLJLOJ6j6UC5EMnRycF0V3uxs4etd7u
+m3kSJJ49F8sjpbhuu8CxAiKVLhLwUCGEhtBTAvr9rGUM8mQBB6Fz+aJoETQ7SA4pgeIXH0G+vKMC
+DaSYzDrJniLpLgYlDmOyIhNTUUpcXGhdEjEuKEChehmhREDD9Qz1MFAMZo8FGWUI/SihS3oHChgE
+IjFishXMTzmJESoptyKkCY0TcsWNpjEUbcZwkDFg/Edd5f06cezo7MDQcwNgXh1SPRdEgTJD4X0C
+POhE6SZgKW4jVIMTcYjB5lwyhCOGSMRY56QiiOzJLMGD5AmRPkFONtD0UuNy8USgMx0DnyGpcXHQ
+pmWSOpRbIboaYEREUXGn2nwPKfP1B89mFkZY93VjmZYhrJ5qTLPLuPN9jduOTow+D5Oj8KcK8HmF
+6Cn1jFk08tBigdhJxyyhgxMiaFazCCwOcOKGmKGWupfqcCIoJEZJMYEWHkdFNaN9wpIcuuKhMcxc
+ZO3ABLhZlhkFLyAZf1bJOc35+LVYZaEj0OxMdEgiTq9Emjo979Bpinq3cNSPNF2dHseLdvGycfHH
+NsVXc0Jp0xXDTGp3m7G6uGak0rEQhIVVFNCJIkSIFSgJRByR0Eh6n1HD6s+/S+/YLZgpg143RoOb
+xJlPhQqbFhqlAUmpzPsdfY5K4PX283LyOHN6tysRjGFVJhZjDGMYzGMVsMxSm0nf0OalFTvSmTm5
+q0+dXbZidJZx4Vr0cNyb4wduGGmzfkn9lG72edyTfyeTTTJPKSCIk1RBOCQFJHgpMuNhsRt2uzBi
+JaVC8WhWUO7vXoU246ZYmRYh7O3rtkATBRJiUxXcGs7r0OFd5wY2eb2Orq9jo7NMc2G04VzbMlb+
+azpE0cJZ6jl0AwLzBEQQscNJknPrM1IGpqAkO0gkznHD1yuL8hJHYddCByPQMGgpMGK495Ych2qV
+kohmCnMvC7YvecDjyYQ4CHMLgYqSFLGIvRiEb1i0HdY6JpL14AIxIycTq58ho7KeE9FwsbHRp4ts
+VwJoPaSgTU3NDANjI0PIwvadrpqdt5LN9BUvH+mQxqSyUkLQsSFIECZDI7CQ+mhicTAYwHEKzvW9
+2SKkxUgKTLDEhRxQEj06/TXplgNW8cXmjfp51hdRgOOzXlxwakKEaGD6YSKEZcSCLHjHSQoKSuYi
+LuMTPziISmR7aG2FhDpIzC3Ne24nGGffhBJSwoQOQey0s0AQmSOZEc6DtKHrexGO6481SS7iiAh+
+snxK1rM0u6S9FhealJYu2I3KVqD6IEYEk1tbWlKlfkX5tytTpcZ0VsR2KBCGUM95RR8Cj5ONY8cD
+Mk1AZNlTRTSq6MMHVhjhXCq9rGNnq5sJNpXBXc2Yu0YZjGMY2YxtGDQizGDP1Gg/MHkz6Q+jOVRN
+trRhiDR8pgVvvFc5SLyYpEgkiBL0mR30MSoKKCIpgY5ZAzlpDxuvYmcFIyE7hyhbMJGIFxQkZmOT
+Xtac1fucJh78Y7JJMczh5dOrybKeSuXRMeTGlhp8nNp0djG7yejRvKbxCJJPnRJZI0dyiuqCWJsJ
+YmwlibCWJsJYmwnZo9Tg4LLJJFH8Yjgj8epHOYDlhD2qAIQu/DY3MhERLDlSm0iEFqQGYzUeDBnH
+NDxKiRcsQLFCJ2hYKEAtsgWQIloBxBvmt1FiRVEUL0QLixVSFPGtxZJJkkzDrIVuLxQvCZMUoKWK
+FE3JkByhAmOIQKBdLL/lmfajn6gAfPi8Tk868kfMzWwAh2IRRq1qq8fCs54URM11IDMKDOGhsKQN
+Cx5GzZ8FHhOk+Mkb9Gz8Hd+Dzfe/SeRO6dzuki9hwuGLyAxAls+prMzrQyFEsKJTlaz8kuk1VR1R
+VOSpH832EOSnRIwa+kOdgnOBNVVlWU3RWxdqM0WEisl6TKMktXGvL5OFxTCVLJgzQtF5JSTRXI00
+/RrTO261VWUTDeT74TXeFkCcnaDMwyq2XTPSFZNgDKrUBL3ZCQsX6ODunGglzzBLNc7HiblWiR0X
+TTXSsS9dbMhBQVVW0McdYUk1AZVagJV2RJCxfXV3TWglzzESzXOxq2tZFElquQ7FSIzClMyI6IhQ
+OZMhImxmK4/SLrImWLI4x1qCykR/DGROb+Zg4qMVJPwVG7jm9Tk73Dhp5LHZu75+suMdGNqb1jSs
+c2mMD/M/tfWqcOicMexj2NZjMezsJ2fNODotFmD8JYDjiNFXB4O4UEF7hBRk2cbKgJcPEucoDCDU
+Ju7iAjiJA7DqlzOdetSeNRnQwLgWvyYhY1olsj2dd8jbo6Pp+QRNRE9iIoiMCjChc6m3wMoEGiNs
+xDMxGHKqObkfrLjFPV2UTobOzk5nxWcK7k5qkUVDHZu1McPa66cGMkI31gAnfX5HEhMLB3+oVbuU
+jPzNDRjlHJzt1bpwDQO8YuBUUSrG46E0eCdpYYoWODFRRlLypANtDrJBlB15rM7bQ1JEttc/tFh4
+OiZkSCwOwTCBAhCBHxsijokoQuxu2SeBngeNGAJQH355Xae7a9BEma8glkhWE5ttWa+BzAiHArsp
+gYkQqGRQ1HNCZQCOS0Gyd1oWjR2OBnp8gzBUcGTRdiLENHA/Nx9253tGRMJM8xYqj86nuIlCPIya
+UJHg8HB3DNCORkkgjyESjXEZt1yZjkZ8RZ5jLhuWQoUO07CwTFFke09Q2BlwRMk1KQBgwIo2oKbh
+roGIpfcGpewXMt7Wd1vIOMQpIZSUlk1NrHrJ8wg4OT7xYwZgtngumBJ+A4ZgyPfeTKjDGJQ9ylS4
+zByNIhEYgchRzUYg2MeY7lB3gwSPL4dZx0dRO79u7xewmyApD0a8YIaFAN7kBDMUC8UgJhOEANSw
+eIiGwoZh4+B5SqROwXpMWSp0HcplC+3TcZlrIgTQ9xA0330JG/MYujcOyoJxFSgqIoKd6k7Tnr6F
+9SpMURIlRxxBRg3Lw0StlXgUBDdW5YBDnGvPvddbPF7nbTuVvY+ZmMXN3Jo7+zwe+bN1NnZW6ySQ
+jjHNpSxLy3McwmpYhiRMrGYOmKqK5opDHgTTMwDQz0GDMGtHBk89SWBBBrKzNtrFwBA4I3gjd1dW
+HVz0w7moiSNrOnV4NwlKRiLMl2zgUPIiknLFizlwyQgwLEuJGITMUiSbAiQxijwegiShDEHg8lrg
+LqhVM7W+JmayuW/fK05DmhoAjDlC4mSIGoodLo5PpfM2TS3nW8iU061HVps6GGlSYMEsEUEwepk1
+yUaNF9hCLNvBMkks2SSImEUZLDmSgowT8Rsso0GDBs75MlxAhBZJkN0EmyrKJOHwcGCSjk0tSMKO
+AI0QRwUQfuAjEZLEGe5cV49hjsMDGSNCGSMwJHYo1RJyYJKqSyhjiRRKDJskdBIMk8OaJFOWV4LP
+VFGzzJBiNFDPCo3k68yyKO0h2XQUMxzJgh7MsXRRBDKKzJVVJ2F7+AoMn0HkMzKHMuiKYmMjoKmp
+cXJ2CiXgoHNChZw9p0naOAekkMiJqAmZPy3HhymXjCTmMSoOOBNtFgjtyc1T2D2cnvY9on+d+9j7
+f9MJnOu95PBjZ21JXoZwrvYqmY1w+nW7/arjEgTIEBBGHCaHAzI9pIwPEWjAxIn03mQnWV8Fc58p
+ermmlrxdnD7mOSa6rNnVu+PpvZzTpzJEk/qdTq6uT9r+pucNMpSvFXBS4+gyJkwQiESRQc85EGIE
+wYI5jZ4EyZgc7rOVGNCBDwoxIUa4qd5aRQ6AUKBMTsrR8VY36ntI741HtQmR+Pg3NN24c7Vk02rN
+GqMgisMJYmwlibCY56PiLpErrcggBYikBMAXXc6R8LGSuY3YBmiCQGK8zj/Rptybc2zpZCtmGlJp
+O5TEpqwnW7FQUkUDYcgUTccsajAxMiOFVKkRFLx0kKScTY4kDPgTKmoOaQCSec6LjKAWKAwMKioK
+LkZhnkTBfcEzE0sZJfHJGaPRZRlYJydCMneZLDAeZtDGZM9HYOjRoyaCGMM8lhZyGWUXg/g4iCSz
+Z7UEcwHqEUEqYFi4qNUWo5kYY/rkAm2hEmWBGGLxQSICimFn5dHn9EIDiqv3BHo9RLfflvhER16d
+ChPzfn4ZaMcQvNzExP3ocD2qKiApQmadUjrFHMyRfzeLUOkekkUjN+JEe5iSRGLlLiR5ipaEER5a
+EeR1oCOx1HMBmku00hqSJba7nE2qJttQjh5CW1g95VMwYJEUzARGjBzgIO3iCJIIwIlHJwb3ISNY
+J22kcPISxNhOTZiIIwWbR0dw5I6CF+E0SfyLyxR5cnyjFhQiXF6mBoNYGLhJBiVJl4KRs4SZqMvn
+5nydV2enJiW8U3Z838KkB+zo07cqFxEvNQiBcBI8+5PDYGcY3UYmTKG6KRLjAgEjaQ45A3DOy37G
+gp0FAUQzAUmIjoXIhIPgekvkRJPmNViMShbRLXoySJmqmVb+Fx6q7OnOcixndpGaYllhbPA8Hgq2
+WSYwdqkvCc22sMoPhwRx69fxxEEs7Gw1O53cy2drt8knck6MwVM42TwuQQAlltCCCJEiYIlklISy
+2oSy2oIS5balBBESyZMSTrM5OZk5LLeACEstqMYkEJZbUJZbZZbUESJEkEE8bknSI31d99EDMzMx
+mKtJSZCYzGZ13SEh11113dd3XdISEhISEiy3Xd123bdW666u7hBBBERISy2oIiJGJKkUTaRAzNGK
+YhgGxda0ZhFLltlptkpSOu6QkJDuImJiTBAIxmWyy2yy3JmsmbJM0hLLbLLaghLLagEDdZMlmajE
+w67sdd3XXXUIIzGYkJZdYzZgibJlkyTZMk6STJOSZJs2IxiYIIIBAUXNBKCmJUccMiZinEk1Tz5F
+F9/pLuEKCJQrr3MbHq7z+reZIqi1KtV0VMmRTxVIOjZitNk0KSoU0yJFKkY5ac/mey2c8cMcvPlJ
+AbNmnD2PhXUxDEUmTLHGw5zpLp0kgOaDExzYf2XEQcwYaVj6mne9rmJw6Kw5zm7/nPcVPa7HD1Vw
+smlfB8a5JtGzTh2baj8/Rs4KpVJ9Ls8k9XXv7mOU07p4a8tzNqJ5rpTAuusiVInPQqRLiheKOTRL
+ESp5CZHmKHDaY5p0DHwLCMFGMNtKts2TFBGKECZcakDibz5OrpzVibFT3e1LY97q7kQ6PYwTHRd6
+dBMSSEbi8NDTrUgOdmBzIklIoAh7JfUQLiyDKnAvMOtFYUUwJiZEDiRGKEiop2ERMzR7Mk9DYzJR
++IZ+fBZz79mI3sttMyPtlIXCc6KPIIMcigSVOFScx0FIBmXGpzI0JBsXGAkRhtVtfR+pWdI6M0DI
+vzHE2FHMig9FgQzDNEpoiMWJEy4U0YYLGjmhIidopIY4/E+wx+Z+o+4V/WxyabuSdFMOEcP1P1Fm
+Q0RR+8Mo0I5NFmREmCyhgyySSReHEULxywoxVFCRxFKhA+J5zAiVJH1n7DUiB9goTHKlBipUiOSC
+xYYsKTP2ngcjZ7VPXoxJjm6tmz/Q02RpVbKPJycjvdXDSP8Xo9To3523E2V6KbvN1e96OzdSuCqO
+bDqe5jd2ZPg4bq8XZ6sCoMKIQOlTiTCwpXplzvieSHbos16ll4DU7nV6Fx4+/xkGBgMpq43ld1cY
+gD3CCVore+pm6fI0duER8GwoMcBdPKyScMDPURBQQ4jBJdAUsOync2NmnNo8WoMVDoly07nab7DY
+3mGN3crBxMZ7XXh2bK+18G6d1c3DGO9oTHPv90xxumP8qlcjWyuTlg73JirHRU8HNhHe5McnZjT3
+uzq5IkzIkMRKkXOZU6CRAvJliQsj1A5tYxKpfz2LJiRngwWc7OuDgpEcUeBhP4quiLBHmrSsVOVV
+3pjg69XXZDkpVTSvJ4f2m8hSkbO5Qjbuw5Ozs4bI69eHZ0dTh4tOG7Dg3cqY2YnDhh4qdFOTJs1F
+jshFHIHjnMYIwYPQZyYNwMGKjhw2aacsTudWKlierTZtL23TxVKiilBjQoGYZjDGNxM9VSpeXBkr
+pKzFwpAraQMQIZF444ZEefRTAvMZGxEtExmGAUIkIYuYhRMAuJFxoXD1/fwwLF6SLoELoWJOcS8Y
+eRoUMBhCxE5EnIDEGLwLxKFxQcuejo8bsTvldVd7uY3VzKR20xPJXe2kRR4EcoZdknEGxHtLzdlH
+b0JNxEHJ0DMhIZLNFjEdxFl4HIiSShMybCgo1PQzyPBUMrg2MPBR0UFkknSxgYyleDDk3Y7sY7zh
+jrWya6O9s2U4bsbkKGICLzyYKNGDIyCPGDzNGzoR3Czo4OA6OTno0exgk0YOChHRmuSiybCs3gfH
+JosdmzQzYWaO/azz1jPBvsZLDg6CyxgGBkdpcFihe9h0UwLi80ZE9xmVIDFksY8CDZytEliO5yI6
+EbHIj1NhJZ55FwWoXRjkwIkycmTRR5lFmZOizJo4Z6nYyWbLKWMJ0ZEWakre5T8Wj4ijPspDuIRg
+X1LF5edBhItnTc2KAxEYkTJGAsAUYUkjyZskwRyY891rW2Yx5OrO4iEdiRiGAkCPAXQIl4QNCYZF
+SRAyGMry8sKREIiMKZZCm2lYESgWKOFSxYn1lx8ymBAxKJbJ131t18FV3X2J5lVVK81MdqwVXepV
+lPNkU9YV0Yxo3U3aYe2bIkTylxP3sVPLAoZihqKZGJpfiQSelw5qYEYrT1EtsyTlIRRPr7yTFlBy
+YO53JjPOPl7GzRJ0CECBknbb5bGb5Zo6OhGw4GMs6VKBYqLAoUQ5H4qHMiZWxoQuGBqoGCIh3bGy
+V73Jj+D5GSGm/RXVZJ5rJKseSUqo2YrJvYmKDRUSqipKCqkYrGMTEsQfYrG3Vrk09zoo91HIYu+C
+y8nmSMwJBPEaDJFhWxmMIW6hCJwKFQiUcCcAYRzYn5B4EjERhkNnmMtEmzo2eRjozAydjPGD+Mrg
+Rk0GReQUuFjoSIPJJjdpKcrGpmeIoWJ4uTIVIqe13LbfjbKhleUrZUO1TapKqdBR71STd4GHq9zb
+v7dnDs7NNMK0qeCuXJhwdzuMvqRckjXAgk5F8g4yPIyzxH7llBs7r4Krm206mK4Pk47fIzdv7Of4
+P4MeSjYUmTCBsVL78FgXyCOCJ7jxlwduZNipAgKajAwmNxZRMqAcyTimRmMeXMSqIWIFxgMJ1MWt
+kRKCdDjikiPgcCgglieZQvKhkRJ3xdhKIx77ytIkXJ4dJYoq5GxoYaqRORwL9TsKm6ngzZKrKxqY
+8XZyY2L68mIrGExVVKo8Tdk0cYclaVFUqycKiTFSVRSUnjeamPobNKqKKb4Y5qVjFVJPQVn8650F
+BxSY9xeKRTcfzjGZeESqSHslZfEctgG4DlsYdvLXc7nNpze5iPRYnCvYkkmGJmJcIgkRBEIbCohY
+VNc4mkNbGJgYK44t8TRLHDNvB5omecsjuM2dw8wI7GA6EdzYTHee1sbN/pVyPRtzPJ1TnHSVPF4K
+GJSZImpneEeIFipuQCwoSFMUBFvIqma2mKTIGM1V74ojFTznUSdKDAwpI4loUYvGdxnIaO4xwUAw
+RNbGLRIqjuZJEBc8FCPQqg/lFIy8s2XGSw5Oiy4GSYKerwb+tbO9R7nI73zNjuE2U/yMe1Tos6PJ
+wadWn8yNMcMjCnixweDs6BgJLMG3QWCARZkUDKPYoZEIoY2fS03U8knV9rd1cnD3Mc2hKdnZ3MYm
+K3ebA2VKlqpwvfTSuvs6NDmLR+r1MmDRgOhjORFHJRwwk8EliIolj2NzTTZWNMdymLGlRlD2Xq4U
+I8HlEQI6EUTRJWGPoZsZr9Ot2akyIRVQ5GBByopJ2nAc17kBII52nrMyQYmtpRhpQ9Jb3RPHkcen
+sOsZTZzMcBOMGGyYjxCJkWGGGGIEwgqayA9mI1ZigpyucG08FL1Lt7D/AT8j1cOqVz7JpowrDH3N
+mGzuYedbPTsicNkXx62PoY7OT1eS/ufuNk/hH/lIfEkT+/7p8oV6+nL1cbPu4G9/2f32249tk9bv
+ZlRkIxZLKfN9zA38vj6qZlC/KGVsVEInx8nuxD+U+o/cv5F/Iv3kH8y/nX86MrKysoMrKyjKysrK
+DKysoys1ms/Sa5l+Sow25EU+cU6xQyoU89VXsgveifxQIbGQftNoifpuAb44H8UKnj28XZmbn1Ro
+nwFd2TU9BkAHaR2SspB5f8h/6TEN6QpbTX/m2f/iChVaXg+UrQY2JR9TZDIQMURH+w2MAoyJ7kB0
+ERDKBVESJAkKJNHRHqfdQM/N6277Hy8zFKB9y/M9P+q/rV/s/cxl1mI5W4jn9R5oFbfiwxXy3a0Z
+fvCGpl0H2HUHjndLiqxDh7/hhjFEBCIUPKZj2QVE+MI+WQpCkKQpCkKQ+s/fh0k6mX+s0/PCfPKL
+36MR0dg4rhYEfTI7ncjuPoBfqGFR/cUSoHPwLOAiIiEdVakA4hyKA0EuhYxlY1o0LoZDUP1wKGpg
+kQAiFeJADc61g6ZSu3MBDiRyWuIFUoEcJAQ5kKpoIVVNcsBNkcQocSvOCkQNkIJxHEihkhCb0iR2
+7cjRNiokckCdn+GiBhX/MuWQRAiUhAlzJJyg+QyMVTc25koKdXYMuEUTAIkExidFRdzRFiama1GG
+tGuDevu+H8/kU2F715dGEaIcIT2QPlJ7cwzMd9+L+2TiXuilyidkcS8t4nII3auP9mjlboKYi/uP
+8PVsTry1oXI6ZhMVf+OWfzst2va9qdxQ/50b/TOjSXt9/W024P+Tk/Vp+/jAr0CcGSUGsQnoxgWj
+KvwOwbsDI43xms75Nn+vMGsxO+DunnJk5L2GGLrAwDlnXiNo7LypY6J+jX/rsIgz+Dm/8erdOSf4
+NFfNmPsfhBHMkT++CO+COkEeMRFJzS0I65Kt3rU+rbXzq+dX06rXcAACggqqqqrqcB/IQPb2nb0+
+v7f3fn/xH6+P09oMn/nIWduzrBHaCLEWJFkKIoPMWIjEOb9rq1sRygwQ+j8vu6oRusR0skP4n61d
+HZp/s3hDmQ7eCnVpG0mMyWT85WCF0bs0lJliSWPe4bvmiSTeBYRCn6nc/g978Pmen+HCIIg3HbD4
+taP4fkG/OnKA9qRg+CRbpNmOARGEUD8GOrTK2bXfbm0FoggLk5lpkaQtRMVuWwoXKwd1/o0G5Dwu
++XuqQ4j5I5HOcv57tnsnraudqoRxJHnR9YNEjtYjCFg+FgENINouSvC5zNRlwVry7K1tqqaSlGLx
+dllrKGtdZTxaVldaMWfVTDFluX/kBA5Skvj4kgpvst6u73P/EVYRG3NrKgShMkleSBiOacDzMePK
+37lGF9BEAUcflytmQOlE67uAlZ1KSXZbdjFdjfxIoR2ownSmQ3MTSP6bK8TNq+apeTnj5uVoFz14
+gPk8/h27PCF4u6p3J70Am5E3uSN7y9qNia2oMYp4REZ1MGklBa0o95BBHKIKZ6d/TfK4DCU5COnM
+RgXfFR4yRJZEUZl1YaUCKPqsXueS6u0uQIHWgCHENU+0RAvToH/1h2h6ggn88SXTx6PTmb9k5qQ4
+cbLA6kECzfo/X+Tx+FyDAXSkPHOIUYsiIiAUDx9+DoSVEQyU0sj7LOtLUcVPtrrDjh9L6t+Pa+vn
+9ZD7iDGni5nfMj5Rj0RTo48d6HBCIhyToOk6U6uSHWpVa4QZwudiySEL5deCCy6/LlCAq9YRpy7L
+NhM2fAhjG5vtr6K67W8djbys4r4wR7raf4kLJJB/aEh9yuzDWGk0upNNSeB2kczr6sNG8yP13bLx
+Ehv/1kMIdiFjpLX5srIrtdB3RowbMHMiwzMHMMmmjaYOzNxCRBkMQZhFlgzBMIuRZMkqZdmtmUmC
+HNm6iGTmSmo0tmCE8VTWmVWZcXMkzBksDMxMIuMbS6rRkRmYmGA4DANBmCCFSkYzEEEEEEN2bmTU
+JMxMIuW5bluXLFZJBBkuWREZNiJNiMwZLmZJ525G0cJiwcCnDMxMhIRxMDDDFzEKlIdc3d6TZu5k
+lueDszdksxkkoZguIwjhOLmYZi0YZhkd55g+aP9DzbJ/3NphTSva5p06GZmMjKTFzIszIrMsZwk0
+Y0yTMMMJ3NNNZhWLKuVlIarVDS5YqZmMzMzz5r+jn9X8yr0Q/7SQPMxViiklsgCCkncwU4ETLCqd
+v6MnM8lr+j9k/F47H+D4relYj/BRWt3iAVklKPBHZcoIeRCkKseb/y+QhoI8+ZEZbJBNLERyRq4l
+yY/t5n79QSbOR9fvRLIiaRKSkTW0klJSoiZJNZVmyJtlslJEREpL65ta6SmkrS2ZNstYmRKSSkRK
+TJSW1KZYiJvp7vxH299up3VKI/Di+aDRU1NewFVrUtxf7ZTaUkNYIG6whnHjt0FhsbbGFx55qZux
+KVKUbW11UTY5H+CAIwoAgbOYguRirt1vfpZOy6vfSHT8ciPyWdoI6QRux+3/D0IED/wHOvb9Dlkm
+KipFURDgLhw+/GcUkKbCs6GCX+HhjFJzQ4K68LsBlujwWEFIozKZNiqPEoeLtVxATJjtPlu90Pjn
+MzDl5/LrM7j6iDbE4W7RKJBjZkqRBmrGiiRGYiAnvMRHx/J5+dcrPBdX0onSO7zro14O6sVdnE9e
+3yiDaI2GSBCIvJ5R2kOOMRCj0rr6qhjgwy1CR7jgVQV0DCwNoyDIOCWSBVkz6JzJNs8mzL4bKWcm
+/YhBGpSir7PZSQgmqhTcrFUIUGLvRpykwWIjt9IHqehgsCOIAgyQUrh54yJ5iFV5iCCFAECooxHn
+VbwODpnEMsjbMJMras2ZJtZmDOPdUVgJ5ecQBB8xvT4OFUm9RFElGIpIhJYyE35MiISkwkxKih4D
+Fhw3BsncOtBtiag8GkKyGSSRUdlEDHKIFZQZcxHiPaksrz0Y4zHEo4lvROIIiINUlz1cHVcaWV2X
+y82M4FuZhKKRAp4Q4LRSGiHS2xDuvW9bDewt8MwWufb+p4dey4jfo5wRtIiQ0yCOsEbIibMS2yCF
+MTVpAGsMiIFS0kEU0RFJWg36uzXg8uXm787ShJV9z7PT7kilJrNpJNTWRbaW9xDIjGq6dhm6offn
+p7oI3ZHbgmDRirrjHrRXPiDb0u04zSzgcZXnbgl7Ws0DSyzQRnetTgeac+5GyMaiOByq+f3Hpxd5
+cVoIdK5oiUJK+S5sI2C0TO+AiM1I2dor0p9B9CfRaO69OBlaCIyprxBAyJJDio6wm2uuiAIYRL3m
+NQZyw9lFRAQYmkSjh63a3ocGlzbDEZJ2XiY4RN7sKipW6NBFhBrje+NmZ4utzItDFTByj7oiQRqQ
+KUVd903N03nhddniX6pDCDTUYUxNTY1EtsiWEDAg7oylOPEcMlMZMXDw13q60k6Ww0xPZdV2gjfo
+2eDpOtBZbLkzJZMyTmSTJWoiAAAAAAUpSlKCgoAAAAAAAKUAApQUpSgAAFKUoBSlKUoKACgAHZ38
+zLkzuSzodlnS51u3PFcmAey2RzScUEdAV3rBJXwdHkvBOBwThdHgvGmJbNDUXEKGiYUeiNMua8qz
+Pc9a5RwzT9YiKidQKUVdNE0NE0nhddmiIJqKJgioPxYYguAMc+au+9D733w5+9t7jz5fL48e8Hvf
+DilBq0fHx7ysrA2bJe973wDgfASUDIJTbIZCTbaghQQkklSqqbb1uyrWZXMgQwiZqq436TDt2Hfe
+oOEvcKIiInBrea11wqpl2K3XPzNgWRBA6ojGiJPtcSQiIkQQLxwVRDvSbxw/JT7/o+xb4ZeHT/Pn
+UeUaNpH58/rG/T85btvNt6DaPRvKQt0r+Xu5E1Xr6PzZUZxeLH9E23Xms8Nzg6YcGTyxXWy7klt6
+FvrlL3/M2Wcvpq9zL2L/JyvIip7rpEIKPzhrxXrl4vwYzr3s0svEd6kN+UJSZvfHj1/0d0OnCLPW
+nGR5NpejzNVTGbO1Ecbkg9ya0d6Q6uw5RPKL84xsPwWN/HHLogo3frPPu0fssHzKa2WOO7Z0ivTb
+xSxhATj7DXcnrtoX282PDxeT1puF9P2j/VDnpXn6cTPGSIjqBQtJAh7yAn3GkNQTFE0kpApIUJGp
+TStr2q1CJ7x5UBNhqG3jRUz+XWjWZmrEhwQHiIiI7zD+rUjexA0zgqYM79T8X6dIShkgCEpLW5cJ
+XYi/D116vZlThDSEGwlnA1FDxr7K4eAVpnE9M9FX0zij05vbHx3tjgcJ7SjwmXuN8+mMBS6l+RaV
+y1f5lxvXDbxUNBevg91lPXp1IgIYDARVAEYEB0AQqMOZOhH2VqRnNNjhx8kW5SyRTFU9ejA+KyL5
++O34V8p5xDtda6Eeq6qaRUqxUqSwTiCMGCqUlSilRFUqi8c/zf0/V19XKCc6hbE5ae58a15/QvJ2
+gjvB0BgRPD2ynfL6h2QBCQAMJYEC4wO7yx04R4/Xr6KkSXVdsCHkPJSDQlRFMRa+W9m/M6Ov1ccH
+mEBR1hblWkAiUQGDM7mMVIr04TMm+bx041A0Oe3ht306kOIQ+SJIaIez2Yk+Xr7NTzejvrUh7tal
+VdzJasSSzGlKClQko6F6PDBQPUcIDs3vQIKCBIxjl5MHz4rG3HmOkiB33NcF+UPf66fI3k7rdnXH
+Tmdp08TQEMg4HQIIVOo5FCh/oU6rfo+TfnTqMUV+KU9CRaEg74Q+iXX/Kx2HO7r7oVxksUUb7FEZ
+Y8T6PBF6/L6O2/b/Ppfywhjm5wVl77cslPfMuRJ8fqbXu1Tg7fKqXqgx48VeC9yhGLRVWaKklaak
+1jBJd3fj/Vz+xOY/Khp8ebL5yzqeqBULinAQNOwIsdRJhT0FkNzsSokkqR+Y+N46dBeGL3YNZV6y
+8T9pBCA4RDYYO0D1U9G76HV7Tls0wpXoqT/cqNn7nY/4PJ2kT7z7DWp7VOHSZ935rc6kVTq7clqn
+8AIHlADyiJCotD6GyI2Ec+W3b121DeCV/l/quutd/2PsHt8cHh6+ye8zADMCXw685u3YWyWS0WZx
+klq26bV3m7bUkxjNKAIJiDdmeWGHLUHTmPtquBIj5lPIqK7IMoehRBqsLxzdV5waAx5HLp6Sk7BZ
+mipwiQnc0lMjJcp+G5sgiJZBC8onMHEQCwngeM9Q5AzGOO/Sbd4aGp0EziWLBA7CRM85ToMRHf0x
+HjGGl0oPcuklOGzatfHmJ178hFL4riJERUefjek8OhTp/GyIiIakzC8UUaipBMXmsExW1Eq6JC9e
+K7k8knmPJo7+vS69SO3vVE64ruvjBH6Orbnkd1JNQRunJEWQhzgBo7IciiBq58aNRLg8s0GZQ6cC
+01ClkAYyUoEABWpJG52q177z7V6vsb6pIZJDiSHLOm/fk6N1Ld8XGNsYJ+0g3ASsnhiAnQFDrt1D
+Q0BaxEyYkO64QHX4wHLW/4kBNqaQEhEELX033jwLZ3Rer/Mu2giABJ+FYOQFnuhi6dajfOWaS1kc
+aXVyOBzHCg1mgaWWSaCM71RpDyU6Q1B95AbIxqI4HKrt8DzZxfRyUHWB+SfYrCvQg5ZieSfNg+bw
+31YPNHfGxdYajrdsauL52H95B+Vh/THZPpn5PA8vZtcr557KQ8XE299as19WPmZ8vc+RDIlgi/qu
+NJ3acuud/f959kEBQUsyJQsHc8+7x+hfoxrpnnrOjpSSr2fsxIkn/JPrxPbSf7YcjnAJjP6pHaxB
+/YfF12bD05KCvvaJEVnRJIf40JQSEigi9IJ7H6Hzx/VIfm5KKcpEif5HsIf2L79vjnd9Y6UAPQIA
+53+KAcfEHJh0QHIdss/bDjG1UoCHq8Wn03c+vvnfX+V+hw9r1OqYzo0momQKCRc/kG3J4kivdTIK
+UVdMC5mBFTMHMER9kEdVkJJ+O53pfdJH+bDh5fQ4+h/T/Py+THSDnWMQmblxp8hM5QobMfJN1U6C
+d40/eBcnVe/7ni42L9XI/a+nYJxKdnr9Ozx3JOavIqmoyX8bFxA/GH3jBzM40PaiILH3nv5d89VP
+9h9W8ggfSeRkgHYcISidZI2GHLvMEDTSIqlW5u6srIBB9ZJKGw2VVL5xzC6kkPtQd0wPqdiOrq3d
+/8uelV3XHzLCR3wPmzZpBnVXFjx3ZtjtrGZi92Mq2VyY83P3kmiSbvpJJMCpkzJKampbJF448qtP
+t3kzHYsiQFRtzkYDIkDUnfnWIoHkYcoa8iZQiUeYqITllOIkjyUowfI/dRR5IpwCzJKJmQQRzuWq
+pQx5Nms2ddeumcsYrGSSTfTFetZFlsvhjOWMsvGMsqPtR7jre3GJxSPfn3aSNq1Uzo+nqm5ObO2m
+nwXs59knuc4nlSc1UvGMOzhoJEda2oIkzGOVzpjN8Yy544nldLHGtHDs3aUXLOLR2cGgXXEkzMEF
+AUkNBCEkE04WiXIKCHJqouySbtnmoPtwMpBHzApCoCoIsEfmS89UliWRVirFWFLGMttqKVFLailR
+VWKsVYW20sRKiqsWKsVYqrFirFWKsVVirFWKsVYqxYqrFWKsVYqxYqxVWLFVYsVYqxVirFWKqxYq
+rFiqsVYsVS7h1zudy7nXO51zuAAC2222lhUVVirC2lhLEVEqKVFVYVFZGSyyllS2220sWKsVYpbU
+UttpYW1F5y66dydISdyd9FdLb7utfd1I1CCbQRvBG7q6eGphuQiwIZkBsU+s+ACYnnmVNRNS8xIG
+xeCIIiQFdczO/WS2d5GEEEgzv2bO8TqSySryXzDmDckkK8SDEJCwDG0yZ0pqSQgt2F3YYjvWcnjg
+dEQQ0EevDNYZvOWo8tPDXGmGLktLvmT4YmKWVLV64dnZ6KQhhtPQTkghIRNJsCXKlSY0yRQckoqi
+8pPBnRdcn0FMo7aYMPgexAhGLJCxHyET+sU5EBMBUGL7A4hgO2ZejBeSRL24M6ohle++k99XxRdX
+yt7X0XxviffAAAAAAkDbNskAkADMkzAArV2bZSFBEiMCcFBxaMnqBYkz8XhiOfJodBPqiEjTBPzD
+jdmBqAj52h0LBRYMWEocByRMBA2BAvIkvaYI963o+Xmo7KkSC7JpLClzY/rUULGI82veLsF7JF0h
+p2skdsmnA6ztP6vDwTzbAooophNZtNJNTWYjGtRR+YpdWvxqvKIiNYJk0IFVSCQpElBEUXU/F/af
+oFxlP1FSfuQNghifzvLvE0PwIf7oI0f6ByTckePdPmadHXJurhArPz5/Rf5ilU9Z/P5fL9Ps50Qg
+FPGjAfnNQgKeQCA4KncbjGvbOTaQrklGgmDwcmo+iw0WFEiMaP0GE85UI/YTPOOJ6ZkMNfj+6KWY
+TCsIMoegUyIDCjh7jIkRHFNwc4EoDkiZA8xEie0U+siMeswYPUR2GYDRkosVCECBiYWUFFGlMVWy
+sYU6dcY+DHzq5nCubTyF5mSIl1ihAmKFAUHGPpIkip73PcKXECZkMVHOYWHJwYvLi8iYECBEYhz+
+QICUFNnN2Y0c3+94PFurm3cOzFcVXDxejhcQFPpKjm6lS0CRMkKRIEDAkMc0SZwWdfjIZSv2sfDU
+Trwh2UyK81eL9XWPkq5U4KRpuu87guDgMexlG+bRosv+IsKHB+p+OQgnYp5CCRqCEKozF8ZeYjYd
+k+U8pbmV1FQTqJjCmhULDgwwqMdZEYcUVTKgp1ml53Hkqn1F5QsdN1TEiNF0/fGHMCPlgyYHveQu
+Ow0V4GJQc6BmWjG09XKyBqQ70RCcdwE21e6aKN3FjcqMbERisGSQo7nYjBgo0MuisGP1/adjgMmj
+ZImOh3tHxThwr3qnDTvVwc1Tm3OK+CuMcjdwxXJjq5uTm3XhXq2a5K4fY/gXDkg61NCZQMJKKXSG
+G3Ig5EmbGIpE6BmhmzgyI7lBPkSYEMyMwUSI+koKKOjowSZMFjNCYxFCBHzHJwIwBRGC8migRgn4
+YoweZJ+sowcyIoZkR8pcHmPpuS1ZWpWK/DwzjhrXM5T7E/UomQfX/2z9KBarbKHmPsDsLCWP0+7+
+v8f1Tp+f7/qrWta1rWta1rWta1rWta1rQKipFJI5acJlweT78gsiGighYyZEc2GRF7seDq5RD7YI
++yR97UAy2e197ZtX5F+eNRBygjzdDf6LvY+zJIdJT3+MU4VCuBkD70kKE7jvw7boQFRH8SOyIqez
+YJQI9+PsU9vK6rucqk4PRQY3NiP3ER4qJADXhu1AjknjchVTSFm55uxnKNhKFWuKwuUs5R7kRII1
+IFKKuGCcDsThPC64wbDqKP73nBGRbHhQefsv82pE3kRMGII6fuOOmyJ9RtMkfQ5yQmRaVRXE8owH
+l43Wwz6Ob+dw5lkMVDFFQDyolwMhuekcMe/MTEb04KHjCilAP+96B6GODoQ5weEC/TJ1kZDqHXSj
+2nibeKQtkiVZJ/Tp7B5Sevj4X0no928PF/UHij2fCCMHSx5VFp5S+tHt8nr3TYckmhe8EWq9JqEY
+U3Ivkki39LxgmIEo9VEeDty4v4g6IAgooICaBnHiulcfHjrmtXU95WPvIrHLGdShdTpQkRV788Kq
+vLxWkUoLoW1JAgIVUHzfM5yQc66URuHV1IVMezy9WkQC7daCepUGBERDoWJzOKjVb+1Vuy40mBwE
+59eoUSz7tauUBInz+t0S+WU2GcQAKVGANJnzDoYKGCLtEOgPD1MdZ1InSSORxJHFnWBcIAimew+Z
+npPbeIcOnlNRPOovfgN1SaqKEpShKEpOyVdHog9Q+v4pIwOfdzBfcSiZ3GAMfJgAcd7JNOJkjcmC
+YydXCfJ/L3PGTnI5rDnLPSmrGpa9MiB1dXz6HzqT7LCeViXr9XK8S75cb4t6Y2IXaLgBkrkEoqHa
+yqudh3nyHPwP863JUeaSqd8BhAdWVyBFUQVULsVheJ4lOzMTI8woVRACpS1Rb+q986td5ItZIn2k
+5yJt9MyDCT6T0CmQidwqCGYiipJ1hKUHwlpEPj8mIx7MA5MnKErEeZD8jnUmEPHYb2Jnzv8HztpB
+vSRanSXiyDso3dceseLI7IR+lWDhjByg8mzYk+a9LI+iwn3/Dw1HKyRyjnKc5+CChOUPph69d6Tr
+KnWOsp1npS1HFTpX2V5eAejiYOliRqo+aTyibFXQnJvg/CHmIxYkV8KyFQQHmQqfLCnNRR6HqxVU
+wJUTlUkhioQqkHWohu+ls6/drZDuw0uwpvcqucenHsRDcU6Q2dC84IQVBP5hEQS83P9H6hVFSWJH
+veBTIUw0FMD+26iH8QIyohv3cDqJIAn4y7M0MuPLSHya4FDmSBlUeQH+0yRBszklsG/tu6bsF6Q0
+gFhNDArAzByw2JLoHVEixMVYiEZ0cxEfjDVEZEag0ua0mhQLwjaMpWT++ta78XodWuOHDS4YyOhv
+iPveDwdk7Eiuol5ZM04MvlRJREsZyTGpUrCFSx/SHM/z+9UVT2zNLWmnvePrI7PD2McxH8P6lv9V
+/p/ZoSJTg/Ybf3b3fvMT3E6iDmYGl6wnOE/ZC7HCv+1qGDUklcccbvS8P6+iEiY9t/u/9X/P9P67
+4fhKH6Xyy/g9N36pzb/Th+r+6H/O0uf8NpfPTXJ3/5T+NP9n7civ3Z6/0dUCPofKCWT7hKjSUK/L
+rSakPP8MAhI+sCFV4+bX0H0rGK/hKjF3iglpJQBDgJmZuqbuh7G6q5L3c81nTurZ/J96nQ/SmIxE
+kywj/k/nfn7ThHFCnQTUTx/S2foWdXny8t+zgj/a7zmrF1OskXaCO09Dt27fpOJZJLSLSP9znHiJ
+xudY817BCBh9x8GUg98WLMjAPcBFyTX+s/7Mnh4RGdwBEtNQZKer+HqBGSLQZ4kMopFLhWqOrVQZ
+CK/0nAaipfEZd3tHCy/yUV2MupQ2MxiDCPEgQ9Y70vtL+k+TKpmoqKmkkkkkgvEAQKT28/Hv82Lz
+fr5KnjuGw7gi8EerLDjNfKFhGYEXd/nMwrOuvv3+xBKiI80oQ0Qo999/kFAEL7wb8ehiAjxqtaTc
+6FcCP/VmVx5vZ392+C68+2HM8+PGZmvL5k9dVM1FISQkkkkklHxNchyfGem346XauyKfbzOA7Er/
+gyYsrpxy2Q4b5KJvvvtNnMTt5ZyWcnUJR6duOfyEccbNIFeWm3xdY7RiAIu+Hyi75/Tvq9fQr7P1
+fat77vBmEIQAAPPGzc9yCDtfEGioOpNy4GQl/fJqpsueM3nVdfQgZQuHLpWcysLwvgTlJIxiV45z
+eBdT23OV4Onbz7Nhy8r5ypmoqKiqoio86eYiN8bREd48t+MhyUaq+2X/Dmbu9RdSZZ65gCOTROAI
+s5/ox0jFc4KmBF6mDjOCXeYAh4PXBiEUdbJllCPaZDFZ2uNJ1xAETR0bNx7GiVrfVGDeMYxqM0ju
+aJEZ+xl0UzWgIKP4g3cx9jHrnG5iiu0GBnQEFEmEHB3M63jNdVEpcHc4znPDbdZNcE4axXFWjSes
+4eVJENSQBGViZnkiEvnDoQca3xqqquQ2dZJNjIUpSlCMYxj+BdfMqb3H6UQ6xTsVET85s5/CeUeJ
+JDU3w/4WrAmtZ2shGq046vxbEP7eO5qRAyxDhpiIkypWMEk5a9mut05Zl5UmKkJO7MQOWsrTtyed
+1UDM9PBKmL6nGJlffxxmS0PHhR9pARr/HzpZJ5ycF6IRcIP6oF9LNQg/O/uY9HpAjAgZmB5EMkhD
+KzsExXngq5QyUUTgUBSgXfNL5dqtenutWu4AAAAAAAAAAAAAAAAAA67gA+ruAAAD59uMfoOvor65
+9Xyvr+i8dFXxLi1/11y0wDyreaxOeIRiiqTXGi9+zRONtSP9mzlrk0kGFDKnnoYVJSqtK8XlmpXs
+X2CFGaOUAlBGRRDBHK7Iuok5UEE2dmW5ITCTSJsZNk9mkWhwUycm+6EEalKKu+1JzC/ZkJOjbD1W
+G+s9IcyHsOx5WN97iXyhhyFrQISxQHQi8DjpSRuZDIs2CA2ooPLIZ8INiFAMk+OShx5ojpHbPNH9
+Flo4EGj49IIh4qSqibfYdx/Ro+o9SAk+pU+o+cz8HO710SpcTROCMcET9IpyMUCB2HjUHQ8L2RDc
+Nt2OrFqWb1ZAJ05oiED6kBNQEuQ+4uPzWOA4dIKDGftP5iWHb6xJoiAieI8R1nABNFOn4Ew/X2i6
+hWtE57v9Z+If85P4/sNH+06bP8xs7j9h/gaM0MZkRjdM4DR/aaME8RsX7ODJRsssk0bNirIRyXav
+2Wf6FJahMIUQxKotQpVqC2Ascm/bZP8Wzo9VePON3GHREk+MI7Orx4cGVOVc66KoomJSTf6q6Yxl
+GaXKCZCpAUEBwEat0MyRrE9DkZWjmTQkbKMo75LEKJ4K7nBJosxgyZDdL0KqKjkskhkkjD53u1g5
+kMcghkmg6MlaNdGCd8ncggiKgiCDko7M7iGM0bOBZomzrHR0bQ+zJFgZZoko2Z2Zo0bKO/cnHKkP
+BzyUcHajsWUT2rZQRAHiu/tkkhPUhYbUgywjFhyWQhzWITm6OekhuxkkiP0q6u2IjEoDsgTshRGB
+JRSJBDCE6fH09XuXxO3qD4CeIJfuE+ay0tRZFfes0SpB/rkIxGbSv0zLqJDOYl3BH6mTBFY/g+3m
+8FrtmYKUeA/00oDlTKcoDnzzncABdMUFcHpFha4aNimVYtkNGittYo2lmk2VlqilItWWW1GNtNZt
+BRbFsWYWfI1PUoCICf1HaFs9HNMTZvmjfT34YohD8UGs1CNVEoir1jrmuODXoilBO9XNee5ytVWu
+b4Q1tAI44T4XKC7m0pm1C5xNUHGOLOTEwScHJk4OJxOJEqFAqXgALhYs8hJGBAwHJBIvEMQigkya
+ODIyojk2SWI/RH6f1fr9KqqrRyYCYGqYHMUvUe64tfkkQkspEpSiEmLCU1GOOSmCPUQdiijXcsZR
+Eo9rF5kjKJLIvgir1kiHEYmhmIEhjqyYmLcMIyiRLx+F6inzxDTRMLCGm1KSVLW5KFgQusSOa8VR
+sC0L1OTlHxQgjUpRV5b0nOYSVjVN1GrChSIhhWeobwux2MHqXlcxQEFFcYo4ggWS6m1xUWf4f8vT
+Ph17jRZv000KBR+bcoMlMhAde1Wdb49rkbWOQ/iD/tIU9dbH9ZD4nR/J4JP2pP8pzgjv8vLx7nle
+3GRtY/ugn+J5wT2/HY83wRQ/hD6vv1Px9rfLr8oL+QUT8AvOYmAfHqGT+z61ZxJxk/RT93+9/4qJ
+qE6WMaewkTyE6Th+kdqP+BT/hGOQeoeYQGI6DsMD/iDS2R73/QmSO8nsJhSUqcjf95llvwrSTZC+
+Rqf8+x2/9R4R/ydyq7zCmjOCeScsVVnVh3TlIg/6HnO0GYqrZV9XgdSuc82DEZ6G7Gg0UaaNjg/8
+w7jdu5G5yk6phonozvSwVUlskSn/YksjwV34x2no7NgouKdp7Zomk848mhzN4Swncc4TkSv9KuDd
+Cck/bIOPTrCcDocn0/HDQ+ud/hyFEdn/gHg8CM8pOqR4z/4YJ0RGoexKLLLFoKkpuYer2ngeiHq7
+p5KdxjGHg4JE3ksSGnwOydD06pDuO5ZCashpTCpGPCBPROaacjxkmLKoqsMKxaw4TEmTiRPCTlJz
+Tvmif+IryRPk8UOh6HQh3LGn/dORsbEPX9EWSP84U/hT9D/0fuVcmYtVhkz98yTUNpNQR/CCNQRk
+EZBGQRqPF5/0/jpj62kbHin/nfgn0zmDSZNHzahOEkfi7P3bITaOcjbRzhJ9bs4VRSjm4MheHCGi
+bPv++abQobmQ98OTif9Ocmk1XtM/VddUqSaqOtdni+pjuU3bzdux7G7FacOFbSRvT9PtxN072Krm
+ckVpp0NSMfwCHiQ85HuVVW1+EOjTSsVjlDZGJI8DZkJU7u5bGxsfS3TY0aO93FaPrKOIdfCGOY4c
+iqw/kr9J3okUqjEexHtcMn/eqamtGkk1rElxZ5fpribxNt10KW9BbdRj8uydR2cKrf+aJcKUJf35
+4jX9iAxjDDRoQiQ90hdo+DvmuULZwkySMQ8WZ1yWvGaa1a06to6Y2eZtR6iNKn2HsHmVEcKkOQMQ
+kDAHvIPINqDsSSVPHn037v9eTkfCn6peltLUmJ+cxO82Y7j1dn8Ps/QT8myvsPnVBSpViGwbHtvw
+b/mgjlBH5oIyQiwRkEbp+iPisU6HPQb+XAEwkvqSO4qX+Jke1RB6fsYROzrkeAcSJ/7S+Xljp0xO
+bzZltjVT86v2boke973vfBpX52Me+iZYWor45GVYs54xKrq+dtpOTcx0YziXJUW7L2/e8DSfSaCF
+ikO6J0n2KgKqpYRPTIjq4VSlnSVjJtGJprCvzfeyva3QeJ1FVOrqqqpWyfgTw69Zyz7Mx4x3H2Zj
+rL7O4wfUEGrzinaHcSNylFkVKik/AbU83WOSbDkPFDUT+qyHrYfrpLfk5sJpZCqC3oxkk96Kgbty
+v5vyp4La7436Hu58O/Zp+1VUh1KnM3KYFHidE8lrfK6kkpJLtuuskklVVjpPCdnJyVH6JK4Obuby
+Os1P/l9vBufTPFOhUU8ksw+QsTc1NGGjbzG6TtubjeOJOx3lT9Tuw/tT9DZqqfiL5133oomKFEaN
+MwFSmpqrYYEEjzJETRJ9wkH3JCKiiDDMqmSJ4eXDthB0Ng/rPrNYDkD/Agdo5MwTgUaGfSbJCzRj
+BmDKNErIkrS5Vnx8MXzZUIck/rgWijJzAAH7cX2FxWNeMmCRBk7CJDJkOhHfk6KLLPBZizjkwbDx
+qNkOTsZYlwm5Qlx2m1p2YgZX6qng7NZMFawkGWuJGg8xBLQNF82KAgkn0TURFSoVBGEuTlo0bwwk
+YSK/pJiP3knQ8msnKyaVPGa2DoVjc+l0TRwmGRNjsP5OTuSjd94qqUqpUYFiLDEwqbmpy8z1akPh
+AOaHq+DeSaPUHSAcnee9+Lo+TGJvIfeN3sQVd9/gzSPM3BO47PM7pHZ3nuRimItkmELALIYOru/B
+J1kOZ05J7EWSlFSSzhKsq46lfkcMaVYxpjRTRjBnenYE9U74T3B4jyJOckj0kd3cdyqU6RK7nIcp
+ongNPkbNik0cR+VITjxlLg6NPj1XHifNyZNrszh6sbNjk09G7Tzb871EUwxAlgYkehDZOC9DDeiM
+5nU6mgw26NJVY3cmFc3NCclExtMtkjRKdkK7hCgNGbwYe86DQdiDJ0TUbhLIepo+Cpsc5OddXcx3
+ZWU0xpNG51eSaDqm7ElclmfMcm7ccxo7kquGGJVV73sKqqqqqqqvbJHafB8ZsmxuxVTCcjMRrxK0
+qilUpVNJjG0Ic1KlSbnhI9rR4orzhTJKYwcF8z1MInPg4k34xd5TdRVQ1btUywteizeOBzROQ2cF
+WPI95z0ORtOxkhybpTc7DdhuN5LE6+851wpXQm0jo5uHaTW2bLK02VlVZFVwczoaHI1JhU3Tc96d
+jiHE3cGm2hjR7inQpuqbk1wPDY8ZP3j+J+CNJGZJksz09m+26AJUoFoDAAATzfnpk8PPVyrJyMkt
+ubnZPCuXz6dmvngjx8VJ8yrh/h9g9FVT2MZKxTKKVVUVZ9kK+7Q+x+fwk+1e+TlO/Zgfq+eHzto+
+csirPS46dO1v79xu2U3rUPbXgfiw6K4qmKmSJjEqs5TUO+I2hPJiqtKbyeh3mJOipOCTlvoY2YSb
+Sk5bNGj0cpumHDCuRWJU0cOViSO36p9Vj5f6R84U4h755JkfL/RyNE/lYfpsT7Qr/LYkO6iJSK/c
+ge2D+B+aew0l+1trVtLZIyHyfBfmL6pJKUsklb7vXSXZ0kqpmMVVVVVSq+s3T9R88cx+g5qQ6NSH
+IqOqfacckcncdkIfPYIq1+cc/XIxuqqMBkA5iORIFGgiPBkkgNT+6DAoZIUtjniRjdVRLQWrhRSQ
+lzN/DLC1CSSBChMcjMEkpKRCHDzeydE2S222zpOjaUIi3MuHRNmaXdW9CzktnSIu1LC9deIzwJ3Y
+iWMsPJBpA8CvvYnTg5NCcEKZB+QYjaf0HREPBTrBFnirUqZr9NfXVsKoth7UjjfHmPnD7giIiGIi
+IlMwZEPgpiWPVUxNptCfLH4urvdcI/q5nofthzdUqSw6w/TJMHqKP8qdzs0dTmbNmGMVSqqlVhs8
+U/lMSeSQdiwnEOBpI6SdFQ3YqRBsOCI8sixKuEYQYr2GERVVVVVVXM1I5nJNEo5Jv+M/ABhD1Ch6
+RQjLzmwwp5zY3JD4dyJoJAPCZMsEblSbJzKnBYT8h6NkHfPV7XQhslk5VVKqW4o/FOw5dfu+DJ17
+I7DHDvP0tiD73YaiTC+pZA8YzU84TTaIbrTqdXVuJqp0TkhMSG5/6W5jhiLKExiqqmSc5UngUZD9
+bvVWEUi1o8Do8MK9j0Vs01xsfnkivpPyTadDweDDSRppVVWmMRVVR9j7Py43iG03Vzj4pzNx4PsS
+UotkslqUpJNGopKii1EeKHI8Cd5uZNI6G8QfGokqWSE+Z1iMP5Q7HhbydEd8+EJo5eyE6QnBshU7
+zkqeMjgbraqpoODuD2THB3eMSSR9YVH8bIT+v+xFRDA+wPxPn0aYuYBvdRtD6Q2qN2vhq/KtXgzI
+BAAPq+uvwG79pPgxIx7K/B+aH4yIPZD4z3nKDfUplkpzhw975lPgxpjtkyzKH3abtVtcnxTCN7JN
+yq231EjW7DHBjc0cREVlmRk2b2UajD+A0Hevvr5w+n6kTxQ0mypXseKqqqqqt5HjIaaOZ2Z9HkHy
+gfr1+W5AeErL0nAPrLVoMnKeJTDxO+AfBseZYHKV0S6NGRyVPRh5tqm0lU0MNpoalqLnrF7TxO5F
+/D2YId542GS+udSU0/WmzRYcjZ2/LhhySU7T5jZisLHSc/f8LfceTTT46dDrCd55rE99icipJx7U
+xPAN1Dw7pFDz9mDeScI6KqmVL2aOjIhZKpYsdiRNz2t2HpI8DSaOfuLYaxo2Fk22rRpKbaNGimkq
+VPHRo2YPEyTCtlwebHK8eMkn0BT6nk/i9z9zZ+/iRD6OoX7kn8Q/whfZ1Xsu7uc451yOdOF3dEC3
+Llystq3En4RAOR6q5vF5D6o9rcSvQ+hpPkPmjYsXZsw0kh7JcKklPfIm7dVVWsncNMUqtDmfIpJ9
+kjvOgodlI+a8gfLunQqxVJ0gHWE4hF/5PHObqm8nkppoPgD8gSMMqRAEREpAREqeRbmGih2KxVRT
+kg9T9J0kYTvbRK5pMkjrTEejucpr1fM/lw4cHuYjhz7jqmGHbC+LgfC+8Sj4o/f/vP1f71lni4+6
+K9FtkfXLA0lPQhSwKk/tiCp7L0cn3yNR/8Gl9SfAqRbDzpGKVT2X8uXPpnwTJsk+MwUl9D7VPoXe
+2ox3tY1I5pW1SLU+o6CRg7TkGiSKPkYY0RZFtKitXMamtKpLolTSRqlNNSoYKrCDsdugIYd60sSJ
+KmwAcDqg0hpSykTRUrcxJ2No4TRZIu5E1CwPUER8QZV6iCtlwd4aRNUGw5jyTmKz0YkiJkiIhLjo
+nRVUpZww1ENmyRqEponA2JpotUMSzaEpDKSQ6RIjgxsaQ3NSTUJg3TTerkjKSrDYo5GpiYLBowyO
+CkMK0bHCxs+/9qyfgz6TVKsEWd1IwUVNfVFvPWdgUaTTuoMD23rCeoBAov7VQZFV6HUxBT9YgBig
+EIKnohB0iinlTzKUn1qoHp/MfLpJNFJaab5JFpI+M/Em4+RVVWQe6FyINFifmPorlAMxkEmE2Pxb
+SP0lJ4bHM6SR2jik7k7HU2KH4GDw8jgepyEQ67A9yoG5Hb3v5FTI8E/nn1jnqOUHgh20kNEshYR0
+VNnidweGjsdBUfg8FVVVXdZf0M2kjeHEJ57aczafycMUO87JtNiY84mFdEjxNkhsOk61fJyhM1np
+psdShSCkDQSo8leAuQJ1FHqg+Ahv9pd8i/TEQ2OogCcvoRIgRIDSGRa+0gHpDA+Txh4yQ9Ee2T5I
+bDCe4v2g+zxn0/YkFQw/GD0HGRL9H7TpfKeQ+87Yw0DNHnV9kPsewYfwE8He0fqORo9U2kZCU9SF
+4kcIQ1hm/4cz/px4DUfVotHwGoIU+v6lq1waO5j6E/Bbb3ph+EgxGDg4cKqqquBp+sxG8wk9qKbr
+EesdPcanSdE6ycMVJ6+3JI9t6DKr6YT8NjqQ7I5InU6js7kyRNCyenp/o04cMMZJk4jmoqn2Fieo
+nkRxCfET1EsBCRAMLIwSO1TtNh7PZnxdxv8ckbahqRmY0kvV3HzHge6NEw2KbDUlT16fpnT+QPsK
+Qd7d90f3Ph90/g4mAOxvxYQ6EG2RE/Taff8ppiGDiMxntn0dvKcnJVMkxiqWyqqvng5m2y7H+BZD
+c3qqr5KYWUVklZkiZzhNGlSNKtW8zD50k96Fn7nI/ZMkmh8oTEJzT90JNjJEnBYhydTZNJo1KhMh
+NiONmSnj/Lxb/KPoPAkbPR5sV13DOnejhoqqptDZvwGRtl7g2PEhSyTk2OIrkOcnN+xo/Y83kR2E
+jkaB6GjZZKtVGyH708BzTebzQ9QpFaJkk0WRKRpsD9LmPPQ8yekepHfDBzQexOxBxQcB6JDJ3kLg
+RDGEm0GomyO5jYTEYs8jzClepVVXKE3TaNl3ThNmInMjtB6e34c44OyEiRmJQCCBl5AdGcCXAlnN
+k0ajCtUypFSq/apMG5RN6aKIUp2E/+OyIdf0B9pH1fQECBEAkPt/P9Q+5L56r9RdXnAO+UKWZBYU
+H7fqPv0e2qn36PPrT98gS5GhLIhiQj5CiiHB+sQUWV+VVSycm2OFcMdHJybOGOrkdXNjFOT3uuxi
+ok+MJD73aONxIUiiJmDWDRSgTaPktuqtleGTjjfBG/Podd25bJH7YSx2uqjkpwsPCuFRvLb0sypO
+bdyaNL2RhGKxLjuUSIyeDoyWR3EcGCSgwcGzY2U6Ojwac27HBWiqqdXYw5jJCAOUMRH3F2aomOIQ
+THJSNx5XV5Xi+Mxm0idlhJzsTs6Y75P83z/wINtl+3v9gntPbGHucJ6H1m9ScPt+EPSE+10VU4Qn
+tTscaN2774e92e9U9r6qjm+rukdycynM8p280/H9bxbKpVVVVVcHn4jxdk7pUVVF5OTSPB8ipVbN
+nq56aKqqtqmwxkmRCu+RzVTxyE81ju7xkKj2Jf+OtDMZWscoh0h5ybo/iqQ3Oww3dtSbFd0qqqtp
+NQ3xO2ODMJpOHDIaKj2aPo658+5GWExUBjgMiVFQqQP5B0TgZpiHMccTMNxO+WxxzY97oexMqe+U
+3yePi9if3n3wh/hpZVoQMCQ+NVfIWrfFLV+Pfhfp78UxtP4PylTlB9OyRH53dMPql/ykUTSYUxYf
+6Kh/m64STLlkaoTVaqNVE2f7ybT+tETQdf4bA+NfeY+3HzmvbvHXuziPmUIEmGWHpdn7foH85AO8
+TykDwIDHpIDjASEUfWUYsFH4MNgTgZIJSbNm6gIsMqOMzAWp2nMz/acPeDkRSP3xa5MAbNDEIJGy
+GQUWZGSRFuMGGlC6n4wdsxgIgjUJykj73tf8z85ppPedTrEOklnH+Z9jD8KxeeFxdYG8TiQj96Yj
+HuSne8DDR3t3nI9yebjGKTlNilPjImRqDnOwnIKfkiDAnYshHtRMHVNNEr4q8FD5KJpUSrD2P0kH
+aE0h3MMTZOckm0dXeOYcJ5IjdkkTQ54+ZVWliiLBsbjmKnvRJOacoT9ydR5nse5ho5/SHekjknwp
+ReqcRIe9JOc7ymIo7OsSe8p3Bk45vRvDJMttVYsprINXXmgpslZJu8YSt4ThOg6OjJ0eBPP+85kO
+ybp07mHvNNHuqPIToeJjRQ7cWzkk0bs3VJzKaGw4Mk4lvXScDnORpyrYpvAPKIMNzcxOUZhvIVMm
+jpuc9rR+YPF+qRL9z+f79+P+hv4ld+RfizWr3vyfoQWQIllJTQiIiP0FvrtVr8FfkrWi5KN/TYNI
+r5ASPjkxAPsMEU3/Od/l/Dv/O30ZSNtqfoWdOP2fH+T9P8txfO91VbUpTGVZv+qFoVdlX45t9bfq
+i3QoxFEEETehs5FrA98zdXWClr98LrilmosLljtRttttt96XznOdMFlupi7X4PspTG+++pGkYxjn
+rtbJojqV1ZsoCw0vvvwutWrCjGd+j37weU91HHKHt58LGPHL9nt7nrnh84mSXzTO3l5eVY661wkl
+Wcss8nJTyUcjkRHe1Mp7Z553by33ue9Zb75RjtvMIGOOOeeFsMM8YXLkumlX0zNKmo7qtoKX2d9d
+dddZY463Ma2ta0alWuUfVt92y312KWk7sywtppKMdrMUias0Z2edML4E98s6x3z333fAXNjdSjss
+LPtWtYXUq88W0hspddddTa+14qw0e1+L7bR2tltnnna6uT7KjkDZ+XL9vXDNEyHd4cJMntPHi488
+GhD16054vF+yNddda11teq7ta/Z98461y2zzztdXF9lRyBs9zEiLaa6bRKTFWOzws2qytOVrNlll
+ppdGMY5zlsuDsu0Xz2iSOvIz4kgrv379++SDEWWWWcwbR6ZfVPwURhoxG9CBJxTbCWQaNF0VXGzb
+TaKbSLIo63ZuYxLh3M4LlV3x2220lhjZTWta1jSjWV9W22bHbTUpaTuzLtE2iRHdVvgprZ300002
+ljjvcxva1rRqVa5R9233bLfXYpaTuzLvE3iRHdVvgprZ300003ljjvcxva1rRqVa5R9233bLfXYp
+aTuzL9x8BRRRRRRRRRUQA5gwwQ2pypdGC5WjvyhOvLjx48bii3MuE5z1nJqPNYKsN8n3bjLirx0H
+2sPAiO5lBdNXfTTTTWWuNlNq1rWNKNZX0bTZsdtNSlpO7Mu0TaJEdy+C62d9NNNNpY42U2rWtY0o
+1lfZttmx201KWk7sy8R7n5R+NJEfpP1wftT86P1G/5yRMVZJK3NofvMSpP1Qn9L+eR/YnDUj+Ex1
+ODug/I8mzmfuknZ/EMin85H6XKtJ5jmcHcihiHZiRPoDm9XWE8IkmSeuyJ4u4rFtVreOJDnCUjJI
+08DccnkTlEhyRKVEdxufs/REwdlP7VelTXjOqOx7ZZPefyQrhyPB04R4xp0ROcjhuWdHRHhsnn84
+k+SiH/G3mhoQ1GLHiiYn8OaT39T/vr0cKqqqkREo+sO8fYCh4u4lH4fV+/Zk+oAexwdbIeFhzvt8
+14SqL2Wf0K/yW3ZreD4NmyTRvq3GmMc9JJtYh4uiRXZiqqqrRJ7AsQPePBGE5TsmDAw8g/WeTvfC
+/cfGfGSPsQdGkHUSvrp6ahNOsgh7SWJDwR9ckfROE94YeZonYWbNG5B0JJwVPpUr7SZHeNJkpzYd
+okWTv8SGp/fXYh8f+S/wwttLavp9GQR0n5zmf+uZKbZ/Xn/cEHAofuQSEU6lyLiPz6rZpL8fxO/+
+G/D6uuZ7V+Lv9ajeyMsIu6zWC1uu+u+FzWq1rvbefGKA6/ZjoklPMdDP+v2nGo4z8zKonp/vXppf
+0N/0n9vybfiJx/X/l8TD0PxXPrQigBCMl+kY6YI0EP2CICf4AiIGhURkE6aYerd/2EOEiwiyEagm
+0EsR3nLjuf6Wuvax4uXD8HGDue1yzhZ5Og1P+JiB4djCCBurLx/sv7JRQmgCG8dwoYzw/vXjnB5m
+d3MVqu01H9RERFf1hAeqCAVcpqORPyyNLlXWefTnw207W7+uySF9OpDQh1oQ/8/B3R+z3Kh3zNUo
+RMUwT2sCCpwVPP6PQ/8CnBRdAA4uJcWAQJVnEstbKyFKDIQG4BBAa1dmlnSmCkDP7TkAOgg2IjUY
+CwRoFEjSdUidmWUBukcoI20z9CE107b8Z0ddv0Vz0o/qQgjUpRV9nKk5zACQAQBAcH2xPAD7w/Bn
+Hwb8rhZVkxAXpEFyCOhDBJFIWB68bUJG8EagMsGQRUMiIbeqDFjTzqLUjCDUE5ENT1qQ45yJuQ3I
+WQN6IJ0WQElQJVJlRdAh5zyFiAm1BXnAvAKi9QQSFNghf5ehBkhHTrIiZBHCRojqk5bNs9dZnZ1X
+sjTMvtBUTrWkvb21nIggESEB1BHiF2Ld6qidgJIBECGCbGEr+I2IPMNw81ECUEB0CvYCuDTn6k/o
+nm/uD9on8gR/MP8Y++hEX+Zgw6HEH9zFVo/2Pt/1G0m1sshVkpW/U007ioyJbJXRFOU6HclcnfOR
+0blcj/UW371KO7vDczxA9t5YKsCQRb1VVBTJEa2JUQ8Jwf674rITn2M9NPLdevWXG1lXY4P9N80o
+QpREihL0I0R3gMB+xEa9t+K4MO7kdYlSSH7COTtSJ2mIIEGUZE00RmlMAkq3ZlmrWh3vDdFFZYUW
+pMcOnXaG4iJjWOGcGtN2TYuFReQMO45nB1NavGzZps3bzKO0m1LoyM0ic/RMcxhjm7NpK3kinoOT
+73Juqursfi+PXs7V5K9z1bYxpvt2PY9jCsbNUps3d6lUpR4+hXCaR7FPFo5uSq4Nxhn2LXx3ea8Y
+lWWDCNQdRFCx1GTkNGSzZjdpubuh0ScjRhznxnVH+ubzq+D4OhXqnuMNHOek8nSSOB8Jj1dh4nHo
+68eKHuAvBV6jagqqmZJ9nT4uqKLz7g89M8w8HDqxWGjCeZXHb24y2VlxcMyrlUQiV5BQe4OPu8AU
+exJIiSQldXtVVU4Yx96rym56xedRmRGVm5miLBRatAkhJRORy7HOT3NKpscj+LDUdCnQ17BscmlK
+5vclTg6Ozv506m/EnZjc04vpmjTaPJXe0xMaVpiew7NHtFQR4EKQ9gxMOrqOG6t3iw0xjTsPZT2n
+KebodjeR6PJh0V1d7IlXF2bMTdXZ1lcpytTaOilLVQ9WDcaYquMFOE6c3NNznjlJxFg/6vWcSOvk
+GGTkQgRJs3/MMyCNh/i/x7jk0GQYck8E6qr0Ie5sc1dyqr1Ke14/Bbb3G1qpUpyMmJ7Fm54Hubp1
+hp87ueSusHCnvsQyOlRacOVXu27TujNNbeccjXNJh2KdpsYNm6rHeaJo9qi/cvMNzE5lyJWigMF4
+jYpQYOwOtTydwidwv5fmze2MOSAv3yCP0f170h+Y+ZqqqsDR+/tbQCaxd7ZyoIkoaKIhCpZWKIom
+tmiKxEYqKiIiiNtJRb9FvxV8v1N898YOE6fwmzq8+7yho742RKiT9+PlTR+79Ffozg/QHChws8lJ
+OcdeT+CGnyDPEmgOhzeQm3iWh5gJo4NqbPRAbNFqR0JOknQ6A0x1nlr8TUsGd/P0mZZn5zywcBQQ
+XJzNGZtNo/pTqvbonl1DqbPw6FPfUUf1eo+/yK914++ZZdieWOw7+/vJ77RmXDym8R+chA4YihAc
+r5t6dwKG+TtFRBgWETkxltWrWYz2KbQcHX3893j49JzjYss7/hi2p4sbPDBOXR1djaHSy+DJukkS
+h1NNNNNnJPWG1OCAOqwpH8/v+k8Tdy9XbSS2d/e+Vmh808Y2z2Hg3HusL0ZiyZhzjTVrIybcdPLy
+rxuLO6G/JXm5P9AVG8iY5Si1MQFGyxgEHpsDyO5rWCMy4zGPnSzx9HV3r5cDdHbhyiRqSVKhppuF
+0HJeho5kvaEvm6Rxz8dJuKq2azGZrXXJpN9s1bGSdZk76Hm2SM8D/oj+bRxBzZKYmm8HAXvGdTej
+rRFWg44WGMeI1f+TDvPbtXhhiQmaauXo9Vya+Kze9/yjzadVezjbUkkuCuSagqU+VxjmxzvOcpDp
+L8O6PKqGM9kcHDXiOgZnjn1O/g96UOXj09C7PiGCCFiYkiEjr6+XWN+tbtP99tvjsTVf5qZAmnyj
+UeF5E8kiUydEGYMrJHRXyUmMfRN97FpFbN5HerFgjZYk3sRP+hTUIgTlGBuVA4JANkvVSVTiDmSH
+EDyIF+k4BDmLJBArEFLPcydajVn+OaUjSWK4kxHJZB+U3a/I2t8fAhEkFUBIfOyo+2WPrwaQ8ul8
+GH4ffX4OGzrJIfiHZsetWz1UzNnDj5D3jk5UtSqZJac5wOEjcFGwqCDZwMQRydOw4oublGSiLFPn
+dctL1r8ipwTlJyYmTY4sxpcGrFVrVR7f/A6QXmpzPQZ/qCoPMQ/gEHyKfeEQz0JIiTMEyKZBSAUU
+wxTBQTbGaqLUVR9MI/WqI+JN+4/dwWwzUmPgp1JBpTQelHsFBTtexdkfMQ/dF+5DAHAgSohdJHEg
+F817+OJEuGHwEaKSg+74fpT7s0aMthmsRbCbyyGDZgn987J1kkntUjyfziUEEqlSpKkPifu2fx+Y
+hg7DSbMU7pD3HsCQIhVaRiUEIlUoRKEiapSJHH0/PBSfH7DDU4T/wBFrB2GzWg0GBBJJYptZyqi9
+Npsy7fHxEiQCACVQ0MokdFBQDKIYxxgDuR9UAo2GlGImCY+aeZ9QGKKe6QTUAcEJgJCAvIjJNEZC
+H5nteFfGVOhyAPiZoFiBIQqVSAh5w9nnPojip77lkZjFuVwpjzxlnJUzdkGNRtqToIcdyttnCyeJ
+Uss095cbLVSp1xOtjVizhjY67NuGN3XmbcNnCm9mHI2c9dKl3DSmdCzAUcxTWYpmkRMcg1KZOQ5c
+jYb1XMOAOhvdTVjFJiwzcgjERHRs5kb6ep+dWpOqfU+TZp0Zh3ojm0hVXuYO12XutO6qS3St6u3J
+SE165pTSR+TGR0LD2q4Kq1wsMpqKHAOj9htewgiXkdex2UGzZnNVPKL+qEjq1J+Sk875JIn/aQqS
+KRSCqhJZBYgUhYiJUikEUQpIFVZYKqyxWTD1INwqUCp+PtU4+a+nEnxM0U+AfulU+IgcJRcgiSJe
+pCLhK6kYmWirSVktsWUtaabV5qq9LeUtWmiMVWprTVliJahFESLBFQRahIixkq9NVyxq0aM0rM1V
+sMELDiKuA4QxKHhGlBPNyP/QP6A5qbom79j2jk2eTIabZMqVbEI3UYN9LpttC3FNmUmsMVE0rSyl
+YqrD97ZnDjXwnmrKbLE2sxjO5p8eRt8wclcmGIjrEYqSlRQYn5TMQpQIJD/TOEIZYQ0sKLO1O9ZD
+aw+Kt5SUVHJmIqTdZGElj27QnM8uP7jtySabjSYVe0R8+YP3qoV9LlJ6P87o3SJ0E6PR6+Q+S/md
+T87DnHUr+s36etqrqHNjR4wJB8F2gHMhmD/WPJNHAqJ+r8Pl5iOdfMr7QiWNdy6aT5Wflz/7/+3u
+5fR855RHvJZMnqkSx8PiexfcGz8dSN9RpR+QKHBEH8gWExKSZVsi20KQUElWclOSKZE73oqOx+cl
+S814WR+ls9zklELAWok3WJxpaZFE001k9g/zTXYeUkkx8znwtfM2MNKCulBXR7KT4lw+c0YGo+sv
+8/6sBcOXId79L4QfBFSPY9yYjFh86rH7kY8kn+hU/j9tyE8XfbHrJjyaYar1X19cfAe72tKBJKjE
+U/gY4MntX4CNIikqkmKntdV/XKtSqlH1PctKJIGQSEAPvt9nW+lrfd3OYp+tT6ijTpLGN5jETFIY
+puS4qI6JPjNeh/U9T5U9AX7M5haDBjBwpoyZrX32TJJOyzucRxszZOx+tumncewvSB5SRFqVBQIz
+EEJJYBZJ6PscukSbq8laKabsEjoo56Y7UywlWBW7NNJjksGylLKlT5wG2bOfJNw8yDgNjI9kqviI
+flJEDzmkfTJyOfeHnH3oyEaGWFinoqY9fa72ppdmuTE3bXPfWKarLD7acrNq4YxtmHh1u+oW7O7E
+h0WRoWNnUwjVjSxVWjkqZW0iXoXemQoO1HwJGQUjXACm9Q8iOUeZun7FVYnogNp34D1XnCd8lgjg
+jzcjxKnZ3N6tXhsp/7GzSzSbMKYp0kdmsMuJ4IdJg7IyNBhIQYYYKxhicDoQiHZJtwloo0Zi8gmz
+TWFsjZZI3pkqGxVNTcTfRVSPLaSNCla3432kinNxPFWVFrd2I5T5RT65Ij4SPmgin2/qn9MAT4EB
+NoiU0lLSgFVSK1i2E7ifQiDzGkfsf4LEwZnzSI8CoevNknjI809JPpwqntVK0w0ySQx9cBsD4Dbo
+1og+JVfY+wD4NKrh3FGUWiRQLX72bqTc9HJYySOX/Ia/ukfZe/TF9De4NGH1xhvM1I58H5E/znoP
+M8j0kJDn9X7emvhI3STIgkwqJyiQsKyRJPWpCTm0GxM3Toeu7YcQSeT+r+70Dp9DHleYHfnzb4SP
+PSeK4aNGBqPiL8vq9PpNna/4wPUwkoQEwyqi0zGhR9CKeohXxoJCIRwgTFYQwlHCMJUDYyriAkDA
+O/45Ty9MPKOYl/TmOjuzu345xoDUGMeq7U7UDA+ZEvG8cSeZ2bNkFbxJ2ZooK1iTo3vdSeoAtl0R
+ZSUl8wARs/Ox8rz/0tNQnR4naMailWRhO0jUmiUanewO53KtkNTl7Gx0cT5WOkhJYIsEWCKhFQjr
+JYeyojvUOUQI+uGSSWFhJYUCySSs/K6snGvk2bNbHRj1m26XiaahqJCqk/luYtT1MRaKXkIoRYWC
+v+b6PseftPiC92dzO94zDf9fdlng2c3cbaomSUTUOzrid20ZE5nFZlHhObfWSpAjEKGpKJiNPdru
+BjaHAMQEIYaf3zSntKbyTdZkR7FJInKuLsOUY2PhPdNNFasnuJU9x4MD/m7Zan1HaeKvN4k56u85
+keGBgFixgzjvkoRKro5FN5PdPmPe4VX1cO/uSR4iuDk0ZNSVIQ4GGEYpGDgM4kQOY4MOXq8vXqXk
+WktVllIVIoiMCNGsTtYcEJUUTbEMbgq1TSCiIsR2E3aUkNn9USM5uDlVrhmSxiZiqMMWqmMGLVpV
+YxZjJHUOanwiwb7uNGvlbKte5OnDsxWGSZJtg0vxViKmph/ezZpNppjJKqqsXGMblxSpSKNqktJu
+7NO5WScRu7SPOvhkR6DRqoXYMBjJzO0LuIdmiVB2iPOREtgiiJJ/6CFaKvSXoaY/CsbWxWLbFupB
+UFQVzc2w1p3d4boxPONBgkO6SmHg08kHgVi4kwJyhizDyWgwsVwgMMxMMJLrGTSLYmYjpzLJ7jII
+qAlApEr85qpGIiPjcynCDGDAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQFgw+O3CuHADYACgC2MAB5w
+DABoDQeTZFwgJeWpNqT85bQEtQe4AGkACgVzjp460wlADAfKuei7MHK4O5UNa8Y5lXCwegPYQpER
+AiRDBAsSoUKnJDwjbB/9NP8fvef7f7f/D/58v6fV/9nXznXw/dqbGn7fogjD/rerGlC1pWkI1iPU
+q/CXmaY99Y2tisW2LdcMVRT4gg9hpDink83RoI1AdC1axJ2+O21tksLJw/hWCNxUP+BUmnRiIfQf
+TicoehgYfdCcll0JDuJgu1mD5X3FHhnowkylAiRCUCVImBxmGxSxqkjGoakw0YaNR5S/Ry8Pm3nP
+WWue7xLEW21C3cLb2gW3jpq6W21WsMMMyqrHcdY2AymdcWgX1H2840Rb0yK5s0tSFUphhJ+9Wtsm
+SgwhgGxGoGqSaINCQg4CsxCwQwcGsXwMzvlfSDLyI8EuQ3aiv0YK+dgeQvUzuvS+gTA/LFFK+Y6/
+l7R/pJYkEU+0QfKPNPu8DtMAIj4y41iLTSL63Ucwj7wkNYGKjEjEUDBAouSgSBaMLtdX5Ur5Xuy+
+bNLLJKkaS1k2YbF8prtzbW7akpCaj+NEOUlhvBFhFIJRYIoETkhBRJmC8lVH3D2oepPkR5jpsoKc
+QNn2mxBJCIaGKJqC+LJtu3NwVNkIq0CQIZIEoNyGcTjA6owEKIVqCJw1kToiKU3J+RNQlFokMzJi
+mgcIjMkhylTCqrGMJTGMUxpjGjCqVZedMkqmyjhjScb41ZVHKhy5ZyEYdNW3QOLC2t83RqOnLg5I
+O1Yze8dAuzgNEZojI5QmEMSBIUqwqVIpVpAqJd2rrRRjj061BxGBIBEkWKsRGMCu5VMIlBCCGQ64
+OEwbDNw5oyVVkbKZNXDhSZekpMLJFFVYWprjDVbicscF02jEW2ylQqoqklVSnNiZYpUVxC0OVFOp
+zUhCgQQrq1dWEKIREK6nAyfkrsUiy3pusq86yUyXzvn7XBpUnFbTbWGOKxVaYVWLFWYmDDeZHEsa
+KYWTWk00xThw22KcgTDUDKJKEC1NqBhCgvLGKBI5EgGREujHFVYiliUuHIjNJNebbdIylLKTavK7
+fzZrjK6COtYakyySkeMDnHHFVrgHawtxvWszjLWbwCgU6a027YmZrTFpRG4hOEBIwg5QotsDjM0b
+BluLEzfW++0bkouQRtkTW+mY300gNRdm8XunjhyNyaIOw2HTd0RyR4HlvDQMtuRzjWrHsB2GBvMM
+ILKcMyZKkyS6gxl4CphXJKiEoJmYBIHIUsUsSbKhiqo2uTbDixxTZUUk7AhwgxTic0czStAC4Zgr
+rMHRK8arHYGwWO3fbz4eF62WZj+ZDtNcUbcuETrluzSqKo2WTS6Rtu0mlQrbGRtq3tMSCOJEJtoV
+qSDAPLajghyd8qqQE1IghQII8BkpwskpKGNCQJMKd8D2SOEjZCeER4SLPGwKxVMMj+vsbiGR1RI7
+EsiSG/OT6/Zj/hRVkeMPEKD1RTsU6Cjo5EdVkDxOL2ESisYrGCrJUlwxcVKlMMkqZKktdLpLky3L
+pa6yYhMpZASRlKFwJBV/o0JglCCI6EjJUVgOvu/qxTzVT4T98NPRphqvav3/f1eip3vRj3sYiY2h
+56GMYsqSY3T4M3yrlzMuMY+qvGEQ+iApUUKYlAEPeEjJEViyJ/nqEcN2QGZeVzs4huxpqapbmWSZ
+JJZs8CMTr16jd3dhsBbbXSXG5yVLsFduNjdtmwqVLSqKpCCpUpQQApQSy8wRmZERvEfGlqVZBKr+
+j7MUsetT8iwqcmD237WTIqpvJXvaYmq95fF8UkYhGEoMREjGSDRgWMdwzWUozDhmitfdHufKSDw3
+5ceW6E29JHiiSQ5mifjXOk2WPYiPVjtW89yzs8seNm4+adyzt9JhFpayST0MYpNNJiqjZi8pQhec
+LQMk2iSpl784+uOeeEShWfejAo6YMJiixhYgxAShSHuewmlRr5UiPY/bqWHeYq6xiSy68xKoj5tG
+IMGjIGDR8yinhAjGbIr0RZc4UMdVRSTmVEyVVaIMBJZdXRE1FVUFVFVXyljZL9mGcxnNZRRVhByV
+HFl5oKoqqyKLsu6CqKqskyJAUFFEi/7Nzcc2YzVnxrECNxAogSj86zxsdyO3f778k5cBu5HSOjaW
+VRkOg1GhU0pvLIPitofYs96SRPvEgX5FU9hHbxdAwU0cHaIacVGMifGE/l7Hzvnr4N3zpXVjTvxs
+7THCt9NoiMo2ClSBznP6nf83g3llng/HHsrVDGTnGnDvSIahykoUxkg6IXuXEwIyS0kNkJ1IIvmI
+chajgcUcJYIFq2SZgyLW7NSavd26/DXDbZwh77E9VFEoP8e5PG2J5sZNzHo9jlqT0WIeU8vyMdhs
+oV8qqdTpEvfHLYoOHrHUBmXszAJTFrD0pHaw4kZBiRjDiRjDiRjDiSSRhUOJGMPaXZbtLst2l2W7
+S6Fu0uhbtLoW7S6Fu0uyLdpdk4kYVDiRjDiSSRjK0OJGQt2l1LdpdDdpdDV2l0yW7S6Fu0umLdpd
+It2l0i3aXSLdpdS3aXZbtLpsYkYVDiRjDiRjDiRjDiSSCjIqED7AZkU8aiHQ7f8P+Hut+v2fZ/lD
+D5f8f/uv+P+Xr/+ofz2/+F//7b23T2z2ni9746P6n8M/bYfoqchSfPZEH2FSqJSxJ+BtJWqNEfi/
+iubKiNK734hsOU+5fLiJB4Sw9O7Ibz+9XCDrjk4aYN3KcQtKfWczqKL1ERXhrWvyMxcN1LVYjCs0
+uHhkxZTZ+VubJvERvSnkkcfdMYbKkJ0HOSbNMnCsQOypHK/0Qz95fPMstIJQQfXrip/NUr9w0vlf
+5Mt15LzSlGoAga29ZvVWBBJ5SRHS4gCCqWNzNhgeRLti4dluGSpCUSoiJShshiclI/p1MAxFJLGN
+XdCCbslc8t3EZWnvbeFAcI4TgIgU87cMiCIUKCIEcc8jxCnWpfBMSJaThOnzyypu7XUEXlzVI16n
+U7+M5s5PWZwQ2VMzHe3cSGm6m7q8FbJsKo3fuY5OZgZ1YzJRyIOYhFisUjJitkkIok5Nncxu2MU2
+nNwjU5mJh1bHZp1OTRshFmY2ZiGbKJK48nZ034775pKTmeFkrZ0MkZBURcCEISxchBYy0jHkPZJs
+yWXG3RWSx0dA+AEPJeCHDKGJMvg3HazgqEIJDHCOlGU0uBSgQYns/He8UGTYpjSoW1BgoqLIRFUB
+RsYKSTZsccVsySOHRk8pdp1dZtNOTfIdVPCVpwiK50Tyk+UhOhRdsI8KkVsgXykkNioeIhSSOSiT
+wpHOUk7LBwpqibqnRUmlkbrE7UdXjO9qSN1DpZHNKQ0sSOHixJ1ENGSeXVjlRtDcxE7x1d5Tjo3D
+v6uydyxOypVGlkd6x2l0rw6OGm0dILtNM5JOTZ+w8GDsRwXksYjkdhZPBFMPddmVCIuQpBbMDgVM
+pXRFzyJqpeYBErQk1R3DJDyUHKjQjJsYEdBzZ5CDBuRuxz1zWOpTSyOTsaNG/GK893m4deErZWdH
+e4f9U2dZvjsrmvazwU4qYrounipjg37MaS6Ux0sm9G7o82NKs3LK6taiq71xY0xjlWlRiwiabutm
+aOcs3rStrKidGOSjbiVuacKVR5q7nKbt9o7pYg2VsXdjd382CKMmSTBICFGoZhxLixmNyGAQGKLu
+qKC2SefeLsuEjusHBwxCIiDuIwIOSne8ExXdkcl3SmlbHeqYkcuvGiI4oOiYCJDh6ZcEMQ8wbBln
+ZRMHMWMOrGIxYmWFJsxNVyWaqTZvXR0bDFN5sclNQmiyeaUvbwbLrG5FhwIgjGrydBLSkUkvp9ur
+xQcIJMlG7TptXcckpSqlTHCY72juVjUGMhCIKFEG3cMO5UhG+g5PIRdb6xXbF4rohmxmxVfqscTK
+vtJy+Oa9KInalraEJi7JocRdp7c2hCsWE0GuSYCODBybsM4J2b+TdpmP+faPGSbF4vFjlrm5tk7L
+DhkeZsUctx669NG6u3LGyndZOam1cKPHv3aRu07jvbGlk6WLTh2V3c15+R5GyYlYIh6GGcyHtNOy
+dBD3xMUKuFiYGal5ICljIvJBJjUU0YYQwY4w0pzO/DQ3VXNmjTTHDTEcyOxUHJyHY7nIijjBJvSg
+CDsSFdhIeLROd41OQ4eSskcCsKszPXmxpe4pu8WnZudScC1O5WlGmObm2Th3MmiiZJOhQgURIibK
+dGJIPAjAyywNNi88PKw7QngxXDxMdmm1WpzyQtdFOrubtROFw3hydObapFKcnDmljNLNGbDGxFnf
+18ROXM5O/nB2WGmYdFR5LG9OiXndU7J2yck72EbCudiTbTJ0rlrk5qd7lHRWpFeCJTHFJ3+B2Skd
+6uGzm3cb7McnI3Y3sYxCO5PQLQjUmbJwIqxDO5LxEQUSzZLEHQUxHIaJL4MnJJRODsVo4EZK0E2S
+UM1GzcuzG7Zg0okM4NZLsJDXcjIUdExAI0Y4J1M6KDckxVzJ5Ex3N7bc4MdibFZisOiq5M05btaV
+d28iZwmNVIsWSSKoVUGxju5NSc7ImnLKS871dzE0ps7zPOp0NurOR0cGkYMjNmgGUR5GPAzwSFnH
+YwYGI2SFYJmQUvzYlIUpupQypJfuGe+8rKNzNigQJUpOfXFdSvPpa3y6dM5lxzbNWHpsjrbt29Zi
+UZejl3TtTiAaQSJApOcOSixFZBhClOdmc3i4OWc7iOGuWQMDAoiBKAhKAzLgURziWYwW+OebWd4Z
+d8x0WbXzZ07ttQQ6wiqWEkUqIsEqOQqGAhBuVBDocHS5ZgG7FDLWzWg7BrIUMgTY75Lctc9G0BIN
+cBykBiK5yG+Abh544w8TAUoFvl7xe9kRFmxiiYSkkgwCROByVYmI3BAWXRCNE4xreKETiyVvTdwG
+VzuuuKeVEOEcqVqtUCJ5stt883isK7kaqAuSd8vninlRDjL4rji+KjlIRZIQEymlvOzT3bwhjoqv
+HBva62KGOHUstITkxACWgyc1nOW95MlmksQZkkhEpkbddySThWtI6VTThIhtOn2FeAbYoEggixre
+wZY7MMbL1UhO6zWnG2Nqb7qw1Y3VMplOK762o23hy0kMp12wndXTbCNq5ZJiu1x2znmiGab1isgW
+oM0a7G27NYazcuJjqzLqXlRe0jbC7jmQK6IKB54dDQvEFFa79DUobWZVqcqcrInRsEQnHDaRyWBt
+2mIxoOTTWOjNEcVlRvUhxXdXdYjfgbpwTaXmxPO6p0ZgBCiIDjqY2gk07VKJUTyhmxxo7CGGw9AU
+ZNEqMGh0UMQjKJjoQWM5HGFR3MUTRYjmYY0iduTkoMMMGTBsOi4684wroxjtyY+Aa314a3iEcsyI
+NuYA2giJ4XG7x0hYxeLxRnciUWVkaMal6xvxs5iGUR759C2q7ePfyXttJjpmhDoKJ39gLkqESpSD
+SHSAwlSkGkM6GiVRF59BcI5Omhg0Jyd/RZeWMjjOnHf37cbZxqCYJGmEOXfklWviaQBVSqgD4u4A
+ABIVUqoaaSAFVVVZmVmKEwg8XTXTpx05CBwQmSZkt8EjgooZXRCEXWixUMksCFiGlheF0hI3AebW
+3KCKdDgTgmlAQGeZSaJaoaxRIxAhC6JDo5K3UBOBnBwwosQjnmuK3xeaQoQWEBMkgQElCgcRrhPl
+QVEOk6QGBI4gsHURICqAShxz2OcpqDhHgTmuDiSCTeIOSRJDaMN/NOCNNFkRyoS2RJVBAapI10uu
+JiCCId21Kq6t3d1ZVW5GrlXTq3LRNSxFVbmbl1cq7t1bkai7qqty6ctVbpEK6miompsV1aurEXVq
+6sRdWqKLdXLqxVVq6sV1aiIiIsRB/qxBGpavGczWMDJOtkTKJXZTClAKU6dRFSqrbbeCKlgHLltv
+z6b8bcjv1II4SbZEQ5LBGiwSwb7cQRsRJNRtCCZBFiO7XDeQR0zlx0358hU2kJJQQYnOunKG0csm
+Tm24dZIjBsjdseEq0mTtHY47TGTZ4zaag6RtHWSORvDWBj6DDF4ReSZp1EZidA5bVU2eYV/ElexE
+PVEUzFVXAJwa1Vk2E0I9dckrZVSVk2VTT/oGpJ3kd+NileMnmhvErY2FU6Mkif1k/4v+x26unR6Z
+zj5KJ5voeUn+/mkkP+Z2hO0E5uhXVIn/JHip57JhELFocHAIkjS5rDDcGiEMWJ/fIWBUKSKhYKhd
+MgdeEuTwEEMdxmJEkg8QgbXm2xPiog02sm3LNczd5JG75dctU2d7vaK5sbq0rhUV9Bs08Ge7k2Oh
+zbmlrZmVTwrFSqmmMOinJeTgT11u8Xzd2z+tXZKVLSL25vndnibuGEV9upx1eLeTpG5lNLiulclH
+vbOapwrhuzTTZtIXlMWqsidRXJyMrRvydStt7i13tI8ngyHa8y1y5JpTGNNAxgQxkiJfhFCEdDOq
+KCupFgkSgMCRs3mKLEQjSCbFqLJIySSBwKjZBvrBydbNlFZDYyIQgNlE8QggoREEaYTFkUcsnhrZ
+w2xw7jlCcG/NjToqQYxwj0EbdGWbqo16E2UR2QxhwCYVpOGdG5m04cOatMKxsU5KjQIl+gySjhGA
+RQuhAxnYZLO4xnJ5mzjg7STsNc1tHPb5FEHqo9y6U5eHOyyIIiAUUqgCFoqltKAFiJQAdcmZkk6T
+MzpMR6HceCPMUE9r8gReK4fYF8tsiI30Nf6v9O/Cno9Xc9jQmzZ3Pjx6QkcO5PkrFGMJDIxVVkJg
+mLLJFYZSetPSRzJIiLB0bPee4fWv9/Ae0CAYr6ETKCjJkvwJrppKkxyBBYkFWCYaBpJEUXC1qkpk
+qbXTVrVySmoqaSYKMFERRE2UUZNKREg2k2SbLLU36vVcAAEsADs64ndkpVjDFq5S3CJCMq5ZlZbX
+OHOHHdkOcODE2rSba17WWtU5RRqZsYsRqgiSkpppioSVB8DzDBvSBD5dBZNRJH0qVY2JFQX/s70Y
+aix86JLA8SRpE00qz1E8nLlttED2RFfw1GyOh5kaSQ7zZ2bE8QeoD5Dg+mPimKVFZpgjnGUa9Jo8
+ixaMe7a2tTq6yVRWtCxkEEZJELsUDsE+pRIET7fSgyVK91eI4iyEkkh+9IHnKjUE+SSeb2PYyT2l
+HRqPCeMlT8rdRUVZKshjp8W783fPqX9n+ODyESNn25GtnfzfM+DTUsT1rxsMrLMzFwxZZlFTB7T3
+Glf9EHBLQ6xxpNGZE1mYcGYDUFBCCkhh4vn0iPBAtTNIU0gyhKCnIQTsIX1mgOSQ5wh+r6f9ZU0n
+Jb9LuVUqmmCbrPD/vNxNKPBs8dNmqZqslkGqkxFS3GKuawwsrsyY0pkpSsbZJipgliac1NYyOGxp
+oZRIWFicfnTOrUEaxkkQlal46tGHIxMUSOyH5P1W/HM0kdXSSPY7Ps9XddNlBO4Kc35kIqTUn986
+uisLsEMdMmp4LGN95qMob1Ek0sBpiypr0m1X2nJ9uHmLNYGlPc7X3WkPg427NgRRrMjLHe/4To9P
+JffiT+Q9e9k+V7U5pv2nwAIegBaFChBglUJESUpYqJsnKbaPypGnVWn1Eh7ntkfF7fcPhLFRg5GA
+aFFxCELJqWcyKYwV8lhQyd4mokiFk01sxy0wxTTSoYiZtUkEYQ2VAVUQ7BprgrZOalbo5K8Si+sv
+ghpj21jbM16Zzk6I7SZlCKCKHCEwkpVjQ8+8zpTFpuoaMOsYbpIwqStfiHpDSFs/njm/g+w7JJO9
++1TyPSVST9apI4aB98KpQ6SEJdED6wGAkTkG0S/inyXeVg9sCrKo44gDvFMhRhj2k0Ow9aSiqcln
+adH0OzDedpo63lNtKYxZK+i66zs6QrpXRv2a6ubqU1jeKxkN2mFdybMBpElFmYVBgRBqUqKwYJOY
+zAGRBlFGzJwYLHBZH5ZJIsmI55p7NzBgUVzdjhxL4UqsdyqolY8tzDZz0xXVt1biYJ4LwdWV4K1i
+5l3d6b6a5yiFAWrMMYxyM7EkKAURnMhwzA41AEC0PQy4G5MFdDycFgZEcljKEBwFmhliJHIyTiIA
+goNHBJlYu4hRVMmBjYgsRvF6EUFjRIqB6FiyICZTlOfMQ685AmFII2+wnm2kiNrIBtKVVbvaY0WC
+LInOEm8RiSc0HeshVTqbEx5QSZBui80OR3GlXvNhwc1EhWOgro/4BIhU2mrEY+1gmRBKDVVZIhOQ
+rAHl+tzQrI7fp+DzPyPoST47CCH0dOmS2MVZUeWKq13NvJpN0K0zfTG1DNsgqspVjapmsROjweTJ
+JExNnCaqFlgnvYmKNhKcuZMSen238D4GuOEnhBmHSviAIKawYn1oYe2ySyEI2YGaKDYzSGjhSGig
+4B8CiNFaHgkMhgnjGNUkqKLsUf3hawaNTyzcfumzgeTkoHwBQ4FlmOiTkRgdEmFhRpDD5Sxmzmcm
+EdzkoN4LMmTQfMHeNF1Jk6OBxBgskNCcZpkyxxQIUiDZIOeBIKJceIjRWDvgyhw1lyI0AwMCD5kD
+E4rgo2eH2NmA1g8jZ0MwiwoRgRUKSOiQkZYzZnMbMiOBGDzKGJCCgwvUo7kbvG980yXBVHMncZRL
+wMszNii1BkYxCGYBiMESeQyooksyaWUknEHcbqARjZcQRdZBGMxBFy8t7VnSzcRoskxOtFSKGaYX
+oyXRgzEclFDKAYhCDdRJ3ssGTIorbkQyGUMRRQjBsoNyScnOIje0ktRgiKhUQEFZmUQHFNjjGy3U
+zM3utW5hPb8MiRI7hO9OinPlPBClek1BIkyRqdWLiXdSbQY2RHZgD+Q7l3AUvk060mR7gjWaHfsk
+tfV3nCeRvN40Q74d0snC9rqV7egURTHuqrAn4veNHBb8rs1xbDR92jYvDeZpWVa3ctbFVC7NTsa2
+VCwMEokEgC7kyMaYWBVJVaCkKBnocgHQ9ODRw+9DxChFqYAAFKaAFICAEkgIZFTMwAgUobQAVmsQ
+ESQAASzYbNkgAkmQZJqTYNpqUG2bZMAELSyAzA1msAAAMyTMBANmJMGbNjMyJMwBB9urZsH/t9Cn
+0GtneL3SR4MMKPREgQPUuKlYEnzBfm04kU5rV8JkuH/dNMEkEgkCSEy+tdfTb1sTSt1UqlThWFW2
+5IEj3KnCbxPbHP13eLtI7SSBJ4PvWY2iTc97k+94bN0r2rN51KilSVUVVOjmdK7aSrpaSkkk0pV1
+qggJhzQ9BH9kcfl+5+rK+1DMDRx9dP3P2OjRWrJPldT6Xx04WdDnemk4FjlSv8WJHICuzHAiMOhr
+RQH77ERJQSRRYIsEWCKSJZCLIRYIsEWCKp5vOb/cZE2r2Xa7QKlNrAYSM4skpTmYTBRWSNxmixSi
+frrd8InRPNPtD+ij8Hu/RT5yQgZxqTLMTBcMMLIMghzExb9HV8/5NA2/KbKkaVEwSO5WI+Larjqh
+/uHBXDWGmTUJkYRga0QkLFlo0xUWpNLFJTFYsdKrCmpMIwIJQHFRWCgW24sy7XYqrtd0aRqjLpCM
+5sY1DKWVWVSRJMZkEbacK29Mbxw/36aRurFIguViEZJ6MkyVpiZIRbTmLpFMSRTJRg0mTEaMXJAN
+E5LhoMElSaUrRiTBklqyZGUZRIk0iy7Vqr10ia6VxispvVKklUiqgoSpKVFShVKskKlKHZrGlkkV
+SaaZNKbNMVRpZVVMYxVSpsuk0uYYZFclm7ddnRs00YcKUUNf1uTFXQAMFREwiffHedCXJFFJSEBo
+BWgEKUFAJ6cGdSNj1qSRiKEQ+NIhlQRYpEMSAm5FByQVoVoEGhUQpAdkIHpJUEDUKrQqgHgYjinc
+YvEo+SVBOf+UAEMCAUZEUhSkKVCwRSFiddoPqgjpIScoI8IIs75IWf2K5og50ExOynaD44mPDdIT
+InEfm6Iy7DpT/gbSTdrJFgQpD1QdDEnohMPs88x5a1NVmYtC8t/otaedbwtsfPmdIxIy4iI4ERsR
+B+IRyZWLKKTULWlaEXggA1InXgtUWcjxvpPnq/dvGvpwQkUhRjB8m5czMceVFQ57KbxJ/YeLZfmA
+QQmTltgnkrzVy5N1pykkRJsPxbOiMFHGF8eGB9oEEZNIZrOiJi4d7YSuaM3SogyInhjo9u/Rxip4
+EQSK75cjTzIHzEJz4yMYEyYKP0qqaDuoBHZEk/BUFTJUNzMMdnTtj+UwxQ5Hxf5Q3sa9d7+JHIzR
+T6ZXBUgrzuoiPF3vwRiRU7hw3K+iNvqWRGEb1Y8X3OzafscIPY5Np4rET34QfCAe8vJDigkE0yRK
+sMTwU0o1VYzMpikpqKYhLrMImr3QGIswwJSBAcWtYYKQjFKrrSkx3tKt4ulcKy6u11YisD2JD74y
+vnICFAnvQI0yE6KQ9fBn/kU1XfYd9azF7r36MVkra6CFCAu2iF6qeyCIEYIj5Veyx6bQNpISvuKP
+BUHKR29rIr1mTk1eXFa+0vvftwAhA7a1925xHo7xBkakyoeD7VMJq2p3yphHhhGKYQ7IGIEIgyyY
+VGD7JwZdWCYYJNgxBgZhmIRlh1JK+byUt7Zm2rSVS3L0UyDRAJKSkYYq5IjAJEyipKsWKiVTKCXj
+TTjTaTRiyJGN7k3KP51mKpVWWV64wYpvk6MCLCqQwX6SXI6smIkicN4qwUsjUnRM1Opu9W23fyr9
+2xw3TglwO8xXCEIJFiFU8iifGhJzskfYVCR9lQ7LpUg9p3uEk+xVFpQXx04PkGQDxHmhh5ThHyjK
+eCvgQnkhwl44TkdCMiSiIii4L7CSRaqaJF92QaWDSx4KT5ny/GHSo8EnJZkjMxDGQYIchU+f4PMa
+OUrqFi68vS6OgNq7cSODNFLtJ4j3yeSRD0dPSI5LrYw+9Zp7t01IVHiWPBejZ1TpB1VJndJznKS1
+zlPrRrMsdogWbb5PGX7+rooipXL3O5cqqcAiRiGHkftEgFUX9erBFWrmZSUpKJVVVXxkJvSStqqq
+qtlkZV3tFdyUtkTZ33+7ybPB9TxNLPxsxH7ldtIxZHLGyqpOvyw9W/n5FrmyxYxYJKwGJSxjEmAo
+AZH9waFfWcnviPOOJEySFha5U4zI9H2rHsPyUtKV9sbaMWCsaabP2sNCpDcsbLDDGTEUpoopmEWW
+LS4kyRiylWlxjCXDDErfGLRBEvuMBxIIaQjcYSmoTFarFbMYTTGJZMN5RttNbtjSbomFFMpcU3b4
+aYYbFrG2mxhERJvcbNGYxAGzg0aXSzgE0WiqbpqME1N/jKmSaDZhPueEagf94VMcP6GjUk6ICwRb
+Vhygh9CxI++kTFz+5sj1KkP0wuJ5HDTbJJJP4pQsokqiqqUJZKWWykltskltlm21lspLSWSSypVK
+S0tlmpSU1SySkrJJSY2qSyxLSyspJVSJtJEIhEIQsJEohEgqUBFWC0FlVUkKpJVJI6qdK0mqS1Yt
+Umsm1JbYSJEjQImDAJhKkTBCoHTXU1rdKvuIiKNfL7BltFfQ2aaGq8F/J+OR5dHmlSqLXAliE30u
+mJPUzVPYDw9CAg0IffPJ/1DyEdFRPM9VMjKsyYgxSVLaVl0okq5Rt+Wl3ldJb4Vt9/FEiMhumwiC
+jRLDhFihDnL2IpivDGiEoaOFO/Bj4xjg94iOIg5n6KR/aocFX0l8TTHsrG1sVhUlanqAoAeICK9T
+uMC1FL3lJpJZZU2RtpElpMsWZqVNMoZJUtsUwyqlKqqi1FKWWixMe97XmhNDZSpInOc2QibtCbBh
+psogwFDFWNkgihEg9me0+MvCTWKHyZbRkikZIkoAwjxlDlBpLuchTMUuDCYKaKCWBvKipoJ2YQc4
+MJf/0aw7zc6rbf0ZLYerowp1cnqjY02SNp9v2vrmsrxVh3Vj7Fe5wc2Ke12W1Gydlk/K3ifykdIJ
+tDwNlq2SR0/Sxux7X1G8R9hkVsDl0OiZ06nCphSIkIRIdNyDgr/KEFtEATNsSQiEdmP6NMV/O1id
+mzFWar2KlV0VjxmQqq2G/eqbTwdxIXlEGxJ7Y3QjY7Ox6FP7k36keKXuOPGjLKPYTWBoWZmLS1a+
+kmsibEzEmCYwkwggcxTAcxH9/M8DVJyeJciWilypllFJmIfAmZEwmZE5EzInQHMR/gtTRrMba4Ua
+xwKA0DrFcIGKisMRxJmJ5h5lPlj1H1h3aCe/Ke3g4aRVTd0NNLOKxuzs9qTSRpw/eE7kO5bCWDoi
+SVBpTlonUf61fM0e0pMWU4Y1rGKylXmldoe3DVqODDFziMoCgyiA/vlKdxPf6v3vxlgi/m2anmlr
+bP5T+u62T7W8FvPTfjfcttcZqSStBQCQI0hSCk2hsZjNqCwob64iFhgV/BrloBJkmi3xZkpZnM3k
+WghuRicqkAtY7IszDUytU1qRpSZcVH6lByLIVLANwiKczkZYGGrltRxiIU/DNd1VcYq520NhlhxY
+cbN/0WG7gnLIxuNZozlhhrOVsj4/t9qeravqdAT4GGJgRqVnfPC3uz986P9vITkkHVRKqT6/q+VY
+rKIZWYCgE9kHec/cKOHpK+BBsm0kyCkNy5JVur6er8PulbxR+SI7SQ6/a75OjmI/hv4v4ylifnkf
+c/EiB5wCTgmDJJJIWdycqWyWROIBySliAfFkdELwRgQJ8Iq2xjXLfCrcrzReYLmKHHMVEQcsgQ1C
+AK6jURKGIMjpgejhDQoGBoiJHSH1LkE0siKqIP73e5eVV2kDKhEpZBG9hN50JtVUFRTtE3jnSF9H
+fw+x6k9DvE2RS8SPRk9jSyD6RDmEK/oIcJHCU26VT5C+DCzKS5mHyffkmr9Zif60+z6B7m0lUfF+
+TGvtYVW1jS+glJJ5VxY2fSplbZCYsEEMGQoPMl0SIhojCRIkI+mp32TSk6YNpC5VTgmyKk0nf2jv
+HR+s98O6aF+Q6qe/s97r2U/e9ro0EaxwxIwih7o+jD59bwzDGuCo5FW4u2W22zG2bn4PmPnv8Ds5
+vk0/qY0smsT7EJojCByPh8k/ZN7EoM5//yeXh9v7jp/y9Xrc6ATxpi8W9IaMO+MN5mrKZKNOYWzJ
+jasbZmqjsshu/mhPkoivysypLFzIwKkiiygZDINj8VF/PB9DosVA8+47v4hV3qB/gH8p2gJ2fWp7
+8HxyjpYY+QxpHCTWjWaNEjq2QoYECnypgbIy+ggoGLYpiLEzFbKxs0jH5Tsh5fo6VV+1w0mlbMfi
+3ex441N1cCuIxdowv4ueNGmsMQIRkkJhGTJDMjLWKZ+6XGDo62VmxSMPfRfpBeDHI4uvxnBQhySS
+DOTZk0YkEPpFVlkij7ie9HDJNnto78ZMHRcdHRoZbODJ2osEQoCjkgllUdDOWaMFHclrTcqlamNO
+Nus5tjgzpF8HaclSqAoVaaQ5ICSZJ3Ry1m4jDns4NnBBwYbnDg7LuI2bIoxM5VTFFEAEh7L2t3xP
+S6m3b6u+Ve2eYA98vdT7X4HRoI1D7x6VYTgVR0BwXqMcIjyHNOE07CDUe8Ktq1iRsz0b9Z95qxmC
+WNEypmqr14rmCSSxsSj7xwTDEoQrhWDJPnRJUy7KYtNsNGG4w3maspi02w0YbjDeZqwpi02w0Ybj
+DeZqymLTbDRhuMN5mrKYtNsNGG4w3ma9XwnP4DhQPuAlTzfcYAJlVYnAhgfXArdnd3c+BgMkn4TU
+UNPsl8dAJRwj67OGCHDwvwUVmGH3nJNXnZPoFQcfM7X9d+uWRvC2HWJH5C0SmiR86MfcRg+hHaOl
+0EDqxJ0r6p8z5a4tnE5TTRWqT60gcnisakxRsW1LWQZKtKatJZSqRLVJWktpK2ZgAiEKIlSlSolj
+zYKphJSWtdLcsapLaxk2upV0k1UmqUa02smtWUkwwSgIRDhIpkIvzHsg8Cgdkftr73EOzR1e9WCS
+R+L4O6J3o+Vj7kqqVcxkGWEk/mUiP3Q+xT7009BTuME0nErsFf0xsThfrAiIiCVqpNsSZKZFs2km
+okWKRSFSL4pDESBlWEAETUq02qZVJtbaUsapVkhUKlQqiKhU+pie76V2aiuAfyngH5YtWylU6rE+
+k8L6FrkxE8OI+o6mNx+Z9fIkn8FSZYpS3VRtja3d1Sm1NWxQWNFEUSRiTFFGMZrWfZ7tIC8hR9dx
+o84tzjWKb6h3+07qeZg/wkaVft+8xDlrBNl0nCNzBIoXYaNPQUTQck2cQcGRQkDjCqOz4V+AJHtl
+ExkKACkBUZlUIsyyzM8Gd52ABETtZu6AKUAAA8XOc5zm7o5u7vOct5FKGXNkJrNfnSa1rRDZD7PO
+SAZud6D4JJH67I+sStlkk4eQTs86YHpVsklkiiyx7WkB/QRU8WxG7unenZkY8xpG7l1qxVnpEc13
+Gtok+FieQB2K95p2M8z3HyHYQnwqIPcioH3tPasT4PBv3EmMc2IjzkQHJ5/nk1IQklKGSZlmAjNK
+EB7Bg49lS1KVLFI9CxjOTNIp+vTDZW7eY7LNt12arMMFlNGmSrJVGoJ5+U1qYfH5K1qA5Y9AzHrt
+xyp8dPqIDRIlEEQ/rIF5H9fUHaMJMilKqwqVO9jFxcwyJI33anEg9V4ByE48m37/owHB9f9byO05
+8h96xcxoPyLn3LtchYlpa0GQl1WltBTwuTQYGTi5DEJhGzBINhhoipd+9zno+D3OTj9uPMS7ejH/
+ztnRUramK+jRrWMmFrDB0Lf4kRXD3j4Bwu7RzqtyGTSkWRrWanJ27sMBiGI8CpHwUaVPYps3V9Ts
+rnEhPfYRzGTnZrR0N4u4whKWSOvZs3m3iIllhDqu2kxxWSS1JCV1MMKlgpsVjfJOnXSt85dLelc+
+F7TGaw1rYxjDTRYiWmKxSVg0aOsZz40wNE3IwSNRGlpK6ZiVmg5lwmwlhqSI2Jy2bjaGjlh03Ynw
+XG7ELZGLJvwyHJVbYHNZMUq27GMWrRzLIOWoU2xurJRkeBwCEESUTJlt2hkkpQTEIiZ3pMJIjh4A
+QkNEEQ5aMJVHUpFxZJQxAiZmlDRGc5FRDR2Ts0Y3EOUpFl0CIEtK8zMQ6QiAujWTxOYYPLa7YMXQ
+cyM2EE3Il0kSazAwjgzjQ8tGRJQtGZmTkawMBATYSgnTkmKibVQ2GhgLCBgMfEjqIeXbW8xxmL1U
+ADw+/RfA9MF8d0X345+xfjWaeI6xJ4Q+ayQm3zB+mpNHxkebd4XwyLPFmlo/z1PsSJ6Hhaj5kbDR
+kSAH8hICjSwUn3GZC2GIiYSooYSZC0CGEqd4edVhV5AMUeL+w72z0nwI5Seyu9SR0cLDkbto71J5
+OKvMgwgXRGEtojA0higsSAkGS4iiMyKIOlLGRENkiiuDJ8t5MwxwbCpxczMHJmXMUuWcayf0FdWm
+JVbUzMhbGCqKyzSzRbWtNNb7TGi2xVVqlhjGNaRNJtlZrSZmXDTTc1MTas2YyKaaw0VYr6NYjaqv
+GY3Vc8w2XqO66hqyX1XdJanxYLg3YNaVn5WOaUr3MxU1Ym46w5BywwJOZhOYjKHBO7rREW4giCjA
+cngwNWyRYg2bMN06cCKrNlm5m2hcizltt2KsmpdYap0uZmbINxbw3GaMMJARByfe7nJS+G10pL4F
+FvnN0vlfK5yiRFFwkNcGjbG8LenDYVGxxcMSskxjFtqzamKVwM2RR0ySdc6c5aLVIIWs67tNkmrQ
+sKrNEZNiEjoIHjHvDsHXbDB3VSpb3THJV5GjTStJiaayaMmjUrNMWTGTUBySSbT/UOQkZNPyf+fP
+JyVOnM0dQ2RIVEnTuwRowkabMauyululc1RtuyhlFi5GKVjDdTSlUqpqSY01pZk8j7Z5OpvEVzcQ
+8IsaHxpEfhII+WnRHzafA2Koh7m4gARaHmAn8/agJZEBEREQPAvHNRD4IHp9+16refdIZTLKn+X9
+n/9+X/HnJ0OtMLH9sWdlSXuyf+H0SSH2PVj4SB4rCvrUEMH1HoEHB6p4gT7RgT6wIyT9f3/v0p8q
+tOmEz89YpFEixSEaDJYYkRh4w23bFEWZrFpttuodelVSqqY8HFYtXdfzkxW6uZl4gwTi7sYxlFRA
+SIrC3KT1Ou91L+w5Hm8tMJbOCPiOuk1+BjgaHsTWgkk1SRjUn8ZszaRtYaHkVOGYn5T3q6idt1rd
+cuTOK0aYouMIXKtusf/h+H8u/MS/wXK/hVVW2oc+Qkkvqtzpbd9T0RF7rqLspMcQMGlbwSPBqUgi
+xvIGjDrGNszVYam000Vq2KyW1HyEj53yWVbJI9Ffm0jFKUqoVTFYnZ9mGGhwkYkEGTZLhJEQExCa
+IMGD2GsDQTKpMRC4SZJmUyWbSWLJSU0pfLquUvXba6pL0tzNZSpKa9EN2MVapUpNTHESaiiqsVI7
+I0Qg6SJQgkxwMWQdEMq+6SH7ZIdft/1PE0s/ifvfJJ/5FH8z9jkq+yz25FdGavYZDFPrrClUbpum
+xoNgQbKSMCKT6/7fkFqhGmhDT4nocJU9Linm94dL6wPY8eqffP6w9gc4mqsek3j4aJNokdwWSx3n
+Zeum7RqnSmhfbJaDBckoJLmIxEWEiHBYKBuljEHISY5RpOEFOEIlFUkPgmCA+B4giVIhSgSJDIBD
+En+wLquhA3wYhtRNHnOwUVxVkkjo7KTJ+M/J3dpNDntp6q02YsPoY7nJlVsu7Gl05I5NMVNXGRVT
+FbPY00relsYqVRys3XThrm2YqXbJ9nU27XFasuZVy4tVp4MyNmzT4vc31sggngjSlJozF7TmYuj7
+QwiMqiywqcKcLNXFjWMK1uWYq4yal0pGKjZWGNmNJjYwXVq34XDfHux6Q3u6V7uTl0pOXTb5Te8u
+xa6c3Q+zfO6vSMJfEOnN4mpUzU9POlxXcXM7cl3a1XYxiIiIiExERESVrJdNt01tvUaAlOWD5eLb
+wcekU+fy1VVivaP++AQdW/J9D8Fcp1fNH1uP9nxicJ7CzL9q5Y/CyoMBOhPzai+qy7/q05ainNa4
+25iW//XoNP6VHq+Xskx/lRhtEfBw0OB6UkPY8TkPGo6iVygSnosbrGuJLIYD7VP2h2AHcQkSkRCy
+IxIotaiOB/QGnR4r5+vh236SRPBTqsgdBI4QIasdaNQSuiB0QYkkQgasiSdFEJE4ksbneqtNJJen
+9OSeM9hiy3Uyszv6DIo78DFifFOWaYJnFtNHNmRTdbFYtsVWlcSC03AaMN5jG6SMKkrW0+RtUEa0
+ZoMheciY8OzNWM4OJhRkkYyHq9B9j7q0k8pprJT0pTCboehgMWSSrIgqSUrkVi8ksYS5X3MTJpYx
+U0ytHJsMiy+kTlUc1kIknN5xfBmJNSA2fCT2wRska2hH3OrpI17kiuEnlWzkMB6AUFiCiRqfcf3L
+ZatKsqpUISEoDMAx/scwhD2p1UEw5mcxJPOOzv7OmpAmNK+B+u2JVLCxpkSK/ToR8hGfXo98z1cB
+iSPPg0/BWMzaal1ki5LPF+zUfIsEe4Uej2DUQ9Gj1JGoQ9zSVZUspZYLQUhnQoyDI6wE+qBCpIC0
+iK4aU+MTRy5bIPTg44AwUmTWS/B1PxeR+GmTyw5JFjybR6Z/um0PGSo5XxxI5maKfBVPQ+8fybS4
+PrPIdj6E85YQKI9fNMJQCSSIcdWWOyygKGUCEEpjTGJj+ZjThumGlVUjGLV4TDKwMaabNZsUbMYz
+MXZtNEl2yOFkJW7GkMRIxhsmipiyJWERpsm2qbKlbKyYoxTbTZcbW04fqY2OGJtcbuFbybU0Uym7
+IEYalb1WMbxUV72xm7aaSN2LhWm0w1mxrFbKaxWRmxpLWzWwRjUZjZUVRObdtFbtzMsb3dppdtmS
+4zGYaKflUag0MUMicCCXIWyRJUUxkkoSJjubHZRgU4aw4ZSRVjmpjWsNtbN5iswwJiMq8tm43Msi
+yVEXZsZJMmwVs1A2mkxs2MkGFMVNZGKSR0OhiASkYibGUWWQQiLEUMkMurq+Kb4pdde9ekQkSaTW
+STM2WrNSWSRKyVjIlkRERKslE0ZbJtlpKSIm2RNsiZNKsllCrEStNmzWjGYwuFbMbGNbNtaStN9m
+xQ1UykyWVYxZvSTSkmpTGRWGlaU0qSVVExjpdSm7/FhuqbLNqNUtjVy4iZjkaFwh2YYxERLs5mcA
+awxLJNTRtNNaPyU0DZFVYkKWSSuGM3Ym10pspqfFczkzI3zIqxi1VXprbXTbaNJkig1ZWBkkaBpX
+ZCbGNGGG76NYmF40rhyFaK2RMmTMgjDMlMsTEEZGCZIRZOFYgixpUK5u3DEbFtjlby2ypRVappgm
+SSjKhbJuppStY2VMlkiq7Km0pioTRRimFNyq6UpZmtl8S6X2bq4v3TsybORcSxizJuomUI5rBsTq
+w2Leq3XZMRkkk0lJbJLS2STJkkkvbSvl8a7Tao7MaN2zZka2YPnSorqyIxRzU3BQlzDMmgoCJcHn
+gGMEa67Za5TrpZq5RVFo1GyHWjNQUlKkSiJs0YQ69H8Hd9xz58FSi7mI/dSsdTEXY3JSLQR8nzoQ
+p+4/EfOcbNRuOI/BURB1gueK6mI/SIRfYZlAsJbuY4QpbIswoCPsJmI0KOJN6100RLnhEuZmZmYm
+ZG2wpM4gDaIm9zM4sQonN3UBdVTqARci5X9xyTCaq6jZ9KIwjjfDHLZG7FmDGMOA1qTGyQtGqMsv
+cwiISCM7YwQRslTFrG5mZKEYquQowQOSlF1EBIogIxIrtxFopR3S+gq8fKDbYZ+c3V7MoUv9JrWv
+zHPiRIhakIOQ8UZGkksa33aFDX3fXyHYzJ85Bry7A0RDCQIz1QRUiFiMwgjmUSNKcz66IiYopKQn
+Dg9r78Lm4t6VPhbZH3hLGSFlVLFUJ9aHkqsQYSYYMSnSHSIyJAsSv0AFI2InFqki1AYRH2Klgigc
+zSBEQgOLZcixtYlmAVkuoKxjSyYoqw0MsmqMYuQaRDRCgmE6l0RqTSgMQDBRFBpYapjKYVLJKuVl
+XWkKvN3z9W3Yyk3m2NUaJXWS6ZGa5aGrJFbrV2FouaGiRrVRbDFSSTMGZktFyQLg0mRpdDJlzTNa
+RljRpZKiklLrQ0xgZoyGJCssksJsJqSJNpoiNmx9BBwSiRwqYQdEVEOHG5DGlkVZEtqSkhQoFTYk
+xUSbsFhW7dZtEmIMrQZMmUpLKbIlkTZNJJSZLSZSsnVvV569K7rYiNiUSKUiLClRKKlXIm2SzFVs
+yi+Lt0plthRMIAQG8BAoMIKFViVCZFEpRCGYphpRAKRSQVUU6MR9imljusS7STk0kbQyofGQTCok
+kUcwURwUUxB2RER+k5vuPs6uXjjgxBh5jWig96/7CTvUHvSGHuUML8CVchADCQTFQqiDGSRhITFJ
+I8leEg4bh0j4jipiroVhUjCMObyDBeNo8x/c22N/J6NmLhheTWipRtJxUjZurNLFKWTcEjGOTUmx
+RRShJIGUYoIECAZA2y9QkCUPtgV4JdEYRwaOFhRSGcTqvYh7ZDD2Mj5x+HZHoqIwMqzMLxqrVuIr
+eFrCvGytZRxpATaAnxQIlINIHAIJxbERc4oqK0uray5ctVbcAYwiSXbEdR4IyF/KwgT0VFsSFU27
+J3a+C+MgCeZ83MxPvJfSSdYw5GEymEuDDWSt2RI0pjTThZsNKkb3dZClkUxJDSIbmsJsxsqwxJWP
+XtJTKQJTK/AmZIa1WMzColLt79GRN12rSzGmDMwl0WNJhGpSwzkYAYbKZwI3aoMYNGkNUNIwoKFg
+YJEIgqyRBQR+qRSI5NoVQ2hERoxSWDkpEbRJFRV4bSqck4YLKhpK2gymkmpJHEEqQ2USCEg+Rf24
+vJ2vcKR/ulU5KvIrecybFhMiMSKTk+qojYUu1Wz7p6OMzPxayKWQqYe5g81kT/IxjiXkFnPDGEQT
+nDxKfeQauU8odEw4WW5ZP+eYH+1tnNNuTTFDfSaXSUZR2GGPpkU4INXEnYEPLRg8xU4NOu2UiEwk
+3wGa2sGfp+k41R1JUe5Y10YhHJUP99R0s1LaIqirCZmFqZ2ya9KyQ7rHWppzx00xiw1LvpGmn91j
+F1cZdka03MNLKisUyZU7eHDQceRO3RwPBin3n+MlMYeZQSpnvH6L4kiiGA/C/Nr5l7iUkiEgJopS
+RpQHEQcECQSEDEENoaCTqMbPElCCRewCVV33dU1UQAAAJBW2TRUIakJNjeIaPOO5JN5A1AhykESI
+UiRD5PWs+gjERJQJ6z1T+lKYKxVNVMVVFLMxgQwgkJoCMidMmhEXSiiBpUDSqf43HZsZUHWgHaoP
+0naHMht3wUhwqFWCyLP8iJF7E8UBV93RUP0DpPhT+r0Do+EBDFXxOaXlPAkj+jwf9CPreL984JJ7
+0/armLVhOZWxZojwe1/oPvymY3Tk/3MeEQ6HKJLJjdZMYxs00VWkaWPNHV38FlPOhkgKIlMWyjDB
+BwzggJDBdJOj/SYu1/s5mElD7Eww9PlA0ArwCtRFsq0qyVFlNqmqSSQqvx8iyJNlIyuzMLUhVG3r
+8GW7WKq9luWXdIXNxLV9Srp6XSZpNrTutw2q6bIQ44ujDBYoyMNEEMSnjguhhHxjCRCJEPB+KCxR
+1ESgyhMydTMUaIkUoAfABkQ+IKJHS2ofFQ3VaJVKqtJZgVZkBID9JgeYZV+Xv8oDpEYwkPkRVenU
+wMJ8DIZMQEhGwxHEEHJEEcKhVQ5/s1+x6nVHqh4sqqlVZZHWeSolbxHZzPKSyFUAgICdobP9LIYw
+DSKvMUOgSs1PkipKTaBtSgpUqUhFSLUQlkIlCCubCGWD0HE4XhzX6XaRqE+ev72KxNa0jkkI4N5i
+x4e1kDX6nchsJZIf1/+/yPTuTmow4g0A8gi24PU2+mUSlX0nvBimsxQPUGzoi+KJQj0OnJETyUMR
+IUUxkxjE+DMjQmU2Z1bJsSUX4c3ZKklG3pXUq8uWUlElh9MhhzcGMPpCNIsRBDwQ5OY9HRjURrFw
+gitYOEqaTA3aYpE5LGyqsk3cCYJuNkyYhZWUxYrlzYaVIsUUqqk2ZktqiVXJrAxYjC7Km05tNNOc
+Jin23ZYmt2mrKT1D4vX3xJyP7ZP8VHaCwef1t5ZBVkO1eliaT58RxvdmCB7g4PeAlnvPtO1kexQ+
+GUH27e8Osk+p1hgD3BTvk35nsKqx6yST2yWCAqyrZ7TOYo/F2ceC1ViQEkZoPEhYlIkUHEqJZUIo
+qXGMSSPB1WWFj4Xq9aPKs7cSLJ2J8HZN6yH1ifN0aJE5oe5orCapNQCYqNJZVqhWh0aWDmbNJEpE
+QkJsBwJWMCYmG387SH2hoJubechikYSE3dzc1HJ88PEOdH0JT7l6zd/7D9EVZEqyUVJqSyllWW19
+q6Fe51eFK+PzPcYpMUmVVIWovnG1k+TGZVRVVCmMkJ8whYkYskie9iSHdHl7mSQr5QhYbpVbfO7P
+R8P3NInQcM3mS0xm/qn+zfEcPoKra9ZbVZVrQ0EKYmrSANYZEQhsaUjBEUNIKEoK/yn4IKRAkQpK
+EWCLElBYJQWSJYkSUqCCbahQmoLZKWbRYplrSiopUJbKKqZCggQgKoRDyOgHu7kxEypF4WzEHHG9
+vzZrNcOOPwizueMk8HZg5AU5Gjfql88PAvDD5jkeuMNOsB1itCqzIwaiSIfpgyaie1syRRJCOZI7
+fQQRBswjFyLMglDQC6fWd2MPtFEwYICIhlZCCxsbSkktZZKWVktSopJLNUrKk20JtaWooj9E7/r7
+fXq2sP0MdxWk7MnHF3HyNjC1abs7+bGzhlcsywqpyWPNdXcWGHU1yiSuQWVuyqrWdP6DlLzTDmc3
+F1k6t65tOFbJXFcOenJzbrD6pI6nOcN5zaNjSNRNsm0LpkXUBJPM94k0nIPIcvHueCZZhn+Owkih
+Y5khgnwXs8Bw/WP8BoO5Nn8ZKH2q0gwkr2ghJ2groEwE7EhMFdpiuLUVMlqUrSVsNGGymGy2KxVs
+VWljDU2mmitVhVyXRpjaxOGtuyyWVl5JsTlicNq3LLuXgMkpElTLQHvIiIfzn0KsR2sZ/+LIHmdE
+noNvyR3r3E9U0RGZL/i0aI0RDdrFiYEpI6gB7zk+GYqLo8ryx+H5vVhjtzs30Ki0KpFitttDSReq
+WGI1xWm5jI+5Z5cEfNZ4qn+1XOSJ62FoiKKKD3nAwZlRWCyMEYQi1TLVY2qjawbbYosarY1aIxRm
+W2xJFiqIWgWxVVKCFsttQfIj2HpFUPMSGzby7DSPNeh6jkySojCLpNzZSrMfTyaEjdsxtKxY55Js
+1BHEOh+dh1PrbyQTSchNopX8zqmnciO5IhoKe1KRyVyk48yTo7yr0WY7nObjeQTFkV3vd/O3gNjy
+nlDRQRESdhLEo7WVEOxNHQFjSDPIBTTh2vI8CXnyeaPo2GHSWTmWDLDEuEiMKQRkWEAQ45hg2WkI
+QVj6l+Y7THD+LA/OjPWI3Ukidx4NNHCyNoT2SZHCcOk86Q/pYPajAeggdkQ+B5TXzoy9Lxpfc+dj
+TVe5f9P2/av6eGtG5tUfL+r79I7SXtKPJ5yjIk2lNrZ2mpporVRPqWdVeayPIJWhyXkMPIcFYHYO
+DpCpSPRvkj+dej0+OHsuLV+DDJyrCzLcjj3x2wczEDCaqX/tMOiQG3Yalijbc2ulW62UnLXWSmap
+yotY1osbRVxVm5qLXSjRaTVzUbRqLRG2xu27oASMaxUFXa/dyjbgawwwgMzBGMZJhjMcNEmh0e9H
+C9yJ1Vewb7xWHDFfrAiQIhgtCYuQuDBErgMjgMg4CRBJKKbMXQPkQOpCbxRxglLoeg1oA49mec0+
+977EZWYMuRiPjmROjMcSDgRzWgxT1S8Qftk5ily7T//fh+6EU9CM1xQOEUgqXF88giIpFEYOsUMB
+DkHtmTtG2yTwZOkRFSP7SGRDFIsbHpV5YfCxbMp71Bla2SIy1ZFGQYiIiSISiTBRzNJgrhGrpWiz
+VarTMa1WI0pVaLU1bW6bG/Cer1111dbKWQyUjEtMTjguAIxBREBEn4cGETpiYYhgIpViAZTgJMaK
+kjb11by9pkqSRXyt8XJkUuqsMUk02YzUl2y6gMUujA3K6NYYEoJMwRvRmpDIMKxFVTYTHBZGlTTC
+Nmpiqo0DGcY4JBDRTSzLSxEws2Syk2ZEVJpZKXzdJayyVeu2UrprqV1JEiElGZN6W/TprSWtqKFr
+lcRdYajU60a1iU2G8TcZOQUNAlGYlbDNaDM2ZjkmxkBMczUm41bjAnGlNHM0GieJX97FGoIiIT4i
+yY4MBFOUUNDxvBOIPSMyhERqYuIxCckueI4Y2KQFgB/OGMyS5K4LVSsqUIUsoClA5ZO3CIR2mMTt
+SybemZJOtyTOhIMyCtKq/WYGDPYoH8p+odv9J9H1X8tWGPN73s77PldsTLfIiIdZPIqVTKSzIEQl
+CA9x+2MUVNIklWpSeQrrye9TkJvJz9YTmSI9r+3YH8VDyTzdAdxIKRD6SFXoSgJ2sJzLeFBgGCvA
+YY6RNLpoIh6oP7GJy+MpWKOQOSqskMTlIdgC/To4DZEQQxEQBMptBcVkSIVwwmApetrSYWJyJMEt
+FyS6lexZpqyUq69LpZpMjVIyGpprJhTTRVVUaF1NYVZjWtRJi4qoq5oYrTGGbB9EYSaNkBEZhxve
+B9jrcFrd5s5AhtwQNh400dFjD0EYX4TuO0vX685XfIrk01Vsj9sexiex2P2oyLH7lUqxZatJa9iv
+WOIT7q+sPgWIRjow9zTUPauibGLjJpt+FRO584h9Yz4QGE0PwmCvynIqXxZUmCYD6pT1jB62SZIi
+CIgOGQ4IffCU0MFwkbYcSMIaSND+dE8TYcKt1Wx+RTCrqXmaY+VY2zNXKllUGnNhoMNxhvM1wYrp
+GVtoyPzQLoIBtIJyRdI6BJWiVD8DOgTWXfIrdmls9r3Nk7QNicRXCrUqYsbYaMO2MN5mrKYtNsNG
+G4w3ma2RgNXbIrTNLZJ9ikfnXvr6VN7yyYlVMcmtLR4vhREk73zKkke5Y2ajErKwqFeSfwck69IS
+MD2t0YO1PlPuk2DntHVSz6mx79vWow9mQ9190Oz+v5zoLyePBdHQX6SB6Oe9odWpEboWrRbl9LW7
+6OuVWiKi+KgczHcOOsBtaMB3sd7TC0LEBSRKiRIgxKphQbxwwySOY1yK97Meb2Ik/P7lrSGRGSSG
+oFDAplBAIhSSUkJEePhVE+clEBOZ4vURX5H2jPaodYbtMQMlaWktHOR+1Ew3Y7CcG59SiqjFSIaQ
+5IxJ3CSR/mI3khYn6KEkkxBTdjEf2uSaSTsb0slogmYhcPchAFEvUnFNkcFgSxmZmBgTHYPlD1hs
+2pEirIqPEA5kKchNEKSwop0MMWIGJJREjkqEYs0RWKWV3RHTMQ/M5nZSywWwm9qoTJSlCyVEyI8U
+E6HeUMSV7Uif/6kT3eQuh9A0MT7FD7XaJP7FPjIPOyMSh5hTSov1dTxflORKv1yVENCMRv4DmgZ8
+lMXg3lDRh8UYbzNWWsepGPB5uDZPQA6+FKJEncovtD2ovpMdh/VJRCwzErQEJs4N6HiFhg9iAmY6
+ZCgdxhRKxA2ZkBSJrZBGaLIYSSNYDarJEVRSIWVR4IdIkaxpp41JjqZhwAwlLGnRpSNIhijktjpr
+Pa1p2dtWuym6ZI3XSdkHAREdKrEhWiTAmQhwsDqf8HENpNt4ihU4MY1BykR+iEi9fW1TqfWUTwlT
+df4WHOOqpPOM3VanalzFWBMW1FjG2mFYU9dYsbxg2RkGnCSDRDqNMIg1GSu66iYZatJtTdddbELC
+RYJVmCqE1LPj4I/bHK7z9i5Cj8pe/j8cira0JVMRAZREQGr+iaeLqcYp6xNo/ReXyueD04owv8Ja
+4LuqVZWH83i+1QBB33OsDZrJ2OCjIoQI6yaNlkln3jJ4LLKTd3r0Ud7Y3rSur4MXTFOqu9TdsYbK
+6rPpsedXXdp2VK7vLjPSYu/Xtn7Fjnar1Wdln/uQR4Y0dzCdysOTFdG7EaerCXgXZ7XkxEBC61zO
+rjVZxS6rl1GeZ1c8ndSHWc+WpVcdsnJTtP7M1BGs5WclckNCfDCd+AxamDeVzlyGCaoIaFEijORU
+UUjhhY5ICI81OPLVGhCM6GE+pqNCeVuogw4UskQiRonZI2Ik70OjwKMEqJOwrQCPxYOEYKMEnh0V
+Ns54mgozgoLUCNwNgIjIZWCiMFopxpFMLEAIaEe8RqyQ2bESe9WMkoQwO3EkiHKmo4ewQmdBBLw7
+xsrcCiOpBS4qDFmCZXEcDZw5OdyRzbt3HDR7VNmm6cJJw3RIY9yt2mROqk0aMdKQ0qbHi51wvkzF
+KGT2NY+MvRjA8iyr0MYjzEQQjeDAywsuSQL2YZD7EmA8xnRqiO57zzKOtnJoLdiZRko2juKAyhCj
+iZ63IGeESnDHgjyeLdpY5dmnc2czvY4mjFaDGLyUx1k7syqmxjJ63Vq+/ZLMFCIFHmicnDLtOTTE
+WRyZNCilK11w81O9uwsm6zO9rRqE2mOGyYl2qzhM58dFN42cJEkaZGGSzuadnJlKrSOEN6YxBI4i
+ewESSVKPYTOpDkvBJ5uG/c5HR4Ntd8mLVbGDIh5sHJXduw8OGaV4tTq0dxqRO6vNU2rxxl4E2MnB
+spKrmzw0akTT2KdSxsrk3aNSSSORhjKa6O/W6tnexHZYscs5eezTn5MhHQzk9VeaxwqOrsydlNlL
+ZNPLInpNMR3Rb6cnfs2bsyqhjYzMSSFAj0MSdpoYUiRMEaQGMVLgiRaPUYVR4VoMLZfkMPCwKu8n
+QsipLUxGqJrgjNkgTRbCJEQQcnI4yeZYOJOXD5DZJsXKZ4MjDucBcDI2jwYJNFjK0nJjDzKqp1dH
+k6tipisk8vFzcMbnZ29vm2d02cOTq3V8SROuXEEb0QAS2rxSdKu26mZmZzeM08z5QyQUFoPhHfOc
++/BzEWbgCDZokNXhp0TAEFmJF2PNiwr0VMYkgCB8vbu3U57TAEDrEmKKWJq6IAgtXicJ0G+LzOs+
+lZxOi+2fiuYIgqOJCAmGLBxE9suObOMGRBySeOuCw+oRcYR1AEHO33V4rE84/jdiI0GTgqKMVmRi
+o0OxB4FFcYRZkkPOsE1NSkY2UfDy9TeSz3FDEcS0tUEAv5EwnPGzBcchgUiMKKDGh2NElGSSTAju
+USaEHsszcrjD8BiKNzKcEC0jeBllGhHAjkQcKPviafrpmzol2Y/2NJOTTHbTDuZ3Pe2NHqyGO7rp
+lAZncCJHypUqfQDyPgoCTOUsZc59+bsIiIO+smVeCQRQ/eRoqKiA2GYg0a5yd1LheaonV9Qfg/Wr
+8qVSaJOb49749/d2vHaTzUzJAQeGAQegnreEnSwgBqI9j4imxzeSSxgjt8kRBq16bzqjgowWI2ZJ
+aeccvd79WK6hbBHjPOQic43iI5IY5E9XRdlq8j0zt83PXMAGrniIPQUFYJNW6xJJ0s8izsU+pxzb
+t3ukwH/Vw5KWFZJiT1kfc8zTnGxp4uxOk5cOHfNzkOja+49AdT2nFW8xMCrD5MqaMM7K2y3Squ2M
+dzP2/LDuXtRckhIxT+bsnz7/NCR4Fsh6vpbGKnzujfb2KliU9pixGcSYYwIorFksEfE2UjAqGDFi
+Ai8WTILASYMFDJhoRJDRRWEQZDM2InEhDGMYUIwIFFmLN51MkKBAFcQGzHWuQ5o2aTEdKCpzgtnC
+9IxSO/1vrkV7GaWodEkrE2bNaXVegvR6O/TyaSJ5LcwdBgcRg7xzUYOg2Bo0QRMhodA6dMM06NBr
+UULUzabQacN5gRukjCpK1Lwdx1dGAxisQ7qlo8VdzxrJJHgokclGqK5GImlhkPR1T7UWpVVE2JHm
+fx1D4LJugSJZ/Kx5fZmVkWIoyLE7+7k9U2cm3edZcS5m5dlGmMkbkZMjmRiGyWIbJYpShEOWaVrf
+Gl2u1aVm2NLGrK2RiZBHarXc7K6Ves88vXbvGaOXpqmHWOBm8NlumHdjJmGaLLUaMWauVpTJpIGE
+TGxkkmKumbK3Y2WbsbLN3GW3LMMSRGYyWrNlqmHW8NlumSph3jjWRoxAXSJYIshGilMKNC6uq0ur
+qtLCiLCauq0pAzTNLl1Wl1TAEDA6BkHQDOacDMcamQZbu3W7q7HL088vTxmhmhmhmhmhm15rqld2
+7U2LiwOhY0Rog0EZozRZajRbtRqeeXp55el8L13XrrsM152Y5eldet2ySy0M0qqW1RxpZGmmQoyG
+BpFKizLqtLqmUJJWQYRIiGE1jjUwZmVMlTDmGaNOFpwCGHBgdAvPL0u9d6c8vS3s0M0MtTDI6RgH
+QjatRotUyVMlajQmmhkxLShQUmihE0SxSmhiJZLFuZpWS0yowzSr1NtccNGa0U7tRst2o0QYaHBz
+HGsjRC4aXNY4FTBq/Yaxp04YbMDErUaVjGE0UhRDRDCFQwhghohUhitK0WalmpU0l1dUYmmhiaaG
+IlksTThQkhJAHzHuksPKpiPB5Pa+JhpWViKyVs0Y49wiEjkJ4wQbTDJIjCIgckdYrCYbw9Ktn2Fj
+KtiOtiINKR2PlP6ZiWSTP6BKQckQhEeXZuiVUt2Ej5jYaw07N+ienL/hevDHByuB+CRSYKSY2iJZ
+UVYMFosbYxJao0areb3fT8XxElSaxbYw7q7l1foyK+lmlsJ42r9ETTt6H2I2nqvtXjlhPX+Sf9+3
+1txPJpVPyrKV1fkYkkesCHxRJDCfoWJ8nCvN1WKskr8X3cPYTm/6P6mni373X4aGHez2KVT4+5ke
+8+tyyH2KmPUyWqsS9FrTU3MyNo4T4u0ewbQjxUqqrFYULUqiWpLu6MDTRJsmz4NI6SeU0DvPpDiC
+oKSQggvgnCdJyT6h1+8YB+gSf5iE7x5I4CPkCPK5gDT1fFcNB5DNwXkUcGFAFgiIYiJPNh42cWSH
+vUkTccv5/Vs6JEbz1c/s9sif8vzc/avDvs8/qT8Pn7nmA+Nk8Vn12SEW61auWqTaslZpZLVGsWLB
+FlE0WDVkI1XRSRDJF4CDCZEIkQg8hclDSZ5ycX88ZE/Ygw1R+wsk3+DhmVbGKy5a98w6aqN5ozcG
+D1Y3gXAXDEGnaPBJAwqJtlwBSIYiSWxObLKmRwBKaTaQiWY0mGOROZgFbs04NrLXpvS3Xdmw0ckt
+ctWTNUItbjCakiNnokwcJE8oaWGT13txJ8h5t7JgjRZbxxiMNGtFDEbFTIOSR2g6uZGdy1eI2xFp
+A80K+Y929Kh3ovkAdd/TAn82+QC7H3BwT9mFTOEmGIfSfdfQHYquyeYf75prlza072NrLYo2WU9S
+nqqqe2nNq0xD6nhtLEVZGr/EYk9NHPUp+qCLEkTEPAV9KvVYfGW/h66HCtliQ9B+OPgoFehH9Hw7
+dGdVt6PD5yQE5HZ2eZRNmzdAAAAAAAAAAAEA3d0Dd3QABu7oAAAAAAAAAAADcmZ3yDzR88Xkxaek
+ma6R4Zp/8Pb/LpOnSzI6nU072LdNF5fjH4w8yPsOQB0JWnnL0NJ9mx0JsfSQ0v09DR+Yjtgd+iwy
+1DhG/aKPvIQo/d08Mw+Rj4f1ZHJ+vcbtOGWtmbGKjF7mo5A2KdLe43upEnExQ+fsYbODlFByfYHB
+wUGhaEBIiQo0aKKEYDRyZKDsYJOQwSHBRRovboiN8F7zjqHvk0SZEIuM8UHaAhxjJGI5FeTGw6Mc
+KMXG52RuKQg3ZYXeDAwjEg6I4ycvZr/wLKDtiTu3GNo5umtWc0JI5Y1u6MhwJ3urHPQhGDluijAV
+tEl9zsMZzJsbDkljNDNiK0MMnIEY5xQaFEEYoUGCTfJmFDo7O9Ccziu6umOTU6tlk/63bG9Tsls7
+iTPIb7RZBcBcIODWClUYQ9CNwCERaMYRRYYDAiNiEUNM6EGjJRbgI+w21O/jucJjZhipNxYXi92m
+zmwueGLmgxiKTNGSxbnfY2zEdjQzE+ONZI1qTjnvyYNDEPgg5kPLjJgRgvQjg1hnByWclG9MwKAm
+eeaiK3kwSIsBQEgIjDjnibrBFBVVRFRjBx5GcFnAI5ERkRSNFBhgQjvkZk8PqIjReoujZVkiihpF
+IsoJLLiWXksEFDLLiIjJRQMwWMRAiIwdhllBgYxDGdb0cUOEUWZIxkoL7kj650dEG4uN9sM5NHA8
+5ovgZyc3ZRyV05hYDWpA0ckmiTgkRm8GCyizAWao5MnQcuzpbnU7TsN3XHI5sybIlyanVjnVkYME
+wFwg5EGT8Vl1AXgoGUFENoXSqwwclKeHGjsvWpJIxZELC5ZydTEiKBGEM5UBwccnAETom4kyOdDC
+udY3jo4anScOmU3c5GNmNmyYQQjZk3WTtwzRSAhHWRFLgk8cwJHM9LiLotOFbCrsiwxeFaaFx5hJ
+rzBFchGCdAidEjAVTV4Y6CBdATRIlMSbkwnC66wDSkvKHpAci2WPBhpFRDsREsgok1ms3zM7RjYW
+9xOiogIJshFJxlAo7QdlPJvA62xGMEaREGDkyHAVBAckxxycpxZvnZyjMpmSdYJ0Qio41qADmIgT
+OREeIqGdGiWI2M2ySnk5qGhYkRuzFPgLAjlRnSMJxoDuVHMD7dyOO0bOCTuaNAxAipDBIzcUVTcE
+IyWT3rHQxhkguQYu4WZBxcBnEwyBULuI0s6kpBqI7UzSgtBIQjIcHKSJ1pEtIk45OCsydts7nHOT
+XZ6nI4q7Icb56JFRFFmCQQhkSFwuTBnqoOyHNBGdzEEVoaDjaL0DSDUQDdoJdNFHDnhmXlrOmNqt
+1pFKWFSpVUSmnVFOomIShORUyqgmUOqUqUhxUkwhFU0hxUtJMpUyYHLHiWcQXmznMcS82c5jiXmz
+nOXNXd5oVSmyqialUyqwQQFTZejAjFsiCAojlrEREzMBNEKjgF2dJURumDDwAnNTcB0IQyWlpHsB
+JAyLXpcojW73RaW6mdJV76ddVXI1iIiI9tK1uVmaVYW8JyYkb8BGTIs3oWSWCyxEevNXbbelEW2I
+sb7RDGSJJgopK5wSqy4sAFdRCAgZBy0gp4nTn4tZlY1lllEsRZCqrcl3ctFqqWstQmZktyYwrSCR
+8FEnz2D8XxsyB5FN46ySGCwjuJ3LIfUokk2rurvfF5SQbC1LVFUsRUP9sj246UknN4dzGWGTMfkf
+5M8vwb5ODZVSsWo5Qk+D3sRE8oI9qyIZ6yZIqT0OyV2DpgDzBva8yTBNOMyoRCvCwfkl0QcSmFwA
+ymQPBoDDarCYw7swBzCGxclRUaRQwkONGBsSTF2WOlROE2uCm2VkcJHnJjz2kdDcxhU1J7zCOXaY
+3OnGzaqMlJsVUsFTqyTFrnhibmMaxZrG7kJu1NSpjhTNSmyuZGyVeCXdxJIbOCOZuIg5mByg4cLi
+buEkyEiiWIFeCrM6R7OsDkEJBKSTkwTErkkZiYZglEysiEor8R5fNdB94iH4R0Og0FNLYrCrZObl
+Hen0qa+d4WRRIR6LB4pJN/XzY5+bY10ZtJyVjd6tnRsb78jSaWLKpWHLoJu02ZNmmuHzubbjc7hA
+ZEbSSWB3vA8Z5TTRWt2bxFE5k08pS2lSkWFKqkstJtKyllNmpZpSkISGlBJBTYK+Q7HTwBC5t7TD
+ZW7ZWMW6Z4+yCO94PJGrFmlkhJNTTDn3P4qj0XzL61jf721bfC2PDHHsw12SP+c1JLzyOdYqI6nB
+Xgg8HhACOkfhLNiwYxWJWHlZI3lVYbSqpbKhsxivVlYxWKxsYxRIsMaMA22kwwCmloXJHGyA6qqu
+EIr2SIqHzkqOIgQIIvwwo/mLy3sxI85milf71gAD+vzPF8asVMVMjVzRU8JrwE03a30nEiuK3qrT
+SJw+qOTUjxpB42A+m8N0kTiETSakk786o05GJHzvngrYBtEQj0Fgie554gJ8Pgc1k3zE4Efy+DlF
+yWGm6OnvnHJxMnB8X4NjvN2xuVOFfTXdsc+N27K4NYMbsHLeGKg6IwI29/Yc5Mh5TEOQatFRlZrR
+lsaVSjFytKmmpmMzEalk0rRUVS4aYaVGmMMYxSpsWghdkO0sxMDRiak1Fq1maIg1Vaas01WirBaQ
+1ZEtabMbGXpcr4luo5ry81E73du70VqaEwhNGpUrANRSGoNWiodK89DkNx1tu67dy9Pa5XPQ43VW
+8vWL10XJdy669Nrenybd8HXSnXZSpLJKpLSGzGCqiqsiaumkWoxZNMMlk3pVwwlgLSQbSYKIioxx
+JQkiIg0KPBtEx01Y2WTZszFaYampppppKaVWJCjF3o0bJxhdkQFoIQo5oZyFeQ+/3r61zCPHSGBL
+XvBkDR4oYSxquFyJwIjBcdnPKW5h07juMmClCp8phjf59gqHmRNjyAjg2eZR/4SOvo/W+FIpBRFH
+UkEMywFVyYakorbm1tXU1sbVa50oEfhSQ1E79skmFiWdtnkVfKXzNMfzVjbM197HdJDmyYj3rIak
+onkRsH7CE+WMIPmLr2Yn5zHGhO9v2YmZl6D1Enmsd+IhizvURE5PGSPGCH6E5aUwTPdgYGp+xPhl
+98DouOzF/GF5gMc0AdqMyLAAIQ96kOyQSFkCqKpVRVQV/e+YnpJU4kUR4UTm6VgJR99+MPx1DetD
+ZiC+BHShak8B6Eg6GMLSmT1hRKETR6FFAqFBkQ3lwLATESP8cgXUkKFVmKJGIte1bM5ZIgkQEojA
+owgscSFVLEZU2msmxK20YOUWamOXym3M3JG57lSZOKKq6Iw09DZoqVSife+tU5Co/gQokKCs0qiO
+zqdT2Hdjvr4uCY2efNMRUxNgkj3JUkkIlSfJ0/HY/QqDD5hfqouSdBjtPBBtPmbaJWlYzKjqkfSj
+uKhT7hknMkDRFE9Wd4DiSEOEJQaglnVXOI8XdE9h7FAcP28s+bTWrVW+QPwFfA8mnH2EfkA2Gw7T
+R758gqtxiq5kJEd49j+9ELEmkTrJP7XJw2k/qNRu+AqyDokSS0kSqQqEVIncZiJT2wmoHGQCJfRI
+KG4dQKJkJSGpVRGJdZpDENJQkrxYmR49X5U8nfDZy/mOWcf7VVVshAtSaiczwltS7xGvk+dCeaG0
+U7AU8wnklFpYZHhewg7D4UgISaJVJVhYsIVygpmQ92jRZ6tk+TI1q+jQnDUTuT5IkShSxe09iuAn
+fH/1qSc3eSYxiSf7rEUlWxFVHlEJP4Nkh5tCYj4MkiPg/MbT3Xxp8n8Roflh4j7f/FnywSdDH+3z
+0BGYcjvacz6iImjwWLf7WbtWsqSyZkkxZGkU+uvsfQfNZGQRSrIkGk/2zZzjYm6yNySfQr55Bj6Z
+BqEO03SF88Yw7CHp23qxJ9BmqdgCKdUZyV8odYPqK4eqn2t2RMWKqT6PnYEfykL+gkFA+UleRJ7C
+RNqPvn+T5wWRaf7kifwecicvvec+KKUizITDKZZJVZCVRZBioUYy4YmdulpTrqZrcllYtWaysr0O
+JKCiljD3GcCB4AerHRaIxZFRDmqqqHI7zl60NvIfL+YO78bSHASD+qOuUPpkPpcLJ25QnD4tLIfn
+4k+L0eQBNIESqZiKWThimQRIh3sfVU+KSTeUhYfUpwG1SRP2FZWhTGF5CFj5yRNkibEicyFSCYQo
+hUibIbLzfizpJuRwvCu8sjLJzoPuif2TzeI85afMrSq6wxwjCDGCVIBySQzAycTBcYZLVnmf6WaE
+rUmJJRIJKixJce3RTDCrOjJjHerVROzSYlVu8Nops2P87GJDdDhM5FP9WOjtC+rdKuzhJs00p+c4
+5xFcThknGyQ5PVnucVh7hx0kyHr+c85mg6En0n1eTtE31u3EjtM0U7M8OpENMTBEM0EzI1vmu50R
+SSlX7KjV8/1mjcRCCoSaR7D7vP7FQcRFdiD3qd9j+xT4Sp63tH6XROrY2TuVWGH86wQ5wA9pIhEr
+9pKB/uSfRPoxJ8hmqfMo+FVIp9elVF7VXwBwAHavLGQPBvJPM0qVapVhUTpeuRHMzRSVMdDDAHa4
+gKjhIhskh3q09a3rqv2fXiHaJO5YqySHuieDssPXZul/yH9NaK0wfTf+NbJVTWI3oxW9PqlfUpwa
+GN63VnGQbtqySGywGKmijWlmJIeyVVH1yUxd8ohhI7ERWAjkR0HQvg9jwyqnuWl//M2ahfmV8JJI
+1uLwsKuk/zNsr2TGPZrrJJ4LaggbOh8JymhghqUoQpGGKKBFfAfw+F4K0fNAIiEiUq2BZSQtIh1k
+IsHO22+Q/IeJvdRFVVVXpREWHSP3KeqPguJ/JCSK+pS2iUhy7SqZk/CFBKKgk/CZbO9wR9Tk2SOb
+nKymtanSa0aYpkAhQjRNwIyWIUWxiEAIy3lFBcgjNkSIqSw5MjIZZwjBQUftw/4AFBRawIYIUI2E
+kF5LsoEcYzIkOhmzBQ0ICjBkocQqBHkFDOaGQyRJXEmBDEAhCBwlSHKfVGzYEYMGLCSiWGzlCcO9
+yVzRON72ROc/97Tq5Mcy1rdGlK7lYpUrbGzTSvNhs0rmoqYphUYxjFZS5MTFV0aYbRlLLFSqZxpo
+rdJXe4mzU7O9c6GoyM3NGtPLARdQolaZQ5KVQNO0NkpQ0SoWIUAQJy9DqzAsYtFDKdJgSMUSKLQi
+TiYGcmSRlzEIGcg6HQ3U8sxwNujiTlLxBEzKZs41utRsjU8bP9Hyi8AJJhAUiHgTo9qzGZmTre3Z
+SRLgxLBlMtwZbCmzHMxyaaHo9HMaeYbPObftM1JOlzBjzomBCnsME7NFRgTg0mEbNGTUGISS2ISr
+YpuE3Y8PDuSOT1iNhZ+Up0TnIDwRkP+IHMFRElSgWUCWgVUkQhYFYWARSSEUCUXzhDO93N0T+Zh0
+k5vbjKg5RHNyTvSNiPR5eKtz1pZZFqqssqlRUilWLCyjTqJ2kT4QO9UkfnrwfNPTJP2v9Ov4EUf8
+BIIkiUQP6SSlO4hEgqIIh/vUARkQ+j/f+rj8eTHSYmPYJ92IzInb/mWgor1+qPtu4xGJow8H2zhb
+g5+g4oK7k/QIiv9kUtdd5lGTu25aZMKL08CPt/m0Y7Ub/igSQc8nm8Lt0F3x9JDg+ou30u5n+txm
+pwLK8vY1RXQphzOY/aBMR9oO9GJlrrDMw/Rg66vRB5WEyk5lMk3/r1WrmVZpQvp/HK67+u9cbmSQ
+c6jqtLG3nFwxWTzwoxhLATOCuza0W+NRz7uP5c8+geocLHY55MU80nK6xoh7peIUrVF7OY84/3ez
+zvvIbCCH9UfKYiD//xdyRThQkIahTA8="""
@@ -1,21 +1,57 @@
 ''' A parser for blocks written in C++ '''
 import re
-import sys
+import hashlib
 
 ### Parser for CC blocks ####################################################
+# Increase this whenever a change to the parser changes its results, so
+# results cached by earlier versions aren't used any more.
+PARSER_VERSION = 1
+
 def dummy_translator(the_type, default_v=None):
     """ Doesn't really translate. """
     return the_type
 
+def grc_type_translator(p_type, default_v=None):
+    """ Translates a type from C++ to GRC """
+    translate_dict = {'float': 'float',
+                      'double': 'real',
+                      'int': 'int',
+                      'short': 'short',
+                      'gr_complex': 'complex',
+                      'char': 'byte',
+                      'unsigned char': 'byte',
+                      'std::string': 'string',
+                      'std::vector<int>': 'int_vector',
+                      'std::vector<float>': 'real_vector',
+                      'std::vector<gr_complex>': 'complex_vector',
+                      }
+    if p_type in ('int',) and default_v is not None and default_v[:2].lower() == '0x':
+        return 'hex'
+    try:
+        return translate_dict[p_type]
+    except KeyError:
+        return 'raw'
+
 class ParserCCBlock(object):
-    """ Class to read blocks written in C++ """
-    def __init__(self, filename_cc, filename_h, blockname, version, type_trans=dummy_translator):
+    """ Class to read blocks written in C++. For a member of a templated
+    block family, template_args maps the template parameters of the family's
+    implementation (e.g. IN_T) to the member's types (e.g. float). """
+    def __init__(self, filename_cc, filename_h, blockname, version, type_trans=dummy_translator, template_args=None):
         self.code_cc = open(filename_cc).read()
+        for (arg, arg_type) in (template_args or {}).items():
+            self.code_cc = re.sub(r'\b%s\b' % re.escape(arg), arg_type, self.code_cc)
         self.code_h  = open(filename_h).read()
         self.blockname = blockname
         self.type_trans = type_trans
         self.version = version
 
+    def cache_key(self):
+        """ Return a hash of everything the parser results depend on: the
+        parser version, the API version, the type translator and the
+        contents of the .cc and .h files. """
+        return hashlib.sha1('\0'.join((str(PARSER_VERSION), self.version, self.type_trans.__name__,
+                                       self.code_cc, self.code_h))).hexdigest()
+
     def read_io_signature(self):
         """ Scans a .cc file for an IO signature. """
         def _figure_out_iotype_and_vlen(iosigcall, typestr):
@@ -75,8 +111,39 @@ class ParserCCBlock(object):
         return iosig
 
 
+    def read_msg_ports(self):
+        """ Scan the .cc file for registered message ports. Returns a dict
+        with the lists of port names under 'in' and 'out'. """
+        msg_ports = {'in': [], 'out': []}
+        msg_port_regex = r'message_port_register_(in|out)\s*\(\s*pmt::(?:mp|intern|string_to_symbol)\s*\(\s*"([^"]+)"\s*\)'
+        for (direction, port) in re.findall(msg_port_regex, self.code_cc):
+            msg_ports[direction].append(port)
+        return msg_ports
+
+    def read_sched_hints(self):
+        """ Scan the .cc file for the buffer and scheduling hints that
+        'gr_modtool add --history' etc. put into the constructor. Returns a
+        list of dicts with the GRC parameter key, the setter and the value.
+        Hints with a value other than a number are skipped: Those are either
+        computed or set from a constructor argument. """
+        hints = []
+        for (key, setter) in (('history', 'set_history'),
+                              ('output_multiple', 'set_output_multiple'),
+                              ('min_output_buffer', 'set_min_output_buffer'),
+                              ('max_noutput', 'set_max_noutput_items')):
+            hint_match = re.search(r'\b%s\s*\(\s*(\d+)\s*\)\s*;' % setter, self.code_cc)
+            if hint_match is not None:
+                hints.append({'key': key, 'setter': setter, 'value': hint_match.group(1)})
+        return hints
+
+    def read_thread_policy(self):
+        """ True if the constructor reads the thread policy from the policy
+        file, which 'gr_modtool add --affinity' sets up. """
+        return re.search(r'\bapply_thread_policy\s*\(\s*this\b', self.code_cc) is not None
+
     def read_params(self):
-        """ Read the parameters required to initialize the block """
+        """ Read the parameters required to initialize the block. Raises
+        ValueError if the argument list of make() can't be parsed. """
         def _scan_param_list(start_idx):
             """ Go through a parameter list and return a tuple each:
                 (type, name, default_value). Python's re just doesn't cut
@@ -84,8 +151,10 @@ class ParserCCBlock(object):
             i = start_idx
             c = self.code_h
             if c[i] != '(':
-                raise ValueError
+                raise ValueError('no opening parentheses')
             i += 1
+            if c[i:].lstrip()[:1] == ')': # No arguments
+                return []
 
             param_list = []
             read_state = 'type'
@@ -190,11 +259,14 @@ class ParserCCBlock(object):
         else:
             make_regex = '(?<=_API)\s+\w+_sptr\s+\w+_make_\w+\s*'
         make_match = re.compile(make_regex, re.MULTILINE).search(self.code_h)
+        if make_match is None:
+            raise ValueError("Can't find the make function in the header.")
         try:
             params_list = _scan_param_list(make_match.end(0))
+        except IndexError:
+            raise ValueError("Can't parse the argument list: no closing parentheses")
         except ValueError as ve:
-            print "Can't parse the argument list: ", ve.args[0]
-            sys.exit(0)
+            raise ValueError("Can't parse the argument list: %s" % ve.args[0])
         params = []
         for plist in params_list:
             params.append({'type': self.type_trans(plist[0], plist[2]),
@@ -0,0 +1,84 @@
+""" Create Python throughput benchmarks for blocks """
+
+import os
+
+from templates import Templates
+from util_functions import is_number
+from template_backend import render_template
+
+### Python benchmark generator ###############################################
+class PythonBenchGenerator(object):
+    """ Creates python/bench_<block>.py, a throughput benchmark and
+    regression test for a block, from the parameters and io signature
+    returned by ParserCCBlock. Ports with a known type are fed from a
+    vector source with random data, all others from a null source. """
+    # GRC type -> (vector source suffix, random value, item size)
+    _port_types = {'float':   ('f', 'random.random()', 'gr.sizeof_float'),
+                   'complex': ('c', 'complex(random.random(), random.random())', 'gr.sizeof_gr_complex'),
+                   'int':     ('i', 'random.randint(-1000, 1000)', 'gr.sizeof_int'),
+                   'short':   ('s', 'random.randint(-1000, 1000)', 'gr.sizeof_short'),
+                   'byte':    ('b', 'random.randint(0, 255)', 'gr.sizeof_char')}
+    def __init__(self, modname, blockname, params, iosig, nitems=10000000):
+        self.modname = modname
+        self.blockname = blockname
+        self.params = [p for p in params if p['in_constructor']]
+        self.iosig = iosig
+        self.nitems = nitems
+
+    def _param_value(self, param):
+        """ Turn a C++ default value into Python, or a placeholder """
+        value = param['default'].strip()
+        if value == '':
+            return '<+%s+>' % param['key']
+        return {'true': 'True', 'false': 'False'}.get(value, value)
+
+    def _ports(self, direction):
+        """ Return a list of port descriptions for 'in' or 'out'. If the
+        number of ports is not a number (e.g. still a placeholder), one
+        port is assumed. """
+        sig = self.iosig.get(direction)
+        if not sig:
+            return []
+        nports = 1
+        if is_number(sig['min_ports']):
+            nports = int(sig['min_ports'])
+        param_keys = [p['key'] for p in self.params]
+        ports = []
+        for idx in range(nports):
+            grc_type = sig['type'][min(idx, len(sig['type']) - 1)]
+            vlen = sig['vlen'][min(idx, len(sig['vlen']) - 1)].strip()
+            if not is_number(vlen) and vlen not in param_keys:
+                vlen = '<+vlen+>'
+            (suffix, value, itemsize) = self._port_types.get(grc_type, (None, None, '<+itemsize+>'))
+            if vlen != '1':
+                itemsize = '%s * %s' % (itemsize, vlen)
+            if suffix is None:
+                source = 'gr.null_source(%s)' % itemsize
+            else:
+                source = 'gr.vector_source_%s([%s for i in range(%s)], True, %s)' % (
+                        suffix, value, {True: '4096'}.get(vlen == '1', '4096 * %s' % vlen), vlen)
+            ports.append({'index': idx, 'itemsize': itemsize, 'source': source})
+        return ports
+
+    def make_script(self):
+        """ Return the benchmark script """
+        params = [{'key': p['key'], 'value': self._param_value(p)} for p in self.params]
+        return render_template(
+                Templates['bench_python'],
+                {'modname': self.modname,
+                 'blockname': self.blockname,
+                 'params': params,
+                 'param_names': ', '.join([p['key'] for p in params]),
+                 'inputs': self._ports('in'),
+                 'outputs': self._ports('out'),
+                 'nitems': self.nitems})
+
+    def save(self, fname):
+        """ Write the benchmark script to fname """
+        open(fname, 'w').write(self.make_script())
+        os.chmod(fname, 0755)
+
+    def cmake_entry(self):
+        """ The line that runs the benchmark as a regression test """
+        return 'GR_ADD_TEST(bench_%s ${PYTHON_EXECUTABLE} ${CMAKE_CURRENT_SOURCE_DIR}/bench_%s.py --qa)\n' % (
+                self.blockname, self.blockname)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+""" Regression tests for gr_modtool. Every test runs gr_modtool.py on a
+fresh module in a temporary directory. Run with 'python qa_modtool.py'. """
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+GR_MODTOOL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gr_modtool.py')
+
+### Helpers ##################################################################
+class ModToolTestCase(unittest.TestCase):
+    """ Creates module 'foo' in a temporary directory """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix='qa_modtool_')
+        self.env = dict(os.environ, XDG_CACHE_HOME=os.path.join(self.tmpdir, 'cache'))
+        self.modtool(self.tmpdir, 'newmod', 'foo')
+        self.moddir = os.path.join(self.tmpdir, 'gr-foo')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def modtool(self, cwd, *args):
+        """ Run gr_modtool.py, fail on a non-zero exit code, return the output """
+        proc = subprocess.Popen([sys.executable, GR_MODTOOL] + list(args), cwd=cwd,
+                                env=self.env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output = proc.communicate()[0]
+        self.assertEqual(proc.returncode, 0, "gr_modtool.py %s failed:\n%s" % (' '.join(args), output))
+        return output
+
+    def add_block(self, blockname, *args):
+        """ Add a C++ sync block with QA code """
+        return self.modtool(self.moddir, 'add', '-t', 'sync', '-l', 'cpp',
+                            '--argument-list', 'int k', '--add-python-qa', '--add-cpp-qa',
+                            *(args + (blockname,)))
+
+    def read(self, fname):
+        return open(os.path.join(self.moddir, fname)).read()
+
+    def exists(self, fname):
+        return os.path.exists(os.path.join(self.moddir, fname))
+
+### Rename ###################################################################
+class qa_rename(ModToolTestCase):
+    def test_cmake_verb_and_prefix(self):
+        """ Renaming 'add' must not touch add_library(), GR_ADD_TEST or add_const """
+        self.add_block('add')
+        self.add_block('add_const')
+        const_files = ('include/foo/add_const.h', 'lib/add_const_impl.h', 'lib/add_const_impl.cc',
+                       'lib/qa_add_const.h', 'lib/qa_add_const.cc', 'python/qa_add_const.py')
+        const_code = dict([(fname, self.read(fname)) for fname in const_files])
+        self.modtool(self.moddir, 'rename', 'add', 'sum')
+        for fname in const_files:
+            self.assertEqual(self.read(fname), const_code[fname])
+        for fname in ('include/foo/add.h', 'lib/add_impl.cc', 'lib/qa_add.cc', 'python/qa_add.py'):
+            self.assertFalse(self.exists(fname))
+        for fname in ('include/foo/sum.h', 'lib/sum_impl.h', 'lib/sum_impl.cc',
+                      'lib/qa_sum.h', 'lib/qa_sum.cc', 'python/qa_sum.py'):
+            self.assertTrue(self.exists(fname))
+        lib_cmake = self.read('lib/CMakeLists.txt')
+        self.assertTrue('add_library(gnuradio-foo SHARED sum_impl.cc add_const_impl.cc' in lib_cmake)
+        python_cmake = self.read('python/CMakeLists.txt')
+        self.assertTrue('GR_ADD_TEST(qa_sum ' in python_cmake)
+        self.assertTrue('GR_ADD_TEST(qa_add_const ' in python_cmake)
+        swig = self.read('swig/foo_swig.i')
+        self.assertTrue('GR_SWIG_BLOCK_MAGIC2(foo, sum);' in swig)
+        self.assertTrue('GR_SWIG_BLOCK_MAGIC2(foo, add_const);' in swig)
+        impl_h = self.read('lib/sum_impl.h')
+        self.assertTrue('INCLUDED_FOO_SUM_IMPL_H' in impl_h)
+        self.assertTrue('class sum_impl : public sum' in impl_h)
+
+### Make XML #################################################################
+class qa_makexml(ModToolTestCase):
+    def test_templated_family(self):
+        """ makexml reads the members of a templated family from the
+        family's .cc and the members' headers """
+        self.add_block('fam', '--types', 'ff,cc', '--templated')
+        self.add_block('plain')
+        for fname in ('foo_fam_ff.xml', 'foo_fam_cc.xml', 'foo_plain.xml'):
+            os.remove(os.path.join(self.moddir, 'grc', fname))
+        self.modtool(self.moddir, 'makexml', '-p', '.')
+        fam_ff = self.read('grc/foo_fam_ff.xml')
+        fam_cc = self.read('grc/foo_fam_cc.xml')
+        self.assertTrue('<make>foo.fam_ff($k)</make>' in fam_ff)
+        self.assertTrue('<type>float</type>' in fam_ff)
+        self.assertTrue('<make>foo.fam_cc($k)</make>' in fam_cc)
+        self.assertTrue('<type>complex</type>' in fam_cc)
+        self.assertTrue(self.exists('grc/foo_plain.xml'))
+
+    def test_int_family(self):
+        """ makexml handles int members, templated or not """
+        self.add_block('tfam', '--types', 'ff,ii', '--templated')
+        self.add_block('fam', '--types', 'ff,ii')
+        for fname in ('foo_tfam_ii.xml', 'foo_fam_ii.xml'):
+            os.remove(os.path.join(self.moddir, 'grc', fname))
+        self.modtool(self.moddir, 'makexml', '-p', '.')
+        for fname in ('grc/foo_tfam_ii.xml', 'grc/foo_fam_ii.xml'):
+            self.assertTrue('<type>int</type>' in self.read(fname))
+
+    def test_keep_edited_xml(self):
+        """ makexml -y keeps GRC bindings edited by hand, --force overwrites them """
+        self.add_block('blk')
+        self.modtool(self.moddir, 'makexml', '-p', '.')
+        fname_xml = os.path.join(self.moddir, 'grc', 'foo_blk.xml')
+        open(fname_xml, 'a').write('<!-- edited -->\n')
+        self.modtool(self.moddir, 'makexml', '-y', '-p', '.')
+        self.assertTrue('<!-- edited -->' in self.read('grc/foo_blk.xml'))
+        self.modtool(self.moddir, 'makexml', '--force', '-p', '.')
+        self.assertFalse('<!-- edited -->' in self.read('grc/foo_blk.xml'))
+
+### New module ###############################################################
+class qa_newmod(ModToolTestCase):
+    def test_skeleton_jobs(self):
+        """ A skeleton directory gives the same module with and without threads """
+        self.add_block('blk')
+        trees = []
+        for jobs in ('1', '4'):
+            moddir = os.path.join(self.tmpdir, 'bar%s' % jobs)
+            self.modtool(self.tmpdir, 'newmod', '--skeleton', self.moddir, '--placeholder', 'foo',
+                         '-j', jobs, '-d', moddir, 'bar')
+            tree = {}
+            for (dirpath, dirnames, filenames) in os.walk(moddir):
+                for fname in filenames:
+                    path = os.path.join(dirpath, fname)
+                    tree[os.path.relpath(path, moddir)] = open(path).read()
+            trees.append(tree)
+        self.assertEqual(trees[0], trees[1])
+        self.assertTrue('class BAR_API blk' in trees[1][os.path.join('include', 'bar', 'blk.h')])
+
+### Locking ##################################################################
+class qa_lock(ModToolTestCase):
+    def test_no_lock_file_left(self):
+        """ Commands must not leave their lock file behind """
+        self.add_block('blk')
+        self.modtool(self.moddir, 'info')
+        self.assertFalse(self.exists('.gr_modtool.lock'))
+        os.mkdir(os.path.join(self.moddir, 'build'))
+        self.add_block('blk2')
+        self.assertEqual(os.listdir(os.path.join(self.moddir, 'build')), [])
+        self.assertFalse(self.exists('.gr_modtool.lock'))
+
+if __name__ == '__main__':
+    unittest.main()
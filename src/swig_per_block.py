@@ -0,0 +1,104 @@
+""" Per-block SWIG interface files """
+
+import os
+import re
+
+from cmakefile_editor import CMakeFileEditor
+from templates import Templates
+from code_generator import get_template
+from template_backend import render_template
+
+### Per-block SWIG layout ####################################################
+class PerBlockSwig(object):
+    """ Manages the per-block SWIG layout: Every block has its own
+    swig/<block>.i, which the main SWIG file %includes. The build can then
+    either wrap everything in one module as usual, or (ENABLE_SPLIT_SWIG)
+    build one SWIG module per block. """
+    marker = '// Per-block SWIG files (maintained by gr_modtool)'
+    def __init__(self, modname, mainswigfile, swigdir='swig'):
+        self.modname = modname
+        self.swigdir = swigdir
+        self.mainswigfile = mainswigfile
+        self.swigname = os.path.splitext(mainswigfile)[0]
+        self.swigfile = os.path.join(swigdir, mainswigfile)
+        self.cmfile = os.path.join(swigdir, 'CMakeLists.txt')
+
+    def is_enabled(self):
+        """ True if the module uses per-block SWIG files """
+        return self.marker in open(self.swigfile).read()
+
+    def enable(self, version, edit_cmakefile=True):
+        """ Switch to the per-block layout. Adds the marker section to the
+        main SWIG file, moves the blocks that are already in there into
+        their own files and adds the ENABLE_SPLIT_SWIG option to the CMake
+        file. Headers without a block (or blocks that are commented out)
+        stay in the main file and are only wrapped in the non-split build. """
+        if self.is_enabled():
+            return
+        print "Switching %s to per-block SWIG files..." % self.swigfile
+        blocknames = self._remove_blocks_from_main(version)
+        open(self.swigfile, 'a').write('\n%s\n' % self.marker)
+        for blockname in blocknames:
+            self.add_block({'modname': self.modname, 'blockname': blockname,
+                            'version': version, 'blocktype': 'noblock'},
+                           edit_cmakefile)
+        if not edit_cmakefile:
+            return
+        ed = CMakeFileEditor(self.cmfile)
+        swig_make_re = r'^GR_SWIG_MAKE\(\s*%s\s+%s\s*\)[ \t]*$' % (re.escape(self.swigname),
+                                                                   re.escape(self.mainswigfile))
+        swig_install_re = r'^(GR_SWIG_INSTALL\(\s*TARGETS\s+%s\s[^()]*\))[ \t]*$' % re.escape(self.swigname)
+        mobj = re.search(swig_make_re, ed.cfile, flags=re.MULTILINE)
+        if mobj is None or not re.search(swig_install_re, ed.cfile, flags=re.MULTILINE):
+            print "Warning: Can't find GR_SWIG_MAKE() or GR_SWIG_INSTALL() for %s in %s." % (
+                    self.swigname, self.cmfile)
+            print "The blocks are still wrapped in one module, but ENABLE_SPLIT_SWIG is not available."
+            return
+        cmake_section = render_template(
+                Templates['swig_split_cmakeentry'],
+                {'modname': self.modname,
+                 'mainswigfile': self.mainswigfile,
+                 'swigname': self.swigname,
+                 'swig_make': mobj.group(0)})
+        ed.cfile = ed.cfile.replace(mobj.group(0), cmake_section.rstrip('\n'), 1)
+        ed.cfile = re.sub(swig_install_re,
+                          lambda mobj: 'if(NOT ENABLE_SPLIT_SWIG)\n%s%s\nendif(NOT ENABLE_SPLIT_SWIG)' % (
+                                       ed.indent, mobj.group(1)),
+                          ed.cfile, count=1, flags=re.MULTILINE)
+        ed.write()
+
+    def _remove_blocks_from_main(self, version):
+        """ Remove the #include, %include and block magic of all blocks from
+        the main SWIG file. Returns the names of the removed blocks. """
+        swigfile = open(self.swigfile).read()
+        mod_block_sep = {'37': '/'}.get(version, '_')
+        magic_re = r'^GR_SWIG_BLOCK_MAGIC2?\(\s*%s\s*,\s*%s\s*\);[ \t]*(\n|$)'
+        blocknames = []
+        for blockname in re.findall(magic_re % (re.escape(self.modname), r'(\w+)'), swigfile, flags=re.MULTILINE):
+            blockname = blockname[0]
+            if os.path.exists(os.path.join(self.swigdir, blockname + '.i')):
+                continue
+            header = re.escape('%s%s%s.h' % (self.modname, mod_block_sep, blockname))
+            swigfile = re.sub(r'^[#%%]include\s+"%s"[ \t]*(\n|$)' % header, '', swigfile, flags=re.MULTILINE)
+            swigfile = re.sub(magic_re % (re.escape(self.modname), blockname), '', swigfile, flags=re.MULTILINE)
+            blocknames.append(blockname)
+        open(self.swigfile, 'w').write(swigfile)
+        return blocknames
+
+    def add_block(self, info, edit_cmakefile=True):
+        """ Create swig/<block>.i for the block described by info, include
+        it from the main SWIG file and install it for development. """
+        fname_i = info['blockname'] + '.i'
+        if os.path.exists(os.path.join(self.swigdir, fname_i)):
+            print "Warning: %s already exists, not creating a SWIG file for this block." % (
+                    os.path.join(self.swigdir, fname_i))
+            return
+        print "Adding file '%s'..." % fname_i
+        open(os.path.join(self.swigdir, fname_i), 'w').write(
+                get_template('swig_block_i', swigname=self.swigname, **info))
+        print "Editing %s..." % self.swigfile
+        open(self.swigfile, 'a').write('%%include "%s"\n' % fname_i)
+        if edit_cmakefile:
+            ed = CMakeFileEditor(self.cmfile, '\n    ')
+            ed.append_value('install', fname_i, 'DESTINATION[^()]+')
+            ed.write()
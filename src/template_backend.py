@@ -0,0 +1,300 @@
+""" Template backends: Cheetah, and a builtin renderer for the part of the
+Cheetah syntax the templates use """
+
+import os
+import re
+import sys
+import __builtin__
+
+### Template backends ########################################################
+try:
+    import Cheetah.Template
+except ImportError:
+    Cheetah = None
+
+class CheetahBackend(object):
+    """ Renders templates with Cheetah """
+    name = 'cheetah'
+    def render(self, src, searchList):
+        """ Substitute the template src """
+        return str(Cheetah.Template.Template(src, searchList=searchList))
+
+class BuiltinBackend(object):
+    """ A small renderer for the Cheetah subset used in templates.py:
+    $var, ${expr}, dotted access to dict keys and attributes (like
+    Cheetah's NameMapper, including autocalling), the directives #if,
+    #else if, #else, #for, #set, #silent, #pass, #stop and #end, inline
+    #if ... then ... else ...#, ## comments, empty directives (a # at the
+    end of a line, which eats the newline) and the escapes \\$ and \\#.
+    Templates are compiled to Python functions once and cached, which is
+    what makes this a lot faster than Cheetah. """
+    name = 'builtin'
+    _directive_re = re.compile(r'\s*#(if|else if|elif|else|for|end|set|silent|pass|stop)\b\s*(.*?)\s*$')
+    _ident_re = re.compile(r'[A-Za-z_]\w*')
+    _set_re = re.compile(r'\$?([A-Za-z_]\w*)\s*=(?!=)\s*(.*)$')
+    def __init__(self):
+        self._cache = {}
+
+    def render(self, src, searchList):
+        """ Substitute the template src """
+        if src not in self._cache:
+            self._cache[src] = self.compile(src)
+        return self._cache[src]({}, [searchList], _lookup, _filter)
+
+    def compile(self, src):
+        """ Turn the template src into a Python function """
+        code = ['def _render(_v, _sl, _lk, _f):', ' _o = []', ' _w = _o.append']
+        literal = []
+        indent = 1
+        def flush():
+            if literal:
+                code.append(' ' * indent + '_w(%r)' % ''.join(literal))
+                del literal[:]
+        def emit(line):
+            flush()
+            code.append(' ' * indent + line)
+        for line in src.splitlines(True):
+            mobj = self._directive_re.match(line)
+            if mobj is not None and not (mobj.group(1) == 'if' and self._split_inline_if(mobj.group(2))):
+                (directive, arg) = mobj.groups()
+                flush()
+                if directive == 'if':
+                    emit('if %s:' % self._translate(arg))
+                elif directive in ('else if', 'elif'):
+                    indent -= 1
+                    emit('elif %s:' % self._translate(arg))
+                elif directive == 'else':
+                    indent -= 1
+                    emit('else:')
+                elif directive == 'for':
+                    (target, iterable) = self._split_top_level(arg, ' in ', 1)
+                    target = re.sub(r'\$([A-Za-z_]\w*)', r"_v['\1']", target)
+                    emit('for %s in %s:' % (target, self._translate(iterable)))
+                elif directive == 'end':
+                    emit('pass')
+                    indent -= 1
+                    continue
+                elif directive == 'set':
+                    setobj = self._set_re.match(arg)
+                    if setobj is None:
+                        raise SyntaxError("Invalid #set directive: %s" % line.strip())
+                    emit('_v[%r] = %s' % (setobj.group(1), self._translate(setobj.group(2))))
+                    continue
+                elif directive == 'silent':
+                    emit(self._translate(arg))
+                    continue
+                elif directive == 'pass':
+                    emit('pass')
+                    continue
+                elif directive == 'stop':
+                    emit("return ''.join(_o)")
+                    continue
+                indent += 1
+                emit('pass')
+                continue
+            if line.lstrip().startswith('##') or (line.strip() == '#' and line.endswith('\n')):
+                continue
+            for (kind, value) in self._parse_text(line):
+                if kind == 'literal':
+                    literal.append(value)
+                else:
+                    emit('_w(_f(%s))' % value)
+        emit("return ''.join(_o)")
+        namespace = {}
+        exec compile('\n'.join(code) + '\n', '<template>', 'exec') in namespace
+        return namespace['_render']
+
+    def _scan_string(self, text, pos):
+        """ text[pos] is a quote, return the position after the string """
+        quote = text[pos]
+        pos += 1
+        while pos < len(text) and text[pos] != quote:
+            if text[pos] == '\\':
+                pos += 1
+            pos += 1
+        return pos + 1
+
+    def _scan_brackets(self, text, pos):
+        """ text[pos] is an opening bracket, return the position after the
+        matching closing bracket """
+        depth = 0
+        while pos < len(text):
+            if text[pos] in '\'"':
+                pos = self._scan_string(text, pos)
+                continue
+            if text[pos] in '([{':
+                depth += 1
+            elif text[pos] in ')]}':
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            pos += 1
+        raise SyntaxError("Unbalanced brackets in template: %s" % text.strip())
+
+    def _scan_name(self, text, pos):
+        """ Return the dotted name starting at text[pos] and its end """
+        end = self._ident_re.match(text, pos).end()
+        while text[end:end+1] == '.' and self._ident_re.match(text, end + 1):
+            end = self._ident_re.match(text, end + 1).end()
+        return (text[pos:end], end)
+
+    def _split_top_level(self, text, sep, maxsplit=-1):
+        """ Split text at sep, but not inside strings or brackets """
+        parts = []
+        start = pos = 0
+        while pos < len(text):
+            if text[pos] in '\'"':
+                pos = self._scan_string(text, pos)
+            elif text[pos] in '([{':
+                pos = self._scan_brackets(text, pos)
+            elif text.startswith(sep, pos) and maxsplit != len(parts):
+                parts.append(text[start:pos])
+                pos += len(sep)
+                start = pos
+            else:
+                pos += 1
+        return parts + [text[start:]]
+
+    def _split_inline_if(self, text):
+        """ Return (condition, then, else) of an inline #if, or None """
+        parts = self._split_top_level(text, ' then ', 1)
+        if len(parts) != 2:
+            return None
+        parts = [parts[0]] + self._split_top_level(parts[1], ' else ', 1)
+        if len(parts) != 3:
+            return None
+        return parts
+
+    def _lookup_code(self, text, pos):
+        """ Translate the placeholder name at text[pos] (after the $) """
+        (name, end) = self._scan_name(text, pos)
+        autocall = text[end:end+1] != '('
+        return ('_lk(_v, _sl, %r, %r)' % (name, autocall), end)
+
+    def _translate(self, expr):
+        """ Translate a Cheetah expression into Python """
+        out = []
+        pos = 0
+        while pos < len(expr):
+            if expr[pos] in '\'"':
+                end = self._scan_string(expr, pos)
+                out.append(expr[pos:end])
+                pos = end
+            elif expr[pos] == '$' and self._ident_re.match(expr, pos + 1):
+                (code, pos) = self._lookup_code(expr, pos + 1)
+                out.append(code)
+            else:
+                out.append(expr[pos])
+                pos += 1
+        return ''.join(out)
+
+    def _parse_text(self, text):
+        """ Split a line of text into ('literal', str) and ('expr', code) """
+        parts = []
+        pos = 0
+        while pos < len(text):
+            char = text[pos]
+            if char == '\\' and text[pos+1:pos+2] in ('$', '#'):
+                parts.append(('literal', text[pos+1]))
+                pos += 2
+            elif char == '$' and text[pos+1:pos+2] == '{':
+                end = self._scan_brackets(text, pos + 1)
+                inner = text[pos+2:end-1].strip()
+                if self._ident_re.match(inner):
+                    inner = '$' + inner
+                parts.append(('expr', self._translate(inner)))
+                pos = end
+            elif char == '$' and self._ident_re.match(text, pos + 1):
+                (code, pos) = self._lookup_code(text, pos + 1)
+                while text[pos:pos+1] in ('(', '['):
+                    end = self._scan_brackets(text, pos)
+                    code += self._translate(text[pos:end])
+                    pos = end
+                parts.append(('expr', code))
+            elif char == '#' and text.startswith('##', pos):
+                pos = len(text.rstrip('\r\n'))
+            elif char == '#' and re.match(r'#[ \t]*\r?\n', text[pos:]):
+                pos = len(text)
+            elif char == '#' and re.match(r'#if\s', text[pos:]):
+                end = pos + 3
+                while end < len(text) and text[end] != '#':
+                    if text[end] in '\'"':
+                        end = self._scan_string(text, end)
+                    else:
+                        end += 1
+                inline_if = self._split_inline_if(text[pos+3:end].strip())
+                if inline_if is None:
+                    raise SyntaxError("Invalid inline #if: %s" % text.strip())
+                (cond, then, otherwise) = [self._translate(part.strip()) for part in inline_if]
+                parts.append(('expr', '(%s) if (%s) else (%s)' % (then, cond, otherwise)))
+                pos = end + 1
+            else:
+                parts.append(('literal', char))
+                pos += 1
+        return parts
+
+def _filter(value):
+    """ Turn a placeholder value into text, like Cheetah's default filter """
+    if value is None:
+        return ''
+    return str(value)
+
+def _autocall(obj):
+    """ Call obj if it is a function or method (but not a class) """
+    if callable(obj) and not isinstance(obj, type):
+        return obj()
+    return obj
+
+def _lookup(local_vars, search_list, name, autocall):
+    """ Find a dotted name like Cheetah's NameMapper: The first part is
+    looked up in the local variables (#set, #for), the search list and the
+    builtins, the rest are dict keys or attributes. """
+    chunks = name.split('.')
+    if chunks[0] in local_vars:
+        obj = local_vars[chunks[0]]
+    else:
+        for namespace in search_list:
+            if isinstance(namespace, dict) and chunks[0] in namespace:
+                obj = namespace[chunks[0]]
+                break
+            if hasattr(namespace, chunks[0]):
+                obj = getattr(namespace, chunks[0])
+                break
+        else:
+            if not hasattr(__builtin__, chunks[0]):
+                raise NameError("Template variable '%s' not found" % chunks[0])
+            obj = getattr(__builtin__, chunks[0])
+        if autocall:
+            obj = _autocall(obj)
+    for key in chunks[1:]:
+        if isinstance(obj, dict) and key in obj:
+            obj = obj[key]
+        else:
+            obj = getattr(obj, key)
+        if autocall:
+            obj = _autocall(obj)
+    return obj
+
+backends = {'builtin': BuiltinBackend, 'cheetah': CheetahBackend}
+_backend = None
+
+def get_backend():
+    """ Return the template backend. It is chosen by the environment
+    variable GR_MODTOOL_TEMPLATE_BACKEND (builtin or cheetah), the default
+    is the builtin renderer. """
+    global _backend
+    if _backend is None:
+        name = os.environ.get('GR_MODTOOL_TEMPLATE_BACKEND', 'builtin')
+        if name not in backends:
+            print "Unknown template backend '%s' (choose from %s)." % (name, ', '.join(sorted(backends.keys())))
+            sys.exit(1)
+        if name == 'cheetah' and Cheetah is None:
+            print "The Cheetah template backend needs Cheetah, which is not installed."
+            sys.exit(1)
+        _backend = backends[name]()
+    return _backend
+
+def render_template(src, searchList):
+    """ Substitute the template src with the variables in the dict
+    searchList """
+    return get_backend().render(src, searchList)
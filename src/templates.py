@@ -33,6 +33,14 @@ ${str_to_fancyc_comment($license)}
 \#define INCLUDED_${modname.upper()}_${blockname.upper()}_IMPL_H
 
 \#include <${modname}/${blockname}.h>
+#if $instrument
+\#include <gruel/high_res_timer.h>
+\#include <boost/atomic.hpp>
+#end if
+#if $async_io
+\#include <boost/thread/thread.hpp>
+\#include "spsc_ring.h"
+#end if
 
 namespace gr {
   namespace ${modname} {
@@ -40,7 +48,59 @@ namespace gr {
     class ${blockname}_impl : public ${blockname}
     {
     private:
+#if $async_io
+#if $blocktype == 'source'
+#set $iotype = $outtype.cpp
+#else
+#set $iotype = $intype.cpp
+#end if
+      // The I/O thread moves the items between the device and the ring,
+      // work() only copies them from or to the ring. <+tune the sizes+>
+      static const int RING_ITEMS = 65536;
+      static const int IO_CHUNK = 4096;
+      static const int IO_WAIT_US = 100;
+      spsc_ring<${iotype}> d_ring;
+      std::vector<${iotype}> d_io_buf;
+      boost::atomic<bool> d_running;
+      boost::thread d_io_thread;
+
+      void io_loop();
+#if $instrument
+
+#end if
+#end if
+#if $instrument
+      // work() statistics. Only the scheduler thread writes them, so they
+      // need no lock; the atomics let the getters read them from any thread.
+      static const int WORK_HIST_BINS = 16;
+      boost::atomic<unsigned long long> d_work_calls;
+      boost::atomic<unsigned long long> d_work_items;
+      boost::atomic<gruel::high_res_timer_type> d_work_ticks;
+      boost::atomic<gruel::high_res_timer_type> d_work_ticks_max;
+      boost::atomic<unsigned long long> d_work_hist[WORK_HIST_BINS];
+
+      void update_work_stats(gruel::high_res_timer_type ticks, int nitems);
+#else if $blocktype == 'message'
+      // Handles the messages on the input port 'in'
+      void handle_msg(pmt::pmt_t msg);
+#else if not $async_io
       // Nothing to declare in this block.
+#end if
+#if $blocktype == 'tagged_stream'
+
+    protected:
+      int calculate_output_stream_length(const gr_vector_int &ninput_items);
+#end if
+#if $async_io
+
+    protected:
+      // The device. Virtual, so the QA code can stand in for it.
+#if $blocktype == 'source'
+      virtual int read_items(${iotype} *buf, int nitems);
+#else
+      virtual void write_items(const ${iotype} *buf, int nitems);
+#end if
+#end if
 
     public:
       ${blockname}_impl(${strip_default_values($arglist)});
@@ -54,13 +114,37 @@ namespace gr {
 		       gr_vector_int &ninput_items,
 		       gr_vector_const_void_star &input_items,
 		       gr_vector_void_star &output_items);
-#else if $blocktype == 'hier'
+#else if $blocktype == 'tagged_stream'
+      // Where all the action really happens
+      int work(int noutput_items,
+	       gr_vector_int &ninput_items,
+	       gr_vector_const_void_star &input_items,
+	       gr_vector_void_star &output_items);
+#else if $blocktype in ('hier', 'message')
 #silent pass
 #else
       // Where all the action really happens
       int work(int noutput_items,
 	       gr_vector_const_void_star &input_items,
 	       gr_vector_void_star &output_items);
+#end if
+#if $async_io
+
+      // Start and stop the I/O thread
+      bool start();
+      bool stop();
+#end if
+#if $instrument
+
+      unsigned long long work_calls() const;
+      double work_time_avg() const;
+      double work_time_max() const;
+      double work_items_avg() const;
+      std::vector<double> work_time_histogram() const;
+      void reset_work_stats();
+\#ifdef GR_CTRLPORT
+      void setup_rpc();
+\#endif
 #end if
     };
 
@@ -79,11 +163,29 @@ ${str_to_fancyc_comment($license)}
 \#endif
 
 \#include <gr_io_signature.h>
+#if $kernel == 'volk'
+\#include <volk/volk.h>
+\#include <algorithm>
+#end if
 #if $blocktype == 'noblock'
 \#include <${modname}/${blockname}.h>
 #else
 \#include "${blockname}_impl.h"
 #end if
+#if $affinity
+\#include "thread_policy.h"
+#end if
+#if $instrument
+\#ifdef GR_CTRLPORT
+\#include <rpcregisterhelpers.h>
+\#endif
+#end if
+#if $blocktype == 'message' or $async_io
+\#include <boost/bind.hpp>
+#end if
+#if $async_io
+\#include <algorithm>
+#end if
 
 namespace gr {
   namespace ${modname} {
@@ -107,18 +209,28 @@ namespace gr {
 #set $decimation = ', <+decimation+>'
 #else if $blocktype == 'interpolator'
 #set $decimation = ', <+interpolation+>'
+#else if $blocktype == 'tagged_stream' and 'length_tag_key' in $arglist
+#set $decimation = ', length_tag_key'
+#else if $blocktype == 'tagged_stream'
+#set $decimation = ', "packet_len"'
 #else
 #set $decimation = ''
 #end if
-#if $blocktype == 'source'
+#if $blocktype in ('source', 'message')
 #set $inputsig = '0, 0, 0'
 #else
-#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (<+float+>)'
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (%s)' % $intype.size
 #end if
-#if $blocktype == 'sink'
+#if $blocktype in ('sink', 'message')
 #set $outputsig = '0, 0, 0'
 #else
-#set $outputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (<+float+>)'
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, sizeof (%s)' % $outtype.size
+#end if
+#if $async_io
+    const int ${blockname}_impl::RING_ITEMS;
+    const int ${blockname}_impl::IO_CHUNK;
+    const int ${blockname}_impl::IO_WAIT_US;
+
 #end if
     /*
      * The private constructor
@@ -126,13 +238,52 @@ namespace gr {
     ${blockname}_impl::${blockname}_impl(${strip_default_values($arglist)})
       : ${grblocktype}("${blockname}",
 		      gr_make_io_signature($inputsig),
+#if $async_io
+		      gr_make_io_signature($outputsig)$decimation),
+        d_ring(RING_ITEMS), d_io_buf(IO_CHUNK), d_running(false)
+#else
 		      gr_make_io_signature($outputsig)$decimation)
+#end if
 #if $blocktype == 'hier'
     {
         connect(self(), 0, d_firstblock, 0);
         // connect other blocks
         connect(d_lastblock, 0, self(), 0);
     }
+#else if $blocktype == 'message'
+    {
+      message_port_register_in(pmt::mp("in"));
+      set_msg_handler(pmt::mp("in"),
+                      boost::bind(&${blockname}_impl::handle_msg, this, _1));
+      message_port_register_out(pmt::mp("out"));
+#if $affinity
+      // Processor affinity and thread priority from ${modname}_affinity.conf
+      apply_thread_policy(this, "${blockname}");
+#end if
+    }
+#else if $kernel == 'volk' or $hints or $instrument or $affinity
+    {
+#if $instrument
+      reset_work_stats();
+#end if
+#if $kernel == 'volk'
+      // Let VOLK work on aligned buffers
+      const int alignment_multiple =
+        volk_get_alignment() / sizeof (${volk_align_type});
+      set_alignment(std::max(1, alignment_multiple));
+      set_output_multiple(std::max(1, alignment_multiple));
+#end if
+#if $hints
+      // Buffer and scheduling hints
+#for $hint in $hints
+      ${hint.call}(${hint.value});
+#end for
+#end if
+#if $affinity
+      // Processor affinity and thread priority from ${modname}_affinity.conf
+      apply_thread_policy(this, "${blockname}");
+#end if
+    }
 #else
     {}
 #end if
@@ -142,13 +293,26 @@ namespace gr {
      */
     ${blockname}_impl::~${blockname}_impl()
     {
+#if $async_io
+      // In case the flow graph was never stopped
+      if (d_io_thread.joinable()) {
+        d_running.store(false, boost::memory_order_release);
+        d_io_thread.join();
+      }
+#end if
     }
 
 #if $blocktype == 'general'
     void
     ${blockname}_impl::forecast (int noutput_items, gr_vector_int &ninput_items_required)
     {
+#if $hints
+        // <+forecast+> Every input needs the history on top of noutput_items
+        for (unsigned int i = 0; i < ninput_items_required.size(); i++)
+          ninput_items_required[i] = noutput_items + history() - 1;
+#else
         /* <+forecast+> e.g. ninput_items_required[0] = noutput_items */
+#end if
     }
 
     int
@@ -157,17 +321,105 @@ namespace gr {
                        gr_vector_const_void_star &input_items,
                        gr_vector_void_star &output_items)
     {
-        const float *in = (const float *) input_items[0];
-        float *out = (float *) output_items[0];
+#if $instrument
+        const gruel::high_res_timer_type work_start = gruel::high_res_timer_now();
+#end if
+#if $kernel == 'volk'
+#for $port in $volk_inputs
+        const ${port.ctype} *${port.name} = (const ${port.ctype} *) input_items[${port.index}];
+#end for
+#for $port in $volk_outputs
+        ${port.ctype} *${port.name} = (${port.ctype} *) output_items[${port.index}];
+#end for
+
+        if (is_unaligned()) {
+          // Unaligned buffers: The dispatcher picks a kernel for them
+          ${volk_kernel}(${volk_args});
+        }
+        else {
+          // Aligned fast path
+          ${volk_kernel}_a(${volk_args});
+        }
+
+#else
+        const ${intype.cpp} *in = (const ${intype.cpp} *) input_items[0];
+        ${outtype.cpp} *out = (${outtype.cpp} *) output_items[0];
 
         // Do <+signal processing+>
+#end if
         // Tell runtime system how many input items we consumed on
         // each input stream.
         consume_each (noutput_items);
 
+#if $instrument
+        update_work_stats(gruel::high_res_timer_now() - work_start, noutput_items);
+
+#end if
         // Tell runtime system how many output items we produced.
         return noutput_items;
     }
+#else if $blocktype == 'tagged_stream'
+    int
+    ${blockname}_impl::calculate_output_stream_length(const gr_vector_int &ninput_items)
+    {
+      // <+output packet length+> e.g. as long as the input packet
+      int noutput_items = ninput_items[0];
+      return noutput_items;
+    }
+
+    int
+    ${blockname}_impl::work (int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items)
+    {
+#if $instrument
+        const gruel::high_res_timer_type work_start = gruel::high_res_timer_now();
+#end if
+        const ${intype.cpp} *in = (const ${intype.cpp} *) input_items[0];
+        ${outtype.cpp} *out = (${outtype.cpp} *) output_items[0];
+
+        // Every call gets one packet of ninput_items[0] items. There is
+        // room for the number of items calculate_output_stream_length()
+        // returned.
+        // Do <+signal processing+>
+
+#if $instrument
+        update_work_stats(gruel::high_res_timer_now() - work_start, noutput_items);
+
+#end if
+        // Tell runtime system how many output items we produced. This is
+        // also the length tag of the output packet.
+        return noutput_items;
+    }
+#else if $blocktype == 'message'
+    void
+    ${blockname}_impl::handle_msg(pmt::pmt_t msg)
+    {
+      // PDUs are pairs of metadata (a dict) and payload (a u8vector)
+      if (!pmt::is_pair(msg) || !pmt::is_u8vector(pmt::cdr(msg))) {
+        return; // <+handle other messages+>
+      }
+      pmt::pmt_t payload = pmt::cdr(msg);
+
+      // blob_data() points into the PMT, which every block subscribed to
+      // the same port shares. So the payload is only read in place, and
+      // the same PMT is published, nothing is copied.
+      const size_t len = pmt::blob_length(payload);
+      const uint8_t *data = (const uint8_t *) pmt::blob_data(payload);
+      // Do <+signal processing+> on data[0] ... data[len-1]
+
+      message_port_pub(pmt::mp("out"), msg);
+
+      // To change the payload, publish a copy instead:
+      //   pmt::pmt_t out = pmt::init_u8vector(len, data);
+      //   size_t out_len;
+      //   uint8_t *out_data = pmt::u8vector_writable_elements(out, out_len);
+      //   <+change out_data[0] ... out_data[out_len-1]+>
+      //   message_port_pub(pmt::mp("out"), pmt::cons(pmt::car(msg), out));
+      // Writing through blob_data() instead is only safe if this block is
+      // the only subscriber of the message.
+    }
 #else if $blocktype == 'hier'
 #silent pass
 #else
@@ -176,15 +428,236 @@ namespace gr {
 			  gr_vector_const_void_star &input_items,
 			  gr_vector_void_star &output_items)
     {
-        const float *in = (const float *) input_items[0];
-        float *out = (float *) output_items[0];
+#if $instrument
+        const gruel::high_res_timer_type work_start = gruel::high_res_timer_now();
+#end if
+#if $kernel == 'volk'
+#for $port in $volk_inputs
+        const ${port.ctype} *${port.name} = (const ${port.ctype} *) input_items[${port.index}];
+#end for
+#for $port in $volk_outputs
+        ${port.ctype} *${port.name} = (${port.ctype} *) output_items[${port.index}];
+#end for
+
+        if (is_unaligned()) {
+          // Unaligned buffers: The dispatcher picks a kernel for them
+          ${volk_kernel}(${volk_args});
+        }
+        else {
+          // Aligned fast path
+          ${volk_kernel}_a(${volk_args});
+        }
+#else if $async_io and $blocktype == 'source'
+        ${outtype.cpp} *out = (${outtype.cpp} *) output_items[0];
+
+        // Only copy what the I/O thread has read, never wait for I/O here
+        noutput_items = d_ring.read(out, noutput_items);
+        if (noutput_items == 0) {
+          // Nothing read yet: Don't spin the scheduler thread
+          boost::this_thread::sleep(boost::posix_time::microseconds(IO_WAIT_US));
+        }
+#else if $async_io
+        const ${intype.cpp} *in = (const ${intype.cpp} *) input_items[0];
+
+        // Only hand the items over to the I/O thread. If the ring is full,
+        // fewer items are consumed, which throttles the upstream blocks
+        // (backpressure).
+        noutput_items = d_ring.write(in, noutput_items);
+        if (noutput_items == 0) {
+          // The device is behind: Don't spin the scheduler thread
+          boost::this_thread::sleep(boost::posix_time::microseconds(IO_WAIT_US));
+        }
+#else
+        const ${intype.cpp} *in = (const ${intype.cpp} *) input_items[0];
+        ${outtype.cpp} *out = (${outtype.cpp} *) output_items[0];
 
         // Do <+signal processing+>
+#end if
+
+#if $instrument
+        update_work_stats(gruel::high_res_timer_now() - work_start, noutput_items);
 
+#end if
         // Tell runtime system how many output items we produced.
         return noutput_items;
     }
 #end if
+#if $async_io
+#if $blocktype == 'source'
+#set $iotype = $outtype.cpp
+#else
+#set $iotype = $intype.cpp
+#end if
+
+    bool
+    ${blockname}_impl::start()
+    {
+      d_ring.reset();
+      d_running.store(true, boost::memory_order_release);
+      d_io_thread = boost::thread(boost::bind(&${blockname}_impl::io_loop, this));
+      return ${grblocktype}::start();
+    }
+
+    bool
+    ${blockname}_impl::stop()
+    {
+      d_running.store(false, boost::memory_order_release);
+      if (d_io_thread.joinable()) {
+        d_io_thread.join();
+      }
+      return ${grblocktype}::stop();
+    }
+
+#if $blocktype == 'source'
+    void
+    ${blockname}_impl::io_loop()
+    {
+      while (d_running.load(boost::memory_order_acquire)) {
+        // Backpressure: Wait until work() has made room for a whole chunk
+        if (d_ring.space() < d_io_buf.size()) {
+          boost::this_thread::sleep(boost::posix_time::microseconds(IO_WAIT_US));
+          continue;
+        }
+        const int nitems = read_items(&d_io_buf[0], d_io_buf.size());
+        if (nitems > 0) {
+          d_ring.write(&d_io_buf[0], nitems);
+        }
+      }
+    }
+
+    int
+    ${blockname}_impl::read_items(${iotype} *buf, int nitems)
+    {
+      // <+blocking read from the file, socket or device+>, e.g.
+      // return ::read(d_fd, buf, nitems * sizeof(${iotype})) / sizeof(${iotype});
+      std::fill(buf, buf + nitems, ${iotype}());
+      return nitems;
+    }
+#else
+    void
+    ${blockname}_impl::io_loop()
+    {
+      for (;;) {
+        const size_t nitems = d_ring.read(&d_io_buf[0], d_io_buf.size());
+        if (nitems == 0) {
+          // Stop once everything work() handed over is written
+          if (!d_running.load(boost::memory_order_acquire)) {
+            break;
+          }
+          boost::this_thread::sleep(boost::posix_time::microseconds(IO_WAIT_US));
+          continue;
+        }
+        write_items(&d_io_buf[0], nitems);
+      }
+    }
+
+    void
+    ${blockname}_impl::write_items(const ${iotype} *buf, int nitems)
+    {
+      // <+blocking write to the file, socket or device+>, e.g.
+      // ::write(d_fd, buf, nitems * sizeof(${iotype}));
+    }
+#end if
+#end if
+#if $instrument
+
+    void
+    ${blockname}_impl::update_work_stats(gruel::high_res_timer_type ticks, int nitems)
+    {
+      d_work_calls.fetch_add(1, boost::memory_order_relaxed);
+      d_work_items.fetch_add(nitems, boost::memory_order_relaxed);
+      d_work_ticks.fetch_add(ticks, boost::memory_order_relaxed);
+      if (ticks > d_work_ticks_max.load(boost::memory_order_relaxed))
+        d_work_ticks_max.store(ticks, boost::memory_order_relaxed);
+      // Bin i counts the calls that took less than 2^i us, the last bin
+      // also all longer ones
+      const double usecs = ticks * 1e6 / gruel::high_res_timer_tps();
+      int bin = 0;
+      while (bin < WORK_HIST_BINS - 1 && usecs >= (1 << bin))
+        bin++;
+      d_work_hist[bin].fetch_add(1, boost::memory_order_relaxed);
+    }
+
+    unsigned long long
+    ${blockname}_impl::work_calls() const
+    {
+      return d_work_calls.load(boost::memory_order_relaxed);
+    }
+
+    double
+    ${blockname}_impl::work_time_avg() const
+    {
+      const unsigned long long calls = work_calls();
+      if (calls == 0)
+        return 0;
+      return double(d_work_ticks.load(boost::memory_order_relaxed)) / gruel::high_res_timer_tps() / calls;
+    }
+
+    double
+    ${blockname}_impl::work_time_max() const
+    {
+      return double(d_work_ticks_max.load(boost::memory_order_relaxed)) / gruel::high_res_timer_tps();
+    }
+
+    double
+    ${blockname}_impl::work_items_avg() const
+    {
+      const unsigned long long calls = work_calls();
+      if (calls == 0)
+        return 0;
+      return double(d_work_items.load(boost::memory_order_relaxed)) / calls;
+    }
+
+    std::vector<double>
+    ${blockname}_impl::work_time_histogram() const
+    {
+      std::vector<double> histogram(WORK_HIST_BINS, 0);
+      unsigned long long count = 0;
+      for (int i = 0; i < WORK_HIST_BINS; i++) {
+        count += d_work_hist[i].load(boost::memory_order_relaxed);
+        histogram[i] = count;
+      }
+      for (int i = 0; count > 0 && i < WORK_HIST_BINS; i++)
+        histogram[i] /= count;
+      return histogram;
+    }
+
+    void
+    ${blockname}_impl::reset_work_stats()
+    {
+      d_work_calls.store(0);
+      d_work_items.store(0);
+      d_work_ticks.store(0);
+      d_work_ticks_max.store(0);
+      for (int i = 0; i < WORK_HIST_BINS; i++)
+        d_work_hist[i].store(0);
+    }
+
+\#ifdef GR_CTRLPORT
+    void
+    ${blockname}_impl::setup_rpc()
+    {
+      add_rpc_variable(
+        rpcbasic_sptr(new rpcbasic_register_get<${blockname}, double>(
+          alias(), "work time avg", &${blockname}::work_time_avg,
+          pmt::mp(0.0), pmt::mp(1.0), pmt::mp(0.0),
+          "s", "Average duration of work()", RPC_PRIVLVL_MIN,
+          DISPTIME | DISPOPTSTRIP)));
+      add_rpc_variable(
+        rpcbasic_sptr(new rpcbasic_register_get<${blockname}, double>(
+          alias(), "work time max", &${blockname}::work_time_max,
+          pmt::mp(0.0), pmt::mp(1.0), pmt::mp(0.0),
+          "s", "Longest duration of work()", RPC_PRIVLVL_MIN,
+          DISPTIME | DISPOPTSTRIP)));
+      add_rpc_variable(
+        rpcbasic_sptr(new rpcbasic_register_get<${blockname}, double>(
+          alias(), "work items avg", &${blockname}::work_items_avg,
+          pmt::mp(0.0), pmt::mp(32768.0), pmt::mp(0.0),
+          "items", "Average number of items per call to work()", RPC_PRIVLVL_MIN,
+          DISPTIME | DISPOPTSTRIP)));
+    }
+\#endif /* GR_CTRLPORT */
+#end if
 #end if
 
   } /* namespace ${modname} */
@@ -236,6 +709,24 @@ namespace gr {
         * creating new instances.
         */
        static sptr make($arglist);
+#if $instrument
+
+       //! Number of calls to work() since the start or reset_work_stats()
+       virtual unsigned long long work_calls() const = 0;
+       //! Average duration of work() in seconds
+       virtual double work_time_avg() const = 0;
+       //! Longest duration of work() in seconds
+       virtual double work_time_max() const = 0;
+       //! Average number of output items per call to work()
+       virtual double work_items_avg() const = 0;
+       /*!
+        * \\brief Cumulative histogram of the work() durations: Element i is
+        * the fraction of calls that took less than 2^i microseconds.
+        */
+       virtual std::vector<double> work_time_histogram() const = 0;
+       //! Clear the work() statistics
+       virtual void reset_work_stats() = 0;
+#end if
     };
 #end if
 
@@ -246,6 +737,190 @@ namespace gr {
 
 '''
 
+# Header file of a templated block family (one implementation for all types)
+Templates['block_family_impl_h'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+\#ifndef INCLUDED_${modname.upper()}_${familyname.upper()}_IMPL_H
+\#define INCLUDED_${modname.upper()}_${familyname.upper()}_IMPL_H
+
+#for $member in $members
+\#include <${modname}/${member.blockname}.h>
+#end for
+
+namespace gr {
+  namespace ${modname} {
+
+    /*!
+     * Implementation of all ${familyname}_* blocks.
+     * BASE is the public block class, IN_T and OUT_T are its item types.
+     */
+    template <class IN_T, class OUT_T, class BASE>
+    class ${familyname}_impl : public BASE
+    {
+    private:
+      // Nothing to declare in this block.
+
+    public:
+      ${familyname}_impl(const char *name#if $arglist == '' then '' else ', '#${strip_default_values($arglist)});
+      ~${familyname}_impl();
+
+#if $blocktype == 'general'
+      void forecast (int noutput_items, gr_vector_int &ninput_items_required);
+
+      // Where all the action really happens
+      int general_work(int noutput_items,
+		       gr_vector_int &ninput_items,
+		       gr_vector_const_void_star &input_items,
+		       gr_vector_void_star &output_items);
+#else
+      // Where all the action really happens
+      int work(int noutput_items,
+	       gr_vector_const_void_star &input_items,
+	       gr_vector_void_star &output_items);
+#end if
+    };
+
+  } // namespace ${modname}
+} // namespace gr
+
+\#endif /* INCLUDED_${modname.upper()}_${familyname.upper()}_IMPL_H */
+
+'''
+
+# C++ file of a templated block family
+Templates['block_family_impl_cpp'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+\#ifdef HAVE_CONFIG_H
+\#include "config.h"
+\#endif
+
+\#include <gr_io_signature.h>
+\#include "${familyname}_impl.h"
+#if $affinity
+\#include "thread_policy.h"
+#end if
+
+namespace gr {
+  namespace ${modname} {
+
+#for $member in $members
+    ${member.blockname}::sptr
+    ${member.blockname}::make(${strip_default_values($arglist)})
+    {
+      return gnuradio::get_initial_sptr
+        (new ${familyname}_impl<${member.intype.cpp}, ${member.outtype.cpp}, ${member.blockname}>("${member.blockname}"#if $arglist == '' then '' else ', '#${strip_arg_types($arglist)}));
+    }
+
+#end for
+#if $blocktype == 'decimator'
+#set $decimation = ', <+decimation+>'
+#else if $blocktype == 'interpolator'
+#set $decimation = ', <+interpolation+>'
+#else
+#set $decimation = ''
+#end if
+#if $blocktype == 'source'
+#set $inputsig = '0, 0, 0'
+#else
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (IN_T)'
+#end if
+#if $blocktype == 'sink'
+#set $outputsig = '0, 0, 0'
+#else
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, sizeof (OUT_T)'
+#end if
+    /*
+     * The private constructor
+     */
+    template <class IN_T, class OUT_T, class BASE>
+    ${familyname}_impl<IN_T, OUT_T, BASE>::${familyname}_impl(const char *name#if $arglist == '' then '' else ', '#${strip_default_values($arglist)})
+      : ${grblocktype}(name,
+		      gr_make_io_signature($inputsig),
+		      gr_make_io_signature($outputsig)$decimation)
+#if $hints or $affinity
+    {
+#if $hints
+      // Buffer and scheduling hints
+#for $hint in $hints
+      this->${hint.call}(${hint.value});
+#end for
+#end if
+#if $affinity
+      // Processor affinity and thread priority from ${modname}_affinity.conf
+      apply_thread_policy(this, name);
+#end if
+    }
+#else
+    {}
+#end if
+
+    /*
+     * Our virtual destructor.
+     */
+    template <class IN_T, class OUT_T, class BASE>
+    ${familyname}_impl<IN_T, OUT_T, BASE>::~${familyname}_impl()
+    {
+    }
+
+#if $blocktype == 'general'
+    template <class IN_T, class OUT_T, class BASE>
+    void
+    ${familyname}_impl<IN_T, OUT_T, BASE>::forecast (int noutput_items, gr_vector_int &ninput_items_required)
+    {
+#if $hints
+        // <+forecast+> Every input needs the history on top of noutput_items
+        for (unsigned int i = 0; i < ninput_items_required.size(); i++)
+          ninput_items_required[i] = noutput_items + this->history() - 1;
+#else
+        /* <+forecast+> e.g. ninput_items_required[0] = noutput_items */
+#end if
+    }
+
+    template <class IN_T, class OUT_T, class BASE>
+    int
+    ${familyname}_impl<IN_T, OUT_T, BASE>::general_work (int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items)
+    {
+        const IN_T *in = (const IN_T *) input_items[0];
+        OUT_T *out = (OUT_T *) output_items[0];
+
+        // Do <+signal processing+>
+        // Tell runtime system how many input items we consumed on
+        // each input stream.
+        this->consume_each (noutput_items);
+
+        // Tell runtime system how many output items we produced.
+        return noutput_items;
+    }
+#else
+    template <class IN_T, class OUT_T, class BASE>
+    int
+    ${familyname}_impl<IN_T, OUT_T, BASE>::work(int noutput_items,
+			  gr_vector_const_void_star &input_items,
+			  gr_vector_void_star &output_items)
+    {
+        const IN_T *in = (const IN_T *) input_items[0];
+        OUT_T *out = (OUT_T *) output_items[0];
+
+        // Do <+signal processing+>
+
+        // Tell runtime system how many output items we produced.
+        return noutput_items;
+    }
+#end if
+
+    // The family members are the only instantiations of the template.
+#for $member in $members
+    template class ${familyname}_impl<${member.intype.cpp}, ${member.outtype.cpp}, ${member.blockname}>;
+#end for
+
+  } /* namespace ${modname} */
+} /* namespace gr */
+
+'''
+
 # Python block (from grextras!)
 Templates['block_python'] = '''\#!/usr/bin/env python
 ${str_to_python_comment($license)}
@@ -254,6 +929,9 @@ ${str_to_python_comment($license)}
 #stop
 #end if
 
+#if $blocktype != 'hier'
+import numpy
+#end if
 from gnuradio import gr
 #if $blocktype != 'hier'
 #set $parenttype = 'gr.block'
@@ -261,28 +939,40 @@ import gnuradio.extras
 #if $blocktype == 'source'
 #set $inputsig = 'None'
 #else
-#set $inputsig = '[<+numpy.float+>]'
+#set $inputsig = '[self.in_dtype]'
 #end if
 #if $blocktype == 'sink'
 #set $outputsig = 'None'
+#set $scratchtype = 'self.in_dtype'
 #else
-#set $outputsig = '[<+numpy.float+>]'
+#set $outputsig = '[self.out_dtype]'
+#set $scratchtype = 'self.out_dtype'
 #end if
 #else
 #set $parenttype = 'gr.hier_block2'
 #if $blocktype == 'source'
 #set $inputsig = '0, 0, 0'
 #else
-#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, gr.sizeof_<+float+>'
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, gr.sizeof_%s' % $intype.gr_size
 #end if
 #if $blocktype == 'sink'
 #set $outputsig = '0, 0, 0'
 #else
-#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, gr.sizeof_<+float+>'
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, gr.sizeof_%s' % $outtype.gr_size
 #end if
 #end if
 
 class ${blockname}(${parenttype}):
+#if $blocktype != 'hier'
+    # input_items and output_items are NumPy arrays of these types
+#if $blocktype != 'source'
+    in_dtype = ${intype.numpy}
+#end if
+#if $blocktype != 'sink'
+    out_dtype = ${outtype.numpy}
+#end if
+
+#end if
     def __init__(self#if $arglist == '' then '' else ', '#$arglist):
         """
         docstring
@@ -300,47 +990,120 @@ class ${blockname}(${parenttype}):
                           in_sig=${inputsig},
                           out_sig=${outputsig})
 #if $blocktype == 'decimator'
-        self.set_relative_rate(1.0/<+decimation+>)
+        self.decimation = <+decimation+>
+        self.set_relative_rate(1.0/self.decimation)
 #else if $blocktype == 'interpolator'
-        self.set_relative_rate(<+interpolation+>)
-#else if $blocktype == 'general'
+        self.interpolation = <+interpolation+>
+        self.set_relative_rate(self.interpolation)
+#end if
+        # Scratch space for intermediate results. Allocated here once, not
+        # in every call to work(); see _get_scratch().
+        self._scratch = numpy.zeros(8192, dtype=${scratchtype})
+#if $blocktype in ('general', 'decimator', 'interpolator')
         self.set_auto_consume(False)
 
     def forecast(self, noutput_items, ninput_items_required):
-        #setup size of input_items[i] for work call
+        \#setup size of input_items[i] for work call
         for i in range(len(ninput_items_required)):
+#if $blocktype == 'decimator'
+            ninput_items_required[i] = noutput_items * self.decimation
+#else if $blocktype == 'interpolator'
+            ninput_items_required[i] = (noutput_items + self.interpolation - 1) // self.interpolation
+#else
             ninput_items_required[i] = noutput_items
 #end if
 #end if
 
+    def _get_scratch(self, nitems):
+        """ Return a scratch array of nitems items. It is only reallocated
+        when work() gets more items than ever before. """
+        if len(self._scratch) < nitems:
+            self._scratch = numpy.zeros(nitems, dtype=self._scratch.dtype)
+        return self._scratch[:nitems]
+#end if
+
 #if $blocktype == 'hier'
 #stop
 #end if
-    def work(self, input_items, output_items):
-#if $blocktype != 'source'
-        in0 = input_items[0]
+    def work(self, input_items, output_items):
+#if $blocktype != 'source'
+        in0 = input_items[0]
+#end if
+#if $blocktype != 'sink'
+        out = output_items[0]
+#end if
+#if $blocktype == 'sync'
+#set $src = 'in0'
+#set $dst = 'out'
+#set $lhs = 'out[:]'
+#else if $blocktype == 'general'
+#set $src = 'in0[:n]'
+#set $dst = 'out[:n]'
+#set $lhs = 'out[:n]'
+#else if $blocktype == 'decimator'
+#set $src = 'rows[:, 0]'
+#set $dst = 'out[:n]'
+#set $lhs = 'out[:n]'
+#else if $blocktype == 'interpolator'
+#set $src = 'in0[:n, numpy.newaxis]'
+#set $dst = 'rows'
+#set $lhs = 'rows[:]'
+#end if
+#if $blocktype == 'general'
+        n = min(len(in0), len(out))
+#else if $blocktype == 'decimator'
+        # One row of self.decimation input items per output item. This is a
+        # reshaped view of in0, nothing is copied.
+        n = min(len(out), len(in0) // self.decimation)
+        rows = in0[:n * self.decimation].reshape(n, self.decimation)
+#else if $blocktype == 'interpolator'
+        # One row of self.interpolation output items per input item. This is
+        # a reshaped view of out, so writing to rows writes to out.
+        n = min(len(in0), len(out) // self.interpolation)
+        rows = out[:n * self.interpolation].reshape(n, self.interpolation)
+#end if
+#if $blocktype in ('sync', 'decimator', 'interpolator', 'general')
+        # <+signal processing here+>
+        # Work on whole buffers and write into the output in place, e.g.
+        # numpy.multiply($src, 2, out=$dst)
+        # Intermediate results go into self._get_scratch(nitems).
+#if $blocktype == 'decimator'
+        # rows.mean(axis=1) would average instead of keeping the first item.
+#else if $blocktype == 'interpolator'
+        # rows[:, 1:] = 0 after this would zero-stuff instead of repeating.
+#end if
+#if $intype.numpy == $outtype.numpy
+        $lhs = $src
+#else if $intype.numpy == 'numpy.complex64'
+        numpy.abs($src, out=$dst) # complex to real: e.g. the magnitude
+#else
+        numpy.copyto($dst, $src, casting='unsafe') # ${intype.numpy} to ${outtype.numpy}
 #end if
-#if $blocktype != 'sink'
-        out = output_items[0]
 #end if
-#if $blocktype in ('sync', 'decimator', 'interpolator')
-        # <+signal processing here+>
-        out[:] = in0
-        return len(output_items[0])
+#if $blocktype == 'sync'
+        return len(out)
+#else if $blocktype == 'decimator'
+        self.consume(0, n * self.decimation)
+        return n
+#else if $blocktype == 'interpolator'
+        self.consume(0, n)
+        return n * self.interpolation
 #else if $blocktype == 'sink'
-        return len(input_items[0])
+        # <+signal processing here+>
+        # Work on the whole buffer at once, e.g. numpy.sum(in0)
+        return len(in0)
 #else if $blocktype == 'source'
-        out[:] = whatever
-        return len(output_items[0])
-#else if $blocktype == 'general'
         # <+signal processing here+>
-        out[:] = in0
+        # Fill the whole buffer at once, e.g. out[:] = numpy.arange(len(out))
+        out[:] = 0
+        return len(out)
+#else if $blocktype == 'general'
 
-        self.consume(0, len(in0)) //consume port 0 input
-        \#self.consume_each(len(out)) //or shortcut to consume on all inputs
+        self.consume(0, n) # consume port 0 input
+        \#self.consume_each(n) # or shortcut to consume on all inputs
 
         # return produced
-        return len(out)
+        return n
 #end if
 
 '''
@@ -353,6 +1116,26 @@ ${str_to_fancyc_comment($license)}
 \#include <cppunit/TestAssert.h>
 
 \#include <$modname/${blockname}.h>
+#if $async_io
+#if $blocktype == 'source'
+#set $iotype = $outtype.cpp
+#set $iovec = $outtype.vec
+#else
+#set $iotype = $intype.cpp
+#set $iovec = $intype.vec
+#end if
+\#include "${blockname}_impl.h"
+\#include "spsc_ring.h"
+\#include <gr_top_block.h>
+#if $blocktype == 'source'
+\#include <gr_head.h>
+\#include <gr_vector_sink_${iovec}.h>
+#else
+\#include <gr_vector_source_${iovec}.h>
+#end if
+\#include <boost/bind.hpp>
+\#include <boost/thread/thread.hpp>
+#end if
 
 namespace gr {
   namespace ${modname} {
@@ -360,9 +1143,171 @@ namespace gr {
     void
     qa_${blockname}::t1()
     {
+#if $blocktype == 'message'
+        ${blockname}::sptr blk = ${blockname}::make(#if $arglist == '' then '' else '<+args+>'#);
+        CPPUNIT_ASSERT(pmt::list_has(blk->message_ports_in(), pmt::mp("in")));
+        CPPUNIT_ASSERT(pmt::list_has(blk->message_ports_out(), pmt::mp("out")));
+        // Put more tests here
+#else
         // Put test here
+#end if
+    }
+#if $async_io
+
+    static void
+    produce(spsc_ring<unsigned int> *ring, unsigned int nitems)
+    {
+      unsigned int buf[100];
+      for (unsigned int next = 0; next < nitems; ) {
+        unsigned int n = std::min(100u, nitems - next);
+        for (unsigned int i = 0; i < n; i++) {
+          buf[i] = next + i;
+        }
+        next += ring->write(buf, n);
+      }
+    }
+
+    void
+    qa_${blockname}::t2()
+    {
+        // The ring between work() and the I/O thread: It takes no more
+        // than its capacity, keeps the order across the wrap-around and
+        // holds the producer back while it is full (backpressure).
+        spsc_ring<unsigned int> ring(1000);
+        CPPUNIT_ASSERT_EQUAL((size_t) 1024, ring.capacity());
+        std::vector<unsigned int> in(1500), out(1500);
+        for (unsigned int i = 0; i < in.size(); i++) {
+          in[i] = i;
+        }
+        CPPUNIT_ASSERT_EQUAL((size_t) 1024, ring.write(&in[0], in.size()));
+        CPPUNIT_ASSERT_EQUAL((size_t) 0, ring.space());
+        CPPUNIT_ASSERT_EQUAL((size_t) 600, ring.read(&out[0], 600));
+        CPPUNIT_ASSERT_EQUAL((size_t) 476, ring.write(&in[1024], 476));
+        CPPUNIT_ASSERT_EQUAL((size_t) 900, ring.read(&out[600], 1000));
+        CPPUNIT_ASSERT(in == out);
+
+        const unsigned int nitems = 100000;
+        ring.reset();
+        boost::thread producer(boost::bind(&produce, &ring, nitems));
+        while (ring.space() != 0) {
+          boost::this_thread::yield();
+        }
+        boost::this_thread::sleep(boost::posix_time::milliseconds(10));
+        CPPUNIT_ASSERT_EQUAL(ring.capacity(), ring.items());
+        unsigned int buf[256];
+        for (unsigned int expected = 0; expected < nitems; ) {
+          size_t n = ring.read(buf, 256);
+          for (size_t i = 0; i < n; i++) {
+            CPPUNIT_ASSERT_EQUAL(expected++, buf[i]);
+          }
+        }
+        producer.join();
     }
 
+#if $blocktype == 'source'
+    /*
+     * Stands in for the device in t3. It counts up, so lost, repeated or
+     * reordered items show. The block's virtual base class is constructed
+     * by the most derived class, so the io signatures are repeated here.
+     */
+    class ${blockname}_counter : public ${blockname}_impl
+    {
+    public:
+      ${blockname}_counter()
+        : ${grblocktype}("${blockname}",
+		      gr_make_io_signature(0, 0, 0),
+		      gr_make_io_signature(1, 1, sizeof (${iotype}))),
+          ${blockname}_impl(#if $arglist == '' then '' else '<+args+>'#), d_next(0) {}
+
+    protected:
+      int read_items(${iotype} *buf, int nitems)
+      {
+        for (int i = 0; i < nitems; i++) {
+          buf[i] = (${iotype}) d_next++;
+        }
+        return nitems;
+      }
+
+    private:
+      unsigned int d_next;
+    };
+
+    void
+    qa_${blockname}::t3()
+    {
+        // The block in a flow graph. The counter is faster than the flow
+        // graph, so the ring runs full and the I/O thread has to wait for
+        // work() (backpressure). run() only returns once head has passed
+        // nitems and stop() has ended the I/O thread.
+        const unsigned int nitems = 1000000;
+        gr_top_block_sptr tb = gr_make_top_block("qa_${blockname}");
+        boost::shared_ptr<${blockname}_counter> src = gnuradio::get_initial_sptr(new ${blockname}_counter());
+        gr_head_sptr head = gr_make_head(sizeof(${iotype}), nitems);
+        gr_vector_sink_${iovec}_sptr dst = gr_make_vector_sink_${iovec}();
+        tb->connect(src, 0, head, 0);
+        tb->connect(head, 0, dst, 0);
+        tb->run();
+        std::vector<${iotype}> data = dst->data();
+        CPPUNIT_ASSERT_EQUAL((size_t) nitems, data.size());
+        for (unsigned int i = 0; i < nitems; i++) {
+          CPPUNIT_ASSERT(data[i] == (${iotype}) i);
+        }
+
+        // Start again and stop while the I/O thread is busy
+        head->reset();
+        tb->start();
+        boost::this_thread::sleep(boost::posix_time::milliseconds(10));
+        tb->stop();
+        tb->wait();
+        CPPUNIT_ASSERT(dst->data().size() <= 2 * nitems);
+    }
+#else
+    /*
+     * Stands in for the device in t3. It's slower than the flow graph and
+     * keeps everything it's given. The block's virtual base class is
+     * constructed by the most derived class, so the io signatures are
+     * repeated here.
+     */
+    class ${blockname}_recorder : public ${blockname}_impl
+    {
+    public:
+      ${blockname}_recorder()
+        : ${grblocktype}("${blockname}",
+		      gr_make_io_signature(1, 1, sizeof (${iotype})),
+		      gr_make_io_signature(0, 0, 0)),
+          ${blockname}_impl(#if $arglist == '' then '' else '<+args+>'#) {}
+      std::vector<${iotype}> d_items;
+
+    protected:
+      void write_items(const ${iotype} *buf, int nitems)
+      {
+        boost::this_thread::sleep(boost::posix_time::microseconds(100));
+        d_items.insert(d_items.end(), buf, buf + nitems);
+      }
+    };
+
+    void
+    qa_${blockname}::t3()
+    {
+        // The block in a flow graph. The recorder is slower than the flow
+        // graph, so work() finds the ring full and consumes less
+        // (backpressure). run() only returns once the source is done and
+        // stop() has let the I/O thread write what was left in the ring.
+        const unsigned int nitems = 1000000;
+        std::vector<${iotype}> data(nitems);
+        for (unsigned int i = 0; i < nitems; i++) {
+          data[i] = (${iotype}) i;
+        }
+        gr_top_block_sptr tb = gr_make_top_block("qa_${blockname}");
+        gr_vector_source_${iovec}_sptr src = gr_make_vector_source_${iovec}(data);
+        boost::shared_ptr<${blockname}_recorder> snk = gnuradio::get_initial_sptr(new ${blockname}_recorder());
+        tb->connect(src, 0, snk, 0);
+        tb->run();
+        CPPUNIT_ASSERT(snk->d_items == data);
+    }
+#end if
+#end if
+
   } /* namespace ${modname} */
 } /* namespace gr */
 
@@ -386,10 +1331,18 @@ namespace gr {
     public:
       CPPUNIT_TEST_SUITE(qa_${blockname});
       CPPUNIT_TEST(t1);
+#if $async_io
+      CPPUNIT_TEST(t2);
+      CPPUNIT_TEST(t3);
+#end if
       CPPUNIT_TEST_SUITE_END();
 
     private:
       void t1();
+#if $async_io
+      void t2();
+      void t3();
+#end if
     };
 
   } /* namespace ${modname} */
@@ -399,11 +1352,364 @@ namespace gr {
 
 '''
 
+# C++ throughput benchmark of a block
+Templates['bench_cpp'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+/*
+ * Throughput benchmark for ${blockname}: Calls work() directly on
+ * preallocated buffers, without a flow graph, and prints the results
+ * as JSON.
+ *
+ * Usage: bench_${blockname} [number of items [items per call]]
+ */
+
+\#include <cstdio>
+\#include <cstdlib>
+\#include <cstring>
+\#include <vector>
+#if $kernel == 'volk'
+\#include <volk/volk.h>
+#end if
+\#include <boost/date_time/posix_time/posix_time.hpp>
+\#include <gr_io_signature.h>
+#if $version == '37'
+\#include <${modname}/${blockname}.h>
+#else
+\#include <${modname}_${blockname}.h>
+#end if
+
+// Returns a zeroed buffer of size bytes
+static void *
+alloc_buffer(size_t size)
+{
+#if $kernel == 'volk'
+  // Aligned like the scheduler's buffers, so work() takes the aligned VOLK path
+  void *buf = volk_malloc(size, volk_get_alignment());
+#else
+  void *buf = malloc(size);
+#end if
+  if (buf == NULL && size > 0) {
+    fprintf(stderr, "Can't allocate %lu bytes.\\n", (unsigned long) size);
+    exit(1);
+  }
+  if (buf != NULL) {
+    memset(buf, 0, size);
+  }
+  return buf;
+}
+
+static void
+free_buffer(const void *buf)
+{
+#if $kernel == 'volk'
+  volk_free((void *) buf);
+#else
+  free((void *) buf);
+#end if
+}
+
+int
+main (int argc, char **argv)
+{
+  const long nitems = (argc > 1) ? atol(argv[1]) : 10000000;
+  const int nitems_per_call = (argc > 2) ? atoi(argv[2]) : 4096;
+
+#if $arglist != ''
+  // <+Choose the block arguments+>
+#for $decl in $arg_declarations($arglist)
+  $decl
+#end for
+#end if
+#if $version == '37'
+  gr::${modname}::${blockname}::sptr block = gr::${modname}::${blockname}::make(${strip_arg_types($arglist)});
+#else
+  ${modname}_${blockname}_sptr block = ${modname}_make_${blockname}(${strip_arg_types($arglist)});
+#end if
+
+  // Buffers for one call of work(), using the minimum number of ports
+  gr_vector_int ninput_items_required(block->input_signature()->min_streams());
+  block->forecast(nitems_per_call, ninput_items_required);
+  gr_vector_const_void_star input_items(ninput_items_required.size());
+  for (size_t i = 0; i < input_items.size(); i++) {
+    input_items[i] = alloc_buffer(ninput_items_required[i] * block->input_signature()->sizeof_stream_item(i));
+  }
+  gr_vector_void_star output_items(block->output_signature()->min_streams());
+  for (size_t i = 0; i < output_items.size(); i++) {
+    output_items[i] = alloc_buffer(nitems_per_call * block->output_signature()->sizeof_stream_item(i));
+  }
+
+  // Warm up the caches
+  block->work(nitems_per_call, input_items, output_items);
+
+  long nitems_done = 0;
+  boost::posix_time::ptime start = boost::posix_time::microsec_clock::universal_time();
+  while (nitems_done < nitems) {
+    int nitems_produced = block->work(nitems_per_call, input_items, output_items);
+    if (nitems_produced <= 0) {
+      fprintf(stderr, "work() returned %d, stopping.\\n", nitems_produced);
+      return 1;
+    }
+    nitems_done += nitems_produced;
+  }
+  double seconds = (boost::posix_time::microsec_clock::universal_time() - start).total_microseconds() * 1e-6;
+
+  printf("{\\"block\\": \\"${blockname}\\", \\"items\\": %ld, \\"items_per_call\\": %d, "
+         "\\"seconds\\": %g, \\"items_per_second\\": %g, \\"ns_per_item\\": %g}\\n",
+         nitems_done, nitems_per_call, seconds,
+         nitems_done / seconds, seconds * 1e9 / nitems_done);
+
+  for (size_t i = 0; i < input_items.size(); i++) {
+    free_buffer(input_items[i]);
+  }
+  for (size_t i = 0; i < output_items.size(); i++) {
+    free_buffer(output_items[i]);
+  }
+  return 0;
+}
+
+'''
+
+# CMake entry for a C++ benchmark
+Templates['bench_cmakeentry'] = """
+add_executable(bench_$blockname bench_${blockname}.cc)
+#if $kernel == 'volk'
+target_link_libraries(bench_$blockname gnuradio-$modname \${Boost_LIBRARIES} \${VOLK_LIBRARIES})
+#else
+target_link_libraries(bench_$blockname gnuradio-$modname \${Boost_LIBRARIES})
+#end if
+"""
+
+# ControlPort section for lib/CMakeLists.txt (instrumented blocks)
+Templates['ctrlport_cmakeentry'] = """
+option(ENABLE_CTRLPORT "Export the work() statistics of instrumented blocks through ControlPort" OFF)
+if(ENABLE_CTRLPORT)
+    add_definitions(-DGR_CTRLPORT)
+endif(ENABLE_CTRLPORT)
+"""
+
+Templates['thread_policy_cmakeentry'] = """
+${'#' * 72}
+# Thread policy of the blocks (processor affinity and thread priority)
+${'#' * 72}
+add_definitions(-DAFFINITY_CONF_FILE="\${CMAKE_INSTALL_PREFIX}/\${GR_PKG_CONF_DIR}/${modname}_affinity.conf")
+install(FILES \${CMAKE_SOURCE_DIR}/${modname}_affinity.conf DESTINATION \${GR_PKG_CONF_DIR})
+"""
+
+# Policy file read by the blocks added with --affinity
+Templates['affinity_conf'] = """\# Thread policy of the blocks in gr-${modname}: One line per block with the
+\# block name, the cores it may run on (comma-separated, e.g. 2,3) and the
+\# thread priority. Use - to keep the scheduler's default.
+\# The blocks read the installed copy of this file when they are constructed,
+\# unless \$${modname.upper()}_AFFINITY_CONF names another file.
+
+\# block                 cores    priority
+"""
+
+# Reads the policy file for the blocks added with --affinity
+Templates['thread_policy_h'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+
+\#ifndef INCLUDED_${modname.upper()}_THREAD_POLICY_H
+\#define INCLUDED_${modname.upper()}_THREAD_POLICY_H
+
+\#include <gr_block.h>
+\#include <string>
+
+namespace gr {
+  namespace ${modname} {
+
+    /*!
+     * Set the processor affinity and thread priority of \\p block to the
+     * entry for \\p blockname in ${modname}_affinity.conf, if there is one.
+     */
+    void apply_thread_policy(gr_block *block, const std::string &blockname);
+
+  } // namespace ${modname}
+} // namespace gr
+
+\#endif /* INCLUDED_${modname.upper()}_THREAD_POLICY_H */
+
+'''
+
+Templates['thread_policy_cc'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+
+\#ifdef HAVE_CONFIG_H
+\#include "config.h"
+\#endif
+
+\#include "thread_policy.h"
+\#include <cstdlib>
+\#include <fstream>
+\#include <sstream>
+\#include <vector>
+
+\#ifndef AFFINITY_CONF_FILE
+\#define AFFINITY_CONF_FILE "${modname}_affinity.conf"
+\#endif
+
+namespace gr {
+  namespace ${modname} {
+
+    void
+    apply_thread_policy(gr_block *block, const std::string &blockname)
+    {
+      const char *fname = std::getenv("${modname.upper()}_AFFINITY_CONF");
+      std::ifstream conf(fname ? fname : AFFINITY_CONF_FILE);
+      std::string line;
+      while (std::getline(conf, line)) {
+        std::istringstream fields(line.substr(0, line.find('\#')));
+        std::string name, cores, priority;
+        if (!(fields >> name >> cores >> priority) || name != blockname) {
+          continue;
+        }
+        if (cores != "-") {
+          std::vector<int> mask;
+          std::istringstream core_list(cores);
+          std::string core;
+          while (std::getline(core_list, core, ',')) {
+            mask.push_back(std::atoi(core.c_str()));
+          }
+          block->set_processor_affinity(mask);
+        }
+        if (priority != "-") {
+          block->set_thread_priority(std::atoi(priority.c_str()));
+        }
+        return;
+      }
+    }
+
+  } /* namespace ${modname} */
+} /* namespace gr */
+
+'''
+
+# Lock-free ring buffer between work() and the I/O thread of --async-io blocks
+Templates['spsc_ring_h'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+
+\#ifndef INCLUDED_${modname.upper()}_SPSC_RING_H
+\#define INCLUDED_${modname.upper()}_SPSC_RING_H
+
+\#include <boost/atomic.hpp>
+\#include <algorithm>
+\#include <cstring>
+\#include <vector>
+
+namespace gr {
+  namespace ${modname} {
+
+    /*!
+     * Lock-free ring buffer with a single producer and a single consumer
+     * thread, e.g. the scheduler thread running work() and an I/O thread.
+     * Neither side ever waits: write() and read() copy as many items as
+     * there are space or items and return that number. The capacity is
+     * rounded up to a power of two. \\p T must be trivially copyable.
+     */
+    template<typename T>
+    class spsc_ring
+    {
+    public:
+      spsc_ring(size_t min_capacity)
+        : d_mask(round_up(min_capacity) - 1), d_buf(d_mask + 1), d_read(0), d_write(0)
+      {
+      }
+
+      size_t capacity() const { return d_mask + 1; }
+
+      //! Number of items that can be read, only exact in the consumer thread
+      size_t items() const
+      {
+        return d_write.load(boost::memory_order_acquire) - d_read.load(boost::memory_order_acquire);
+      }
+
+      //! Number of items that can be written, only exact in the producer thread
+      size_t space() const { return capacity() - items(); }
+
+      //! Drop all items. Only call this while no other thread uses the ring.
+      void reset()
+      {
+        d_read.store(0, boost::memory_order_relaxed);
+        d_write.store(0, boost::memory_order_release);
+      }
+
+      //! Producer: Copy up to \\p nitems items into the ring
+      size_t write(const T *items, size_t nitems)
+      {
+        const size_t wpos = d_write.load(boost::memory_order_relaxed);
+        const size_t rpos = d_read.load(boost::memory_order_acquire);
+        nitems = std::min(nitems, capacity() - (wpos - rpos));
+        copy_in(wpos & d_mask, items, nitems);
+        d_write.store(wpos + nitems, boost::memory_order_release);
+        return nitems;
+      }
+
+      //! Consumer: Copy up to \\p nitems items out of the ring
+      size_t read(T *items, size_t nitems)
+      {
+        const size_t rpos = d_read.load(boost::memory_order_relaxed);
+        const size_t wpos = d_write.load(boost::memory_order_acquire);
+        nitems = std::min(nitems, wpos - rpos);
+        copy_out(rpos & d_mask, items, nitems);
+        d_read.store(rpos + nitems, boost::memory_order_release);
+        return nitems;
+      }
+
+    private:
+      const size_t d_mask;
+      std::vector<T> d_buf;
+      // Total number of items read and written. They only grow, so the
+      // difference is the fill level even after they wrap around.
+      boost::atomic<size_t> d_read;
+      boost::atomic<size_t> d_write;
+
+      static size_t round_up(size_t n)
+      {
+        size_t cap = 1;
+        while (cap < n) {
+          cap <<= 1;
+        }
+        return cap;
+      }
+
+      // The items wrap around the end of the ring, so copy them in two parts
+      void copy_in(size_t pos, const T *items, size_t nitems)
+      {
+        const size_t first = std::min(nitems, capacity() - pos);
+        std::memcpy(&d_buf[pos], items, first * sizeof(T));
+        std::memcpy(&d_buf[0], items + first, (nitems - first) * sizeof(T));
+      }
+
+      void copy_out(size_t pos, T *items, size_t nitems) const
+      {
+        const size_t first = std::min(nitems, capacity() - pos);
+        std::memcpy(items, &d_buf[pos], first * sizeof(T));
+        std::memcpy(items + first, &d_buf[0], (nitems - first) * sizeof(T));
+      }
+    };
+
+  } // namespace ${modname}
+} // namespace gr
+
+\#endif /* INCLUDED_${modname.upper()}_SPSC_RING_H */
+
+'''
+
 # Python QA code
 Templates['qa_python'] = '''\#!/usr/bin/env python
 ${str_to_python_comment($license)}
 #
 
+#set $vectorized = $lang == 'python' and $blocktype in ('sync', 'decimator', 'interpolator')
+#if $vectorized
+import numpy
+#end if
+#if $blocktype == 'message'
+import time
+#end if
+#if $blocktype in ('tagged_stream', 'message')
+import pmt
+#end if
 from gnuradio import gr, gr_unittest
 #if $lang == 'cpp'
 import ${modname}_swig as ${modname}
@@ -420,22 +1726,187 @@ class qa_$blockname (gr_unittest.TestCase):
         self.tb = None
 
     def test_001_t (self):
+#if $vectorized
+        src_data = (numpy.random.random(4096) * 100).astype(${blockname}.in_dtype)
+        blk = ${blockname}(#if $arglist == '' then '' else '<+args+>'#)
+        src = gr.vector_source_${intype.vec}(src_data.tolist())
+        dst = gr.vector_sink_${outtype.vec}()
+        self.tb.connect(src, blk, dst)
+        self.tb.run ()
+        # Reference result, computed with NumPy on the whole input
+#if $blocktype == 'decimator'
+        expected_result = src_data[::blk.decimation][:len(src_data) // blk.decimation]
+#else if $blocktype == 'interpolator'
+        expected_result = numpy.repeat(src_data, blk.interpolation)
+#else
+        expected_result = src_data
+#end if
+#if $intype.numpy != $outtype.numpy
+#if $intype.numpy == 'numpy.complex64'
+        expected_result = numpy.abs(expected_result)
+#else
+        expected_result = expected_result.astype(blk.out_dtype)
+#end if
+#end if
+        numpy.testing.assert_allclose(numpy.array(dst.data(), dtype=blk.out_dtype),
+                                      expected_result, rtol=1e-5)
+#else if $blocktype == 'tagged_stream'
+        packet_len = 16
+        length_tag_key = "packet_len"
+        src_data = range(3 * packet_len)
+        tags = []
+        for offset in range(0, len(src_data), packet_len):
+            tag = gr.tag_t()
+            tag.offset = offset
+            tag.key = pmt.intern(length_tag_key)
+            tag.value = pmt.from_long(packet_len)
+            tags.append(tag)
+        src = gr.vector_source_${intype.vec}(src_data, False, 1, tags)
+        blk = ${modname}.${blockname}(#if $arglist == '' then '' else '<+args+>'#)
+        dst = gr.vector_sink_${outtype.vec}()
+        self.tb.connect(src, blk, dst)
+        self.tb.run ()
+        # check data
+        result_tags = [t for t in dst.tags() if pmt.symbol_to_string(t.key) == length_tag_key]
+        self.assertEqual(len(result_tags), 3)
+#else if $blocktype == 'message'
+        payload = range(16)
+        pdu = pmt.cons(pmt.make_dict(), pmt.init_u8vector(len(payload), payload))
+        blk = ${modname}.${blockname}(#if $arglist == '' then '' else '<+args+>'#)
+        dbg = gr.message_debug()
+        self.tb.msg_connect(blk, "out", dbg, "store")
+        self.tb.start ()
+        blk.to_basic_block()._post(pmt.intern("in"), pdu)
+        # Give the message time to pass through the flow graph
+        time.sleep(0.1)
+        self.tb.stop ()
+        self.tb.wait ()
+        # check data
+        self.assertEqual(dbg.num_messages(), 1)
+        self.assertEqual(list(pmt.u8vector_elements(pmt.cdr(dbg.get_message(0)))), payload)
+#else
         # set up fg
         self.tb.run ()
         # check data
+#end if
 
 
 if __name__ == '__main__':
     gr_unittest.run(qa_${blockname}, "qa_${blockname}.xml")
 '''
 
+# Python throughput benchmark and regression test of a block
+Templates['bench_python'] = '''\#!/usr/bin/env python
+"""
+Throughput benchmark and regression test for ${modname}.${blockname}
+(generated by gr_modtool from the io signature of the block).
+
+  bench_${blockname}.py                    Print the throughput as JSON
+  bench_${blockname}.py --update-baseline  Store the throughput as baseline
+  bench_${blockname}.py --qa               Fail if the throughput is more than
+                                           the margin below the baseline
+
+The baseline is kept in bench_${blockname}.json next to this file.
+"""
+
+import os
+import sys
+import time
+import json
+import random
+from optparse import OptionParser
+from gnuradio import gr
+import ${modname}_swig as ${modname}
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_${blockname}.json')
+
+#if $params
+# Block arguments
+#for $param in $params
+${param.key} = ${param.value}
+#end for
+
+#end if
+def build_flowgraph(nitems):
+    """ Return a flow graph that pushes nitems items through the block """
+    tb = gr.top_block()
+    block = ${modname}.${blockname}(${param_names})
+#for $port in $inputs
+    tb.connect(${port.source},
+               gr.head(${port.itemsize}, nitems),
+               (block, ${port.index}))
+#end for
+#for $port in $outputs
+#if $inputs
+    tb.connect((block, ${port.index}), gr.null_sink(${port.itemsize}))
+#else
+    tb.connect((block, ${port.index}),
+               gr.head(${port.itemsize}, nitems),
+               gr.null_sink(${port.itemsize}))
+#end if
+#end for
+    return tb
+
+def measure(nitems):
+    """ Run the flow graph once, return the throughput in items per second """
+    tb = build_flowgraph(nitems)
+    start = time.time()
+    tb.run()
+    return nitems / (time.time() - start)
+
+def main():
+    """ Measure, and compare to or update the baseline """
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--items", type="int", default=${nitems},
+            help="Number of items per run [default=%default]")
+    parser.add_option("-r", "--runs", type="int", default=3,
+            help="The throughput is the best of this many runs [default=%default]")
+    parser.add_option("-m", "--margin", type="float", default=float(os.environ.get('BENCH_MARGIN', 0.2)),
+            help="Relative drop below the baseline that fails --qa, can also be set by \\$BENCH_MARGIN [default=%default]")
+    parser.add_option("--update-baseline", action="store_true", default=False,
+            help="Store the measured throughput as the new baseline")
+    parser.add_option("--qa", action="store_true", default=False,
+            help="Fail if the throughput is below the baseline minus the margin")
+    (options, args) = parser.parse_args()
+    rate = max([measure(options.items) for i in range(options.runs)])
+    result = {'block': '${blockname}', 'items': options.items, 'items_per_second': rate}
+    print json.dumps(result)
+    if options.update_baseline:
+        json.dump(result, open(BASELINE_FILE, 'w'))
+        print "Stored baseline in %s." % BASELINE_FILE
+    elif options.qa:
+        if not os.path.isfile(BASELINE_FILE):
+            print "No baseline in %s, nothing to compare to." % BASELINE_FILE
+            return 0
+        baseline = json.load(open(BASELINE_FILE))['items_per_second']
+        if rate < baseline * (1 - options.margin):
+            print "FAIL: %g items/s is more than %d%% below the baseline (%g items/s)." % (
+                    rate, options.margin * 100, baseline)
+            return 1
+        print "OK: %g items/s, baseline is %g items/s." % (rate, baseline)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
+
 Templates['grc_xml'] = '''<?xml version="1.0"?>
 <block>
   <name>$blockname</name>
   <key>${modname}_$blockname</key>
   <category>$modname</category>
   <import>import $modname</import>
+#if $affinity
+  <make>${modname}.${blockname}(${strip_arg_types($arglist)})
+\#if \$affinity()
+self.\$(id).set_processor_affinity(\$affinity)
+\#end if
+\#if \$priority() >= 0
+self.\$(id).set_thread_priority(\$priority)
+\#end if</make>
+#else
   <make>${modname}.${blockname}(${strip_arg_types($arglist)})</make>
+#end if
   <!-- Make one 'param' node for every Parameter you want settable from the GUI.
        Sub-nodes:
        * name
@@ -446,26 +1917,65 @@ Templates['grc_xml'] = '''<?xml version="1.0"?>
     <key>...</key>
     <type>...</type>
   </param>
+#if $blocktype == 'tagged_stream' and 'length_tag_key' in $arglist
+  <param>
+    <name>Length tag key</name>
+    <key>length_tag_key</key>
+    <value>packet_len</value>
+    <type>string</type>
+  </param>
+#end if
+#if $affinity
+  <param>
+    <name>Core affinity</name>
+    <key>affinity</key>
+    <value>[]</value>
+    <type>int_vector</type>
+    <hide>part</hide>
+  </param>
+  <param>
+    <name>Thread priority</name>
+    <key>priority</key>
+    <value>-1</value>
+    <type>int</type>
+    <hide>part</hide>
+  </param>
+#end if
 
   <!-- Make one 'sink' node per input. Sub-nodes:
        * name (an identifier for the GUI)
        * type
        * vlen
        * optional (set to 1 for optional inputs) -->
+#if $blocktype == 'message'
+  <sink>
+    <name>in</name>
+    <type>message</type>
+  </sink>
+#else
   <sink>
     <name>in</name>
-    <type><!-- e.g. int, real, complex, byte, short, xxx_vector, ...--></type>
+    <type>$intype.grc</type>
   </sink>
+#end if
 
   <!-- Make one 'source' node per output. Sub-nodes:
        * name (an identifier for the GUI)
        * type
        * vlen
        * optional (set to 1 for optional inputs) -->
+#if $blocktype == 'message'
   <source>
     <name>out</name>
-    <type><!-- e.g. int, real, complex, byte, short, xxx_vector, ...--></type>
+    <type>message</type>
+    <optional>1</optional>
   </source>
+#else
+  <source>
+    <name>out</name>
+    <type>$outtype.grc</type>
+  </source>
+#end if
 </block>
 '''
 
@@ -498,6 +2008,10 @@ ${str_to_fancyc_comment($license)}
 #if $blocktype != 'noblock'
 \#include <gr_io_signature.h>
 #end if
+#if $kernel == 'volk'
+\#include <volk/volk.h>
+\#include <algorithm>
+#end if
 \#include "${modname}_${blockname}.h"
 
 #if $blocktype == 'noblock'
@@ -525,12 +2039,12 @@ ${modname}_make_${blockname} (${strip_default_values($arglist)})
 #if $blocktype == 'sink'
 #set $inputsig = '0, 0, 0'
 #else
-#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (<+float+>)'
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (%s)' % $intype.size
 #end if
 #if $blocktype == 'source'
 #set $outputsig = '0, 0, 0'
 #else
-#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, sizeof (<+float+>)'
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, sizeof (%s)' % $outtype.size
 #end if
 
 /*
@@ -545,9 +2059,21 @@ ${modname}_${blockname}::${modname}_${blockname} (${strip_default_values($arglis
 		connect(self(), 0, d_firstblock, 0);
 		// <+connect other blocks+>
 		connect(d_lastblock, 0, self(), 0);
-#else
+#else if $kernel == 'volk'
+	// Let VOLK work on aligned buffers
+	const int alignment_multiple =
+	  volk_get_alignment() / sizeof (${volk_align_type});
+	set_alignment(std::max(1, alignment_multiple));
+	set_output_multiple(std::max(1, alignment_multiple));
+#else if not $hints
 	// Put in <+constructor stuff+> here
 #end if
+#if $hints
+	// Buffer and scheduling hints
+#for $hint in $hints
+	${hint.call}(${hint.value});
+#end for
+#end if
 }
 
 
@@ -565,7 +2091,13 @@ ${modname}_${blockname}::~${modname}_${blockname}()
 void
 ${modname}_${blockname}::forecast (int noutput_items, gr_vector_int &ninput_items_required)
 {
+#if $hints
+	// <+forecast+> Every input needs the history on top of noutput_items
+	for (unsigned int i = 0; i < ninput_items_required.size(); i++)
+	  ninput_items_required[i] = noutput_items + history() - 1;
+#else
 	/* <+forecast+> e.g. ninput_items_required[0] = noutput_items */
+#end if
 }
 
 int
@@ -574,10 +2106,29 @@ ${modname}_${blockname}::general_work (int noutput_items,
 				   gr_vector_const_void_star &input_items,
 				   gr_vector_void_star &output_items)
 {
-	const float *in = (const float *) input_items[0];
-	float *out = (float *) output_items[0];
+#if $kernel == 'volk'
+#for $port in $volk_inputs
+	const ${port.ctype} *${port.name} = (const ${port.ctype} *) input_items[${port.index}];
+#end for
+#for $port in $volk_outputs
+	${port.ctype} *${port.name} = (${port.ctype} *) output_items[${port.index}];
+#end for
+
+	if (is_unaligned()) {
+	  // Unaligned buffers: The dispatcher picks a kernel for them
+	  ${volk_kernel}(${volk_args});
+	}
+	else {
+	  // Aligned fast path
+	  ${volk_kernel}_a(${volk_args});
+	}
+
+#else
+	const ${intype.cpp} *in = (const ${intype.cpp} *) input_items[0];
+	${outtype.cpp} *out = (${outtype.cpp} *) output_items[0];
 
 	// Do <+signal processing+>
+#end if
 	// Tell runtime system how many input items we consumed on
 	// each input stream.
 	consume_each (noutput_items);
@@ -593,10 +2144,28 @@ ${modname}_${blockname}::work(int noutput_items,
 		  gr_vector_const_void_star &input_items,
 		  gr_vector_void_star &output_items)
 {
-	const float *in = (const float *) input_items[0];
-	float *out = (float *) output_items[0];
+#if $kernel == 'volk'
+#for $port in $volk_inputs
+	const ${port.ctype} *${port.name} = (const ${port.ctype} *) input_items[${port.index}];
+#end for
+#for $port in $volk_outputs
+	${port.ctype} *${port.name} = (${port.ctype} *) output_items[${port.index}];
+#end for
+
+	if (is_unaligned()) {
+	  // Unaligned buffers: The dispatcher picks a kernel for them
+	  ${volk_kernel}(${volk_args});
+	}
+	else {
+	  // Aligned fast path
+	  ${volk_kernel}_a(${volk_args});
+	}
+#else
+	const ${intype.cpp} *in = (const ${intype.cpp} *) input_items[0];
+	${outtype.cpp} *out = (${outtype.cpp} *) output_items[0];
 
 	// Do <+signal processing+>
+#end if
 
 	// Tell runtime system how many output items we produced.
 	return noutput_items;
@@ -693,3 +2262,153 @@ target_link_libraries($basename gnuradio-$modname \${Boost_LIBRARIES})
 GR_ADD_TEST($basename $basename)
 """
 
+
+# Unity build section for lib/CMakeLists.txt
+Templates['unity_cmakeentry'] = """${'#' * 72}
+# Unity build (maintained by gr_modtool, group size: $group_size)
+# The unity_build_N files include groups of the library sources and are
+# compiled instead of them.
+${'#' * 72}
+option(ENABLE_UNITY_BUILD "Compile the block sources in groups" ON)
+set(${modname}_unity_sources)
+if(ENABLE_UNITY_BUILD)
+    file(GLOB ${modname}_unity_sources RELATIVE \${CMAKE_CURRENT_SOURCE_DIR}
+        \${CMAKE_CURRENT_SOURCE_DIR}/unity_build_[0-9]*.cc)
+    foreach(unity_file \${${modname}_unity_sources})
+        file(STRINGS \${CMAKE_CURRENT_SOURCE_DIR}/\${unity_file} unity_includes REGEX "^\#include \\"")
+        foreach(unity_include \${unity_includes})
+            string(REGEX REPLACE "^\#include \\"([^\\"]+)\\".*$" "\\\\1" unity_member "\${unity_include}")
+            set_source_files_properties(\${unity_member} PROPERTIES HEADER_FILE_ONLY TRUE)
+        endforeach(unity_include)
+    endforeach(unity_file)
+endif(ENABLE_UNITY_BUILD)
+
+"""
+
+# Precompiled header section for lib/CMakeLists.txt
+Templates['pch_cmakeentry'] = """
+if(NOT CMAKE_VERSION VERSION_LESS 3.16)
+    option(ENABLE_PRECOMPILED_HEADER "Precompile ${modname}_pch.h" ON)
+    if(ENABLE_PRECOMPILED_HEADER)
+        target_precompile_headers(gnuradio-${modname} PRIVATE ${modname}_pch.h)
+    endif(ENABLE_PRECOMPILED_HEADER)
+endif(NOT CMAKE_VERSION VERSION_LESS 3.16)
+
+"""
+
+# Precompiled header
+Templates['pch_h'] = '''/* -*- c++ -*- */
+/*
+ * Precompiled header of the ${modname} library, created by gr_modtool.
+ * Add headers that most blocks include and that rarely change.
+ */
+\#ifndef INCLUDED_${modname.upper()}_PCH_H
+\#define INCLUDED_${modname.upper()}_PCH_H
+
+\#include <vector>
+\#include <string>
+\#include <boost/shared_ptr.hpp>
+\#include <gr_io_signature.h>
+\#include <gr_block.h>
+\#include <gr_sync_block.h>
+\#include <gr_sync_decimator.h>
+\#include <gr_sync_interpolator.h>
+\#include <gr_hier_block2.h>
+
+\#endif /* INCLUDED_${modname.upper()}_PCH_H */
+
+'''
+
+# SWIG interface file of a single block (per-block SWIG layout)
+Templates['swig_block_i'] = """/* -*- c++ -*- */
+#if $version == '37'
+#set $mod_block_sep = '/'
+#set $block_magic_version = '2'
+#else
+#set $mod_block_sep = '_'
+#set $block_magic_version = ''
+#end if
+// SWIG interface of the $blockname block, included by the module's main
+// SWIG file. With ENABLE_SPLIT_SWIG, it's built as a SWIG module of its own.
+
+\#ifdef ${modname.upper()}_SWIG_SPLIT
+\#define ${modname.upper()}_API
+%include "gnuradio.i"
+%include "${swigname}_doc.i"
+\#endif
+
+%{
+\#include "${modname}${mod_block_sep}${blockname}.h"
+%}
+
+%include "${modname}${mod_block_sep}${blockname}.h"
+GR_SWIG_BLOCK_MAGIC${block_magic_version}($modname, $blockname);
+"""
+
+# Split SWIG build section for swig/CMakeLists.txt
+Templates['swig_split_cmakeentry'] = """${'#' * 72}
+# Per-block SWIG modules (maintained by gr_modtool)
+# With ENABLE_SPLIT_SWIG, every block .i file included by $mainswigfile
+# is built as a SWIG module of its own, so changing a block only rebuilds
+# its own wrapper. ${swigname}.py imports them all into one namespace.
+${'#' * 72}
+option(ENABLE_SPLIT_SWIG "Build one SWIG module per block" OFF)
+if(ENABLE_SPLIT_SWIG)
+    list(APPEND GR_SWIG_FLAGS -D${modname.upper()}_SWIG_SPLIT)
+    if(GR_SWIG_DOC_FILE)
+        # Generate the docs only once for all modules
+        GR_SWIG_MAKE_DOCS(\${GR_SWIG_DOC_FILE} \${GR_SWIG_DOC_DIRS})
+        add_custom_target(${modname}_swig_docs DEPENDS \${GR_SWIG_DOC_FILE})
+        list(APPEND GR_SWIG_TARGET_DEPS ${modname}_swig_docs)
+        unset(GR_SWIG_DOC_FILE)
+    endif(GR_SWIG_DOC_FILE)
+    file(STRINGS \${CMAKE_CURRENT_SOURCE_DIR}/$mainswigfile swig_includes REGEX "^%include \\"[^\\"]+\\\\.i\\"")
+    set(${modname}_swig_modules)
+    foreach(swig_include \${swig_includes})
+        string(REGEX REPLACE "^%include \\"([^\\"]+)\\\\.i\\".*$" "\\\\1" swig_block "\${swig_include}")
+        if(EXISTS \${CMAKE_CURRENT_SOURCE_DIR}/\${swig_block}.i)
+            GR_SWIG_MAKE(${modname}_\${swig_block}_swig \${swig_block}.i)
+            GR_SWIG_INSTALL(TARGETS ${modname}_\${swig_block}_swig DESTINATION \${GR_PYTHON_DIR}/$modname)
+            list(APPEND ${modname}_swig_modules ${modname}_\${swig_block}_swig)
+        endif(EXISTS \${CMAKE_CURRENT_SOURCE_DIR}/\${swig_block}.i)
+    endforeach(swig_include)
+    set(swig_shim \${CMAKE_CURRENT_BINARY_DIR}/${swigname}.py)
+    file(WRITE \${swig_shim} "# Generated by CMake: Imports all per-block SWIG modules\\n")
+    foreach(swig_module \${${modname}_swig_modules})
+        file(APPEND \${swig_shim} "from \${swig_module} import *\\n")
+    endforeach(swig_module)
+    GR_PYTHON_INSTALL(FILES \${swig_shim} DESTINATION \${GR_PYTHON_DIR}/$modname)
+else(ENABLE_SPLIT_SWIG)
+    $swig_make
+endif(ENABLE_SPLIT_SWIG)
+"""
+
+# CMake find module for VOLK (written as it is, not substituted)
+Templates['find_volk_cmake'] = '''INCLUDE(FindPkgConfig)
+PKG_CHECK_MODULES(PC_VOLK volk)
+
+FIND_PATH(
+    VOLK_INCLUDE_DIRS
+    NAMES volk/volk.h
+    HINTS $ENV{VOLK_DIR}/include
+        ${PC_VOLK_INCLUDEDIR}
+    PATHS /usr/local/include
+          /usr/include
+)
+
+FIND_LIBRARY(
+    VOLK_LIBRARIES
+    NAMES volk
+    HINTS $ENV{VOLK_DIR}/lib
+        ${PC_VOLK_LIBDIR}
+    PATHS /usr/local/lib
+          /usr/local/lib64
+          /usr/lib
+          /usr/lib64
+)
+
+INCLUDE(FindPackageHandleStandardArgs)
+FIND_PACKAGE_HANDLE_STANDARD_ARGS(VOLK DEFAULT_MSG VOLK_LIBRARIES VOLK_INCLUDE_DIRS)
+MARK_AS_ADVANCED(VOLK_LIBRARIES VOLK_INCLUDE_DIRS)
+'''
+
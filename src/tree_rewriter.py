@@ -0,0 +1,111 @@
+""" Replace identifiers across a whole directory tree """
+
+import os
+import re
+
+### Multi-pattern replacer ###################################################
+class MultiReplacer(object):
+    """ Replaces a set of strings by others in a single pass over a text.
+    All patterns are compiled into one alternation, longest first, so
+    overlapping patterns resolve to the longest match at every position.
+    If whole_words is set, a pattern that starts or ends with a word
+    character must not be directly preceded or followed by one. The word
+    characters are letters and digits by default, so underscores and other
+    punctuation count as word separators and e.g. 'howto' matches in
+    'howto_swig', 'gr-howto' and 'howto/api.h', but not in 'howtos'. Pass
+    word_chars='a-zA-Z0-9_' to match whole identifiers only. """
+    def __init__(self, replacements, whole_words=False, word_chars='a-zA-Z0-9'):
+        self.replacements = dict(replacements)
+        patterns = sorted(self.replacements.keys(), key=len, reverse=True)
+        if whole_words:
+            word_re = re.compile('[%s]' % word_chars)
+            def _bounded(pattern):
+                regexp = re.escape(pattern)
+                if word_re.match(pattern[0]):
+                    regexp = '(?<![%s])%s' % (word_chars, regexp)
+                if word_re.match(pattern[-1]):
+                    regexp = '%s(?![%s])' % (regexp, word_chars)
+                return regexp
+            regexp = '|'.join([_bounded(p) for p in patterns])
+        else:
+            regexp = '|'.join([re.escape(p) for p in patterns])
+        self._regexp = re.compile(regexp)
+
+    def _substitute(self, mobj):
+        """ Return the replacement for a match """
+        return self.replacements[mobj.group(0)]
+
+    def search(self, text):
+        """ Returns True if any of the patterns occurs in text """
+        return self._regexp.search(text) is not None
+
+    def replace(self, text):
+        """ Return a tuple (new_text, number of replacements) """
+        return self._regexp.subn(self._substitute, text)
+
+def is_binary(head):
+    """ Guess if a file is binary from its first bytes. """
+    return '\0' in head
+
+### Tree rewriter ############################################################
+class TreeRewriter(object):
+    """ Applies a MultiReplacer to the contents and names of all files and
+    directories below a root directory. Hidden files and directories,
+    build directories (anything with a CMakeCache.txt) and binary files
+    are left alone. """
+    def __init__(self, replacer):
+        self.replacer = replacer
+
+    def _walk(self, root):
+        """ Like os.walk(root), minus everything we skip """
+        for (dirpath, dirnames, filenames) in os.walk(root):
+            dirnames[:] = sorted([d for d in dirnames if d[0] != '.' and not
+                                  os.path.isfile(os.path.join(dirpath, d, 'CMakeCache.txt'))])
+            yield (dirpath, dirnames, [f for f in filenames if f[0] != '.'])
+
+    def rewrite_file(self, fname, dry_run=False):
+        """ Replace all occurrences in fname. Binary files and files without
+        occurrences are only read, never written.
+        Returns the number of replacements. """
+        fid = open(fname, 'rb')
+        head = fid.read(1024)
+        if is_binary(head):
+            fid.close()
+            return 0
+        (text, nsubs) = self.replacer.replace(head + fid.read())
+        fid.close()
+        if nsubs and not dry_run:
+            open(fname, 'wb').write(text)
+        return nsubs
+
+    def rewrite(self, root='.', dry_run=False):
+        """ Go through all files below root, replace occurrences and then
+        rename files and directories.
+        Renaming happens in a final bottom-up pass, so paths stay valid
+        while renaming.
+        Returns a tuple (dict filename -> number of replacements,
+        list of (old path, new path)). """
+        dirs = list(self._walk(root))
+        fnames = []
+        for (dirpath, dirnames, filenames) in dirs:
+            fnames += [os.path.join(dirpath, f) for f in filenames]
+        nsubs_list = [self.rewrite_file(fname, dry_run) for fname in fnames]
+        files_changed = dict([(f, n) for (f, n) in zip(fnames, nsubs_list) if n])
+        return (files_changed, self.rename_paths(dirs, dry_run))
+
+    def rename_paths(self, dirs, dry_run=False):
+        """ Rename files and directories whose name contains a pattern.
+        dirs is a list of (dirpath, dirnames, filenames) in top-down order,
+        it is processed bottom-up. Returns a list of (old path, new path). """
+        renamed = []
+        for (dirpath, dirnames, filenames) in reversed(dirs):
+            for name in filenames + dirnames:
+                (new_name, nsubs) = self.replacer.replace(name)
+                if nsubs == 0:
+                    continue
+                old_path = os.path.join(dirpath, name)
+                new_path = os.path.join(dirpath, new_name)
+                if not dry_run:
+                    os.rename(old_path, new_path)
+                renamed.append((old_path, new_path))
+        return renamed
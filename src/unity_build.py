@@ -0,0 +1,110 @@
+""" Unity builds and precompiled headers for the module library """
+
+import os
+import re
+import glob
+
+from cmakefile_editor import CMakeFileEditor
+from templates import Templates
+from template_backend import render_template
+
+### Unity build manager ######################################################
+class UnityBuild(object):
+    """ Maintains the unity build files lib/unity_build_N.cc and the
+    precompiled header of a module.
+    Each unity file #includes a group of the sources from add_library() in
+    lib/CMakeLists.txt. Sources are grouped in the order they appear there,
+    so adding a block only changes the last group and keeps rebuilds small.
+    The CMake code reads the groups back from the unity files, so the block
+    sources themselves are only listed in add_library(). """
+    _unity_re = re.compile(r'unity_build_\d+\.cc$')
+    _group_size_re = re.compile(r'^# Unity build \(maintained by gr_modtool, group size: (\d+)\)$', re.MULTILINE)
+    def __init__(self, modname, libdir='lib'):
+        self.modname = modname
+        self.libdir = libdir
+        self.cmfile = os.path.join(libdir, 'CMakeLists.txt')
+        self.fname_pch = '%s_pch.h' % modname
+
+    def _render(self, tpl_id, **kwargs):
+        """ Substitute a template """
+        kwargs['modname'] = self.modname
+        return render_template(Templates[tpl_id], kwargs)
+
+    def get_group_size(self):
+        """ Return the group size, or None if unity builds are disabled """
+        mobj = self._group_size_re.search(open(self.cmfile).read())
+        if mobj is None:
+            return None
+        return int(mobj.group(1))
+
+    def has_pch(self):
+        """ True if the library uses a precompiled header """
+        return re.search(r'target_precompile_headers\(.*%s' % re.escape(self.fname_pch),
+                         open(self.cmfile).read()) is not None
+
+    def get_sources(self):
+        """ Return the enabled sources of add_library(), minus the unity
+        files. Sources commented out by 'gr_modtool disable' are skipped. """
+        value = CMakeFileEditor(self.cmfile).get_entry_value('add_library')
+        if value is None:
+            return []
+        sources = []
+        for line in value.splitlines():
+            for word in line.split('#')[0].split():
+                if re.match(r'[\w./-]+\.(cc|cpp|cxx|c)$', word) and not self._unity_re.match(word):
+                    sources.append(word)
+        return sources
+
+    def enable(self, group_size=None, pch=False):
+        """ Add the unity build and/or precompiled header sections to
+        lib/CMakeLists.txt. If unity builds are already enabled, only the
+        group size is changed. """
+        ed = CMakeFileEditor(self.cmfile)
+        if group_size is not None:
+            if self._group_size_re.search(ed.cfile):
+                ed.cfile = self._group_size_re.sub(
+                        '# Unity build (maintained by gr_modtool, group size: %d)' % group_size,
+                        ed.cfile)
+            else:
+                print "Enabling unity builds in %s (%d sources per group)..." % (self.cmfile, group_size)
+                cmake_section = self._render('unity_cmakeentry', group_size=group_size)
+                (ed.cfile, nsubs) = re.subn(r'^add_library\(',
+                                            lambda mobj: cmake_section + mobj.group(0),
+                                            ed.cfile, count=1, flags=re.MULTILINE)
+                if nsubs == 0:
+                    print "Warning: No add_library() found in %s, can't enable unity builds." % self.cmfile
+                    return
+                ed.append_value('add_library', '${%s_unity_sources}' % self.modname)
+        if pch and not self.has_pch():
+            print "Adding precompiled header %s..." % os.path.join(self.libdir, self.fname_pch)
+            open(os.path.join(self.libdir, self.fname_pch), 'w').write(self._render('pch_h'))
+            cmake_section = self._render('pch_cmakeentry')
+            ed.cfile = re.sub(r'^add_library\([^()]*\)[^\n]*\n',
+                              lambda mobj: mobj.group(0) + cmake_section,
+                              ed.cfile, count=1, flags=re.MULTILINE)
+        ed.write()
+        self.update()
+
+    def update(self):
+        """ Regenerate the unity files from add_library(). Files are only
+        written if their contents change, so make doesn't rebuild groups
+        that stayed the same. Does nothing if unity builds are disabled. """
+        group_size = self.get_group_size()
+        if group_size is None:
+            return
+        sources = self.get_sources()
+        groups = [sources[i:i+group_size] for i in range(0, len(sources), group_size)]
+        unity_files = []
+        for (idx, group) in enumerate(groups):
+            fname = os.path.join(self.libdir, 'unity_build_%d.cc' % idx)
+            unity_files.append(fname)
+            contents = '/* Unity build group, generated by gr_modtool from CMakeLists.txt. Do not edit. */\n'
+            contents += ''.join(['#include "%s"\n' % src for src in group])
+            if os.path.isfile(fname) and open(fname).read() == contents:
+                continue
+            print "Writing %s (%s)..." % (fname, ', '.join(group))
+            open(fname, 'w').write(contents)
+        for fname in glob.glob(os.path.join(self.libdir, 'unity_build_*.cc')):
+            if self._unity_re.match(os.path.basename(fname)) and fname not in unity_files:
+                print "Deleting %s." % fname
+                os.unlink(fname)
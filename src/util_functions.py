@@ -1,7 +1,9 @@
 """ Utility functions for gr_modtool.py """
 
+import os
 import re
 import sys
+import cPickle
 
 ### Utility functions ########################################################
 def get_command_from_argv(possible_cmds):
@@ -56,9 +58,24 @@ def strip_default_values(string):
 
 def strip_arg_types(string):
     """" Strip the argument types from a list of arguments
-    Example: "int arg1, double arg2" -> "arg1, arg2" """
+    Example: "int arg1, const std::string &arg2" -> "arg1, arg2" """
     string = strip_default_values(string)
-    return ", ".join([part.strip().split(' ')[-1] for part in string.split(',')])
+    return ", ".join([part.strip().split(' ')[-1].lstrip('&*') for part in string.split(',')])
+
+def arg_declarations(string):
+    """ Turn a C++ argument list into a list of variable declarations,
+    initialised with the default values or a placeholder.
+    Example: "int arg1, double arg2=1.0" -> ["int arg1 = <+arg1+>;", "double arg2 = 1.0;"] """
+    decls = []
+    for part in string.split(','):
+        if not part.strip():
+            continue
+        (decl, default) = (part.split('=', 1) + [None])[:2]
+        decl = decl.strip()
+        if default is None:
+            default = '<+%s+>' % decl.split(' ')[-1].lstrip('&*')
+        decls.append('%s = %s;' % (decl, default.strip()))
+    return decls
 
 def get_modname():
     """ Grep the current module's name from gnuradio.project or CMakeLists.txt """
@@ -86,6 +103,57 @@ def get_class_dict():
             pass
     return classdict
 
+def get_cache_dir():
+    """ Return the directory in which gr_modtool keeps its caches, creating
+    it if necessary. Uses $XDG_CACHE_HOME if set, ~/.cache otherwise.
+    Returns None if the directory can't be created. """
+    cache_base = os.environ.get('XDG_CACHE_HOME',
+                                os.path.join(os.path.expanduser('~'), '.cache'))
+    cache_dir = os.path.join(cache_base, 'gr_modtool')
+    if not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            return None
+    return cache_dir
+
+def load_cache(name):
+    """ Load the cache called 'name' from the cache dir. Any problem reading
+    the cache (missing, corrupt, from another version...) returns an empty
+    dict, i.e. a cache is never more than a shortcut. """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return {}
+    try:
+        cache = cPickle.load(open(os.path.join(cache_dir, name), 'rb'))
+    except Exception:
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+def save_cache(name, cache):
+    """ Write a cache to the cache dir. The file is first written to a
+    temporary file and then renamed, so concurrent readers never see
+    a half-written cache. Failing to write a cache is not an error. """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    fname = os.path.join(cache_dir, name)
+    tmp_fname = '%s.%d.tmp' % (fname, os.getpid())
+    try:
+        cPickle.dump(cache, open(tmp_fname, 'wb'), cPickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_fname, fname)
+    except (IOError, OSError):
+        pass
+
+def get_mtime(path):
+    """ Return the mtime of path, or None if it doesn't exist. """
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
 def is_number(s):
     " Return True if the string s contains a number. "
     try: